@@ -0,0 +1,30 @@
+"""Add sync fingerprint to licenses.
+
+Revision ID: 034
+Revises: 033
+Create Date: 2026-10-16
+
+Provider sync stores a SHA-256 fingerprint of the fetched license content so
+unchanged licenses can be skipped instead of rewritten on every sync.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "034"
+down_revision = "033"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add sync_fingerprint column to licenses."""
+    op.add_column(
+        "licenses",
+        sa.Column("sync_fingerprint", sa.String(64), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Remove sync_fingerprint column from licenses."""
+    op.drop_column("licenses", "sync_fingerprint")
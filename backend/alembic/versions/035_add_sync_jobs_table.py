@@ -0,0 +1,52 @@
+"""Add sync_jobs table for background provider syncs.
+
+Revision ID: 035
+Revises: 034
+Create Date: 2026-10-16
+
+Provider syncs run as background jobs; this table persists their state,
+progress counters and cancellation requests.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "035"
+down_revision = "034"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create sync_jobs table."""
+    op.create_table(
+        "sync_jobs",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("provider_id", UUID(as_uuid=True), sa.ForeignKey("providers.id", ondelete="CASCADE"), nullable=True),
+        sa.Column("status", sa.String(50), nullable=False, server_default="pending"),
+        sa.Column("full_resync", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("cancel_requested", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("total_providers", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("completed_providers", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("failed_providers", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("progress", JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", UUID(as_uuid=True), sa.ForeignKey("admin_users.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+
+    op.create_index("idx_sync_jobs_status", "sync_jobs", ["status"])
+    op.create_index("idx_sync_jobs_created_at", "sync_jobs", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop sync_jobs table."""
+    op.drop_index("idx_sync_jobs_created_at", table_name="sync_jobs")
+    op.drop_index("idx_sync_jobs_status", table_name="sync_jobs")
+    op.drop_table("sync_jobs")
@@ -0,0 +1,40 @@
+"""Add email domain to licenses.
+
+Revision ID: 036
+Revises: 035
+Create Date: 2026-10-16
+
+External licenses were detected with NOT ILIKE '%@domain' chains over
+external_user_id, once per provider. A generated, indexed email_domain column
+lets reports compare against the company domains directly.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "036"
+down_revision = "035"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add generated email_domain column and index to licenses."""
+    op.add_column(
+        "licenses",
+        sa.Column(
+            "email_domain",
+            sa.String(255),
+            sa.Computed(
+                "lower(substring(external_user_id from '@([^@]*)$'))", persisted=True
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index("idx_licenses_email_domain", "licenses", ["email_domain"])
+
+
+def downgrade() -> None:
+    """Remove email_domain column and index from licenses."""
+    op.drop_index("idx_licenses_email_domain", table_name="licenses")
+    op.drop_column("licenses", "email_domain")
@@ -0,0 +1,64 @@
+"""Add dashboard_aggregates table for precomputed dashboard metrics.
+
+Revision ID: 037
+Revises: 036
+Create Date: 2026-10-16
+
+Dashboard license and employee counts are kept per department and provider,
+updated by provider syncs and license mutations, so the dashboard reads them
+instead of aggregating licenses and employees on every cache miss. The table
+is filled on the first dashboard read after this migration.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "037"
+down_revision = "036"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create dashboard_aggregates table."""
+    op.create_table(
+        "dashboard_aggregates",
+        sa.Column(
+            "id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")
+        ),
+        sa.Column("department", sa.String(255), nullable=True),
+        sa.Column(
+            "provider_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("providers.id", ondelete="CASCADE"),
+            nullable=True,
+        ),
+        sa.Column("employees_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("employees_active", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("employees_offboarded", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("licenses_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("licenses_active", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("licenses_unassigned", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("licenses_external", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("monthly_cost", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column("unassigned_monthly_cost", sa.Numeric(14, 2), nullable=False, server_default="0"),
+        sa.Column(
+            "refreshed_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+
+    op.create_index("idx_dashboard_aggregates_department", "dashboard_aggregates", ["department"])
+    op.create_index("idx_dashboard_aggregates_provider", "dashboard_aggregates", ["provider_id"])
+
+
+def downgrade() -> None:
+    """Drop dashboard_aggregates table."""
+    op.drop_index("idx_dashboard_aggregates_provider", table_name="dashboard_aggregates")
+    op.drop_index("idx_dashboard_aggregates_department", table_name="dashboard_aggregates")
+    op.drop_table("dashboard_aggregates")
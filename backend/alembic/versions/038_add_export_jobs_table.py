@@ -0,0 +1,49 @@
+"""Add export_jobs table for background report exports.
+
+Revision ID: 038
+Revises: 037
+Create Date: 2026-10-16
+
+Large report exports are generated as background jobs; this table persists
+their state and the artifact to download once they finish.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision = "038"
+down_revision = "037"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create export_jobs table."""
+    op.create_table(
+        "export_jobs",
+        sa.Column("id", UUID(as_uuid=True), primary_key=True, server_default=sa.text("gen_random_uuid()")),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("status", sa.String(50), nullable=False, server_default="pending"),
+        sa.Column("rows_written", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("filename", sa.String(255), nullable=True),
+        sa.Column("file_size", sa.BigInteger(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_by", UUID(as_uuid=True), sa.ForeignKey("admin_users.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.text("now()")),
+    )
+
+    op.create_index("idx_export_jobs_status", "export_jobs", ["status"])
+    op.create_index("idx_export_jobs_created_at", "export_jobs", ["created_at"])
+
+
+def downgrade() -> None:
+    """Drop export_jobs table."""
+    op.drop_index("idx_export_jobs_created_at", table_name="export_jobs")
+    op.drop_index("idx_export_jobs_status", table_name="export_jobs")
+    op.drop_table("export_jobs")
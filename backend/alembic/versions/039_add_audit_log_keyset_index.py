@@ -0,0 +1,30 @@
+"""Index audit logs on (created_at, id) for keyset pagination.
+
+Revision ID: 039
+Revises: 038
+Create Date: 2026-10-16
+
+The audit log list pages by keyset on (created_at, id) instead of OFFSET.
+The composite index serves both the row comparison and the ordering, and
+replaces the single-column created_at index.
+"""
+
+from alembic import op
+
+
+revision = "039"
+down_revision = "038"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the created_at index with a (created_at, id) index."""
+    op.create_index("idx_audit_logs_created_id", "audit_logs", ["created_at", "id"])
+    op.drop_index("idx_audit_logs_created", table_name="audit_logs")
+
+
+def downgrade() -> None:
+    """Restore the created_at index."""
+    op.create_index("idx_audit_logs_created", "audit_logs", ["created_at"])
+    op.drop_index("idx_audit_logs_created_id", table_name="audit_logs")
@@ -0,0 +1,51 @@
+"""Add trigram-indexed search text to audit logs.
+
+Revision ID: 040
+Revises: 039
+Create Date: 2026-10-16
+
+Audit log search ORed five LIKE predicates, casting every changes payload
+to text and scanning the whole table. A generated, lowercased search_text
+column over action, resource type, resource_id and changes, with a trigram
+GIN index, serves the substring search from the index. Adding the column
+rewrites audit_logs once.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "040"
+down_revision = "039"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add generated search_text column and trigram index to audit_logs."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "audit_logs",
+        sa.Column(
+            "search_text",
+            sa.Text(),
+            sa.Computed(
+                "lower(action || ' ' || resource_type || ' ' || coalesce(resource_id::text, '')"
+                " || ' ' || coalesce(changes::text, ''))",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "idx_audit_logs_search_text_trgm",
+        "audit_logs",
+        ["search_text"],
+        postgresql_using="gin",
+        postgresql_ops={"search_text": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Remove search_text column and index from audit_logs."""
+    op.drop_index("idx_audit_logs_search_text_trgm", table_name="audit_logs")
+    op.drop_column("audit_logs", "search_text")
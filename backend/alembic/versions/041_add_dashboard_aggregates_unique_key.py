@@ -0,0 +1,39 @@
+"""Add a unique (department, provider_id) key to dashboard_aggregates.
+
+Revision ID: 041
+Revises: 040
+Create Date: 2026-10-16
+
+Aggregate refreshes replaced their rows with DELETE then INSERT ... SELECT,
+so two overlapping refreshes of the same provider or department could both
+insert their rows. Refreshes now upsert on this key. It leads with
+department, so it also serves the department filter and replaces
+idx_dashboard_aggregates_department. Existing rows are dropped; they are
+rebuilt on the next dashboard read.
+"""
+
+from alembic import op
+
+revision = "041"
+down_revision = "040"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the department index with a unique (department, provider_id) index."""
+    op.execute("DELETE FROM dashboard_aggregates")
+    op.drop_index("idx_dashboard_aggregates_department", table_name="dashboard_aggregates")
+    op.create_index(
+        "uq_dashboard_aggregates_department_provider",
+        "dashboard_aggregates",
+        ["department", "provider_id"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+
+def downgrade() -> None:
+    """Restore the department index."""
+    op.drop_index("uq_dashboard_aggregates_department_provider", table_name="dashboard_aggregates")
+    op.create_index("idx_dashboard_aggregates_department", "dashboard_aggregates", ["department"])
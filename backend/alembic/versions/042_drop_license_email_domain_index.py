@@ -0,0 +1,28 @@
+"""Drop the email_domain index of licenses.
+
+Revision ID: 042
+Revises: 041
+Create Date: 2026-10-16
+
+External licenses are those whose email_domain is NOT IN the company domains
+and NOT LIKE any of their subdomains. Negated conditions cannot seek a btree
+index, so idx_licenses_email_domain was never used and only slowed down
+license writes. The generated column stays; it spares the regex per row.
+"""
+
+from alembic import op
+
+revision = "042"
+down_revision = "041"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Drop the email_domain index."""
+    op.drop_index("idx_licenses_email_domain", table_name="licenses")
+
+
+def downgrade() -> None:
+    """Restore the email_domain index."""
+    op.create_index("idx_licenses_email_domain", "licenses", ["email_domain"])
@@ -60,6 +60,41 @@ class Settings(BaseSettings):
 
     # Sync settings
     sync_interval_minutes: int = 60
+    # Maximum number of providers synced in parallel by sync_all_providers (1 = sequential)
+    sync_max_concurrency: int = 4
+    # Worker processes for fuzzy license matching during sync (0 = match on the event loop)
+    matching_max_workers: int = 2
+    # HRIS syncs are incremental between full resyncs; force a full resync after this many hours
+    hris_full_resync_interval_hours: int = 168
+    # Sync jobs running at the same time (further jobs wait as pending)
+    sync_job_max_concurrent: int = 2
+    # Seconds between writes of a running sync job's progress counters
+    sync_job_progress_interval_seconds: float = 1.0
+    # HiBob avatar sync: parallel downloads, maximum avatar requests per second,
+    # and how often stored avatars are checked for changes
+    avatar_sync_concurrency: int = 4
+    avatar_sync_rate_per_second: float = 2.0
+    avatar_refresh_interval_hours: int = 24
+    # Dashboard aggregates are rebuilt from scratch this often, catching changes made
+    # outside syncs and license mutations; older aggregates are reported as stale
+    dashboard_aggregate_rebuild_hours: int = 24
+    # Artifacts of finished export jobs are deleted with their jobs after this many hours
+    export_job_retention_hours: int = 24
+    # Backup compression: "zstd" needs the optional zstandard package (pip install
+    # licence-api[zstd]) and compresses with backup_compression_threads worker threads
+    backup_compression: Literal["gzip", "zstd"] = "gzip"
+    backup_compression_threads: int = 2
+
+    # Provider API requests (shared connection pool, see providers/http.py)
+    provider_http_timeout_seconds: float = 30.0
+    provider_http_connect_timeout_seconds: float = 10.0
+    provider_http_max_connections: int = 50
+    provider_http_max_keepalive_connections: int = 20
+    # Retries of transient failures, with exponential backoff starting at this delay
+    provider_http_max_retries: int = 3
+    provider_http_backoff_seconds: float = 0.5
+    # Longer Retry-After waits are not honored; the response is returned instead
+    provider_http_max_retry_after_seconds: float = 60.0
 
     # Session settings
     session_cookie_name: str = "licence_session"
@@ -18,6 +18,8 @@ else:
 # Avatar directories
 AVATAR_DIR = DATA_DIR / "avatars"
 ADMIN_AVATAR_DIR = DATA_DIR / "admin_avatars"
+# Content hashes and ETags of synced avatars, used to skip unchanged downloads
+AVATAR_MANIFEST_PATH = AVATAR_DIR / "manifest.json"
 
 # Provider-related directories
 PROVIDER_LOGOS_DIR = DATA_DIR / "provider_logos"
@@ -29,3 +31,6 @@ LOGOS_DIR = DATA_DIR / "logos"
 
 # Backup directory
 BACKUPS_DIR = DATA_DIR / "backups"
+
+# Artifacts of finished export jobs
+EXPORTS_DIR = DATA_DIR / "exports"
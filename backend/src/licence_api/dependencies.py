@@ -15,6 +15,7 @@ from licence_api.services.backup_service import BackupService
 from licence_api.services.cancellation_service import CancellationService
 from licence_api.services.email_service import EmailService
 from licence_api.services.employee_service import EmployeeService
+from licence_api.services.export_job_service import ExportJobService
 from licence_api.services.export_service import ExportService
 from licence_api.services.forecast_service import ForecastService
 from licence_api.services.external_account_service import ExternalAccountService
@@ -34,6 +35,7 @@ from licence_api.services.rbac_service import RbacService
 from licence_api.services.report_service import ReportService
 from licence_api.services.service_account_service import ServiceAccountService
 from licence_api.services.settings_service import SettingsService
+from licence_api.services.sync_job_service import SyncJobService
 from licence_api.services.sync_service import SyncService
 
 
@@ -92,6 +94,11 @@ def get_sync_service(db: AsyncSession = Depends(get_db)) -> SyncService:
     return SyncService(db)
 
 
+def get_sync_job_service(db: AsyncSession = Depends(get_db)) -> SyncJobService:
+    """Get SyncJobService instance."""
+    return SyncJobService(db)
+
+
 def get_pricing_service(db: AsyncSession = Depends(get_db)) -> PricingService:
     """Get PricingService instance."""
     return PricingService(db)
@@ -208,6 +215,11 @@ def get_export_service(db: AsyncSession = Depends(get_db)) -> ExportService:
     return ExportService(db)
 
 
+def get_export_job_service(db: AsyncSession = Depends(get_db)) -> ExportJobService:
+    """Get ExportJobService instance."""
+    return ExportJobService(db)
+
+
 # =============================================================================
 # Admin Service Factories
 # =============================================================================
@@ -51,6 +51,24 @@ class RoleNotFoundError(NotFoundError):
         super().__init__(message, details)
 
 
+class SyncJobNotFoundError(NotFoundError):
+    """Raised when a sync job cannot be found."""
+
+    def __init__(self, job_id: str | None = None) -> None:
+        message = "Sync job not found"
+        details = {"job_id": str(job_id)} if job_id else {}
+        super().__init__(message, details)
+
+
+class ExportJobNotFoundError(NotFoundError):
+    """Raised when an export job or its artifact cannot be found."""
+
+    def __init__(self, job_id: str | None = None) -> None:
+        message = "Export job not found"
+        details = {"job_id": str(job_id)} if job_id else {}
+        super().__init__(message, details)
+
+
 # =============================================================================
 # Conflict Errors (409)
 # =============================================================================
@@ -80,6 +98,24 @@ class RoleAlreadyExistsError(ConflictError):
         super().__init__(message, details)
 
 
+class SyncJobAlreadyActiveError(ConflictError):
+    """Raised when a sync job for the same scope is already pending or running."""
+
+    def __init__(self, job_id: str | None = None) -> None:
+        message = "A sync job for these providers is already pending or running"
+        details = {"job_id": str(job_id)} if job_id else {}
+        super().__init__(message, details)
+
+
+class ExportJobNotReadyError(ConflictError):
+    """Raised when the artifact of an unfinished export job is requested."""
+
+    def __init__(self, job_id: str | None = None) -> None:
+        message = "Export job has not completed"
+        details = {"job_id": str(job_id)} if job_id else {}
+        super().__init__(message, details)
+
+
 # =============================================================================
 # Validation Errors (400)
 # =============================================================================
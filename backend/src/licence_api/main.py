@@ -48,6 +48,7 @@ from licence_api.routers import (
     reports,
     service_accounts,
     settings,
+    sync_jobs,
     users,
 )
 from licence_api.security.rate_limit import limiter
@@ -117,11 +118,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await stop_scheduler()
 
     # Close shared HTTP clients to release connections
-    from licence_api.providers.slack import SlackProvider
+    from licence_api.providers.http import close_provider_http
     from licence_api.services.notification_service import NotificationService
 
     await NotificationService.close_client()
-    await SlackProvider.close_client()
+    await close_provider_http()
 
 
 async def _rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> JSONResponse:
@@ -239,6 +240,7 @@ def create_app() -> FastAPI:
     app.include_router(providers.router, prefix="/api/v1/providers", tags=["Providers"])
     app.include_router(provider_files.router, prefix="/api/v1/providers", tags=["Provider Files"])
     app.include_router(provider_import.router, prefix="/api/v1/providers", tags=["Provider Import"])
+    app.include_router(sync_jobs.router, prefix="/api/v1/sync-jobs", tags=["Sync Jobs"])
     app.include_router(
         license_packages.router, prefix="/api/v1/providers", tags=["License Packages"]
     )
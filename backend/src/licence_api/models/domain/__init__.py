@@ -4,6 +4,7 @@ from licence_api.models.domain.admin_user import AdminUser, AuthProvider
 from licence_api.models.domain.employee import Employee, EmployeeStatus
 from licence_api.models.domain.license import License, LicenseStatus
 from licence_api.models.domain.provider import Provider, ProviderConfig, ProviderName
+from licence_api.models.domain.sync import SyncChangeSet
 
 __all__ = [
     "Employee",
@@ -13,6 +14,7 @@ __all__ = [
     "Provider",
     "ProviderConfig",
     "ProviderName",
+    "SyncChangeSet",
     "AdminUser",
     "AuthProvider",
 ]
@@ -0,0 +1,39 @@
+"""Sync change set domain model."""
+
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class SyncChangeSet(BaseModel):
+    """Data changed by a sync run, used for scoped cache invalidation."""
+
+    # Providers that were synced (their sync status and last_sync_at changed)
+    provider_ids: set[UUID] = Field(default_factory=set)
+    # Providers whose licenses were created or updated
+    license_provider_ids: set[UUID] = Field(default_factory=set)
+    # Employees created, updated or offboarded
+    employee_ids: set[UUID] = Field(default_factory=set)
+    # Departments whose employees or assigned licenses changed
+    departments: set[str] = Field(default_factory=set)
+
+    @property
+    def licenses_changed(self) -> bool:
+        """Check if any license data changed."""
+        return bool(self.license_provider_ids)
+
+    @property
+    def employees_changed(self) -> bool:
+        """Check if any employee data changed."""
+        return bool(self.employee_ids)
+
+    def merge(self, other: "SyncChangeSet") -> None:
+        """Add the changes of another change set to this one.
+
+        Args:
+            other: Change set to merge
+        """
+        self.provider_ids |= other.provider_ids
+        self.license_provider_ids |= other.license_provider_ids
+        self.employee_ids |= other.employee_ids
+        self.departments |= other.departments
@@ -22,13 +22,19 @@ class AuditLogResponse(BaseModel):
 
 
 class AuditLogListResponse(BaseModel):
-    """Paginated audit log list response."""
+    """Paginated audit log list response.
+
+    total is the planner's estimate for large results unless total_exact.
+    next_cursor is None on the last page.
+    """
 
     items: list[AuditLogResponse]
     total: int
+    total_exact: bool = True
     page: int
     page_size: int
     total_pages: int
+    next_cursor: str | None = None
 
 
 class ResourceTypesResponse(BaseModel):
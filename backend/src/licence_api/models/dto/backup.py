@@ -127,6 +127,8 @@ class BackupConfig(BaseModel):
     schedule: str = "0 2 * * *"  # Cron format, default: 2 AM daily
     retention_count: int = 7  # Max number of backups to keep
     password_configured: bool = False
+    incremental: bool = False  # Write incremental backups between full backups
+    full_backup_interval: int = 7  # Backups per chain: a full backup and its increments
 
 
 class BackupConfigUpdate(BaseModel):
@@ -135,6 +137,8 @@ class BackupConfigUpdate(BaseModel):
     enabled: bool | None = None
     schedule: str | None = Field(None, max_length=100)  # Cron format
     retention_count: int | None = Field(None, ge=1, le=100)
+    incremental: bool | None = None
+    full_backup_interval: int | None = Field(None, ge=1, le=100)
     password: str | None = Field(None, min_length=12, max_length=256)  # New encryption password
 
 
@@ -157,6 +161,9 @@ class StoredBackup(BaseModel):
     age_description: str  # "vor 2 Stunden", "vor 1 Tag"
     is_overdue: bool = False  # True if older than schedule expects
     metadata: StoredBackupMetadata | None = None
+    kind: str = "full"  # "full" or "incremental"
+    parent_id: str | None = None  # Backup an incremental backup is based on
+    chain_length: int = 1  # Backups read on restore, including the full backup
 
 
 class BackupListResponse(BaseModel):
@@ -58,3 +58,7 @@ class DashboardResponse(BaseModel):
     providers: list[ProviderSummary]
     recent_offboardings: list[RecentOffboarding]
     unassigned_license_samples: list[UnassignedLicense]
+    # Oldest refresh of the precomputed counts and costs above; stale if older than
+    # the periodic rebuild interval
+    aggregates_refreshed_at: datetime | None = None
+    aggregates_stale: bool = False
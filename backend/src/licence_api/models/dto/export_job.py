@@ -0,0 +1,29 @@
+"""Export job DTOs for background report exports."""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ExportJobResponse(BaseModel):
+    """Export job state."""
+
+    id: UUID
+    kind: str  # full_report_excel
+    status: str  # pending, running, completed, failed
+    rows_written: int
+    filename: str | None = None
+    file_size: int | None = None
+    error_message: str | None = None
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class ExportJobListResponse(BaseModel):
+    """List of recent export jobs."""
+
+    items: list[ExportJobResponse]
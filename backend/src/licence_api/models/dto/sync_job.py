@@ -0,0 +1,41 @@
+"""Sync job DTOs for background provider syncs."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SyncJobCreate(BaseModel):
+    """Request to start a sync job."""
+
+    provider_id: UUID | None = None  # None = all enabled providers
+    full_resync: bool = False
+
+
+class SyncJobResponse(BaseModel):
+    """Sync job state and progress."""
+
+    id: UUID
+    provider_id: UUID | None = None
+    status: str  # pending, running, completed, failed, cancelled
+    full_resync: bool
+    cancel_requested: bool
+    total_providers: int
+    completed_providers: int
+    failed_providers: int
+    # Per-provider progress keyed by provider name: status, phase, processed, total, result
+    progress: dict[str, Any]
+    error_message: str | None = None
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class SyncJobListResponse(BaseModel):
+    """List of recent sync jobs."""
+
+    items: list[SyncJobResponse]
@@ -4,8 +4,10 @@ from licence_api.models.orm.admin_user import AdminUserORM
 from licence_api.models.orm.audit_log import AuditLogORM
 from licence_api.models.orm.base import Base
 from licence_api.models.orm.cost_snapshot import CostSnapshotORM
+from licence_api.models.orm.dashboard_aggregate import DashboardAggregateORM
 from licence_api.models.orm.employee import EmployeeORM
 from licence_api.models.orm.employee_external_account import EmployeeExternalAccountORM
+from licence_api.models.orm.export_job import ExportJobORM
 from licence_api.models.orm.import_job import ImportJobORM
 from licence_api.models.orm.license import LicenseORM
 from licence_api.models.orm.license_package import LicensePackageORM
@@ -20,6 +22,7 @@ from licence_api.models.orm.role import RoleORM
 from licence_api.models.orm.role_permission import RolePermissionORM
 from licence_api.models.orm.service_account_license_type import ServiceAccountLicenseTypeORM
 from licence_api.models.orm.settings import SettingsORM
+from licence_api.models.orm.sync_job import SyncJobORM
 from licence_api.models.orm.user_notification_preference import UserNotificationPreferenceORM
 from licence_api.models.orm.user_role import UserRoleORM
 
@@ -46,4 +49,7 @@ __all__ = [
     "ServiceAccountLicenseTypeORM",
     "EmployeeExternalAccountORM",
     "ImportJobORM",
+    "SyncJobORM",
+    "DashboardAggregateORM",
+    "ExportJobORM",
 ]
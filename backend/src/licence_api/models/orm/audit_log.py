@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
+from sqlalchemy import DDL, Computed, DateTime, ForeignKey, Index, String, Text, event, func
 from sqlalchemy.dialects.postgresql import INET, JSONB
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column
@@ -30,8 +30,33 @@ class AuditLogORM(Base):
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    # Lowercased searchable text of the log, kept up to date by PostgreSQL on
+    # every write; trigram-indexed for substring search
+    search_text: Mapped[str] = mapped_column(
+        Text,
+        Computed(
+            "lower(action || ' ' || resource_type || ' ' || coalesce(resource_id::text, '')"
+            " || ' ' || coalesce(changes::text, ''))",
+            persisted=True,
+        ),
+        nullable=False,
+    )
 
     __table_args__ = (
-        Index("idx_audit_logs_created", "created_at"),
+        Index("idx_audit_logs_created_id", "created_at", "id"),
         Index("idx_audit_logs_resource", "resource_type", "resource_id"),
+        Index(
+            "idx_audit_logs_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
     )
+
+
+# The search_text index needs pg_trgm when the table is created from metadata
+event.listen(
+    AuditLogORM.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
@@ -0,0 +1,54 @@
+"""Dashboard Aggregate ORM model for precomputed dashboard metrics."""
+
+from datetime import datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from licence_api.models.orm.base import Base, UUIDMixin
+
+
+class DashboardAggregateORM(Base, UUIDMixin):
+    """Dashboard metrics of one department and provider.
+
+    License rows (provider_id set) hold the license counts and costs of a
+    provider's licenses whose employee is in the department; licenses without
+    employee or department are counted under department None. Employee rows
+    (provider_id None) hold the employee counts of the department.
+    """
+
+    __tablename__ = "dashboard_aggregates"
+
+    department: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    provider_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("providers.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    employees_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    employees_active: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    employees_offboarded: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    licenses_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    licenses_active: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    licenses_unassigned: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    licenses_external: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    monthly_cost: Mapped[Decimal] = mapped_column(Numeric(14, 2), default=0, nullable=False)
+    unassigned_monthly_cost: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), default=0, nullable=False
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        # One row per department and provider; NULL provider is the employee row
+        Index(
+            "uq_dashboard_aggregates_department_provider",
+            "department",
+            "provider_id",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+        Index("idx_dashboard_aggregates_provider", "provider_id"),
+    )
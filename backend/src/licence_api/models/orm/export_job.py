@@ -0,0 +1,48 @@
+"""Export Job ORM model for tracking background report exports."""
+
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from licence_api.models.orm.base import Base, TimestampMixin, UUIDMixin
+
+
+class ExportJobORM(Base, UUIDMixin, TimestampMixin):
+    """Export Job database model for tracking background report exports."""
+
+    __tablename__ = "export_jobs"
+
+    # Export type, e.g. "full_report_excel"
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        default="pending",
+    )
+    rows_written: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Download file name and size of the finished artifact in EXPORTS_DIR
+    filename: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    file_size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_by: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("admin_users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    # Relationships
+    creator: Mapped["AdminUserORM | None"] = relationship("AdminUserORM")
+
+    __table_args__ = (
+        Index("idx_export_jobs_status", "status"),
+        Index("idx_export_jobs_created_at", "created_at"),
+    )
+
+
+# Import to avoid circular import issues
+from licence_api.models.orm.admin_user import AdminUserORM  # noqa: E402, F401
@@ -7,6 +7,7 @@ from uuid import UUID
 
 from sqlalchemy import (
     Boolean,
+    Computed,
     Date,
     DateTime,
     Float,
@@ -36,6 +37,14 @@ class LicenseORM(Base, UUIDMixin, TimestampMixin):
         PGUUID(as_uuid=True), ForeignKey("employees.id"), nullable=True
     )
     external_user_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Lowercased domain of email-like external_user_ids (None otherwise), kept up
+    # to date by PostgreSQL on every write; used for external license detection.
+    # Not indexed: the external condition is a NOT IN / NOT LIKE a btree cannot seek
+    email_domain: Mapped[str | None] = mapped_column(
+        String(255),
+        Computed("lower(substring(external_user_id from '@([^@]*)$'))", persisted=True),
+        nullable=True,
+    )
     license_type: Mapped[str | None] = mapped_column(String(500), nullable=True)
     status: Mapped[str] = mapped_column(String(50), nullable=False)
     assigned_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -47,7 +56,11 @@ class LicenseORM(Base, UUIDMixin, TimestampMixin):
     extra_data: Mapped[dict[str, Any] | None] = mapped_column(
         "metadata", JSONB, default=dict, nullable=True
     )
+    # When a sync last wrote the license; syncs that find it unchanged leave it as
+    # is (the provider's last_sync_at records when it was last seen)
     synced_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # SHA-256 of the provider-supplied content at the last sync that changed it
+    sync_fingerprint: Mapped[str | None] = mapped_column(String(64), nullable=True)
 
     # Service account fields
     is_service_account: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
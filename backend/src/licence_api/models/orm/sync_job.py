@@ -0,0 +1,59 @@
+"""Sync Job ORM model for tracking background provider syncs."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from licence_api.models.orm.base import Base, TimestampMixin, UUIDMixin
+
+
+class SyncJobORM(Base, UUIDMixin, TimestampMixin):
+    """Sync Job database model for tracking background provider syncs."""
+
+    __tablename__ = "sync_jobs"
+
+    # None means all enabled providers
+    provider_id: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("providers.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    status: Mapped[str] = mapped_column(
+        String(50),
+        nullable=False,
+        default="pending",
+    )
+    full_resync: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    total_providers: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    completed_providers: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed_providers: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Per-provider progress counters and results, keyed by provider name
+    progress: Mapped[dict[str, Any]] = mapped_column(JSONB, default=dict, nullable=False)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_by: Mapped[UUID | None] = mapped_column(
+        PGUUID(as_uuid=True),
+        ForeignKey("admin_users.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+
+    # Relationships
+    provider: Mapped["ProviderORM | None"] = relationship("ProviderORM")
+    creator: Mapped["AdminUserORM | None"] = relationship("AdminUserORM")
+
+    __table_args__ = (
+        Index("idx_sync_jobs_status", "status"),
+        Index("idx_sync_jobs_created_at", "created_at"),
+    )
+
+
+# Import to avoid circular import issues
+from licence_api.models.orm.admin_user import AdminUserORM  # noqa: E402, F401
+from licence_api.models.orm.provider import ProviderORM  # noqa: E402, F401
@@ -5,8 +5,6 @@ from datetime import datetime
 from typing import Any
 from urllib.parse import quote
 
-import httpx
-
 from licence_api.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
@@ -49,26 +47,26 @@ class AdobeProvider(BaseProvider):
         if self._access_token:
             return self._access_token
 
-        async with httpx.AsyncClient() as client:
-            # Use OAuth Server-to-Server (client credentials)
-            response = await client.post(
-                f"{self.IMS_URL}/ims/token/v3",
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "scope": "openid,AdobeID,user_management_sdk",
-                },
-                timeout=30.0,
-            )
-
-            if response.status_code != 200:
-                logger.error("Failed to get Adobe access token: status=%d", response.status_code)
-                raise ValueError(f"Adobe auth failed: {response.status_code}")
-
-            data = response.json()
-            self._access_token = data.get("access_token")
-            return self._access_token
+        client = self._get_http_client()
+        # Use OAuth Server-to-Server (client credentials)
+        response = await client.post(
+            f"{self.IMS_URL}/ims/token/v3",
+            data={
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": "openid,AdobeID,user_management_sdk",
+            },
+            timeout=30.0,
+        )
+
+        if response.status_code != 200:
+            logger.error("Failed to get Adobe access token: status=%d", response.status_code)
+            raise ValueError(f"Adobe auth failed: {response.status_code}")
+
+        data = response.json()
+        self._access_token = data.get("access_token")
+        return self._access_token
 
     def _get_headers(self, access_token: str) -> dict[str, str]:
         """Get API request headers."""
@@ -86,15 +84,15 @@ class AdobeProvider(BaseProvider):
         """
         try:
             access_token = await self._get_access_token()
-            async with httpx.AsyncClient() as client:
-                # Test by getting organization info
-                response = await client.get(
-                    f"{self.BASE_URL}/organizations/{quote(self.org_id, safe='')}/users",
-                    headers=self._get_headers(access_token),
-                    params={"page": 0, "size": 1},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            # Test by getting organization info
+            response = await client.get(
+                f"{self.BASE_URL}/organizations/{quote(self.org_id, safe='')}/users",
+                headers=self._get_headers(access_token),
+                params={"page": 0, "size": 1},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.error("Adobe connection test failed: %s", e)
             return False
@@ -108,121 +106,119 @@ class AdobeProvider(BaseProvider):
         licenses = []
         access_token = await self._get_access_token()
 
-        async with httpx.AsyncClient() as client:
-            page = 0
-            while True:
-                response = await client.get(
-                    f"{self.BASE_URL}/organizations/{quote(self.org_id, safe='')}/users",
-                    headers=self._get_headers(access_token),
-                    params={"page": page, "size": 100},
-                    timeout=30.0,
-                )
+        client = self._get_http_client()
+        page = 0
+        while True:
+            response = await client.get(
+                f"{self.BASE_URL}/organizations/{quote(self.org_id, safe='')}/users",
+                headers=self._get_headers(access_token),
+                params={"page": page, "size": 100},
+                timeout=30.0,
+            )
 
-                if response.status_code != 200:
-                    logger.error("Failed to fetch Adobe users: status=%d", response.status_code)
-                    raise ValueError(f"Adobe API error: {response.status_code}")
-
-                data = response.json()
-                users = data.get("users", [])
-
-                if not users:
-                    break
-
-                for user in users:
-                    user_id = user.get("id", "")
-                    email = user.get("email", "").lower().strip()
-                    username = user.get("username", "")
-                    first_name = user.get("firstname", "")
-                    last_name = user.get("lastname", "")
-                    name = f"{first_name} {last_name}".strip() or username
-
-                    # Get user status
-                    user_status = user.get("status", "active")
-                    if user_status == "active":
-                        status = "active"
-                    elif user_status == "disabled":
-                        status = "inactive"
-                    else:
-                        status = "suspended"
-
-                    # Get product entitlements (licenses)
-                    groups = user.get("groups", [])
-                    products = []
-
-                    # Product configurations are in adminRoles or groups
-                    for group in groups:
-                        if isinstance(group, str):
-                            # Filter out admin groups, keep product groups
-                            if not group.startswith("_"):
-                                products.append(group)
-                        elif isinstance(group, dict):
-                            group_name = group.get("groupName", "")
-                            if group_name and not group_name.startswith("_"):
-                                products.append(group_name)
-
-                    # Determine license type from products
-                    if products:
-                        # Clean up product names
-                        clean_products = []
-                        for p in products:
-                            # Remove common prefixes/suffixes
-                            clean_name = p.replace("Default ", "")
-                            clean_name = clean_name.replace(" - Default Configuration", "")
-                            clean_products.append(clean_name)
-                        license_type = ", ".join(sorted(set(clean_products)))
-                    else:
-                        license_type = "Adobe ID Only"
-
-                    # Parse last login timestamp
-                    last_activity = None
-                    last_login = user.get("lastLogin")
-                    if last_login:
-                        try:
-                            last_activity = datetime.fromisoformat(
-                                last_login.replace("Z", "+00:00")
-                            )
-                        except (ValueError, AttributeError):
-                            pass
-
-                    # Use email as external_user_id if available
-                    if email:
-                        external_id = email
-                    elif name:
-                        external_id = f"{name} ({user_id})"
-                    else:
-                        external_id = user_id
-
-                    # Determine user type
-                    user_type = user.get("type", "federatedID")
-                    is_federated = user_type == "federatedID"
-                    is_enterprise = user_type == "enterpriseID"
-
-                    licenses.append(
-                        {
-                            "external_user_id": external_id,
+            if response.status_code != 200:
+                logger.error("Failed to fetch Adobe users: status=%d", response.status_code)
+                raise ValueError(f"Adobe API error: {response.status_code}")
+
+            data = response.json()
+            users = data.get("users", [])
+
+            if not users:
+                break
+
+            for user in users:
+                user_id = user.get("id", "")
+                email = user.get("email", "").lower().strip()
+                username = user.get("username", "")
+                first_name = user.get("firstname", "")
+                last_name = user.get("lastname", "")
+                name = f"{first_name} {last_name}".strip() or username
+
+                # Get user status
+                user_status = user.get("status", "active")
+                if user_status == "active":
+                    status = "active"
+                elif user_status == "disabled":
+                    status = "inactive"
+                else:
+                    status = "suspended"
+
+                # Get product entitlements (licenses)
+                groups = user.get("groups", [])
+                products = []
+
+                # Product configurations are in adminRoles or groups
+                for group in groups:
+                    if isinstance(group, str):
+                        # Filter out admin groups, keep product groups
+                        if not group.startswith("_"):
+                            products.append(group)
+                    elif isinstance(group, dict):
+                        group_name = group.get("groupName", "")
+                        if group_name and not group_name.startswith("_"):
+                            products.append(group_name)
+
+                # Determine license type from products
+                if products:
+                    # Clean up product names
+                    clean_products = []
+                    for p in products:
+                        # Remove common prefixes/suffixes
+                        clean_name = p.replace("Default ", "")
+                        clean_name = clean_name.replace(" - Default Configuration", "")
+                        clean_products.append(clean_name)
+                    license_type = ", ".join(sorted(set(clean_products)))
+                else:
+                    license_type = "Adobe ID Only"
+
+                # Parse last login timestamp
+                last_activity = None
+                last_login = user.get("lastLogin")
+                if last_login:
+                    try:
+                        last_activity = datetime.fromisoformat(last_login.replace("Z", "+00:00"))
+                    except (ValueError, AttributeError):
+                        pass
+
+                # Use email as external_user_id if available
+                if email:
+                    external_id = email
+                elif name:
+                    external_id = f"{name} ({user_id})"
+                else:
+                    external_id = user_id
+
+                # Determine user type
+                user_type = user.get("type", "federatedID")
+                is_federated = user_type == "federatedID"
+                is_enterprise = user_type == "enterpriseID"
+
+                licenses.append(
+                    {
+                        "external_user_id": external_id,
+                        "email": email,
+                        "license_type": license_type,
+                        "status": status,
+                        "last_activity_at": last_activity,
+                        "metadata": {
+                            "adobe_user_id": user_id,
                             "email": email,
-                            "license_type": license_type,
-                            "status": status,
-                            "last_activity_at": last_activity,
-                            "metadata": {
-                                "adobe_user_id": user_id,
-                                "email": email,
-                                "name": name,
-                                "username": username,
-                                "user_type": user_type,
-                                "is_federated": is_federated,
-                                "is_enterprise": is_enterprise,
-                                "products": products,
-                                "country": user.get("country"),
-                                "domain": user.get("domain"),
-                            },
-                        }
-                    )
-
-                # Check if there are more pages
-                if len(users) < 100:
-                    break
-                page += 1
+                            "name": name,
+                            "username": username,
+                            "user_type": user_type,
+                            "is_federated": is_federated,
+                            "is_enterprise": is_enterprise,
+                            "products": products,
+                            "country": user.get("country"),
+                            "domain": user.get("domain"),
+                        },
+                    }
+                )
+
+            # Check if there are more pages
+            if len(users) < 100:
+                break
+            page += 1
 
         logger.info("Fetched %d users from Adobe", len(licenses))
         return licenses
@@ -71,15 +71,15 @@ class AnthropicProvider(BaseProvider):
             True if connection is successful
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/organizations/users",
-                    headers=self._get_headers(),
-                    params={"limit": 1},
-                    timeout=10.0,
-                )
-                # 200 = success, 403 = valid key but no admin access
-                return response.status_code in [200, 403]
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/organizations/users",
+                headers=self._get_headers(),
+                params={"limit": 1},
+                timeout=10.0,
+            )
+            # 200 = success, 403 = valid key but no admin access
+            return response.status_code in [200, 403]
         except Exception as e:
             logger.error(f"Anthropic connection test failed: {e}")
             return False
@@ -177,96 +177,75 @@ class AnthropicProvider(BaseProvider):
         """
         licenses = []
 
-        async with httpx.AsyncClient() as client:
-            # Fetch organization users
-            try:
-                users = await self._fetch_all_users(client)
+        client = self._get_http_client()
+        # Fetch organization users
+        try:
+            users = await self._fetch_all_users(client)
+
+            for user in users:
+                role = user.get("role", "user")
+                license_type = self.ROLE_LICENSE_MAP.get(role, "User")
+
+                licenses.append(
+                    {
+                        "external_user_id": user.get("id"),
+                        "email": user.get("email"),
+                        "license_type": license_type,
+                        "status": "active",
+                        "assigned_at": self._parse_datetime(user.get("added_at")),
+                        "last_activity_at": None,
+                        "metadata": {
+                            "user_id": user.get("id"),
+                            "name": user.get("name"),
+                            "role": role,
+                        },
+                    }
+                )
 
-                for user in users:
-                    role = user.get("role", "user")
-                    license_type = self.ROLE_LICENSE_MAP.get(role, "User")
+            logger.info(f"Fetched {len(users)} users from Anthropic")
 
-                    licenses.append(
-                        {
-                            "external_user_id": user.get("id"),
-                            "email": user.get("email"),
-                            "license_type": license_type,
-                            "status": "active",
-                            "assigned_at": self._parse_datetime(user.get("added_at")),
-                            "last_activity_at": None,
-                            "metadata": {
-                                "user_id": user.get("id"),
-                                "name": user.get("name"),
-                                "role": role,
-                            },
-                        }
-                    )
+        except Exception as e:
+            logger.error(f"Error fetching Anthropic users: {e}")
 
-                logger.info(f"Fetched {len(users)} users from Anthropic")
-
-            except Exception as e:
-                logger.error(f"Error fetching Anthropic users: {e}")
-
-            # Fetch API keys
-            try:
-                api_keys = await self._fetch_all_api_keys(client)
-
-                for key in api_keys:
-                    key_id = key.get("id", "")
-                    key_name = key.get("name", "API Key")
-
-                    # Check if this key is associated with a user
-                    created_by = key.get("created_by", {})
-                    owner_id = created_by.get("id") if isinstance(created_by, dict) else None
-
-                    if owner_id:
-                        # Update existing license with API key info
-                        for lic in licenses:
-                            if lic["metadata"].get("user_id") == owner_id:
-                                if "api_keys" not in lic["metadata"]:
-                                    lic["metadata"]["api_keys"] = []
-                                lic["metadata"]["api_keys"].append(
-                                    {
-                                        "id": key_id,
-                                        "name": key_name,
-                                        "status": key.get("status", "active"),
-                                    }
-                                )
-                                break
-                        else:
-                            # Owner not in user list, add as separate entry
-                            if isinstance(created_by, dict):
-                                owner_email = created_by.get("email")
-                            else:
-                                owner_email = None
-                            key_status = key.get("status")
-                            licenses.append(
+        # Fetch API keys
+        try:
+            api_keys = await self._fetch_all_api_keys(client)
+
+            for key in api_keys:
+                key_id = key.get("id", "")
+                key_name = key.get("name", "API Key")
+
+                # Check if this key is associated with a user
+                created_by = key.get("created_by", {})
+                owner_id = created_by.get("id") if isinstance(created_by, dict) else None
+
+                if owner_id:
+                    # Update existing license with API key info
+                    for lic in licenses:
+                        if lic["metadata"].get("user_id") == owner_id:
+                            if "api_keys" not in lic["metadata"]:
+                                lic["metadata"]["api_keys"] = []
+                            lic["metadata"]["api_keys"].append(
                                 {
-                                    "external_user_id": f"api_key:{key_id}",
-                                    "email": owner_email,
-                                    "license_type": "API Key",
-                                    "status": "active" if key_status != "disabled" else "disabled",
-                                    "assigned_at": self._parse_datetime(key.get("created_at")),
-                                    "last_activity_at": self._parse_datetime(
-                                        key.get("last_used_at")
-                                    ),
-                                    "metadata": {
-                                        "key_id": key_id,
-                                        "key_name": key_name,
-                                        "partial_key_hint": key.get("partial_key_hint"),
-                                        "workspace_id": key.get("workspace_id"),
-                                    },
+                                    "id": key_id,
+                                    "name": key_name,
+                                    "status": key.get("status", "active"),
                                 }
                             )
+                            break
                     else:
-                        # Unassigned/service key
+                        # Owner not in user list, add as separate entry
+                        if isinstance(created_by, dict):
+                            owner_email = created_by.get("email")
+                        else:
+                            owner_email = None
+                        key_status = key.get("status")
                         licenses.append(
                             {
                                 "external_user_id": f"api_key:{key_id}",
+                                "email": owner_email,
                                 "license_type": "API Key",
-                                "status": "active"
-                                if key.get("status") != "disabled"
-                                else "disabled",
+                                "status": "active" if key_status != "disabled" else "disabled",
                                 "assigned_at": self._parse_datetime(key.get("created_at")),
                                 "last_activity_at": self._parse_datetime(key.get("last_used_at")),
                                 "metadata": {
@@ -277,11 +256,28 @@ class AnthropicProvider(BaseProvider):
                                 },
                             }
                         )
+                else:
+                    # Unassigned/service key
+                    licenses.append(
+                        {
+                            "external_user_id": f"api_key:{key_id}",
+                            "license_type": "API Key",
+                            "status": "active" if key.get("status") != "disabled" else "disabled",
+                            "assigned_at": self._parse_datetime(key.get("created_at")),
+                            "last_activity_at": self._parse_datetime(key.get("last_used_at")),
+                            "metadata": {
+                                "key_id": key_id,
+                                "key_name": key_name,
+                                "partial_key_hint": key.get("partial_key_hint"),
+                                "workspace_id": key.get("workspace_id"),
+                            },
+                        }
+                    )
 
-                logger.info(f"Processed {len(api_keys)} API keys from Anthropic")
+            logger.info(f"Processed {len(api_keys)} API keys from Anthropic")
 
-            except Exception as e:
-                logger.debug(f"API keys endpoint not available or error: {e}")
+        except Exception as e:
+            logger.debug(f"API keys endpoint not available or error: {e}")
 
         return licenses
 
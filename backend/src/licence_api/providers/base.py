@@ -1,8 +1,31 @@
 """Base provider interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
+import httpx
+
+from licence_api.providers.http import get_provider_client
+
+# Licenses per page when the list of fetch_licenses is consumed as pages
+LICENSE_PAGE_SIZE = 1000
+
+
+class ProviderRateLimitError(Exception):
+    """Raised when a provider API answers 429 Too Many Requests."""
+
+    def __init__(self, message: str, retry_after: float | None = None) -> None:
+        """Initialize error.
+
+        Args:
+            message: Error message
+            retry_after: Seconds to wait before retrying, from Retry-After
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
 
 class BaseProvider(ABC):
     """Abstract base class for provider integrations."""
@@ -15,6 +38,20 @@ class BaseProvider(ABC):
         """
         self.credentials = credentials
 
+    @property
+    def provider_type(self) -> str:
+        """Name under which this provider's HTTP requests are recorded."""
+        return type(self).__name__.removesuffix("Provider").lower()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client of this provider type.
+
+        The client pools connections with all other providers and applies the
+        shared timeout and retry policy (see providers/http.py). It stays open
+        between calls, so it must not be used as a context manager.
+        """
+        return get_provider_client(self.provider_type)
+
     @abstractmethod
     async def test_connection(self) -> bool:
         """Test the provider connection.
@@ -42,6 +79,30 @@ class BaseProvider(ABC):
         """
         pass
 
+    async def iter_licenses(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Iterate over the licenses/users of the provider page by page.
+
+        The sync matches and writes each page while the next one is fetched.
+        By default, the list returned by fetch_licenses is split into pages of
+        LICENSE_PAGE_SIZE. Providers with paged APIs override this to yield
+        each remote page as it arrives, and implement fetch_licenses with
+        collect_licenses.
+
+        Yields:
+            Lists of license data dicts (same keys as fetch_licenses)
+        """
+        licenses = await self.fetch_licenses()
+        for start in range(0, len(licenses), LICENSE_PAGE_SIZE):
+            yield licenses[start : start + LICENSE_PAGE_SIZE]
+
+    async def collect_licenses(self) -> list[dict[str, Any]]:
+        """Collect all pages of iter_licenses into one list.
+
+        Returns:
+            List of license data dicts
+        """
+        return [license async for page in self.iter_licenses() for license in page]
+
 
 class HRISProvider(BaseProvider):
     """Base class for HRIS providers like HiBob."""
@@ -62,6 +123,21 @@ class HRISProvider(BaseProvider):
         """
         pass
 
+    async def fetch_employees_changed_since(self, since: datetime) -> list[dict[str, Any]] | None:
+        """Fetch employees changed in the HRIS since a point in time.
+
+        Used by incremental syncs. HRIS providers without a change feed return
+        None, and the caller falls back to fetch_employees.
+
+        Args:
+            since: Only return employees changed after this time
+
+        Returns:
+            List of employee data dicts (same keys as fetch_employees),
+            or None if the HRIS cannot filter by change time
+        """
+        return None
+
     async def fetch_licenses(self) -> list[dict[str, Any]]:
         """HRIS providers don't have licenses."""
         return []
@@ -50,20 +50,20 @@ class CursorProvider(BaseProvider):
             raise ValueError("API key is required")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/teams/members",
-                    auth=self._get_auth(),
-                    timeout=10.0,
-                )
-                if response.status_code == 200:
-                    return True
-                elif response.status_code == 401:
-                    raise ValueError("Invalid API key")
-                elif response.status_code == 403:
-                    raise ValueError("Access forbidden - check API key permissions")
-                else:
-                    raise ValueError(f"API error: {response.status_code}")
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/teams/members",
+                auth=self._get_auth(),
+                timeout=10.0,
+            )
+            if response.status_code == 200:
+                return True
+            elif response.status_code == 401:
+                raise ValueError("Invalid API key")
+            elif response.status_code == 403:
+                raise ValueError("Access forbidden - check API key permissions")
+            else:
+                raise ValueError(f"API error: {response.status_code}")
         except httpx.RequestError as e:
             raise ValueError(f"Connection error: {str(e)}")
 
@@ -158,58 +158,58 @@ class CursorProvider(BaseProvider):
         licenses = []
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Fetch members
-                response = await client.get(
-                    f"{self.BASE_URL}/teams/members",
-                    auth=self._get_auth(),
-                    timeout=30.0,
+            client = self._get_http_client()
+            # Fetch members
+            response = await client.get(
+                f"{self.BASE_URL}/teams/members",
+                auth=self._get_auth(),
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            members_data = response.json()
+
+            # Fetch spend and usage data
+            spend_data = await self._fetch_spend_data(client)
+            usage_data = await self._fetch_usage_data(client)
+
+            for member in members_data.get("teamMembers", []):
+                email = member.get("email", "").lower()
+                role = member.get("role", "member")
+
+                # Determine license type based on role
+                if role == "unpaid admin":
+                    license_type = "Admin (Unpaid)"
+                    monthly_cost = Decimal("0.00")
+                elif role == "owner":
+                    license_type = "Owner"
+                    monthly_cost = Decimal("20.00")
+                else:
+                    license_type = "Pro"
+                    monthly_cost = Decimal("20.00")
+
+                # Get spend data for this user
+                user_spend = spend_data.get(email, {})
+                current_spend = user_spend.get("spend_usd", Decimal("0.00"))
+
+                # Get last activity
+                last_activity = usage_data.get(email)
+
+                licenses.append(
+                    {
+                        "external_user_id": email,
+                        "email": email,
+                        "license_type": license_type,
+                        "status": "active",
+                        "monthly_cost": monthly_cost,
+                        "currency": "USD",
+                        "last_activity_at": last_activity,
+                        "metadata": {
+                            "name": member.get("name"),
+                            "role": role,
+                            "current_spend_usd": str(current_spend),
+                        },
+                    }
                 )
-                response.raise_for_status()
-                members_data = response.json()
-
-                # Fetch spend and usage data
-                spend_data = await self._fetch_spend_data(client)
-                usage_data = await self._fetch_usage_data(client)
-
-                for member in members_data.get("teamMembers", []):
-                    email = member.get("email", "").lower()
-                    role = member.get("role", "member")
-
-                    # Determine license type based on role
-                    if role == "unpaid admin":
-                        license_type = "Admin (Unpaid)"
-                        monthly_cost = Decimal("0.00")
-                    elif role == "owner":
-                        license_type = "Owner"
-                        monthly_cost = Decimal("20.00")
-                    else:
-                        license_type = "Pro"
-                        monthly_cost = Decimal("20.00")
-
-                    # Get spend data for this user
-                    user_spend = spend_data.get(email, {})
-                    current_spend = user_spend.get("spend_usd", Decimal("0.00"))
-
-                    # Get last activity
-                    last_activity = usage_data.get(email)
-
-                    licenses.append(
-                        {
-                            "external_user_id": email,
-                            "email": email,
-                            "license_type": license_type,
-                            "status": "active",
-                            "monthly_cost": monthly_cost,
-                            "currency": "USD",
-                            "last_activity_at": last_activity,
-                            "metadata": {
-                                "name": member.get("name"),
-                                "role": role,
-                                "current_spend_usd": str(current_spend),
-                            },
-                        }
-                    )
         except Exception:
             pass
 
@@ -265,28 +265,28 @@ class CursorProvider(BaseProvider):
             raise ValueError("API key is required")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.BASE_URL}/teams/remove-member",
-                    auth=self._get_auth(),
-                    json={"email": email},
-                    timeout=30.0,
-                )
+            client = self._get_http_client()
+            response = await client.post(
+                f"{self.BASE_URL}/teams/remove-member",
+                auth=self._get_auth(),
+                json={"email": email},
+                timeout=30.0,
+            )
 
-                if response.status_code == 200:
-                    return {
-                        "success": True,
-                        "message": f"Successfully removed {email} from Cursor team",
-                    }
-                elif response.status_code == 401:
-                    raise ValueError("Invalid API key")
-                elif response.status_code == 403:
-                    raise ValueError("Enterprise feature not available or insufficient permissions")
-                elif response.status_code == 404:
-                    raise ValueError(f"Member {email} not found in team")
-                else:
-                    error_msg = response.text or f"API error: {response.status_code}"
-                    raise ValueError(error_msg)
+            if response.status_code == 200:
+                return {
+                    "success": True,
+                    "message": f"Successfully removed {email} from Cursor team",
+                }
+            elif response.status_code == 401:
+                raise ValueError("Invalid API key")
+            elif response.status_code == 403:
+                raise ValueError("Enterprise feature not available or insufficient permissions")
+            elif response.status_code == 404:
+                raise ValueError(f"Member {email} not found in team")
+            else:
+                error_msg = response.text or f"API error: {response.status_code}"
+                raise ValueError(error_msg)
 
         except httpx.RequestError as e:
             raise ValueError(f"Connection error: {str(e)}")
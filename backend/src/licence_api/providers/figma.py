@@ -67,15 +67,15 @@ class FigmaProvider(BaseProvider):
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Try to fetch users with count=1 to test connection
-                response = await client.get(
-                    f"{self.base_url}/Users",
-                    headers=self._get_headers(),
-                    params={"count": 1},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            # Try to fetch users with count=1 to test connection
+            response = await client.get(
+                f"{self.base_url}/Users",
+                headers=self._get_headers(),
+                params={"count": 1},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -89,94 +89,94 @@ class FigmaProvider(BaseProvider):
         start_index = 1  # SCIM uses 1-based indexing
         page_size = 100
 
-        async with httpx.AsyncClient() as client:
-            while True:
-                response = await client.get(
-                    f"{self.base_url}/Users",
-                    headers=self._get_headers(),
-                    params={
-                        "startIndex": start_index,
-                        "count": page_size,
-                    },
-                    timeout=30.0,
+        client = self._get_http_client()
+        while True:
+            response = await client.get(
+                f"{self.base_url}/Users",
+                headers=self._get_headers(),
+                params={
+                    "startIndex": start_index,
+                    "count": page_size,
+                },
+                timeout=30.0,
+            )
+            if response.status_code != 200:
+                error_detail = response.text
+                raise httpx.HTTPStatusError(
+                    f"Figma SCIM API error: {response.status_code} - {error_detail}",
+                    request=response.request,
+                    response=response,
                 )
-                if response.status_code != 200:
-                    error_detail = response.text
-                    raise httpx.HTTPStatusError(
-                        f"Figma SCIM API error: {response.status_code} - {error_detail}",
-                        request=response.request,
-                        response=response,
-                    )
-                data = response.json()
-
-                resources = data.get("Resources", [])
-                if not resources:
-                    break
-
-                for user in resources:
-                    # Extract email from userName or emails array
-                    email = user.get("userName", "")
-                    if not email:
-                        emails = user.get("emails", [])
-                        for email_obj in emails:
-                            if email_obj.get("primary"):
-                                email = email_obj.get("value", "")
-                                break
-                        if not email and emails:
-                            email = emails[0].get("value", "")
-
-                    # Determine seat type from roles array
-                    # Note: roles/seatType is only available on Figma Enterprise plans
-                    seat_type = None
-                    roles = user.get("roles", [])
-                    for role in roles:
-                        if role.get("type") == "seatType":
-                            seat_type = role.get("value", "").lower()
+            data = response.json()
+
+            resources = data.get("Resources", [])
+            if not resources:
+                break
+
+            for user in resources:
+                # Extract email from userName or emails array
+                email = user.get("userName", "")
+                if not email:
+                    emails = user.get("emails", [])
+                    for email_obj in emails:
+                        if email_obj.get("primary"):
+                            email = email_obj.get("value", "")
                             break
+                    if not email and emails:
+                        email = emails[0].get("value", "")
+
+                # Determine seat type from roles array
+                # Note: roles/seatType is only available on Figma Enterprise plans
+                seat_type = None
+                roles = user.get("roles", [])
+                for role in roles:
+                    if role.get("type") == "seatType":
+                        seat_type = role.get("value", "").lower()
+                        break
+
+                # Map seat type to license type
+                if seat_type:
+                    license_type = SEAT_TYPE_MAP.get(seat_type, f"Figma {seat_type.title()}")
+                else:
+                    # No seat type available (Business plan) - default to Viewer
+                    # Admins can manually adjust license types in the UI
+                    license_type = "Figma Viewer"
+
+                # Build display name
+                display_name = user.get("displayName", "")
+                if not display_name:
+                    name_obj = user.get("name", {})
+                    given = name_obj.get("givenName", "")
+                    family = name_obj.get("familyName", "")
+                    display_name = f"{given} {family}".strip()
+
+                # Extract enterprise extension data
+                enterprise_ext = user.get(
+                    "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User", {}
+                )
+
+                licenses.append(
+                    {
+                        "external_user_id": user.get("id"),
+                        "email": email.lower() if email else "",
+                        "license_type": license_type,
+                        "status": "active" if user.get("active", True) else "inactive",
+                        "metadata": {
+                            "name": display_name,
+                            "seat_type": seat_type,
+                            "figma_admin": user.get("figmaAdmin", False),
+                            "department": enterprise_ext.get("department")
+                            or user.get("department"),
+                            "title": user.get("title"),
+                        },
+                    }
+                )
+
+            # Check if we've fetched all users
+            total_results = data.get("totalResults", 0)
+            if start_index + len(resources) > total_results:
+                break
 
-                    # Map seat type to license type
-                    if seat_type:
-                        license_type = SEAT_TYPE_MAP.get(seat_type, f"Figma {seat_type.title()}")
-                    else:
-                        # No seat type available (Business plan) - default to Viewer
-                        # Admins can manually adjust license types in the UI
-                        license_type = "Figma Viewer"
-
-                    # Build display name
-                    display_name = user.get("displayName", "")
-                    if not display_name:
-                        name_obj = user.get("name", {})
-                        given = name_obj.get("givenName", "")
-                        family = name_obj.get("familyName", "")
-                        display_name = f"{given} {family}".strip()
-
-                    # Extract enterprise extension data
-                    enterprise_ext = user.get(
-                        "urn:ietf:params:scim:schemas:extension:enterprise:2.0:User", {}
-                    )
-
-                    licenses.append(
-                        {
-                            "external_user_id": user.get("id"),
-                            "email": email.lower() if email else "",
-                            "license_type": license_type,
-                            "status": "active" if user.get("active", True) else "inactive",
-                            "metadata": {
-                                "name": display_name,
-                                "seat_type": seat_type,
-                                "figma_admin": user.get("figmaAdmin", False),
-                                "department": enterprise_ext.get("department")
-                                or user.get("department"),
-                                "title": user.get("title"),
-                            },
-                        }
-                    )
-
-                # Check if we've fetched all users
-                total_results = data.get("totalResults", 0)
-                if start_index + len(resources) > total_results:
-                    break
-
-                start_index += page_size
+            start_index += page_size
 
         return licenses
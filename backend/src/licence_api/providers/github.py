@@ -1,13 +1,66 @@
 """GitHub provider integration."""
 
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 from urllib.parse import quote
 
-import httpx
-
 from licence_api.providers.base import BaseProvider
 
+logger = logging.getLogger(__name__)
+
+# Members per GraphQL page (GitHub's maximum)
+GRAPHQL_PAGE_SIZE = 100
+
+MEMBERS_QUERY = """
+query($org: String!, $first: Int!, $after: String) {
+  organization(login: $org) {
+    membersWithRole(first: $first, after: $after) {
+      pageInfo { hasNextPage endCursor }
+      edges {
+        role
+        hasTwoFactorEnabled
+        node {
+          login
+          databaseId
+          name
+          email
+          avatarUrl
+          company
+          location
+          createdAt
+          updatedAt
+        }
+      }
+    }
+  }
+}
+"""
+
+# REST fallback: user detail requests in flight at the same time
+REST_ENRICHMENT_CONCURRENCY = 8
+# REST fallback: pause enrichment when fewer requests than this remain in the
+# rate limit window, and wait at most this long for the window to reset
+RATE_LIMIT_RESERVE = 50
+MAX_RATE_LIMIT_WAIT_SECONDS = 60.0
+
+# Last /users/{login} responses with their ETags, kept across syncs. A
+# conditional request for a user whose updated_at did not change answers 304,
+# which GitHub does not count against the rate limit.
+USER_CACHE_MAX_ENTRIES = 20000
+_user_cache: "OrderedDict[str, tuple[str, dict[str, Any]]]" = OrderedDict()
+
+
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse a GitHub ISO 8601 timestamp."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
 
 class GitHubProvider(BaseProvider):
     """GitHub organization member integration."""
@@ -25,6 +78,8 @@ class GitHubProvider(BaseProvider):
         super().__init__(credentials)
         self.access_token = credentials.get("access_token")
         self.org_name = credentials.get("org_name")
+        # Monotonic time until which REST requests wait for the rate limit reset
+        self._rate_limited_until = 0.0
 
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with authentication."""
@@ -41,13 +96,13 @@ class GitHubProvider(BaseProvider):
             True if connection is successful
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/orgs/{quote(self.org_name, safe='')}",
-                    headers=self._get_headers(),
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/orgs/{quote(self.org_name, safe='')}",
+                headers=self._get_headers(),
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -57,94 +112,266 @@ class GitHubProvider(BaseProvider):
         Returns:
             List of license data dicts
         """
-        licenses = []
-        page = 1
-        per_page = 100
-
-        async with httpx.AsyncClient() as client:
-            # Fetch organization members
-            while True:
-                response = await client.get(
-                    f"{self.BASE_URL}/orgs/{quote(self.org_name, safe='')}/members",
-                    headers=self._get_headers(),
-                    params={"per_page": per_page, "page": page},
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                members = response.json()
+        return await self.collect_licenses()
 
-                if not members:
-                    break
+    async def iter_licenses(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Iterate over the organization members page by page.
 
-                # Fetch detailed user info for each member
-                for member in members:
-                    username = member.get("login")
+        Members, their roles and profile data are fetched with a GraphQL bulk
+        query in pages of 100. If GraphQL is not available for the token, the
+        REST API is used instead (see _fetch_members_rest) and its members are
+        yielded as one page.
 
-                    # Get user details including email
-                    user_response = await client.get(
-                        f"{self.BASE_URL}/users/{quote(username, safe='')}",
-                        headers=self._get_headers(),
-                        timeout=10.0,
-                    )
+        Yields:
+            Lists of license data dicts
+        """
+        yielded = False
+        try:
+            async for page in self._iter_members_graphql():
+                yielded = True
+                yield page
+        except Exception as e:
+            # Members of the pages already yielded may have been synced
+            if yielded:
+                raise
+            logger.warning("GitHub GraphQL member query failed, using REST API: %s", e)
+            yield await self._fetch_members_rest()
 
-                    user_data = {}
-                    if user_response.status_code == 200:
-                        user_data = user_response.json()
+    def _build_license(
+        self,
+        username: str,
+        role: str,
+        user_data: dict[str, Any],
+        github_id: int | None,
+        avatar_url: str | None,
+        two_factor_enabled: bool | None,
+    ) -> dict[str, Any]:
+        """Build a license dict for an organization member.
 
-                    # Get membership details
-                    membership_response = await client.get(
-                        f"{self.BASE_URL}/orgs/{quote(self.org_name, safe='')}/memberships/{quote(username, safe='')}",
-                        headers=self._get_headers(),
-                        timeout=10.0,
-                    )
+        Args:
+            username: GitHub login
+            role: Organization role ("admin" or "member")
+            user_data: User profile with REST field names
+            github_id: Numeric GitHub user ID
+            avatar_url: Avatar URL
+            two_factor_enabled: 2FA status, if visible to the token
+
+        Returns:
+            License data dict
+        """
+        license_type = "GitHub Organization Member"
+        if role == "admin":
+            license_type = "GitHub Organization Admin"
+
+        # Use email if available, otherwise use username
+        email = user_data.get("email") or f"{username}@github.com"
+
+        return {
+            "external_user_id": username,
+            "email": email.lower() if email else None,
+            "license_type": license_type,
+            "status": "active",
+            "assigned_at": _parse_timestamp(user_data.get("created_at")),
+            "last_activity_at": _parse_timestamp(user_data.get("updated_at")),
+            "metadata": {
+                "github_id": github_id,
+                "username": username,
+                "name": user_data.get("name"),
+                "avatar_url": avatar_url,
+                "role": role,
+                "two_factor_enabled": two_factor_enabled,
+                "company": user_data.get("company"),
+                "location": user_data.get("location"),
+            },
+        }
 
-                    role = "member"
-                    if membership_response.status_code == 200:
-                        membership_data = membership_response.json()
-                        role = membership_data.get("role", "member")
-
-                    # Determine license type based on role
-                    license_type = "GitHub Organization Member"
-                    if role == "admin":
-                        license_type = "GitHub Organization Admin"
-
-                    # Parse dates
-                    created_at = None
-                    if user_data.get("created_at"):
-                        created_at = datetime.fromisoformat(
-                            user_data["created_at"].replace("Z", "+00:00")
-                        )
-
-                    updated_at = None
-                    if user_data.get("updated_at"):
-                        updated_at = datetime.fromisoformat(
-                            user_data["updated_at"].replace("Z", "+00:00")
-                        )
-
-                    # Use email if available, otherwise use username
-                    email = user_data.get("email") or f"{username}@github.com"
-
-                    licenses.append(
-                        {
-                            "external_user_id": username,
-                            "email": email.lower() if email else None,
-                            "license_type": license_type,
-                            "status": "active",
-                            "assigned_at": created_at,
-                            "last_activity_at": updated_at,
-                            "metadata": {
-                                "github_id": member.get("id"),
-                                "username": username,
-                                "name": user_data.get("name"),
-                                "avatar_url": member.get("avatar_url"),
-                                "role": role,
-                                "two_factor_enabled": member.get("two_factor_authentication"),
-                                "company": user_data.get("company"),
-                                "location": user_data.get("location"),
-                            },
-                        }
+    async def _iter_members_graphql(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Iterate over the organization member pages of the GraphQL API.
+
+        Yields:
+            Lists of license data dicts
+
+        Raises:
+            httpx.HTTPStatusError: On HTTP errors
+            ValueError: If the query returns errors
+        """
+        cursor = None
+        client = self._get_http_client()
+
+        while True:
+            response = await client.post(
+                f"{self.BASE_URL}/graphql",
+                headers=self._get_headers(),
+                json={
+                    "query": MEMBERS_QUERY,
+                    "variables": {
+                        "org": self.org_name,
+                        "first": GRAPHQL_PAGE_SIZE,
+                        "after": cursor,
+                    },
+                },
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            body = response.json()
+            organization = (body.get("data") or {}).get("organization")
+            if body.get("errors") or organization is None:
+                messages = [error.get("message") for error in body.get("errors") or []]
+                raise ValueError(f"GitHub GraphQL query failed: {messages}")
+
+            members = organization["membersWithRole"]
+            licenses = []
+            for edge in members["edges"]:
+                node = edge["node"]
+                user_data = {
+                    "name": node.get("name"),
+                    # GraphQL returns "" for users without a public email
+                    "email": node.get("email") or None,
+                    "company": node.get("company"),
+                    "location": node.get("location"),
+                    "created_at": node.get("createdAt"),
+                    "updated_at": node.get("updatedAt"),
+                }
+                licenses.append(
+                    self._build_license(
+                        node["login"],
+                        "admin" if edge.get("role") == "ADMIN" else "member",
+                        user_data,
+                        github_id=node.get("databaseId"),
+                        avatar_url=node.get("avatarUrl"),
+                        two_factor_enabled=edge.get("hasTwoFactorEnabled"),
                     )
+                )
+            yield licenses
+
+            if not members["pageInfo"]["hasNextPage"]:
+                break
+            cursor = members["pageInfo"]["endCursor"]
+
+    async def _list_members_rest(self, role: str = "all") -> list[dict[str, Any]]:
+        """List organization members with the REST API.
 
-                page += 1
+        Args:
+            role: Member role filter ("all" or "admin")
+
+        Returns:
+            Member summaries
+        """
+        members: list[dict[str, Any]] = []
+        page = 1
+        client = self._get_http_client()
+
+        while True:
+            response = await client.get(
+                f"{self.BASE_URL}/orgs/{quote(self.org_name, safe='')}/members",
+                headers=self._get_headers(),
+                params={"per_page": 100, "page": page, "role": role},
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            page_members = response.json()
+            if not page_members:
+                break
+            members.extend(page_members)
+            page += 1
+
+        return members
+
+    async def _fetch_members_rest(self) -> list[dict[str, Any]]:
+        """Fetch organization members with the REST API.
+
+        Roles come from one listing of the admins instead of a membership
+        request per member. User details are fetched with bounded concurrency
+        and conditional requests against the user cache.
+
+        Returns:
+            List of license data dicts
+        """
+        members = await self._list_members_rest()
+        admins = {member.get("login") for member in await self._list_members_rest("admin")}
+
+        semaphore = asyncio.Semaphore(REST_ENRICHMENT_CONCURRENCY)
+
+        async def enrich(member: dict[str, Any]) -> dict[str, Any]:
+            username = member.get("login")
+            async with semaphore:
+                user_data = await self._fetch_user(username)
+            return self._build_license(
+                username,
+                "admin" if username in admins else "member",
+                user_data,
+                github_id=member.get("id"),
+                avatar_url=member.get("avatar_url"),
+                two_factor_enabled=member.get("two_factor_authentication"),
+            )
+
+        return list(await asyncio.gather(*(enrich(member) for member in members)))
+
+    async def _fetch_user(self, username: str) -> dict[str, Any]:
+        """Fetch a user's profile, reusing the cached one if it did not change.
+
+        Args:
+            username: GitHub login
+
+        Returns:
+            User profile, or an empty dict if it could not be fetched
+        """
+        await self._wait_for_rate_limit()
+
+        cached = _user_cache.get(username)
+        headers = self._get_headers()
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        client = self._get_http_client()
+        response = await client.get(
+            f"{self.BASE_URL}/users/{quote(username, safe='')}",
+            headers=headers,
+            timeout=10.0,
+        )
+        self._record_rate_limit(response.headers)
+
+        if response.status_code == 304 and cached is not None:
+            _user_cache.move_to_end(username)
+            return cached[1]
+        if response.status_code != 200:
+            return cached[1] if cached is not None else {}
+
+        user_data = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            _user_cache[username] = (etag, user_data)
+            _user_cache.move_to_end(username)
+            while len(_user_cache) > USER_CACHE_MAX_ENTRIES:
+                _user_cache.popitem(last=False)
+        return user_data
+
+    def _record_rate_limit(self, headers: Any) -> None:
+        """Pause REST enrichment when the rate limit window is nearly used up.
+
+        Args:
+            headers: Response headers with X-RateLimit-Remaining/-Reset
+        """
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset = headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            if int(remaining) >= RATE_LIMIT_RESERVE:
+                return
+            wait = float(reset) - time.time()
+        except ValueError:
+            return
+        if wait > MAX_RATE_LIMIT_WAIT_SECONDS:
+            logger.warning(
+                "GitHub rate limit nearly exhausted; resets in %.0fs, continuing without waiting",
+                wait,
+            )
+            return
+        self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + wait)
 
-        return licenses
+    async def _wait_for_rate_limit(self) -> None:
+        """Wait until the rate limit window reset, if enrichment was paused."""
+        delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -5,8 +5,6 @@ from datetime import datetime
 from typing import Any
 from urllib.parse import quote, urljoin
 
-import httpx
-
 from licence_api.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
@@ -55,25 +53,25 @@ class GitLabProvider(BaseProvider):
     async def test_connection(self) -> bool:
         """Test GitLab API connection."""
         try:
-            async with httpx.AsyncClient() as client:
-                if self.is_self_hosted:
-                    # Test with users endpoint for self-hosted
-                    response = await client.get(
-                        f"{self.base_url}/users",
-                        headers=self._get_headers(),
-                        params={"per_page": 1},
-                        timeout=10.0,
-                    )
-                else:
-                    # Test with group endpoint for gitlab.com
-                    if not self.group_id:
-                        return False
-                    response = await client.get(
-                        f"{self.base_url}/groups/{quote(str(self.group_id), safe='')}",
-                        headers=self._get_headers(),
-                        timeout=10.0,
-                    )
-                return response.status_code == 200
+            client = self._get_http_client()
+            if self.is_self_hosted:
+                # Test with users endpoint for self-hosted
+                response = await client.get(
+                    f"{self.base_url}/users",
+                    headers=self._get_headers(),
+                    params={"per_page": 1},
+                    timeout=10.0,
+                )
+            else:
+                # Test with group endpoint for gitlab.com
+                if not self.group_id:
+                    return False
+                response = await client.get(
+                    f"{self.base_url}/groups/{quote(str(self.group_id), safe='')}",
+                    headers=self._get_headers(),
+                    timeout=10.0,
+                )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -94,100 +92,100 @@ class GitLabProvider(BaseProvider):
         page = 1
         per_page = 100
 
-        async with httpx.AsyncClient() as client:
-            while True:
-                response = await client.get(
-                    f"{self.base_url}/users",
-                    headers=self._get_headers(),
-                    params={"per_page": per_page, "page": page},
-                    timeout=30.0,
-                )
+        client = self._get_http_client()
+        while True:
+            response = await client.get(
+                f"{self.base_url}/users",
+                headers=self._get_headers(),
+                params={"per_page": per_page, "page": page},
+                timeout=30.0,
+            )
 
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch users page {page}: {response.status_code}")
-                    break
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch users page {page}: {response.status_code}")
+                break
 
-                users = response.json()
-                if not users:
-                    break
+            users = response.json()
+            if not users:
+                break
 
-                for user in users:
-                    user_id = user.get("id")
-                    username = user.get("username", "")
-                    state = user.get("state", "active")
-                    is_bot = user.get("bot", False)
-                    name = user.get("name", "")
+            for user in users:
+                user_id = user.get("id")
+                username = user.get("username", "")
+                state = user.get("state", "active")
+                is_bot = user.get("bot", False)
+                name = user.get("name", "")
 
-                    # Skip bot accounts
-                    if is_bot:
-                        continue
+                # Skip bot accounts
+                if is_bot:
+                    continue
 
-                    # Skip placeholder users (created during imports)
-                    if "_placeholder_" in username.lower() or name.startswith("Placeholder"):
-                        continue
+                # Skip placeholder users (created during imports)
+                if "_placeholder_" in username.lower() or name.startswith("Placeholder"):
+                    continue
 
-                    # Get email
-                    email = (
-                        user.get("email") or user.get("commit_email") or user.get("public_email")
-                    )
+                # Get email
+                email = (
+                    user.get("email") or user.get("commit_email") or user.get("public_email")
+                )
 
-                    # Determine status
-                    status = "active" if state == "active" else "suspended"
-
-                    # Parse dates
-                    created_at = None
-                    if user.get("created_at"):
-                        try:
-                            created_at = datetime.fromisoformat(
-                                user["created_at"].replace("Z", "+00:00")
-                            )
-                        except Exception:
-                            pass
-
-                    last_activity = None
-                    if user.get("last_activity_on"):
-                        try:
-                            last_activity = datetime.fromisoformat(
-                                f"{user['last_activity_on']}T00:00:00+00:00"
-                            )
-                        except Exception:
-                            pass
-
-                    # Use email for HRIS matching, fall back to username
-                    external_id = email.lower() if email else username
-
-                    # Determine license type based on admin status
-                    is_admin = user.get("is_admin", False)
-                    license_type = "GitLab Admin" if is_admin else "GitLab User"
-
-                    licenses.append(
-                        {
-                            "external_user_id": external_id,
-                            "email": email.lower() if email else None,
-                            "license_type": license_type,
-                            "status": status,
-                            "assigned_at": created_at,
-                            "last_activity_at": last_activity,
-                            "metadata": {
-                                "gitlab_id": user_id,
-                                "username": username,
-                                "name": user.get("name"),
-                                "avatar_url": user.get("avatar_url"),
-                                "state": state,
-                                "web_url": user.get("web_url"),
-                                "is_admin": is_admin,
-                                "is_using_seat": user.get("using_license_seat", True),
-                                "two_factor_enabled": user.get("two_factor_enabled", False),
-                            },
-                        }
-                    )
+                # Determine status
+                status = "active" if state == "active" else "suspended"
+
+                # Parse dates
+                created_at = None
+                if user.get("created_at"):
+                    try:
+                        created_at = datetime.fromisoformat(
+                            user["created_at"].replace("Z", "+00:00")
+                        )
+                    except Exception:
+                        pass
+
+                last_activity = None
+                if user.get("last_activity_on"):
+                    try:
+                        last_activity = datetime.fromisoformat(
+                            f"{user['last_activity_on']}T00:00:00+00:00"
+                        )
+                    except Exception:
+                        pass
+
+                # Use email for HRIS matching, fall back to username
+                external_id = email.lower() if email else username
+
+                # Determine license type based on admin status
+                is_admin = user.get("is_admin", False)
+                license_type = "GitLab Admin" if is_admin else "GitLab User"
+
+                licenses.append(
+                    {
+                        "external_user_id": external_id,
+                        "email": email.lower() if email else None,
+                        "license_type": license_type,
+                        "status": status,
+                        "assigned_at": created_at,
+                        "last_activity_at": last_activity,
+                        "metadata": {
+                            "gitlab_id": user_id,
+                            "username": username,
+                            "name": user.get("name"),
+                            "avatar_url": user.get("avatar_url"),
+                            "state": state,
+                            "web_url": user.get("web_url"),
+                            "is_admin": is_admin,
+                            "is_using_seat": user.get("using_license_seat", True),
+                            "two_factor_enabled": user.get("two_factor_enabled", False),
+                        },
+                    }
+                )
 
-                logger.info(f"Fetched page {page} with {len(users)} users")
+            logger.info(f"Fetched page {page} with {len(users)} users")
 
-                if len(users) < per_page:
-                    break
+            if len(users) < per_page:
+                break
 
-                page += 1
+            page += 1
 
         logger.info(f"Total GitLab users fetched: {len(licenses)}")
         return licenses
@@ -202,98 +200,98 @@ class GitLabProvider(BaseProvider):
         page = 1
         per_page = 100
 
-        async with httpx.AsyncClient() as client:
-            while True:
-                response = await client.get(
-                    f"{self.base_url}/groups/{quote(str(self.group_id), safe='')}/members/all",
-                    headers=self._get_headers(),
-                    params={"per_page": per_page, "page": page},
-                    timeout=30.0,
-                )
+        client = self._get_http_client()
+        while True:
+            response = await client.get(
+                f"{self.base_url}/groups/{quote(str(self.group_id), safe='')}/members/all",
+                headers=self._get_headers(),
+                params={"per_page": per_page, "page": page},
+                timeout=30.0,
+            )
 
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch members page {page}: {response.status_code}")
-                    break
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch members page {page}: {response.status_code}")
+                break
 
-                members = response.json()
-                if not members:
-                    break
+            members = response.json()
+            if not members:
+                break
 
-                for member in members:
-                    username = member.get("username")
-                    user_id = member.get("id")
+            for member in members:
+                username = member.get("username")
+                user_id = member.get("id")
 
-                    # Get detailed user info for email
-                    user_data = {}
+                # Get detailed user info for email
+                user_data = {}
+                try:
+                    user_response = await client.get(
+                        f"{self.base_url}/users/{quote(str(user_id), safe='')}",
+                        headers=self._get_headers(),
+                        timeout=10.0,
+                    )
+                    if user_response.status_code == 200:
+                        user_data = user_response.json()
+                except Exception as e:
+                    logger.debug(f"Could not fetch user {user_id}: {e}")
+
+                access_level = member.get("access_level", 0)
+                license_type = self._get_license_type(access_level)
+
+                state = member.get("state", "active")
+                status = "active" if state == "active" else "suspended"
+
+                created_at = None
+                if user_data.get("created_at"):
                     try:
-                        user_response = await client.get(
-                            f"{self.base_url}/users/{quote(str(user_id), safe='')}",
-                            headers=self._get_headers(),
-                            timeout=10.0,
+                        created_at = datetime.fromisoformat(
+                            user_data["created_at"].replace("Z", "+00:00")
                         )
-                        if user_response.status_code == 200:
-                            user_data = user_response.json()
-                    except Exception as e:
-                        logger.debug(f"Could not fetch user {user_id}: {e}")
-
-                    access_level = member.get("access_level", 0)
-                    license_type = self._get_license_type(access_level)
-
-                    state = member.get("state", "active")
-                    status = "active" if state == "active" else "suspended"
-
-                    created_at = None
-                    if user_data.get("created_at"):
-                        try:
-                            created_at = datetime.fromisoformat(
-                                user_data["created_at"].replace("Z", "+00:00")
-                            )
-                        except Exception:
-                            pass
-
-                    last_activity = None
-                    if user_data.get("last_activity_on"):
-                        try:
-                            last_activity = datetime.fromisoformat(
-                                f"{user_data['last_activity_on']}T00:00:00+00:00"
-                            )
-                        except Exception:
-                            pass
-
-                    email = (
-                        user_data.get("email")
-                        or user_data.get("commit_email")
-                        or user_data.get("public_email")
-                        or member.get("email")
-                    )
+                    except Exception:
+                        pass
 
-                    external_id = email.lower() if email else username
-
-                    licenses.append(
-                        {
-                            "external_user_id": external_id,
-                            "email": email.lower() if email else None,
-                            "license_type": license_type,
-                            "status": status,
-                            "assigned_at": created_at,
-                            "last_activity_at": last_activity,
-                            "metadata": {
-                                "gitlab_id": user_id,
-                                "username": username,
-                                "name": member.get("name"),
-                                "avatar_url": member.get("avatar_url"),
-                                "access_level": access_level,
-                                "access_level_name": self._get_access_level_name(access_level),
-                                "state": state,
-                                "web_url": member.get("web_url"),
-                            },
-                        }
-                    )
+                last_activity = None
+                if user_data.get("last_activity_on"):
+                    try:
+                        last_activity = datetime.fromisoformat(
+                            f"{user_data['last_activity_on']}T00:00:00+00:00"
+                        )
+                    except Exception:
+                        pass
+
+                email = (
+                    user_data.get("email")
+                    or user_data.get("commit_email")
+                    or user_data.get("public_email")
+                    or member.get("email")
+                )
+
+                external_id = email.lower() if email else username
+
+                licenses.append(
+                    {
+                        "external_user_id": external_id,
+                        "email": email.lower() if email else None,
+                        "license_type": license_type,
+                        "status": status,
+                        "assigned_at": created_at,
+                        "last_activity_at": last_activity,
+                        "metadata": {
+                            "gitlab_id": user_id,
+                            "username": username,
+                            "name": member.get("name"),
+                            "avatar_url": member.get("avatar_url"),
+                            "access_level": access_level,
+                            "access_level_name": self._get_access_level_name(access_level),
+                            "state": state,
+                            "web_url": member.get("web_url"),
+                        },
+                    }
+                )
 
-                if len(members) < per_page:
-                    break
+            if len(members) < per_page:
+                break
 
-                page += 1
+            page += 1
 
         logger.info(f"Total GitLab members fetched: {len(licenses)}")
         return licenses
@@ -1,9 +1,11 @@
 """Google Workspace provider integration."""
 
+import asyncio
 import json
 import logging
 import time
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import Any
 
@@ -103,6 +105,20 @@ GOOGLE_WORKSPACE_SKUS: dict[str, str] = {
     "1010360001": "Google Meet Global Dialing",
 }
 
+# Licensing API products queried at the same time
+LICENSING_CONCURRENCY = 4
+
+# Directory API user fields kept for enrichment (see _build_license_entry)
+DIRECTORY_USER_FIELDS = (
+    "suspended",
+    "lastLoginTime",
+    "creationTime",
+    "name",
+    "orgUnitPath",
+    "isAdmin",
+)
+
+
 class GoogleWorkspaceProvider(BaseProvider):
     """Google Workspace integration for user licenses."""
 
@@ -144,20 +160,20 @@ class GoogleWorkspaceProvider(BaseProvider):
     async def _refresh_oauth_token(self) -> str:
         """Get access token by refreshing OAuth2 token."""
         settings = get_settings()
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "grant_type": "refresh_token",
-                    "refresh_token": self.refresh_token,
-                    "client_id": settings.google_client_id,
-                    "client_secret": settings.google_client_secret,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            self._access_token = data["access_token"]
-            return self._access_token
+        client = self._get_http_client()
+        response = await client.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token,
+                "client_id": settings.google_client_id,
+                "client_secret": settings.google_client_secret,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        self._access_token = data["access_token"]
+        return self._access_token
 
     async def _get_service_account_token(self) -> str:
         """Get access token using service account JWT."""
@@ -180,44 +196,42 @@ class GoogleWorkspaceProvider(BaseProvider):
             algorithm="RS256",
         )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://oauth2.googleapis.com/token",
-                data={
-                    "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
-                    "assertion": signed_jwt,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-            self._access_token = data["access_token"]
-            return self._access_token
+        client = self._get_http_client()
+        response = await client.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "grant_type": "urn:ietf:params:oauth:grant-type:jwt-bearer",
+                "assertion": signed_jwt,
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+        self._access_token = data["access_token"]
+        return self._access_token
 
     async def test_connection(self) -> bool:
         """Test Google Workspace API connection."""
         try:
             token = await self._get_access_token()
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://admin.googleapis.com/admin/directory/v1/users",
-                    headers={"Authorization": f"Bearer {token}"},
-                    params={"domain": self.domain, "maxResults": 1},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            response = await client.get(
+                "https://admin.googleapis.com/admin/directory/v1/users",
+                headers={"Authorization": f"Bearer {token}"},
+                params={"domain": self.domain, "maxResults": 1},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
-    async def _fetch_all_users(
+    async def _iter_user_pages(
         self, client: httpx.AsyncClient, token: str,
-    ) -> tuple[dict[str, dict[str, Any]], str]:
-        """Fetch all users from Directory API for enrichment.
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """Iterate over the Directory API user pages.
 
-        Returns:
-            Tuple of (dict mapping email → user details, customer_id)
+        Yields:
+            Users of one page (up to 500)
         """
-        users: dict[str, dict[str, Any]] = {}
-        customer_id = "my_customer"
         page_token = None
 
         while True:
@@ -234,93 +248,141 @@ class GoogleWorkspaceProvider(BaseProvider):
             response.raise_for_status()
             data = response.json()
 
-            for user in data.get("users", []):
-                email = user["primaryEmail"].lower()
-                users[email] = user
-                if customer_id == "my_customer" and user.get("customerId"):
-                    customer_id = user["customerId"]
+            yield data.get("users", [])
+
+            page_token = data.get("nextPageToken")
+            if not page_token:
+                break
+
+    @staticmethod
+    def _add_users(
+        users: dict[str, dict[str, Any]], page: list[dict[str, Any]],
+    ) -> None:
+        """Add a Directory API page to the user map, keeping only the fields used.
+
+        Full Directory user resources are large; keeping just the fields read
+        by _build_license_entry bounds memory on large tenants.
+        """
+        for user in page:
+            users[user["primaryEmail"].lower()] = {
+                field: user[field] for field in DIRECTORY_USER_FIELDS if field in user
+            }
+
+    async def _fetch_product_assignments(
+        self,
+        client: httpx.AsyncClient,
+        token: str,
+        customer_id: str,
+        product_id: str,
+        license_types: dict[str, set[str]],
+    ) -> int:
+        """Fetch the license assignments of one product from the Licensing API.
+
+        Assignments are merged into license_types page by page instead of
+        being buffered.
+
+        Args:
+            client: HTTP client
+            token: Access token
+            customer_id: Google customer ID
+            product_id: Licensing API product ID
+            license_types: Map of user email → license type names, updated in place
+
+        Returns:
+            Number of assignments of the product
+        """
+        count = 0
+        page_token = None
+        while True:
+            params: dict[str, Any] = {
+                "customerId": customer_id,
+                "maxResults": 1000,
+            }
+            if page_token:
+                params["pageToken"] = page_token
+
+            response = await client.get(
+                f"https://licensing.googleapis.com/apps/licensing/v1/product/{product_id}/users",
+                headers={"Authorization": f"Bearer {token}"},
+                params=params,
+                timeout=30.0,
+            )
+            if response.status_code == 403:
+                logger.warning(
+                    "Licensing API 403 for product %s: %s",
+                    product_id, response.text,
+                )
+                break
+            if response.status_code == 404:
+                break
+            if response.status_code != 200:
+                logger.warning("Licensing API error for product %s: %s", product_id, response.status_code)
+                break
+
+            data = response.json()
+            items = data.get("items", [])
+            if items:
+                logger.warning(
+                    "Licensing API product=%s: items=%d, sample=%s",
+                    product_id, len(items),
+                    items[0] if items else "empty",
+                )
+            for item in items:
+                sku_id = item.get("skuId", "")
+                sku_name = item.get("skuName", "")
+                product_name = item.get("productName", "")
+                resolved_name = (
+                    sku_name
+                    or GOOGLE_WORKSPACE_SKUS.get(sku_id)
+                    or (f"{product_name} ({sku_id})" if product_name else f"Google Workspace ({sku_id})")
+                )
+                license_types[item.get("userId", "").lower()].add(resolved_name)
+            count += len(items)
 
             page_token = data.get("nextPageToken")
             if not page_token:
                 break
 
-        logger.warning("Directory API: %d users, customerId=%s", len(users), customer_id)
-        return users, customer_id
+        return count
 
     async def _fetch_license_assignments(
-        self, client: httpx.AsyncClient, token: str, customer_id: str,
-    ) -> list[dict[str, str]]:
+        self,
+        client: httpx.AsyncClient,
+        token: str,
+        customer_id: str,
+        license_types: dict[str, set[str]],
+    ) -> int:
         """Fetch all license assignments from Google Licensing API.
 
         Queries multiple product IDs to capture all license types
-        (Workspace, Gemini, Storage, etc.).
+        (Workspace, Gemini, Storage, etc.). Products are queried concurrently,
+        at most LICENSING_CONCURRENCY at a time; each product's pages are
+        fetched in order.
+
+        Args:
+            client: HTTP client
+            token: Access token
+            customer_id: Google customer ID
+            license_types: Map of user email → license type names, updated in place
 
         Returns:
-            List of dicts with userId (email), skuId, productId, license_type.
+            Total number of assignments
         """
-        assignments: list[dict[str, str]] = []
-
-        for product_id in GOOGLE_PRODUCT_IDS:
-            try:
-                page_token = None
-                while True:
-                    params: dict[str, Any] = {
-                        "customerId": customer_id,
-                        "maxResults": 1000,
-                    }
-                    if page_token:
-                        params["pageToken"] = page_token
-
-                    response = await client.get(
-                        f"https://licensing.googleapis.com/apps/licensing/v1/product/{product_id}/users",
-                        headers={"Authorization": f"Bearer {token}"},
-                        params=params,
-                        timeout=30.0,
+        semaphore = asyncio.Semaphore(LICENSING_CONCURRENCY)
+
+        async def fetch_product(product_id: str) -> int:
+            async with semaphore:
+                try:
+                    return await self._fetch_product_assignments(
+                        client, token, customer_id, product_id, license_types
                     )
-                    if response.status_code == 403:
-                        logger.warning(
-                            "Licensing API 403 for product %s: %s",
-                            product_id, response.text,
-                        )
-                        break
-                    if response.status_code == 404:
-                        break
-                    if response.status_code != 200:
-                        logger.warning("Licensing API error for product %s: %s", product_id, response.status_code)
-                        break
-
-                    data = response.json()
-                    items = data.get("items", [])
-                    if items:
-                        logger.warning(
-                            "Licensing API product=%s: items=%d, sample=%s",
-                            product_id, len(items),
-                            items[0] if items else "empty",
-                        )
-                    for item in items:
-                        sku_id = item.get("skuId", "")
-                        sku_name = item.get("skuName", "")
-                        product_name = item.get("productName", "")
-                        resolved_name = (
-                            sku_name
-                            or GOOGLE_WORKSPACE_SKUS.get(sku_id)
-                            or (f"{product_name} ({sku_id})" if product_name else f"Google Workspace ({sku_id})")
-                        )
-                        assignments.append({
-                            "userId": item.get("userId", "").lower(),
-                            "skuId": sku_id,
-                            "productId": product_id,
-                            "license_type": resolved_name,
-                        })
-
-                    page_token = data.get("nextPageToken")
-                    if not page_token:
-                        break
-            except Exception:
-                logger.warning("Failed to query Licensing API for product %s", product_id, exc_info=True)
-
-        logger.warning("Licensing API total assignments: %d", len(assignments))
-        return assignments
+                except Exception:
+                    logger.warning("Failed to query Licensing API for product %s", product_id, exc_info=True)
+                    return 0
+
+        total = sum(await asyncio.gather(*(fetch_product(p) for p in GOOGLE_PRODUCT_IDS)))
+        logger.warning("Licensing API total assignments: %d", total)
+        return total
 
     async def fetch_licenses(self) -> list[dict[str, Any]]:
         """Fetch all license assignments from Google Workspace.
@@ -331,28 +393,48 @@ class GoogleWorkspaceProvider(BaseProvider):
         Fallback: Directory API users (all get generic "Google Workspace" type).
         Directory API is always used to enrich with user details.
 
+        The first Directory API page provides the customer ID; the remaining
+        directory pages are then read while the Licensing API products are
+        queried, and both are joined by email once complete.
+
         Returns:
             List of license data dicts
         """
         token = await self._get_access_token()
 
-        async with httpx.AsyncClient() as client:
-            # Always fetch users for enrichment (name, last login, status)
-            users_map, customer_id = await self._fetch_all_users(client, token)
+        client = self._get_http_client()
+        # Always fetch users for enrichment (name, last login, status)
+        users_map: dict[str, dict[str, Any]] = {}
+        user_pages = self._iter_user_pages(client, token)
+        first_page = await anext(user_pages, [])
+        self._add_users(users_map, first_page)
+        customer_id = next(
+            (user["customerId"] for user in first_page if user.get("customerId")),
+            "my_customer",
+        )
 
-            # Try Licensing API for real license assignments
-            assignments = await self._fetch_license_assignments(client, token, customer_id)
+        async def read_remaining_users() -> None:
+            async for page in user_pages:
+                self._add_users(users_map, page)
 
-            if assignments:
-                logger.warning("Using %d license assignments from Licensing API", len(assignments))
-                return self._build_from_assignments(assignments, users_map)
-            else:
-                logger.warning("Licensing API returned no data, falling back to %d Directory API users", len(users_map))
-                return self._build_from_users(users_map)
+        # Try Licensing API for real license assignments
+        license_types: dict[str, set[str]] = defaultdict(set)
+        _, assignment_count = await asyncio.gather(
+            read_remaining_users(),
+            self._fetch_license_assignments(client, token, customer_id, license_types),
+        )
+        logger.warning("Directory API: %d users, customerId=%s", len(users_map), customer_id)
+
+        if license_types:
+            logger.warning("Using %d license assignments from Licensing API", assignment_count)
+            return self._build_from_assignments(license_types, users_map)
+        else:
+            logger.warning("Licensing API returned no data, falling back to %d Directory API users", len(users_map))
+            return self._build_from_users(users_map)
 
     def _build_from_assignments(
         self,
-        assignments: list[dict[str, str]],
+        license_types: dict[str, set[str]],
         users_map: dict[str, dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """Build license list from Licensing API assignments enriched with user data.
@@ -361,23 +443,14 @@ class GoogleWorkspaceProvider(BaseProvider):
         comma-separated license types (e.g. "Enterprise Plus, AI Ultra Access").
         The pricing infrastructure splits by comma for individual per-type pricing.
         """
-        # Group assignments by user email
-        user_assignments: dict[str, list[str]] = defaultdict(list)
-        for assignment in assignments:
-            user_assignments[assignment["userId"]].append(assignment["license_type"])
-
-        licenses = []
-        for email, license_types in user_assignments.items():
-            user = users_map.get(email, {})
-            combined_type = ", ".join(sorted(set(license_types)))
-
-            licenses.append(self._build_license_entry(
+        return [
+            self._build_license_entry(
                 email=email,
-                license_type=combined_type,
-                user=user,
-            ))
-
-        return licenses
+                license_type=", ".join(sorted(types)),
+                user=users_map.get(email, {}),
+            )
+            for email, types in license_types.items()
+        ]
 
     def _build_from_users(
         self, users_map: dict[str, dict[str, Any]],
@@ -0,0 +1,342 @@
+"""Shared HTTP transport for provider API requests.
+
+All providers send their requests through one pooled connection transport, so
+TLS sessions and keep-alive connections are reused across pages, methods and
+provider instances. HTTP/2 is used when the optional h2 package is installed
+(httpx[http2]). Each provider type gets its own client on top of the pool that
+adds the shared timeout, retries with exponential backoff and Retry-After
+handling, and records request counts and latencies per provider.
+
+Proxies are taken from the environment (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and
+NO_PROXY) like plain httpx clients do; each proxy gets its own shared pool.
+"""
+
+import asyncio
+import importlib.util
+import ipaddress
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.request import getproxies
+
+import httpx
+
+from licence_api.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying; 429 and 503 are retried for every method because
+# the request was not processed, the others only for idempotent methods
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+ALWAYS_RETRYABLE_STATUS_CODES = frozenset({429, 503})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Maximum delay between two attempts when backing off exponentially
+MAX_BACKOFF_SECONDS = 30.0
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if absent or unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+@dataclass(slots=True)
+class ProviderRequestStats:
+    """Request counters and latency histogram of one provider."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    latency_sum: float = 0.0
+    # Counts per LATENCY_BUCKETS upper bound, plus one for slower requests
+    latency_buckets: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    status_codes: dict[int, int] = field(default_factory=dict)
+
+    def observe(self, seconds: float, status_code: int | None) -> None:
+        """Record a finished request attempt.
+
+        Args:
+            seconds: Time until the response headers arrived
+            status_code: Response status, or None if the request failed
+        """
+        self.requests += 1
+        self.latency_sum += seconds
+        for index, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.latency_buckets[index] += 1
+                break
+        else:
+            self.latency_buckets[-1] += 1
+        if status_code is None or status_code >= 500:
+            self.errors += 1
+        if status_code is not None:
+            self.status_codes[status_code] = self.status_codes.get(status_code, 0) + 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get the stats as a JSON-serializable dict."""
+        bounds = [str(bound) for bound in LATENCY_BUCKETS] + ["+Inf"]
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "latency_seconds_sum": round(self.latency_sum, 3),
+            "latency_seconds_avg": (
+                round(self.latency_sum / self.requests, 3) if self.requests else None
+            ),
+            "latency_histogram": dict(zip(bounds, self.latency_buckets, strict=True)),
+            "status_codes": {str(code): count for code, count in self.status_codes.items()},
+        }
+
+
+class ProviderHTTPMetrics:
+    """Per-provider request stats of this process."""
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._stats: dict[str, ProviderRequestStats] = {}
+
+    def get(self, provider_name: str) -> ProviderRequestStats:
+        """Get (or create) the stats of a provider."""
+        stats = self._stats.get(provider_name)
+        if stats is None:
+            stats = self._stats[provider_name] = ProviderRequestStats()
+        return stats
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get the stats of all providers, keyed by provider name."""
+        return {name: stats.snapshot() for name, stats in sorted(self._stats.items())}
+
+    def reset(self) -> None:
+        """Drop all recorded stats."""
+        self._stats.clear()
+
+
+provider_http_metrics = ProviderHTTPMetrics()
+
+
+class ProviderTransport(httpx.AsyncBaseTransport):
+    """Transport of one provider type on top of the shared connection pool.
+
+    Retries transient failures (connection errors, timeouts of idempotent
+    requests and RETRYABLE_STATUS_CODES) with exponential backoff and jitter.
+    A Retry-After header replaces the backoff delay; responses asking for a
+    longer wait than max_retry_after are returned instead of retried.
+    """
+
+    def __init__(
+        self,
+        provider_name: str,
+        pool: httpx.AsyncBaseTransport,
+        max_retries: int,
+        backoff: float,
+        max_retry_after: float,
+    ) -> None:
+        """Initialize transport.
+
+        Args:
+            provider_name: Name under which requests are recorded
+            pool: Shared connection pool transport
+            max_retries: Retries after the first attempt
+            backoff: Delay before the first retry, doubled for each further retry
+            max_retry_after: Longest Retry-After wait that is honored
+        """
+        self.provider_name = provider_name
+        self.pool = pool
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_retry_after = max_retry_after
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Get the jittered exponential backoff delay before a retry."""
+        delay = min(MAX_BACKOFF_SECONDS, self.backoff * 2.0**attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request, retrying transient failures."""
+        stats = provider_http_metrics.get(self.provider_name)
+        idempotent = request.method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = await self.pool.handle_async_request(request)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout):
+                stats.observe(time.perf_counter() - started, None)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            except (httpx.ReadTimeout, httpx.RemoteProtocolError, httpx.ReadError):
+                stats.observe(time.perf_counter() - started, None)
+                if not idempotent or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                stats.observe(time.perf_counter() - started, response.status_code)
+                status_code = response.status_code
+                retryable = status_code in ALWAYS_RETRYABLE_STATUS_CODES or (
+                    idempotent and status_code in RETRYABLE_STATUS_CODES
+                )
+                if not retryable or attempt >= self.max_retries:
+                    return response
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                if retry_after is not None and retry_after > self.max_retry_after:
+                    return response
+                delay = retry_after if retry_after is not None else self._backoff_delay(attempt)
+                await response.aclose()
+
+            attempt += 1
+            stats.retries += 1
+            logger.debug(
+                f"Retrying {request.method} request of {self.provider_name} "
+                f"in {delay:.2f}s (attempt {attempt + 1})"
+            )
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        """Keep the shared pool open; it is closed by close_provider_http()."""
+
+
+# Connection pools shared by all provider clients, keyed by proxy URL (None = direct)
+_pools: dict[str | None, httpx.AsyncHTTPTransport] = {}
+# Clients per provider name, all sending through _pools
+_clients: dict[str, httpx.AsyncClient] = {}
+
+
+def _get_pool(proxy: str | None = None) -> httpx.AsyncHTTPTransport:
+    """Get or create a shared connection pool transport.
+
+    Args:
+        proxy: Proxy URL the pool connects through, None for direct connections
+
+    Returns:
+        Pool transport; certificates are verified with SSL_CERT_FILE or
+        SSL_CERT_DIR when set
+    """
+    pool = _pools.get(proxy)
+    if pool is None:
+        settings = get_settings()
+        pool = _pools[proxy] = httpx.AsyncHTTPTransport(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(
+                max_connections=settings.provider_http_max_connections,
+                max_keepalive_connections=settings.provider_http_max_keepalive_connections,
+            ),
+            proxy=proxy,
+        )
+    return pool
+
+
+def _environment_proxies() -> dict[str, str | None]:
+    """Get the proxy of each URL pattern from the environment.
+
+    Follows the rules httpx applies to clients without a custom transport:
+    NO_PROXY hosts map to None (direct), and NO_PROXY=* disables proxies.
+
+    Returns:
+        Proxy URL (or None) by httpx mount pattern
+    """
+    proxy_info = getproxies()
+    proxies: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        proxy = proxy_info.get(scheme)
+        if proxy:
+            proxies[f"{scheme}://"] = proxy if "://" in proxy else f"http://{proxy}"
+
+    for host in (host.strip() for host in proxy_info.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if not host:
+            continue
+        if "://" in host:
+            proxies[host] = None
+            continue
+        try:
+            address = ipaddress.ip_address(host)
+        except ValueError:
+            address = None
+        if address is not None and address.version == 6:
+            proxies[f"all://[{host}]"] = None
+        elif address is not None or host.lower() == "localhost":
+            proxies[f"all://{host}"] = None
+        else:
+            # example.com also matches its subdomains, .example.com only those
+            proxies[f"all://*{host}"] = None
+    return proxies
+
+
+def get_provider_client(provider_name: str) -> httpx.AsyncClient:
+    """Get the shared HTTP client of a provider type.
+
+    Args:
+        provider_name: Name under which requests are recorded
+
+    Returns:
+        Client with the shared timeout and retry policy; it stays open and
+        must not be closed by callers
+    """
+    client = _clients.get(provider_name)
+    if client is None or client.is_closed:
+        settings = get_settings()
+
+        def transport(proxy: str | None) -> ProviderTransport:
+            return ProviderTransport(
+                provider_name,
+                _get_pool(proxy),
+                max_retries=settings.provider_http_max_retries,
+                backoff=settings.provider_http_backoff_seconds,
+                max_retry_after=settings.provider_http_max_retry_after_seconds,
+            )
+
+        # httpx ignores environment proxies when a transport is given, so mount
+        # the proxied pools here; unmatched URLs use the direct pool
+        client = httpx.AsyncClient(
+            transport=transport(None),
+            mounts={
+                pattern: transport(proxy) if proxy else None
+                for pattern, proxy in _environment_proxies().items()
+            },
+            timeout=httpx.Timeout(
+                settings.provider_http_timeout_seconds,
+                connect=settings.provider_http_connect_timeout_seconds,
+            ),
+        )
+        _clients[provider_name] = client
+    return client
+
+
+async def close_provider_http() -> None:
+    """Close all provider clients and the shared connection pools."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.aclose()
@@ -99,15 +99,15 @@ class HuggingFaceProvider(BaseProvider):
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Hugging Face API requires limit >= 10
-                response = await client.get(
-                    f"{self.BASE_URL}/organizations/{self.organization}/members",
-                    headers=self._get_headers(),
-                    params={"limit": 10},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            # Hugging Face API requires limit >= 10
+            response = await client.get(
+                f"{self.BASE_URL}/organizations/{self.organization}/members",
+                headers=self._get_headers(),
+                params={"limit": 10},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.error(f"Hugging Face connection test failed: {e}")
             return False
@@ -239,95 +239,95 @@ class HuggingFaceProvider(BaseProvider):
             logger.error("Organization name is required")
             return licenses
 
-        async with httpx.AsyncClient() as client:
-            try:
-                # First try to fetch SCIM users for email addresses
-                scim_users = await self._fetch_scim_users(client)
-
-                # Then fetch members from standard API
-                members = await self._fetch_all_members(client)
-
-                members_with_email = 0
-                members_without_email = 0
-
-                for member in members:
-                    # Get role - can be at top level or nested
-                    role = member.get("role", "read")
-                    license_type = self.ROLE_LICENSE_MAP.get(role, "Read")
-
-                    # Get username
-                    username = member.get("user", member.get("username", ""))
-
-                    # Try to get email from SCIM data first, then from member data
-                    email = None
-                    scim_user = scim_users.get(username, {})
-                    if scim_user:
-                        email = scim_user.get("email")
-
-                    if not email:
-                        email = member.get("verifiedEmail") or member.get("email")
-
-                    if email:
-                        members_with_email += 1
-                    else:
-                        members_without_email += 1
-
-                    # Build metadata
-                    metadata: dict[str, Any] = {
-                        "user_id": member.get("_id"),
-                        "username": username,
-                        "fullname": member.get("fullname"),
-                        "role": role,
-                        "is_pro": member.get("isPro", False),
-                        "two_fa_enabled": member.get("twoFaEnabled", False),
-                        "is_external_collaborator": member.get("isExternalCollaborator", False),
-                        "has_email": bool(email),
-                        "requires_manual_linking": not bool(email),
-                    }
+        client = self._get_http_client()
+        try:
+            # First try to fetch SCIM users for email addresses
+            scim_users = await self._fetch_scim_users(client)
 
-                    # Add resource groups if available
-                    resource_groups = member.get("resourceGroups", [])
-                    if resource_groups:
-                        metadata["resource_groups"] = [
-                            {
-                                "name": rg.get("name"),
-                                "id": rg.get("id"),
-                                "role": rg.get("role"),
-                            }
-                            for rg in resource_groups
-                        ]
-
-                    user_id = member.get("_id") or username
-
-                    # Use email as external_user_id if available, otherwise use HF user ID
-                    # This ensures consistent identification across syncs
-                    # Username is stored in metadata for display and manual linking
-                    external_user_id = email if email else user_id
-
-                    # Store original user_id and username in metadata for reference
-                    metadata["hf_user_id"] = user_id
-                    metadata["hf_username"] = username
-
-                    licenses.append(
+            # Then fetch members from standard API
+            members = await self._fetch_all_members(client)
+
+            members_with_email = 0
+            members_without_email = 0
+
+            for member in members:
+                # Get role - can be at top level or nested
+                role = member.get("role", "read")
+                license_type = self.ROLE_LICENSE_MAP.get(role, "Read")
+
+                # Get username
+                username = member.get("user", member.get("username", ""))
+
+                # Try to get email from SCIM data first, then from member data
+                email = None
+                scim_user = scim_users.get(username, {})
+                if scim_user:
+                    email = scim_user.get("email")
+
+                if not email:
+                    email = member.get("verifiedEmail") or member.get("email")
+
+                if email:
+                    members_with_email += 1
+                else:
+                    members_without_email += 1
+
+                # Build metadata
+                metadata: dict[str, Any] = {
+                    "user_id": member.get("_id"),
+                    "username": username,
+                    "fullname": member.get("fullname"),
+                    "role": role,
+                    "is_pro": member.get("isPro", False),
+                    "two_fa_enabled": member.get("twoFaEnabled", False),
+                    "is_external_collaborator": member.get("isExternalCollaborator", False),
+                    "has_email": bool(email),
+                    "requires_manual_linking": not bool(email),
+                }
+
+                # Add resource groups if available
+                resource_groups = member.get("resourceGroups", [])
+                if resource_groups:
+                    metadata["resource_groups"] = [
                         {
-                            "external_user_id": external_user_id,
-                            "email": email,
-                            "license_type": license_type,
-                            "status": "active",
-                            "assigned_at": None,  # Not provided in API
-                            "last_activity_at": None,  # Not provided in API
-                            "metadata": metadata,
+                            "name": rg.get("name"),
+                            "id": rg.get("id"),
+                            "role": rg.get("role"),
                         }
-                    )
-
-                logger.info(
-                    f"Fetched {len(members)} members from Hugging Face "
-                    f"({members_with_email} with email, "
-                    f"{members_without_email} require manual linking)"
+                        for rg in resource_groups
+                    ]
+
+                user_id = member.get("_id") or username
+
+                # Use email as external_user_id if available, otherwise use HF user ID
+                # This ensures consistent identification across syncs
+                # Username is stored in metadata for display and manual linking
+                external_user_id = email if email else user_id
+
+                # Store original user_id and username in metadata for reference
+                metadata["hf_user_id"] = user_id
+                metadata["hf_username"] = username
+
+                licenses.append(
+                    {
+                        "external_user_id": external_user_id,
+                        "email": email,
+                        "license_type": license_type,
+                        "status": "active",
+                        "assigned_at": None,  # Not provided in API
+                        "last_activity_at": None,  # Not provided in API
+                        "metadata": metadata,
+                    }
                 )
 
-            except Exception as e:
-                logger.error(f"Error fetching Hugging Face members: {e}")
+            logger.info(
+                f"Fetched {len(members)} members from Hugging Face "
+                f"({members_with_email} with email, "
+                f"{members_without_email} require manual linking)"
+            )
+
+        except Exception as e:
+            logger.error(f"Error fetching Hugging Face members: {e}")
 
         return licenses
 
@@ -356,27 +356,25 @@ class HuggingFaceProvider(BaseProvider):
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                payload: dict[str, Any] = {"role": role}
-                if resource_groups:
-                    payload["resourceGroups"] = resource_groups
+            client = self._get_http_client()
+            payload: dict[str, Any] = {"role": role}
+            if resource_groups:
+                payload["resourceGroups"] = resource_groups
 
-                response = await client.put(
-                    f"{self.BASE_URL}/organizations/{self.organization}/members/{username}/role",
-                    headers=self._get_headers(),
-                    json=payload,
-                    timeout=30.0,
-                )
+            response = await client.put(
+                f"{self.BASE_URL}/organizations/{self.organization}/members/{username}/role",
+                headers=self._get_headers(),
+                json=payload,
+                timeout=30.0,
+            )
 
-                if response.status_code == 200:
-                    logger.info(f"Changed role for {username} to {role}")
-                    return True
-                else:
-                    status = response.status_code
-                    logger.error(
-                        f"Failed to change role for {username}: {status} - {response.text}"
-                    )
-                    return False
+            if response.status_code == 200:
+                logger.info(f"Changed role for {username} to {role}")
+                return True
+            else:
+                status = response.status_code
+                logger.error(f"Failed to change role for {username}: {status} - {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"Error changing member role: {e}")
@@ -74,20 +74,20 @@ class JetBrainsProvider(BaseProvider):
             raise ValueError("Customer code is required")
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/token",
-                    headers=self._get_headers(),
-                    timeout=10.0,
-                )
-                if response.status_code == 200:
-                    return True
-                elif response.status_code == 401:
-                    raise ValueError("Invalid API key")
-                elif response.status_code == 403:
-                    raise ValueError("Access forbidden - check API key permissions")
-                else:
-                    raise ValueError(f"API error: {response.status_code}")
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/token",
+                headers=self._get_headers(),
+                timeout=10.0,
+            )
+            if response.status_code == 200:
+                return True
+            elif response.status_code == 401:
+                raise ValueError("Invalid API key")
+            elif response.status_code == 403:
+                raise ValueError("Access forbidden - check API key permissions")
+            else:
+                raise ValueError(f"API error: {response.status_code}")
         except httpx.RequestError as e:
             raise ValueError(f"Connection error: {str(e)}")
 
@@ -105,120 +105,120 @@ class JetBrainsProvider(BaseProvider):
         per_page = 100
 
         try:
-            async with httpx.AsyncClient() as client:
-                while True:
-                    response = await client.get(
-                        f"{self.BASE_URL}/customer/licenses",
-                        headers=self._get_headers(),
-                        params={"page": page, "perPage": per_page},
-                        timeout=30.0,
+            client = self._get_http_client()
+            while True:
+                response = await client.get(
+                    f"{self.BASE_URL}/customer/licenses",
+                    headers=self._get_headers(),
+                    params={"page": page, "perPage": per_page},
+                    timeout=30.0,
+                )
+                response.raise_for_status()
+                data = response.json()
+
+                if not data:
+                    break
+
+                for lic in data:
+                    license_id = lic.get("licenseId", "")
+                    product = lic.get("product", {})
+                    product_code = product.get("code", "")
+                    product_name = product.get("name") or self.PRODUCT_NAMES.get(
+                        product_code, product_code
                     )
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if not data:
-                        break
-
-                    for lic in data:
-                        license_id = lic.get("licenseId", "")
-                        product = lic.get("product", {})
-                        product_code = product.get("code", "")
-                        product_name = product.get("name") or self.PRODUCT_NAMES.get(
-                            product_code, product_code
-                        )
-
-                        assignee = lic.get("assignee")
-                        team = lic.get("team", {})
-                        is_suspended = lic.get("isSuspended", False)
-                        is_trial = lic.get("isTrial", False)
-
-                        # Determine assignee info
-                        email = None
-                        assignee_name = None
-                        assignee_type = None
-
-                        if assignee:
-                            assignee_type = assignee.get("type")
-                            if assignee_type == "USER":
-                                email = assignee.get("email", "").lower()
-                                assignee_name = assignee.get("name")
-                            elif assignee_type == "SERVER":
-                                email = f"server:{assignee.get('uid', 'unknown')}"
-                                assignee_name = (
-                                    f"License Server ({assignee.get('serverType', 'UNKNOWN')})"
-                                )
-                            elif assignee_type == "LICENSE_KEY":
-                                email = f"key:{license_id}"
-                                assignee_name = assignee.get("registrationName", "License Key")
-
-                        # Determine status
-                        # Note: "unassigned" should be determined by employee_id at the
-                        # system level, not by provider status. All non-suspended are "active".
-                        if is_suspended:
-                            status = "inactive"
-                        else:
-                            status = "active"
-
-                        # Get last activity from lastSeen
-                        last_seen = lic.get("lastSeen", {})
-                        last_activity = None
-                        if last_seen.get("lastSeenDate"):
+
+                    assignee = lic.get("assignee")
+                    team = lic.get("team", {})
+                    is_suspended = lic.get("isSuspended", False)
+                    is_trial = lic.get("isTrial", False)
+
+                    # Determine assignee info
+                    email = None
+                    assignee_name = None
+                    assignee_type = None
+
+                    if assignee:
+                        assignee_type = assignee.get("type")
+                        if assignee_type == "USER":
+                            email = assignee.get("email", "").lower()
+                            assignee_name = assignee.get("name")
+                        elif assignee_type == "SERVER":
+                            email = f"server:{assignee.get('uid', 'unknown')}"
+                            assignee_name = (
+                                f"License Server ({assignee.get('serverType', 'UNKNOWN')})"
+                            )
+                        elif assignee_type == "LICENSE_KEY":
+                            email = f"key:{license_id}"
+                            assignee_name = assignee.get("registrationName", "License Key")
+
+                    # Determine status
+                    # Note: "unassigned" should be determined by employee_id at the
+                    # system level, not by provider status. All non-suspended are "active".
+                    if is_suspended:
+                        status = "inactive"
+                    else:
+                        status = "active"
+
+                    # Get last activity from lastSeen
+                    last_seen = lic.get("lastSeen", {})
+                    last_activity = None
+                    if last_seen.get("lastSeenDate"):
+                        try:
+                            last_activity = datetime.fromisoformat(
+                                last_seen["lastSeenDate"].replace("Z", "+00:00")
+                            )
+                        except (ValueError, TypeError):
+                            pass
+
+                    # Get subscription info
+                    subscription = lic.get("subscription", {})
+                    valid_until = None
+                    is_renewed = False
+
+                    if subscription:
+                        if subscription.get("validUntilDate"):
                             try:
-                                last_activity = datetime.fromisoformat(
-                                    last_seen["lastSeenDate"].replace("Z", "+00:00")
+                                valid_until = datetime.fromisoformat(
+                                    subscription["validUntilDate"].replace("Z", "+00:00")
                                 )
                             except (ValueError, TypeError):
                                 pass
+                        is_renewed = subscription.get("isAutomaticallyRenewed", False)
+
+                    # License type
+                    license_type = product_name
+                    if is_trial:
+                        license_type = f"{product_name} (Trial)"
+
+                    licenses.append(
+                        {
+                            "external_user_id": license_id,
+                            "email": email,
+                            "license_type": license_type,
+                            "status": status,
+                            "monthly_cost": None,  # JetBrains is yearly, cost set at org level
+                            "currency": "USD",
+                            "last_activity_at": last_activity,
+                            "metadata": {
+                                "license_id": license_id,
+                                "product_code": product_code,
+                                "email": email,  # Store email for display
+                                "assignee_name": assignee_name,
+                                "assignee_type": assignee_type,
+                                "team_id": team.get("id"),
+                                "team_name": team.get("name"),
+                                "is_trial": is_trial,
+                                "is_suspended": is_suspended,
+                                "valid_until": valid_until.isoformat() if valid_until else None,
+                                "is_auto_renewed": is_renewed,
+                            },
+                        }
+                    )
 
-                        # Get subscription info
-                        subscription = lic.get("subscription", {})
-                        valid_until = None
-                        is_renewed = False
-
-                        if subscription:
-                            if subscription.get("validUntilDate"):
-                                try:
-                                    valid_until = datetime.fromisoformat(
-                                        subscription["validUntilDate"].replace("Z", "+00:00")
-                                    )
-                                except (ValueError, TypeError):
-                                    pass
-                            is_renewed = subscription.get("isAutomaticallyRenewed", False)
-
-                        # License type
-                        license_type = product_name
-                        if is_trial:
-                            license_type = f"{product_name} (Trial)"
-
-                        licenses.append(
-                            {
-                                "external_user_id": license_id,
-                                "email": email,
-                                "license_type": license_type,
-                                "status": status,
-                                "monthly_cost": None,  # JetBrains is yearly, cost set at org level
-                                "currency": "USD",
-                                "last_activity_at": last_activity,
-                                "metadata": {
-                                    "license_id": license_id,
-                                    "product_code": product_code,
-                                    "email": email,  # Store email for display
-                                    "assignee_name": assignee_name,
-                                    "assignee_type": assignee_type,
-                                    "team_id": team.get("id"),
-                                    "team_name": team.get("name"),
-                                    "is_trial": is_trial,
-                                    "is_suspended": is_suspended,
-                                    "valid_until": valid_until.isoformat() if valid_until else None,
-                                    "is_auto_renewed": is_renewed,
-                                },
-                            }
-                        )
-
-                    # Check if there are more pages
-                    if len(data) < per_page:
-                        break
-                    page += 1
+                # Check if there are more pages
+                if len(data) < per_page:
+                    break
+                page += 1
 
         except Exception:
             pass
@@ -3,8 +3,6 @@
 from datetime import datetime
 from typing import Any
 
-import httpx
-
 from licence_api.providers.base import BaseProvider
 
 
@@ -38,21 +36,21 @@ class MicrosoftProvider(BaseProvider):
         if self._access_token:
             return self._access_token
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.LOGIN_URL}/{self.tenant_id}/oauth2/v2.0/token",
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "scope": "https://graph.microsoft.com/.default",
-                },
-                timeout=10.0,
-            )
-            response.raise_for_status()
-            data = response.json()
-            self._access_token = data["access_token"]
-            return self._access_token
+        client = self._get_http_client()
+        response = await client.post(
+            f"{self.LOGIN_URL}/{self.tenant_id}/oauth2/v2.0/token",
+            data={
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "scope": "https://graph.microsoft.com/.default",
+            },
+            timeout=10.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+        self._access_token = data["access_token"]
+        return self._access_token
 
     async def test_connection(self) -> bool:
         """Test Microsoft Graph API connection.
@@ -62,14 +60,14 @@ class MicrosoftProvider(BaseProvider):
         """
         try:
             token = await self._get_access_token()
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.GRAPH_BASE_URL}/users",
-                    headers={"Authorization": f"Bearer {token}"},
-                    params={"$top": 1},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.GRAPH_BASE_URL}/users",
+                headers={"Authorization": f"Bearer {token}"},
+                params={"$top": 1},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -83,20 +81,20 @@ class MicrosoftProvider(BaseProvider):
             Dict mapping SKU ID to product display name
         """
         sku_map = {}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.GRAPH_BASE_URL}/subscribedSkus",
-                headers={"Authorization": f"Bearer {token}"},
-                timeout=10.0,
-            )
-            if response.status_code == 200:
-                data = response.json()
-                for sku in data.get("value", []):
-                    sku_id = sku.get("skuId")
-                    sku_name = sku.get("skuPartNumber", "Unknown")
-                    # Map common SKU part numbers to friendly names
-                    friendly_name = self._get_friendly_sku_name(sku_name)
-                    sku_map[sku_id] = friendly_name
+        client = self._get_http_client()
+        response = await client.get(
+            f"{self.GRAPH_BASE_URL}/subscribedSkus",
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10.0,
+        )
+        if response.status_code == 200:
+            data = response.json()
+            for sku in data.get("value", []):
+                sku_id = sku.get("skuId")
+                sku_name = sku.get("skuPartNumber", "Unknown")
+                # Map common SKU part numbers to friendly names
+                friendly_name = self._get_friendly_sku_name(sku_name)
+                sku_map[sku_id] = friendly_name
         return sku_map
 
     def _get_friendly_sku_name(self, sku_part_number: str) -> str:
@@ -162,85 +160,83 @@ class MicrosoftProvider(BaseProvider):
             "$top": 999,
         }
 
-        async with httpx.AsyncClient() as client:
-            while next_link:
-                response = await client.get(
-                    next_link,
-                    headers={"Authorization": f"Bearer {token}"},
-                    params=params if "?" not in next_link else None,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
-                data = response.json()
-
-                for user in data.get("value", []):
-                    assigned_licenses = user.get("assignedLicenses", [])
-
-                    # Skip users without licenses
-                    if not assigned_licenses:
-                        continue
-
-                    # Determine status
-                    if user.get("accountEnabled"):
-                        status = "active"
-                    else:
-                        status = "suspended"
-
-                    # Parse sign-in activity
-                    last_activity = None
-                    sign_in = user.get("signInActivity", {})
-                    if sign_in:
-                        last_sign_in = sign_in.get("lastSignInDateTime")
-                        if last_sign_in:
-                            last_activity = datetime.fromisoformat(
-                                last_sign_in.replace("Z", "+00:00")
-                            )
-
-                    # Parse creation time
-                    created_at = None
-                    if user.get("createdDateTime"):
-                        created_at = datetime.fromisoformat(
-                            user["createdDateTime"].replace("Z", "+00:00")
-                        )
-
-                    # Get license names
-                    license_names = []
-                    for lic in assigned_licenses:
-                        sku_id = lic.get("skuId")
-                        if sku_id and sku_id in sku_map:
-                            license_names.append(sku_map[sku_id])
-                        elif sku_id:
-                            license_names.append(sku_id)
-
-                    # Sort license names alphabetically for consistent grouping
-                    # This ensures "A, B, C" and "C, B, A" are stored the same way
-                    license_names.sort()
-
-                    # User principal name is the email
-                    email = user.get("userPrincipalName", "").lower()
-
-                    licenses.append(
-                        {
-                            "external_user_id": email,  # Use email as external ID for matching
-                            "email": email,
-                            "license_type": ", ".join(license_names)
-                            if license_names
-                            else "Microsoft 365",
-                            "status": status,
-                            "assigned_at": created_at,
-                            "last_activity_at": last_activity,
-                            "metadata": {
-                                "azure_id": user.get("id"),
-                                "name": user.get("displayName"),
-                                "department": user.get("department"),
-                                "job_title": user.get("jobTitle"),
-                                "license_skus": [lic.get("skuId") for lic in assigned_licenses],
-                            },
-                        }
+        client = self._get_http_client()
+        while next_link:
+            response = await client.get(
+                next_link,
+                headers={"Authorization": f"Bearer {token}"},
+                params=params if "?" not in next_link else None,
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            for user in data.get("value", []):
+                assigned_licenses = user.get("assignedLicenses", [])
+
+                # Skip users without licenses
+                if not assigned_licenses:
+                    continue
+
+                # Determine status
+                if user.get("accountEnabled"):
+                    status = "active"
+                else:
+                    status = "suspended"
+
+                # Parse sign-in activity
+                last_activity = None
+                sign_in = user.get("signInActivity", {})
+                if sign_in:
+                    last_sign_in = sign_in.get("lastSignInDateTime")
+                    if last_sign_in:
+                        last_activity = datetime.fromisoformat(last_sign_in.replace("Z", "+00:00"))
+
+                # Parse creation time
+                created_at = None
+                if user.get("createdDateTime"):
+                    created_at = datetime.fromisoformat(
+                        user["createdDateTime"].replace("Z", "+00:00")
                     )
 
-                # Handle pagination
-                next_link = data.get("@odata.nextLink")
-                params = {}  # Clear params for subsequent requests
+                # Get license names
+                license_names = []
+                for lic in assigned_licenses:
+                    sku_id = lic.get("skuId")
+                    if sku_id and sku_id in sku_map:
+                        license_names.append(sku_map[sku_id])
+                    elif sku_id:
+                        license_names.append(sku_id)
+
+                # Sort license names alphabetically for consistent grouping
+                # This ensures "A, B, C" and "C, B, A" are stored the same way
+                license_names.sort()
+
+                # User principal name is the email
+                email = user.get("userPrincipalName", "").lower()
+
+                licenses.append(
+                    {
+                        "external_user_id": email,  # Use email as external ID for matching
+                        "email": email,
+                        "license_type": ", ".join(license_names)
+                        if license_names
+                        else "Microsoft 365",
+                        "status": status,
+                        "assigned_at": created_at,
+                        "last_activity_at": last_activity,
+                        "metadata": {
+                            "azure_id": user.get("id"),
+                            "name": user.get("displayName"),
+                            "department": user.get("department"),
+                            "job_title": user.get("jobTitle"),
+                            "license_skus": [lic.get("skuId") for lic in assigned_licenses],
+                        },
+                    }
+                )
+
+            # Handle pagination
+            next_link = data.get("@odata.nextLink")
+            params = {}  # Clear params for subsequent requests
 
         return licenses
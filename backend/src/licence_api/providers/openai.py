@@ -3,8 +3,6 @@
 from datetime import datetime
 from typing import Any
 
-import httpx
-
 from licence_api.providers.base import BaseProvider
 
 
@@ -42,13 +40,13 @@ class OpenAIProvider(BaseProvider):
             True if connection is successful
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/organization/users",
-                    headers=self._get_headers(),
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.BASE_URL}/organization/users",
+                headers=self._get_headers(),
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -60,38 +58,38 @@ class OpenAIProvider(BaseProvider):
         """
         licenses = []
 
-        async with httpx.AsyncClient() as client:
-            # Fetch organization users
-            response = await client.get(
-                f"{self.BASE_URL}/organization/users",
-                headers=self._get_headers(),
-                timeout=30.0,
+        client = self._get_http_client()
+        # Fetch organization users
+        response = await client.get(
+            f"{self.BASE_URL}/organization/users",
+            headers=self._get_headers(),
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        for member in data.get("members", data.get("data", [])):
+            user = member.get("user", member)
+
+            # Parse added date
+            added_at = None
+            if member.get("added"):
+                added_at = datetime.fromtimestamp(member["added"])
+            elif member.get("created"):
+                added_at = datetime.fromtimestamp(member["created"])
+
+            licenses.append(
+                {
+                    "external_user_id": user.get("id", member.get("id")),
+                    "email": user.get("email", "").lower(),
+                    "license_type": member.get("role", "member"),
+                    "status": "active",
+                    "assigned_at": added_at,
+                    "metadata": {
+                        "name": user.get("name"),
+                        "role": member.get("role"),
+                    },
+                }
             )
-            response.raise_for_status()
-            data = response.json()
-
-            for member in data.get("members", data.get("data", [])):
-                user = member.get("user", member)
-
-                # Parse added date
-                added_at = None
-                if member.get("added"):
-                    added_at = datetime.fromtimestamp(member["added"])
-                elif member.get("created"):
-                    added_at = datetime.fromtimestamp(member["created"])
-
-                licenses.append(
-                    {
-                        "external_user_id": user.get("id", member.get("id")),
-                        "email": user.get("email", "").lower(),
-                        "license_type": member.get("role", "member"),
-                        "status": "active",
-                        "assigned_at": added_at,
-                        "metadata": {
-                            "name": user.get("name"),
-                            "role": member.get("role"),
-                        },
-                    }
-                )
 
         return licenses
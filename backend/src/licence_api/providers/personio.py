@@ -114,16 +114,16 @@ class PersonioProvider(HRISProvider):
             True if connection is successful
         """
         try:
-            async with httpx.AsyncClient() as client:
-                token = await self._get_access_token(client)
-                # Test with a simple employees request (limit 1)
-                response = await client.get(
-                    f"{self.BASE_URL}/company/employees",
-                    headers=self._get_headers(token),
-                    params={"limit": 1},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            token = await self._get_access_token(client)
+            # Test with a simple employees request (limit 1)
+            response = await client.get(
+                f"{self.BASE_URL}/company/employees",
+                headers=self._get_headers(token),
+                params={"limit": 1},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.warning(f"Personio connection test failed: {e}")
             return False
@@ -141,46 +141,84 @@ class PersonioProvider(HRISProvider):
         offset = 0
         limit = 100  # Personio max is 100 (starting May 2025)
 
-        async with httpx.AsyncClient() as client:
-            token = await self._get_access_token(client)
+        client = self._get_http_client()
+        token = await self._get_access_token(client)
+
+        while True:
+            response = await client.get(
+                f"{self.BASE_URL}/company/employees",
+                headers=self._get_headers(token),
+                params={
+                    "limit": limit,
+                    "offset": offset,
+                },
+                timeout=30.0,
+            )
+            response.raise_for_status()
+            data = response.json()
 
-            while True:
-                response = await client.get(
-                    f"{self.BASE_URL}/company/employees",
-                    headers=self._get_headers(token),
-                    params={
-                        "limit": limit,
-                        "offset": offset,
-                    },
-                    timeout=30.0,
+            if not data.get("success"):
+                raise ValueError(
+                    f"Personio API error: {data.get('error', {}).get('message', 'Unknown')}"
                 )
-                response.raise_for_status()
-                data = response.json()
-
-                if not data.get("success"):
-                    raise ValueError(
-                        f"Personio API error: {data.get('error', {}).get('message', 'Unknown')}"
-                    )
 
-                employee_list = data.get("data", [])
-                if not employee_list:
-                    break
+            employee_list = data.get("data", [])
+            if not employee_list:
+                break
 
-                for emp in employee_list:
-                    parsed = self._parse_employee(emp)
-                    if parsed:
-                        employees.append(parsed)
+            for emp in employee_list:
+                parsed = self._parse_employee(emp)
+                if parsed:
+                    employees.append(parsed)
 
-                # Check if we got less than limit (no more pages)
-                if len(employee_list) < limit:
-                    break
+            # Check if we got less than limit (no more pages)
+            if len(employee_list) < limit:
+                break
 
-                offset += limit
-                logger.info(f"Personio: fetched {len(employees)} employees so far...")
+            offset += limit
+            logger.info(f"Personio: fetched {len(employees)} employees so far...")
 
         logger.info(f"Personio: fetched {len(employees)} employees total")
         return employees
 
+    async def fetch_employees_changed_since(self, since: datetime) -> list[dict[str, Any]]:
+        """Fetch employees updated in Personio since a point in time.
+
+        API: GET /company/employees?updated_since=...
+        Personio ignores limit and offset when updated_since is set and
+        returns all matching employees in one response.
+
+        Args:
+            since: Only return employees updated after this time
+
+        Returns:
+            List of employee data dicts
+        """
+        client = self._get_http_client()
+        token = await self._get_access_token(client)
+        response = await client.get(
+            f"{self.BASE_URL}/company/employees",
+            headers=self._get_headers(token),
+            params={"updated_since": since.astimezone(UTC).strftime("%Y-%m-%dT%H:%M:%S")},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        if not data.get("success"):
+            raise ValueError(
+                f"Personio API error: {data.get('error', {}).get('message', 'Unknown')}"
+            )
+
+        employees = []
+        for emp in data.get("data", []):
+            parsed = self._parse_employee(emp)
+            if parsed:
+                employees.append(parsed)
+
+        logger.info(f"Personio: fetched {len(employees)} employees updated since {since}")
+        return employees
+
     def _parse_employee(self, emp: dict[str, Any]) -> dict[str, Any] | None:
         """Parse Personio employee data into our format.
 
@@ -3,7 +3,7 @@
 import asyncio
 import logging
 from datetime import datetime
-from typing import Any, ClassVar
+from typing import Any
 
 import httpx
 
@@ -13,8 +13,6 @@ logger = logging.getLogger(__name__)
 
 # Slack API constants
 SLACK_API_BASE = "https://slack.com/api"
-SLACK_TIMEOUT = 30.0
-SLACK_CONNECT_TIMEOUT = 10.0
 SLACK_MAX_RETRIES = 3
 SLACK_RETRY_DELAY = 1.0
 
@@ -25,9 +23,6 @@ USER_AGENT = "LicenseManagementSystem/1.0 (https://github.com/Kiefer-Networks/Li
 class SlackProvider(BaseProvider):
     """Slack workspace integration for team licenses."""
 
-    # Shared HTTP client for connection reuse
-    _http_client: ClassVar[httpx.AsyncClient | None] = None
-
     def __init__(self, credentials: dict[str, Any]) -> None:
         """Initialize Slack provider.
 
@@ -40,31 +35,14 @@ class SlackProvider(BaseProvider):
         self.bot_token = credentials.get("bot_token") or credentials.get("slack_bot_token")
         self.user_token = credentials.get("user_token") or credentials.get("slack_user_token")
 
-    @classmethod
-    def _get_http_client(cls) -> httpx.AsyncClient:
-        """Get or create shared HTTP client with connection pooling."""
-        if cls._http_client is None or cls._http_client.is_closed:
-            cls._http_client = httpx.AsyncClient(
-                timeout=httpx.Timeout(SLACK_TIMEOUT, connect=SLACK_CONNECT_TIMEOUT),
-                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
-                headers={
-                    "User-Agent": USER_AGENT,
-                    "Content-Type": "application/json",
-                },
-            )
-        return cls._http_client
-
-    @classmethod
-    async def close_client(cls) -> None:
-        """Close the shared HTTP client."""
-        if cls._http_client and not cls._http_client.is_closed:
-            await cls._http_client.aclose()
-            cls._http_client = None
-
     def _get_headers(self, use_user_token: bool = False) -> dict[str, str]:
         """Get API request headers with authorization."""
         token = self.user_token if use_user_token else self.bot_token
-        return {"Authorization": f"Bearer {token}"}
+        return {
+            "Authorization": f"Bearer {token}",
+            "User-Agent": USER_AGENT,
+            "Content-Type": "application/json",
+        }
 
     async def _api_call_with_retry(
         self,
@@ -5,8 +5,6 @@ import logging
 from datetime import datetime
 from typing import Any
 
-import httpx
-
 from licence_api.providers.base import BaseProvider
 
 logger = logging.getLogger(__name__)
@@ -64,27 +62,27 @@ class ZoomProvider(BaseProvider):
         credentials = f"{self.client_id}:{self.client_secret}"
         encoded = base64.b64encode(credentials.encode()).decode()
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.AUTH_URL,
-                headers={
-                    "Authorization": f"Basic {encoded}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-                data={
-                    "grant_type": "account_credentials",
-                    "account_id": self.account_id,
-                },
-                timeout=10.0,
-            )
+        client = self._get_http_client()
+        response = await client.post(
+            self.AUTH_URL,
+            headers={
+                "Authorization": f"Basic {encoded}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            data={
+                "grant_type": "account_credentials",
+                "account_id": self.account_id,
+            },
+            timeout=10.0,
+        )
 
-            if response.status_code != 200:
-                logger.debug("Zoom OAuth error response: %s", response.text)
-                raise ValueError("Failed to authenticate with Zoom API")
+        if response.status_code != 200:
+            logger.debug("Zoom OAuth error response: %s", response.text)
+            raise ValueError("Failed to authenticate with Zoom API")
 
-            data = response.json()
-            self._access_token = data["access_token"]
-            return self._access_token
+        data = response.json()
+        self._access_token = data["access_token"]
+        return self._access_token
 
     def _get_headers(self, token: str) -> dict[str, str]:
         """Get API request headers."""
@@ -101,14 +99,14 @@ class ZoomProvider(BaseProvider):
         """
         try:
             token = await self._get_access_token()
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.API_URL}/users",
-                    headers=self._get_headers(token),
-                    params={"page_size": 1},
-                    timeout=10.0,
-                )
-                return response.status_code == 200
+            client = self._get_http_client()
+            response = await client.get(
+                f"{self.API_URL}/users",
+                headers=self._get_headers(token),
+                params={"page_size": 1},
+                timeout=10.0,
+            )
+            return response.status_code == 200
         except Exception as e:
             logger.warning("Zoom connection test failed: %s", e)
             return False
@@ -158,29 +156,127 @@ class ZoomProvider(BaseProvider):
         licenses = []
         token = await self._get_access_token()
 
-        async with httpx.AsyncClient() as client:
-            # Get account info for plan type
-            plan_type = None
-            try:
-                account_response = await client.get(
-                    f"{self.API_URL}/accounts/{self.account_id}/plans",
-                    headers=self._get_headers(token),
-                    timeout=10.0,
+        client = self._get_http_client()
+        # Get account info for plan type
+        plan_type = None
+        try:
+            account_response = await client.get(
+                f"{self.API_URL}/accounts/{self.account_id}/plans",
+                headers=self._get_headers(token),
+                timeout=10.0,
+            )
+            if account_response.status_code == 200:
+                account_data = account_response.json()
+                plan_type = account_data.get("plan_base", {}).get("type")
+        except Exception as e:
+            logger.debug("Failed to fetch Zoom account plans: %s", e)
+
+        # Fetch all users with pagination
+        next_page_token = ""
+        page_number = 1
+
+        while True:
+            params: dict[str, Any] = {
+                "page_size": 300,
+                "status": "active",
+            }
+            if next_page_token:
+                params["next_page_token"] = next_page_token
+
+            response = await client.get(
+                f"{self.API_URL}/users",
+                headers=self._get_headers(token),
+                params=params,
+                timeout=30.0,
+            )
+
+            if response.status_code != 200:
+                logger.debug("Zoom API error response: %s", response.text)
+                raise ValueError("Failed to fetch users from Zoom API")
+
+            data = response.json()
+
+            for user in data.get("users", []):
+                user_id = user.get("id")
+                email = user.get("email", "").lower().strip()
+                user_type = user.get("type", 1)
+
+                # Parse timestamps
+                last_login = None
+                if user.get("last_login_time"):
+                    try:
+                        last_login = datetime.fromisoformat(
+                            user["last_login_time"].replace("Z", "+00:00")
+                        )
+                    except (ValueError, TypeError):
+                        pass
+
+                created_at = None
+                if user.get("created_at"):
+                    try:
+                        created_at = datetime.fromisoformat(
+                            user["created_at"].replace("Z", "+00:00")
+                        )
+                    except (ValueError, TypeError):
+                        pass
+
+                # Determine license type
+                license_type = self._get_license_type(user_type, plan_type)
+
+                # Determine role
+                role_id = user.get("role_id", 0)
+                if role_id == 0:
+                    role = "Owner"
+                elif role_id == 1:
+                    role = "Admin"
+                else:
+                    role = "Member"
+
+                # Use email as external_user_id
+                external_id = email if email else user_id
+
+                licenses.append(
+                    {
+                        "external_user_id": external_id,
+                        "email": email,
+                        "license_type": license_type,
+                        "status": self._get_status(user.get("status", "active")),
+                        "last_activity_at": last_login,
+                        "metadata": {
+                            "zoom_user_id": user_id,
+                            "email": email,
+                            "first_name": user.get("first_name"),
+                            "last_name": user.get("last_name"),
+                            "display_name": (
+                                f"{user.get('first_name', '')} "
+                                f"{user.get('last_name', '')}".strip()
+                            ),
+                            "user_type": self.USER_TYPES.get(user_type, "Unknown"),
+                            "user_type_id": user_type,
+                            "role": role,
+                            "role_id": role_id,
+                            "department": user.get("dept"),
+                            "timezone": user.get("timezone"),
+                            "created_at": created_at.isoformat() if created_at else None,
+                            "pmi": user.get("pmi"),
+                            "verified": user.get("verified", 0) == 1,
+                        },
+                    }
                 )
-                if account_response.status_code == 200:
-                    account_data = account_response.json()
-                    plan_type = account_data.get("plan_base", {}).get("type")
-            except Exception as e:
-                logger.debug("Failed to fetch Zoom account plans: %s", e)
 
-            # Fetch all users with pagination
-            next_page_token = ""
-            page_number = 1
+            # Check for more pages
+            next_page_token = data.get("next_page_token", "")
+            if not next_page_token:
+                break
+            page_number += 1
 
+        # Also fetch inactive/pending users
+        for status in ["inactive", "pending"]:
+            next_page_token = ""
             while True:
-                params: dict[str, Any] = {
+                params = {
                     "page_size": 300,
-                    "status": "active",
+                    "status": status,
                 }
                 if next_page_token:
                     params["next_page_token"] = next_page_token
@@ -193,8 +289,7 @@ class ZoomProvider(BaseProvider):
                 )
 
                 if response.status_code != 200:
-                    logger.debug("Zoom API error response: %s", response.text)
-                    raise ValueError("Failed to fetch users from Zoom API")
+                    break
 
                 data = response.json()
 
@@ -203,38 +298,7 @@ class ZoomProvider(BaseProvider):
                     email = user.get("email", "").lower().strip()
                     user_type = user.get("type", 1)
 
-                    # Parse timestamps
-                    last_login = None
-                    if user.get("last_login_time"):
-                        try:
-                            last_login = datetime.fromisoformat(
-                                user["last_login_time"].replace("Z", "+00:00")
-                            )
-                        except (ValueError, TypeError):
-                            pass
-
-                    created_at = None
-                    if user.get("created_at"):
-                        try:
-                            created_at = datetime.fromisoformat(
-                                user["created_at"].replace("Z", "+00:00")
-                            )
-                        except (ValueError, TypeError):
-                            pass
-
-                    # Determine license type
                     license_type = self._get_license_type(user_type, plan_type)
-
-                    # Determine role
-                    role_id = user.get("role_id", 0)
-                    if role_id == 0:
-                        role = "Owner"
-                    elif role_id == 1:
-                        role = "Admin"
-                    else:
-                        role = "Member"
-
-                    # Use email as external_user_id
                     external_id = email if email else user_id
 
                     licenses.append(
@@ -242,90 +306,24 @@ class ZoomProvider(BaseProvider):
                             "external_user_id": external_id,
                             "email": email,
                             "license_type": license_type,
-                            "status": self._get_status(user.get("status", "active")),
-                            "last_activity_at": last_login,
+                            "status": "inactive",
                             "metadata": {
                                 "zoom_user_id": user_id,
                                 "email": email,
                                 "first_name": user.get("first_name"),
                                 "last_name": user.get("last_name"),
                                 "display_name": (
-                                    f"{user.get('first_name', '')} "
-                                    f"{user.get('last_name', '')}".strip()
-                                ),
+                                f"{user.get('first_name', '')} "
+                                f"{user.get('last_name', '')}".strip()
+                            ),
                                 "user_type": self.USER_TYPES.get(user_type, "Unknown"),
-                                "user_type_id": user_type,
-                                "role": role,
-                                "role_id": role_id,
-                                "department": user.get("dept"),
-                                "timezone": user.get("timezone"),
-                                "created_at": created_at.isoformat() if created_at else None,
-                                "pmi": user.get("pmi"),
-                                "verified": user.get("verified", 0) == 1,
+                                "original_status": status,
                             },
                         }
                     )
 
-                # Check for more pages
                 next_page_token = data.get("next_page_token", "")
                 if not next_page_token:
                     break
-                page_number += 1
-
-            # Also fetch inactive/pending users
-            for status in ["inactive", "pending"]:
-                next_page_token = ""
-                while True:
-                    params = {
-                        "page_size": 300,
-                        "status": status,
-                    }
-                    if next_page_token:
-                        params["next_page_token"] = next_page_token
-
-                    response = await client.get(
-                        f"{self.API_URL}/users",
-                        headers=self._get_headers(token),
-                        params=params,
-                        timeout=30.0,
-                    )
-
-                    if response.status_code != 200:
-                        break
-
-                    data = response.json()
-
-                    for user in data.get("users", []):
-                        user_id = user.get("id")
-                        email = user.get("email", "").lower().strip()
-                        user_type = user.get("type", 1)
-
-                        license_type = self._get_license_type(user_type, plan_type)
-                        external_id = email if email else user_id
-
-                        licenses.append(
-                            {
-                                "external_user_id": external_id,
-                                "email": email,
-                                "license_type": license_type,
-                                "status": "inactive",
-                                "metadata": {
-                                    "zoom_user_id": user_id,
-                                    "email": email,
-                                    "first_name": user.get("first_name"),
-                                    "last_name": user.get("last_name"),
-                                    "display_name": (
-                                    f"{user.get('first_name', '')} "
-                                    f"{user.get('last_name', '')}".strip()
-                                ),
-                                    "user_type": self.USER_TYPES.get(user_type, "Unknown"),
-                                    "original_status": status,
-                                },
-                            }
-                        )
-
-                    next_page_token = data.get("next_page_token", "")
-                    if not next_page_token:
-                        break
 
         return licenses
@@ -1,16 +1,51 @@
 """Audit log repository."""
 
+import json
 from datetime import datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import String, and_, cast, distinct, func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    any_,
+    case,
+    cast,
+    distinct,
+    func,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
 
 from licence_api.models.orm.admin_user import AdminUserORM
 from licence_api.models.orm.audit_log import AuditLogORM
 from licence_api.repositories.base import BaseRepository
 from licence_api.utils.validation import escape_like_wildcards
 
+# Approximate counts below this are replaced by an exact count
+AUDIT_EXACT_COUNT_THRESHOLD = 10000
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a query, for the planner's row estimate."""
+
+    inherit_cache = False
+
+    def __init__(self, query: Select[Any]) -> None:
+        self.query = query
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: Any, **kw: Any) -> str:
+    """Render EXPLAIN with the query's bound parameters."""
+    return "EXPLAIN (FORMAT JSON) " + str(compiler.process(element.query, **kw))
+
 
 class AuditRepository(BaseRepository[AuditLogORM]):
     """Repository for audit log operations."""
@@ -106,43 +141,47 @@ class AuditRepository(BaseRepository[AuditLogORM]):
         )
         return list(result.scalars().all())
 
-    async def get_recent(
+    @staticmethod
+    def _admin_email_match(search_term: str) -> ColumnElement[bool]:
+        """Match logs of admin users whose email is LIKE search_term.
+
+        The matching admin IDs are collected into one array first, so the
+        comparison is an index lookup on admin_user_id that PostgreSQL can
+        combine with the search_text index.
+        """
+        admin_ids = (
+            select(func.array_agg(AdminUserORM.id))
+            .where(func.lower(AdminUserORM.email).like(search_term, escape="\\"))
+            .scalar_subquery()
+        )
+        # The cast makes this ANY(array) rather than ANY(subquery)
+        return AuditLogORM.admin_user_id == any_(cast(admin_ids, ARRAY(PGUUID(as_uuid=True))))
+
+    def _apply_filters(
         self,
-        limit: int = 100,
-        offset: int = 0,
+        query: Select[Any],
         action: str | None = None,
         resource_type: str | None = None,
         admin_user_id: UUID | None = None,
         date_from: datetime | None = None,
         date_to: datetime | None = None,
         search: str | None = None,
-    ) -> tuple[list[AuditLogORM], int]:
-        """Get recent audit logs with optional filters.
+    ) -> Select[Any]:
+        """Add the audit log list filters to a query.
 
         Args:
-            limit: Maximum results
-            offset: Pagination offset
+            query: Query selecting from audit_logs
             action: Filter by action
             resource_type: Filter by resource type
             admin_user_id: Filter by admin user ID
             date_from: Filter by minimum date
             date_to: Filter by maximum date
-            search: Full-text search over email, resource_id, and changes
+            search: Substring search over action, resource type, resource_id,
+                changes and admin email
 
         Returns:
-            Tuple of (logs, total_count)
+            Filtered query
         """
-        # Base query with join to admin_users for search
-        query = select(AuditLogORM)
-        count_query = select(func.count()).select_from(AuditLogORM)
-
-        # For search, we need to join with admin_users
-        if search:
-            query = query.outerjoin(AdminUserORM, AuditLogORM.admin_user_id == AdminUserORM.id)
-            count_query = count_query.outerjoin(
-                AdminUserORM, AuditLogORM.admin_user_id == AdminUserORM.id
-            )
-
         conditions = []
 
         if action:
@@ -161,31 +200,100 @@ class AuditRepository(BaseRepository[AuditLogORM]):
             conditions.append(AuditLogORM.created_at <= date_to)
 
         if search:
-            # Escape SQL wildcards to prevent LIKE injection
+            # One LIKE on the trigram-indexed search_text column, or a match
+            # on the few admin users whose email contains the term. Escape SQL
+            # wildcards to prevent LIKE injection
             escaped_search = escape_like_wildcards(search.lower())
             search_term = f"%{escaped_search}%"
-            search_conditions = [
-                func.lower(AdminUserORM.email).like(search_term, escape="\\"),
-                cast(AuditLogORM.resource_id, String).like(search_term, escape="\\"),
-                cast(AuditLogORM.changes, String).ilike(search_term, escape="\\"),
-                func.lower(AuditLogORM.action).like(search_term, escape="\\"),
-                func.lower(AuditLogORM.resource_type).like(search_term, escape="\\"),
-            ]
-            conditions.append(or_(*search_conditions))
+            conditions.append(
+                or_(
+                    AuditLogORM.search_text.like(search_term, escape="\\"),
+                    self._admin_email_match(search_term),
+                )
+            )
 
         if conditions:
             query = query.where(and_(*conditions))
-            count_query = count_query.where(and_(*conditions))
+        return query
+
+    async def get_recent(
+        self,
+        limit: int = 100,
+        before: tuple[datetime, UUID] | None = None,
+        offset: int = 0,
+        ranked: bool = False,
+        **filters: Any,
+    ) -> list[AuditLogORM]:
+        """Get recent audit logs with optional filters, newest first.
+
+        Pages are read by keyset on (created_at, id): pass the position of
+        the last log of the previous page as before, which uses the
+        idx_audit_logs_created_id index however deep the page is. offset
+        is kept for page-number clients and scans all skipped rows.
+
+        With ranked and a search term, logs are ordered by how well they
+        match the term instead (trigram word similarity, admin email matches
+        first), newest first among equal ranks. Ranked pages are read by
+        offset only.
 
-        query = query.order_by(AuditLogORM.created_at.desc()).offset(offset).limit(limit)
+        Args:
+            limit: Maximum results
+            before: (created_at, id) of the last log of the previous page
+            offset: Number of logs to skip
+            ranked: Whether to order search results by relevance
+            **filters: Filters of _apply_filters
+
+        Returns:
+            List of audit logs
+        """
+        query = self._apply_filters(select(AuditLogORM), **filters)
+        if before is not None:
+            query = query.where(tuple_(AuditLogORM.created_at, AuditLogORM.id) < tuple_(*before))
+        search = filters.get("search")
+        if ranked and search:
+            search_term = f"%{escape_like_wildcards(search.lower())}%"
+            rank = func.greatest(
+                func.word_similarity(search.lower(), AuditLogORM.search_text),
+                case((self._admin_email_match(search_term), 1.0), else_=0.0),
+            )
+            query = query.order_by(rank.desc())
+        query = (
+            query.order_by(AuditLogORM.created_at.desc(), AuditLogORM.id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
 
         result = await self.session.execute(query)
-        logs = list(result.scalars().all())
+        return list(result.scalars().all())
+
+    async def count_logs(self, exact: bool = True, **filters: Any) -> tuple[int, bool]:
+        """Count the audit logs matching the filters.
 
-        count_result = await self.session.execute(count_query)
-        total = count_result.scalar_one()
+        An approximate count reads the planner's row estimate instead of
+        scanning every matching row. Estimates below
+        AUDIT_EXACT_COUNT_THRESHOLD are replaced by an exact count, which is
+        cheap at that size.
 
-        return logs, total
+        Args:
+            exact: Whether to always count exactly
+            **filters: Filters of _apply_filters
+
+        Returns:
+            Tuple of (count, whether the count is exact)
+        """
+        if not exact:
+            query = self._apply_filters(select(AuditLogORM.id), **filters)
+            result = await self.session.execute(_Explain(query))
+            plan = result.scalar_one()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = int(plan[0]["Plan"]["Plan Rows"])
+            if estimate >= AUDIT_EXACT_COUNT_THRESHOLD:
+                return estimate, False
+
+        count_query = self._apply_filters(select(func.count()).select_from(AuditLogORM), **filters)
+        result = await self.session.execute(count_query)
+        return result.scalar_one(), True
 
     async def get_distinct_resource_types(self) -> list[str]:
         """Get all distinct resource types from audit logs.
@@ -251,44 +359,15 @@ class AuditRepository(BaseRepository[AuditLogORM]):
         Returns:
             List of all matching audit logs
         """
-        query = select(AuditLogORM)
-
-        if search:
-            query = query.outerjoin(AdminUserORM, AuditLogORM.admin_user_id == AdminUserORM.id)
-
-        conditions = []
-
-        if action:
-            conditions.append(AuditLogORM.action == action)
-
-        if resource_type:
-            conditions.append(AuditLogORM.resource_type == resource_type)
-
-        if admin_user_id:
-            conditions.append(AuditLogORM.admin_user_id == admin_user_id)
-
-        if date_from:
-            conditions.append(AuditLogORM.created_at >= date_from)
-
-        if date_to:
-            conditions.append(AuditLogORM.created_at <= date_to)
-
-        if search:
-            # Escape SQL wildcards to prevent LIKE injection
-            escaped_search = escape_like_wildcards(search.lower())
-            search_term = f"%{escaped_search}%"
-            search_conditions = [
-                func.lower(AdminUserORM.email).like(search_term, escape="\\"),
-                cast(AuditLogORM.resource_id, String).like(search_term, escape="\\"),
-                cast(AuditLogORM.changes, String).ilike(search_term, escape="\\"),
-                func.lower(AuditLogORM.action).like(search_term, escape="\\"),
-                func.lower(AuditLogORM.resource_type).like(search_term, escape="\\"),
-            ]
-            conditions.append(or_(*search_conditions))
-
-        if conditions:
-            query = query.where(and_(*conditions))
-
+        query = self._apply_filters(
+            select(AuditLogORM),
+            action=action,
+            resource_type=resource_type,
+            admin_user_id=admin_user_id,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+        )
         query = query.order_by(AuditLogORM.created_at.desc())
 
         result = await self.session.execute(query)
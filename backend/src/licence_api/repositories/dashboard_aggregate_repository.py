@@ -0,0 +1,228 @@
+"""Dashboard aggregate repository."""
+
+from collections.abc import Collection
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, Select, delete, false, func, literal, or_, select
+from sqlalchemy.dialects.postgresql import insert
+
+from licence_api.models.orm.dashboard_aggregate import DashboardAggregateORM
+from licence_api.models.orm.employee import EmployeeORM
+from licence_api.models.orm.license import LicenseORM
+from licence_api.models.orm.provider import ProviderORM
+from licence_api.repositories.base import BaseRepository
+from licence_api.repositories.license_repository import external_license_condition
+
+# Columns filled by the license and employee aggregate queries, in select order
+_LICENSE_COLUMNS = (
+    "id",
+    "department",
+    "provider_id",
+    "licenses_total",
+    "licenses_active",
+    "licenses_unassigned",
+    "licenses_external",
+    "monthly_cost",
+    "unassigned_monthly_cost",
+    "refreshed_at",
+)
+_EMPLOYEE_COLUMNS = (
+    "id",
+    "department",
+    "employees_total",
+    "employees_active",
+    "employees_offboarded",
+    "refreshed_at",
+)
+
+
+def _department_in(column: Any, departments: Collection[str | None]) -> ColumnElement[bool]:
+    """Build a condition matching departments, where None matches NULL."""
+    named = [department for department in departments if department is not None]
+    conditions = [column.in_(named)] if named else []
+    if None in departments:
+        conditions.append(column.is_(None))
+    return or_(false(), *conditions)
+
+
+class DashboardAggregateRepository(BaseRepository[DashboardAggregateORM]):
+    """Repository for precomputed dashboard metrics.
+
+    Refreshes upsert their rows on the unique (department, provider_id) key
+    and then delete the rows of their scope they did not write, so refreshes
+    running concurrently in other transactions never leave duplicate rows.
+    """
+
+    model = DashboardAggregateORM
+
+    async def _upsert(self, columns: tuple[str, ...], query: Select) -> None:
+        """Insert the rows selected by query, replacing rows with the same key.
+
+        Args:
+            columns: Columns filled by query, in select order (starting with id)
+            query: Aggregate query
+        """
+        stmt = insert(DashboardAggregateORM).from_select(columns, query)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["department", "provider_id"],
+            set_={
+                column: stmt.excluded[column]
+                for column in columns
+                if column not in ("id", "department", "provider_id")
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def refresh_licenses(
+        self,
+        company_domains: list[str],
+        refreshed_at: datetime,
+        provider_ids: Collection[UUID] | None = None,
+        departments: Collection[str | None] | None = None,
+    ) -> None:
+        """Recompute the license rows of providers and departments.
+
+        Rows of every listed provider (all departments) and of every listed
+        department (all providers) are recomputed from the licenses table, and
+        rows of that scope without licenses left are deleted. With neither
+        given, all license rows are recomputed.
+
+        Args:
+            company_domains: Company email domains for external license counts
+            refreshed_at: Refresh timestamp stored on the new rows
+            provider_ids: Providers whose licenses changed
+            departments: Departments whose employees' licenses changed
+                (None is the bucket of licenses without employee department)
+        """
+        scope = None
+        if provider_ids is not None or departments is not None:
+            if not provider_ids and not departments:
+                return
+            scope = or_(
+                LicenseORM.provider_id.in_(list(provider_ids or [])),
+                _department_in(EmployeeORM.department, departments or []),
+            )
+
+        unassigned = LicenseORM.employee_id.is_(None)
+        if company_domains:
+            external = func.count().filter(
+                ProviderORM.name != "hibob", external_license_condition(company_domains)
+            )
+        else:
+            external = literal(0)
+        query = (
+            select(
+                func.gen_random_uuid(),
+                EmployeeORM.department,
+                LicenseORM.provider_id,
+                func.count(),
+                func.count().filter(LicenseORM.status == "active"),
+                func.count().filter(unassigned),
+                external,
+                func.coalesce(func.sum(LicenseORM.monthly_cost), 0),
+                func.coalesce(func.sum(LicenseORM.monthly_cost).filter(unassigned), 0),
+                literal(refreshed_at),
+            )
+            .select_from(LicenseORM)
+            .join(ProviderORM, LicenseORM.provider_id == ProviderORM.id)
+            .outerjoin(EmployeeORM, LicenseORM.employee_id == EmployeeORM.id)
+            .group_by(EmployeeORM.department, LicenseORM.provider_id)
+        )
+        if scope is not None:
+            query = query.where(scope)
+        await self._upsert(_LICENSE_COLUMNS, query)
+
+        # Rows the refresh did not write have no licenses left
+        stale = DashboardAggregateORM.provider_id.is_not(None) & (
+            DashboardAggregateORM.refreshed_at < refreshed_at
+        )
+        if scope is not None:
+            stale = stale & or_(
+                DashboardAggregateORM.provider_id.in_(list(provider_ids or [])),
+                _department_in(DashboardAggregateORM.department, departments or []),
+            )
+        await self.session.execute(delete(DashboardAggregateORM).where(stale))
+
+    async def refresh_employees(self, refreshed_at: datetime) -> None:
+        """Recompute the employee rows of all departments.
+
+        Args:
+            refreshed_at: Refresh timestamp stored on the new rows
+        """
+        query = select(
+            func.gen_random_uuid(),
+            EmployeeORM.department,
+            func.count(),
+            func.count().filter(EmployeeORM.status == "active"),
+            func.count().filter(EmployeeORM.status == "offboarded"),
+            literal(refreshed_at),
+        ).group_by(EmployeeORM.department)
+        await self._upsert(_EMPLOYEE_COLUMNS, query)
+
+        # Rows the refresh did not write have no employees left
+        await self.session.execute(
+            delete(DashboardAggregateORM).where(
+                DashboardAggregateORM.provider_id.is_(None),
+                DashboardAggregateORM.refreshed_at < refreshed_at,
+            )
+        )
+
+    async def get_totals(self, department: str | None = None) -> dict[str, Any]:
+        """Sum the dashboard metrics of all rows, or of one department.
+
+        Args:
+            department: Optional department filter
+
+        Returns:
+            Dict with the summed metrics, the row count and the oldest and
+            newest refreshed_at of the rows
+        """
+        query = select(
+            func.count().label("rows"),
+            func.coalesce(func.sum(DashboardAggregateORM.employees_total), 0).label(
+                "employees_total"
+            ),
+            func.coalesce(func.sum(DashboardAggregateORM.employees_active), 0).label(
+                "employees_active"
+            ),
+            func.coalesce(func.sum(DashboardAggregateORM.employees_offboarded), 0).label(
+                "employees_offboarded"
+            ),
+            func.coalesce(func.sum(DashboardAggregateORM.licenses_total), 0).label(
+                "licenses_total"
+            ),
+            func.coalesce(func.sum(DashboardAggregateORM.licenses_active), 0).label(
+                "licenses_active"
+            ),
+            func.coalesce(func.sum(DashboardAggregateORM.licenses_unassigned), 0).label(
+                "licenses_unassigned"
+            ),
+            func.coalesce(func.sum(DashboardAggregateORM.licenses_external), 0).label(
+                "licenses_external"
+            ),
+            func.coalesce(func.sum(DashboardAggregateORM.monthly_cost), Decimal("0")).label(
+                "monthly_cost"
+            ),
+            func.coalesce(
+                func.sum(DashboardAggregateORM.unassigned_monthly_cost), Decimal("0")
+            ).label("unassigned_monthly_cost"),
+            func.min(DashboardAggregateORM.refreshed_at).label("oldest_refreshed_at"),
+            func.max(DashboardAggregateORM.refreshed_at).label("refreshed_at"),
+        )
+        if department:
+            query = query.where(DashboardAggregateORM.department == department)
+
+        result = await self.session.execute(query)
+        return dict(result.one()._mapping)
+
+    async def has_rows(self) -> bool:
+        """Check whether the aggregates were computed at all.
+
+        Returns:
+            True if any aggregate row exists
+        """
+        result = await self.session.execute(select(DashboardAggregateORM.id).limit(1))
+        return result.first() is not None
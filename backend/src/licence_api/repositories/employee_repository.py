@@ -4,7 +4,7 @@ import calendar
 from datetime import date, datetime, timedelta
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, or_, select, update
 
 from licence_api.models.orm.employee import EmployeeORM
 from licence_api.models.orm.license import LicenseORM
@@ -25,6 +25,9 @@ VALID_SORT_COLUMNS = {
     "license_count",
 }
 
+# Maximum number of IDs per statement for bulk sync updates
+BULK_CHUNK_SIZE = 1000
+
 
 class EmployeeRepository(BaseRepository[EmployeeORM]):
     """Repository for employee operations."""
@@ -253,6 +256,7 @@ class EmployeeRepository(BaseRepository[EmployeeORM]):
         termination_date: datetime | None,
         synced_at: datetime,
         manager_email: str | None = None,
+        existing: EmployeeORM | None = None,
     ) -> EmployeeORM:
         """Create or update employee by HiBob ID.
 
@@ -266,11 +270,13 @@ class EmployeeRepository(BaseRepository[EmployeeORM]):
             termination_date: Termination date
             synced_at: Sync timestamp
             manager_email: Manager's email address (resolved to ID after sync)
+            existing: Already loaded employee with this HiBob ID, to skip the lookup
 
         Returns:
             Created or updated EmployeeORM
         """
-        existing = await self.get_by_hibob_id(hibob_id)
+        if existing is None:
+            existing = await self.get_by_hibob_id(hibob_id)
 
         if existing:
             existing.email = email
@@ -297,19 +303,116 @@ class EmployeeRepository(BaseRepository[EmployeeORM]):
             manager_email=manager_email,
         )
 
-    async def resolve_manager_ids(self) -> int:
-        """Resolve manager_email to manager_id for all employees.
+    async def touch_synced_at(
+        self,
+        employee_ids: list[UUID],
+        synced_at: datetime,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> None:
+        """Set synced_at on employees whose HRIS data did not change.
+
+        Args:
+            employee_ids: Employee UUIDs
+            synced_at: Sync timestamp
+            chunk_size: Number of IDs per statement
+        """
+        for start in range(0, len(employee_ids), chunk_size):
+            await self.session.execute(
+                update(EmployeeORM)
+                .where(EmployeeORM.id.in_(employee_ids[start : start + chunk_size]))
+                .values(synced_at=synced_at)
+            )
+
+    async def offboard_terminated(self, today: date) -> dict[UUID, str | None]:
+        """Mark synced employees whose termination date has passed as offboarded.
+
+        HRIS syncs derive the offboarded status from the termination date. An
+        incremental sync only sees employees changed in the HRIS, so employees
+        whose termination date passed since their last change are updated here.
+
+        Args:
+            today: Current date
 
-        This should be called after syncing all employees to link
+        Returns:
+            Dict of offboarded employee ID -> department
+        """
+        result = await self.session.execute(
+            update(EmployeeORM)
+            .where(
+                and_(
+                    EmployeeORM.source != "manual",
+                    EmployeeORM.status != "offboarded",
+                    EmployeeORM.termination_date.isnot(None),
+                    EmployeeORM.termination_date <= today,
+                )
+            )
+            .values(status="offboarded")
+            .returning(EmployeeORM.id, EmployeeORM.department)
+        )
+        return {row.id: row.department for row in result}
+
+    async def get_departments_by_ids(
+        self,
+        employee_ids: list[UUID],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> set[str]:
+        """Get the departments of employees.
+
+        Args:
+            employee_ids: Employee UUIDs
+            chunk_size: Number of IDs per query
+
+        Returns:
+            Set of department names (employees without department are ignored)
+        """
+        departments: set[str] = set()
+        for start in range(0, len(employee_ids), chunk_size):
+            result = await self.session.execute(
+                select(EmployeeORM.department)
+                .where(
+                    EmployeeORM.id.in_(employee_ids[start : start + chunk_size]),
+                    EmployeeORM.department.isnot(None),
+                )
+                .distinct()
+            )
+            departments.update(result.scalars().all())
+        return departments
+
+    async def resolve_manager_ids(
+        self,
+        employee_ids: list[UUID] | None = None,
+        manager_emails: list[str] | None = None,
+    ) -> int:
+        """Resolve manager_email to manager_id.
+
+        This should be called after syncing employees to link
         managers by their email addresses.
 
+        Without arguments all employees are resolved. An incremental sync
+        passes the affected employees instead: those whose own manager_email
+        changed, and the direct reports of employees whose email changed.
+
         Uses batch query to avoid N+1 problem when resolving managers.
 
+        Args:
+            employee_ids: Only resolve these employees
+            manager_emails: Also resolve employees reporting to these emails
+
         Returns:
             Number of manager relationships resolved
         """
-        # Get all employees with manager_email
         query = select(EmployeeORM).where(EmployeeORM.manager_email.isnot(None))
+        if employee_ids is not None or manager_emails is not None:
+            scope = []
+            if employee_ids:
+                scope.append(EmployeeORM.id.in_(employee_ids))
+            if manager_emails:
+                scope.append(
+                    func.lower(EmployeeORM.manager_email).in_([e.lower() for e in manager_emails])
+                )
+            if not scope:
+                return 0
+            query = query.where(or_(*scope))
         result = await self.session.execute(query)
         employees = result.scalars().all()
 
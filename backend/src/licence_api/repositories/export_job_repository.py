@@ -0,0 +1,69 @@
+"""Export job repository."""
+
+from datetime import datetime
+
+from sqlalchemy import select, update
+
+from licence_api.models.orm.export_job import ExportJobORM
+from licence_api.repositories.base import BaseRepository
+
+# Statuses of jobs that have not finished yet
+ACTIVE_EXPORT_JOB_STATUSES = ("pending", "running")
+
+
+class ExportJobRepository(BaseRepository[ExportJobORM]):
+    """Repository for export job operations."""
+
+    model = ExportJobORM
+
+    async def get_recent(self, limit: int = 20) -> list[ExportJobORM]:
+        """Get the most recently created export jobs.
+
+        Args:
+            limit: Maximum number of jobs
+
+        Returns:
+            List of export jobs, newest first
+        """
+        result = await self.session.execute(
+            select(ExportJobORM).order_by(ExportJobORM.created_at.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_finished_before(self, completed_before: datetime) -> list[ExportJobORM]:
+        """Get jobs that finished before a point in time.
+
+        Args:
+            completed_before: Completion timestamp cutoff
+
+        Returns:
+            List of finished export jobs
+        """
+        result = await self.session.execute(
+            select(ExportJobORM).where(
+                ExportJobORM.status.not_in(ACTIVE_EXPORT_JOB_STATUSES),
+                ExportJobORM.completed_at < completed_before,
+            )
+        )
+        return list(result.scalars().all())
+
+    async def fail_interrupted(self, completed_at: datetime) -> int:
+        """Mark jobs left active by a previous process as failed.
+
+        Args:
+            completed_at: Completion timestamp to record
+
+        Returns:
+            Number of jobs marked as failed
+        """
+        result = await self.session.execute(
+            update(ExportJobORM)
+            .where(ExportJobORM.status.in_(ACTIVE_EXPORT_JOB_STATUSES))
+            .values(
+                status="failed",
+                error_message="Interrupted by a restart",
+                completed_at=completed_at,
+            )
+            .returning(ExportJobORM.id)
+        )
+        return len(result.all())
@@ -1,11 +1,12 @@
 """License repository."""
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from typing import Any
-from uuid import UUID
+from uuid import UUID, uuid4
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import ColumnElement, and_, func, or_, select
 
 from licence_api.models.orm.employee import EmployeeORM
 from licence_api.models.orm.license import LicenseORM
@@ -13,6 +14,65 @@ from licence_api.models.orm.provider import ProviderORM
 from licence_api.repositories.base import BaseRepository
 from licence_api.utils.validation import escape_like_wildcards
 
+# Provider-supplied license content, covered by licenses.sync_fingerprint
+SYNC_CONTENT_COLUMNS = (
+    "license_type",
+    "status",
+    "assigned_at",
+    "last_activity_at",
+    "monthly_cost",
+    "currency",
+    "metadata",
+)
+
+# Columns written by provider sync (table column names, "metadata" is extra_data)
+SYNC_COLUMNS = (
+    "provider_id",
+    "external_user_id",
+    "employee_id",
+    *SYNC_CONTENT_COLUMNS,
+    "synced_at",
+    "sync_fingerprint",
+    "is_service_account",
+    "service_account_name",
+    "service_account_owner_id",
+    "is_admin_account",
+    "admin_account_name",
+    "admin_account_owner_id",
+    "suggested_employee_id",
+    "match_confidence",
+    "match_method",
+    "match_status",
+)
+
+# Rows per bulk statement (asyncpg allows at most 32767 bind parameters)
+BULK_CHUNK_SIZE = 1000
+
+
+def external_license_condition(company_domains: list[str]) -> ColumnElement[bool]:
+    """Build the SQL condition for licenses with external email addresses.
+
+    A license is external if its external_user_id is email-like and its
+    domain is neither a company domain nor a subdomain of one.
+
+    Args:
+        company_domains: List of company email domains
+
+    Returns:
+        Condition on LicenseORM.email_domain
+    """
+    domains = [domain.lower() for domain in company_domains]
+    return and_(
+        LicenseORM.email_domain.is_not(None),
+        LicenseORM.email_domain.not_in(domains),
+        # Also exclude subdomain matches (e.g., @sub.company.com)
+        # Escape SQL wildcards in domains to prevent injection
+        *(
+            ~LicenseORM.email_domain.like(f"%.{escape_like_wildcards(domain)}", escape="\\")
+            for domain in domains
+        ),
+    )
+
 
 class LicenseRepository(BaseRepository[LicenseORM]):
     """Repository for license operations."""
@@ -142,30 +202,9 @@ class LicenseRepository(BaseRepository[LicenseORM]):
             query = query.where(search_filter)
             count_query = count_query.where(search_filter)
 
-        # External email filter - filter at SQL level for performance
+        # External email filter - filter at SQL level on the indexed email domain
         if external_only and company_domains:
-            # Must have @ sign (be an email-like identifier)
-            email_condition = LicenseORM.external_user_id.like("%@%")
-            # Must NOT match any company domain
-            # Escape SQL wildcards in domains to prevent injection
-            domain_conditions = [
-                ~LicenseORM.external_user_id.ilike(
-                    f"%@{escape_like_wildcards(domain)}", escape="\\"
-                )
-                for domain in company_domains
-            ]
-            # Also exclude subdomain matches (e.g., @sub.company.com)
-            subdomain_conditions = [
-                ~LicenseORM.external_user_id.ilike(
-                    f"%@%.{escape_like_wildcards(domain)}", escape="\\"
-                )
-                for domain in company_domains
-            ]
-            external_filter = and_(
-                email_condition,
-                *domain_conditions,
-                *subdomain_conditions,
-            )
+            external_filter = external_license_condition(company_domains)
             query = query.where(external_filter)
             count_query = count_query.where(external_filter)
 
@@ -201,6 +240,49 @@ class LicenseRepository(BaseRepository[LicenseORM]):
 
         return licenses, total
 
+    async def stream_with_details(
+        self,
+        provider_id: UUID | None = None,
+        department: str | None = None,
+        status: str | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[list[tuple[LicenseORM, ProviderORM, EmployeeORM | None]]]:
+        """Stream licenses with provider and employee details in batches.
+
+        Rows are read through a server-side cursor, so only one batch is held
+        in memory at a time and there is no limit on the number of rows.
+        Ordered like get_all_with_details by default (newest sync first).
+
+        Args:
+            provider_id: Filter by provider
+            department: Filter by employee department
+            status: Filter by status
+            batch_size: Rows fetched from the cursor per batch
+
+        Yields:
+            Lists of (license, provider, employee) tuples
+        """
+        query = (
+            select(LicenseORM, ProviderORM, EmployeeORM)
+            .join(ProviderORM, LicenseORM.provider_id == ProviderORM.id)
+            .outerjoin(EmployeeORM, LicenseORM.employee_id == EmployeeORM.id)
+            .order_by(LicenseORM.synced_at.desc().nulls_last(), LicenseORM.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if provider_id:
+            query = query.where(LicenseORM.provider_id == provider_id)
+        if department:
+            query = query.where(EmployeeORM.department == department)
+        if status:
+            query = query.where(LicenseORM.status == status)
+
+        result = await self.session.stream(query)
+        try:
+            async for partition in result.partitions():
+                yield [tuple(row) for row in partition]
+        finally:
+            await result.close()
+
     async def get_inactive(
         self,
         days_threshold: int = 30,
@@ -316,6 +398,68 @@ class LicenseRepository(BaseRepository[LicenseORM]):
             synced_at=synced_at,
         )
 
+    async def get_sync_state_by_provider(self, provider_id: UUID) -> dict[str, dict[str, Any]]:
+        """Load the sync state of all license rows of a provider in one query.
+
+        Provider-supplied content (SYNC_CONTENT_COLUMNS, including the metadata
+        JSON) is not loaded; the stored sync_fingerprint stands in for it. Rows
+        are returned as plain column mappings keyed by table column name, which
+        keeps the identity map empty for providers with many thousands of seats.
+
+        Args:
+            provider_id: Provider UUID
+
+        Returns:
+            Dict of external_user_id -> column mapping
+        """
+        table = LicenseORM.__table__
+        columns = [
+            table.c.id,
+            *(table.c[name] for name in SYNC_COLUMNS if name not in SYNC_CONTENT_COLUMNS),
+            table.c.match_reviewed_at,
+        ]
+        result = await self.session.execute(
+            select(*columns).where(table.c.provider_id == provider_id)
+        )
+        return {row["external_user_id"]: dict(row) for row in result.mappings()}
+
+    async def bulk_upsert(
+        self,
+        rows: list[dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> None:
+        """Insert or update licenses with batched INSERT ... ON CONFLICT DO UPDATE.
+
+        Each row must contain every column in SYNC_COLUMNS, keyed by table
+        column name. Conflicts on (provider_id, external_user_id) update all
+        sync columns and bump updated_at.
+
+        Args:
+            rows: License rows to write
+            chunk_size: Number of rows per statement
+        """
+        if not rows:
+            return
+
+        from sqlalchemy.dialects.postgresql import insert
+
+        table = LicenseORM.__table__
+        for start in range(0, len(rows), chunk_size):
+            chunk = [{"id": uuid4(), **row} for row in rows[start : start + chunk_size]]
+            stmt = insert(table).values(chunk)
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_license_provider_external",
+                set_={
+                    **{
+                        name: stmt.excluded[name]
+                        for name in SYNC_COLUMNS
+                        if name not in ("provider_id", "external_user_id")
+                    },
+                    "updated_at": func.now(),
+                },
+            )
+            await self.session.execute(stmt)
+
     async def get_statistics(
         self,
         department: str | None = None,
@@ -951,6 +1095,143 @@ class LicenseRepository(BaseRepository[LicenseORM]):
 
         return counts
 
+    async def get_totals_excluding_provider(self, provider_name: str) -> dict[str, Any]:
+        """Get license counts and the monthly cost sum of all other providers.
+
+        Args:
+            provider_name: Provider type whose licenses are not counted (e.g. "hibob")
+
+        Returns:
+            Dict with total, active and unassigned counts and total_monthly_cost
+        """
+        result = await self.session.execute(
+            select(
+                func.count(),
+                func.count().filter(LicenseORM.status == "active"),
+                func.count().filter(LicenseORM.employee_id.is_(None)),
+                func.coalesce(func.sum(LicenseORM.monthly_cost), Decimal("0")),
+            )
+            .join(ProviderORM, LicenseORM.provider_id == ProviderORM.id)
+            .where(ProviderORM.name != provider_name)
+        )
+        total, active, unassigned, total_cost = result.one()
+        return {
+            "total": total,
+            "active": active,
+            "unassigned": unassigned,
+            "total_monthly_cost": total_cost,
+        }
+
+    async def get_cost_totals_by_provider(
+        self,
+        department: str | None = None,
+    ) -> list[tuple[str, str, Decimal, int, bool]]:
+        """Get license costs summed per provider and currency.
+
+        Licenses of all statuses count, since unassigned and inactive licenses
+        still cost money. HRIS providers (hibob) are excluded.
+
+        Args:
+            department: Only count licenses of employees in this department
+
+        Returns:
+            List of (provider display name, currency, monthly cost sum,
+            license count, whether any license has a cost) tuples
+        """
+        cost = func.coalesce(LicenseORM.monthly_cost, 0)
+        query = (
+            select(
+                ProviderORM.display_name,
+                LicenseORM.currency,
+                func.sum(cost),
+                func.count(),
+                func.bool_or(cost > 0),
+            )
+            .join(ProviderORM, LicenseORM.provider_id == ProviderORM.id)
+            .where(ProviderORM.name != "hibob")
+            .group_by(ProviderORM.display_name, LicenseORM.currency)
+        )
+        if department:
+            query = query.join(EmployeeORM, LicenseORM.employee_id == EmployeeORM.id).where(
+                EmployeeORM.department == department
+            )
+
+        result = await self.session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    async def get_active_cost_totals_by_employee(
+        self,
+        department: str | None = None,
+        min_cost: Decimal | None = None,
+    ) -> list[tuple[EmployeeORM, int, Decimal]]:
+        """Get active license counts and costs summed per assigned employee.
+
+        HRIS providers (hibob) are excluded.
+
+        Args:
+            department: Filter by employee department
+            min_cost: Only return employees with at least this monthly cost
+
+        Returns:
+            List of (employee, license count, monthly cost sum) tuples,
+            highest cost first
+        """
+        total_cost = func.sum(func.coalesce(LicenseORM.monthly_cost, 0))
+        query = (
+            select(EmployeeORM, func.count(LicenseORM.id), total_cost)
+            .join(LicenseORM, LicenseORM.employee_id == EmployeeORM.id)
+            .join(ProviderORM, LicenseORM.provider_id == ProviderORM.id)
+            .where(LicenseORM.status == "active", ProviderORM.name != "hibob")
+            .group_by(EmployeeORM.id)
+            .order_by(total_cost.desc(), EmployeeORM.full_name)
+        )
+        if department:
+            query = query.where(EmployeeORM.department == department)
+        if min_cost is not None:
+            query = query.having(total_cost >= min_cost)
+
+        result = await self.session.execute(query)
+        return [tuple(row) for row in result.all()]
+
+    async def get_active_license_costs_for_employees(
+        self,
+        employee_ids: list[UUID],
+    ) -> dict[UUID, list[tuple[str, str | None, Decimal | None]]]:
+        """Get the active licenses of multiple employees with their costs.
+
+        HRIS providers (hibob) are excluded.
+
+        Args:
+            employee_ids: List of employee UUIDs
+
+        Returns:
+            Dict mapping employee ID to list of (provider display name,
+            license type, monthly cost) tuples
+        """
+        if not employee_ids:
+            return {}
+
+        result = await self.session.execute(
+            select(
+                LicenseORM.employee_id,
+                ProviderORM.display_name,
+                LicenseORM.license_type,
+                LicenseORM.monthly_cost,
+            )
+            .join(ProviderORM, LicenseORM.provider_id == ProviderORM.id)
+            .where(
+                LicenseORM.employee_id.in_(employee_ids),
+                LicenseORM.status == "active",
+                ProviderORM.name != "hibob",
+            )
+            .order_by(ProviderORM.display_name, LicenseORM.license_type)
+        )
+
+        grouped: dict[UUID, list[tuple[str, str | None, Decimal | None]]] = {}
+        for employee_id, provider_name, license_type, monthly_cost in result.all():
+            grouped.setdefault(employee_id, []).append((provider_name, license_type, monthly_cost))
+        return grouped
+
     async def count_external_licenses(
         self,
         company_domains: list[str],
@@ -987,19 +1268,7 @@ class LicenseRepository(BaseRepository[LicenseORM]):
         if exclude_provider_name:
             query = query.where(ProviderORM.name != exclude_provider_name)
 
-        # Must have @ sign (be an email-like identifier)
-        query = query.where(LicenseORM.external_user_id.like("%@%"))
-
-        # Must NOT match any company domain
-        # Escape SQL wildcards in domains to prevent injection
-        for domain in company_domains:
-            escaped_domain = escape_like_wildcards(domain)
-            query = query.where(
-                ~LicenseORM.external_user_id.ilike(f"%@{escaped_domain}", escape="\\")
-            )
-            query = query.where(
-                ~LicenseORM.external_user_id.ilike(f"%@%.{escaped_domain}", escape="\\")
-            )
+        query = query.where(external_license_condition(company_domains))
 
         result = await self.session.execute(query)
         return result.scalar_one()
@@ -1163,50 +1432,37 @@ class LicenseRepository(BaseRepository[LicenseORM]):
             }
         return provider_stats
 
-    async def count_external_by_provider(
+    async def get_external_stats_by_provider(
         self,
-        provider_id: UUID,
         company_domains: list[str],
-    ) -> dict[str, int | Decimal]:
-        """Count external licenses and their cost for a provider.
+    ) -> dict[str, dict[str, int | Decimal]]:
+        """Count active external licenses and their cost for all providers.
 
         Args:
-            provider_id: Provider UUID
-            company_domains: List of company email domains (lowercase)
+            company_domains: List of company email domains
 
         Returns:
-            Dict with 'count' and 'cost' keys
+            Dict mapping provider_id_str to dict with 'count' and 'cost' keys
         """
-        from decimal import Decimal
-
-        from sqlalchemy import literal
-
-        conditions = [
-            LicenseORM.provider_id == provider_id,
-            LicenseORM.status == "active",
-            LicenseORM.external_user_id.like("%@%"),
-        ]
-        for domain in company_domains:
-            conditions.append(
-                ~func.lower(LicenseORM.external_user_id).like(
-                f"%@{escape_like_wildcards(domain.lower())}", escape="\\"
-            )
-            )
+        if not company_domains:
+            return {}
 
         result = await self.session.execute(
             select(
-                func.count().label("count"),
-                func.coalesce(func.sum(LicenseORM.monthly_cost), literal(Decimal("0"))).label(
-                    "cost"
-                ),
+                LicenseORM.provider_id,
+                func.count(),
+                func.coalesce(func.sum(LicenseORM.monthly_cost), 0),
             )
-            .select_from(LicenseORM)
-            .where(and_(*conditions))
+            .where(
+                LicenseORM.status == "active",
+                external_license_condition(company_domains),
+            )
+            .group_by(LicenseORM.provider_id)
         )
-        row = result.one()
+
         return {
-            "count": row.count or 0,
-            "cost": row.cost or Decimal("0"),
+            str(provider_id): {"count": count, "cost": cost}
+            for provider_id, count, cost in result.all()
         }
 
     async def get_by_id_with_provider(self, license_id: UUID) -> LicenseORM | None:
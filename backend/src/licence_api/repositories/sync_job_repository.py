@@ -0,0 +1,125 @@
+"""Sync job repository."""
+
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select, update
+
+from licence_api.models.orm.sync_job import SyncJobORM
+from licence_api.repositories.base import BaseRepository
+
+# Statuses of jobs that have not finished yet
+ACTIVE_SYNC_JOB_STATUSES = ("pending", "running")
+
+
+class SyncJobRepository(BaseRepository[SyncJobORM]):
+    """Repository for sync job operations."""
+
+    model = SyncJobORM
+
+    async def get_recent(self, limit: int = 20) -> list[SyncJobORM]:
+        """Get the most recently created sync jobs.
+
+        Args:
+            limit: Maximum number of jobs
+
+        Returns:
+            List of sync jobs, newest first
+        """
+        result = await self.session.execute(
+            select(SyncJobORM).order_by(SyncJobORM.created_at.desc()).limit(limit)
+        )
+        return list(result.scalars().all())
+
+    async def get_active(self, provider_id: UUID | None) -> SyncJobORM | None:
+        """Get a pending or running job for the same providers.
+
+        Args:
+            provider_id: Provider UUID, or None for a job syncing all providers
+
+        Returns:
+            Active SyncJobORM or None
+        """
+        scope = (
+            SyncJobORM.provider_id.is_(None)
+            if provider_id is None
+            else SyncJobORM.provider_id == provider_id
+        )
+        result = await self.session.execute(
+            select(SyncJobORM)
+            .where(scope, SyncJobORM.status.in_(ACTIVE_SYNC_JOB_STATUSES))
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def save_progress(
+        self,
+        job_id: UUID,
+        progress: dict[str, Any],
+        completed_providers: int,
+        failed_providers: int,
+    ) -> bool:
+        """Store progress counters of a running job.
+
+        Args:
+            job_id: Sync job UUID
+            progress: Per-provider progress
+            completed_providers: Number of finished providers
+            failed_providers: Number of failed providers
+
+        Returns:
+            True if cancellation of the job was requested
+        """
+        result = await self.session.execute(
+            update(SyncJobORM)
+            .where(SyncJobORM.id == job_id)
+            .values(
+                progress=progress,
+                completed_providers=completed_providers,
+                failed_providers=failed_providers,
+            )
+            .returning(SyncJobORM.cancel_requested)
+        )
+        return bool(result.scalar_one_or_none())
+
+    async def request_cancel(self, job_id: UUID) -> bool:
+        """Request cancellation of a pending or running job.
+
+        Args:
+            job_id: Sync job UUID
+
+        Returns:
+            True if the job was still active
+        """
+        result = await self.session.execute(
+            update(SyncJobORM)
+            .where(
+                SyncJobORM.id == job_id,
+                SyncJobORM.status.in_(ACTIVE_SYNC_JOB_STATUSES),
+            )
+            .values(cancel_requested=True)
+            .returning(SyncJobORM.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def fail_interrupted(self, completed_at: datetime) -> int:
+        """Mark jobs left active by a previous process as failed.
+
+        Args:
+            completed_at: Completion timestamp to record
+
+        Returns:
+            Number of jobs marked as failed
+        """
+        result = await self.session.execute(
+            update(SyncJobORM)
+            .where(SyncJobORM.status.in_(ACTIVE_SYNC_JOB_STATUSES))
+            .values(
+                status="failed",
+                error_message="Interrupted by a restart",
+                completed_at=completed_at,
+            )
+            .returning(SyncJobORM.id)
+        )
+        return len(result.all())
@@ -19,6 +19,7 @@ from licence_api.models.dto.audit import (
 from licence_api.security.auth import Permissions, require_permission
 from licence_api.security.rate_limit import API_DEFAULT_LIMIT, EXPENSIVE_READ_LIMIT, limiter
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.utils.errors import raise_bad_request
 
 router = APIRouter()
 
@@ -87,6 +88,9 @@ async def list_audit_logs(
     audit_service: Annotated[AuditService, Depends(get_audit_service)],
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=10, le=100),
+    cursor: str | None = Query(None, max_length=200),
+    exact_count: bool = Query(False),
+    ranked: bool = Query(False),
     action: str | None = Query(None, max_length=50),
     resource_type: str | None = Query(None, max_length=50),
     admin_user_id: UUID | None = Query(None),
@@ -94,19 +98,30 @@ async def list_audit_logs(
     date_to: datetime | None = Query(None),
     search: str | None = Query(None, min_length=2, max_length=200),
 ) -> AuditLogListResponse:
-    """List audit logs with optional filters. Requires audit.view permission."""
-    return await audit_service.list_audit_logs(
-        page=page,
-        page_size=page_size,
-        action=action,
-        resource_type=resource_type,
-        admin_user_id=admin_user_id,
-        date_from=date_from,
-        date_to=date_to,
-        search=search,
-        allowed_actions=ALLOWED_ACTIONS,
-        allowed_resource_types=ALLOWED_RESOURCE_TYPES,
-    )
+    """List audit logs with optional filters. Requires audit.view permission.
+
+    Pass next_cursor of a page as cursor to read the next one. The total is
+    estimated for large results unless exact_count is set. With ranked, a
+    search is ordered by relevance and paged by page number.
+    """
+    try:
+        return await audit_service.list_audit_logs(
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            exact_count=exact_count,
+            ranked=ranked,
+            action=action,
+            resource_type=resource_type,
+            admin_user_id=admin_user_id,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            allowed_actions=ALLOWED_ACTIONS,
+            allowed_resource_types=ALLOWED_RESOURCE_TYPES,
+        )
+    except ValueError:
+        raise_bad_request("Invalid cursor")
 
 
 @router.get("/export")
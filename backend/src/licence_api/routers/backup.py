@@ -1,11 +1,13 @@
 """Backup router for system export and restore."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Path, Request, UploadFile, status
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from licence_api.dependencies import get_backup_service
@@ -83,6 +85,40 @@ async def read_upload_with_limit(
     return b"".join(chunks)
 
 
+async def iter_upload_with_limit(
+    file: UploadFile,
+    max_size: int,
+) -> AsyncIterator[bytes]:
+    """Read an uploaded file in chunks with size limit.
+
+    Like read_upload_with_limit, but yields the chunks instead of joining
+    them, so the file can be processed while it is read.
+
+    Args:
+        file: The uploaded file
+        max_size: Maximum allowed file size in bytes
+
+    Yields:
+        The file content in chunks of READ_CHUNK_SIZE bytes
+
+    Raises:
+        HTTPException: If file exceeds max_size
+    """
+    total_size = 0
+
+    while True:
+        chunk = await file.read(READ_CHUNK_SIZE)
+        if not chunk:
+            break
+        total_size += len(chunk)
+        if total_size > max_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File too large. Maximum size: {max_size // 1024 // 1024}MB",
+            )
+        yield chunk
+
+
 @router.post("/export")
 @limiter.limit(BACKUP_EXPORT_LIMIT)
 async def create_backup(
@@ -90,21 +126,24 @@ async def create_backup(
     body: BackupExportRequest,
     current_user: Annotated[AdminUser, Depends(require_permission(Permissions.SYSTEM_ADMIN))],
     service: Annotated[BackupService, Depends(get_backup_service)],
-) -> Response:
+) -> StreamingResponse:
     """Create an encrypted backup of all system data.
 
     Requires system.admin permission.
 
-    Returns encrypted backup file as application/octet-stream.
+    Returns the encrypted backup file as application/octet-stream, streamed
+    while the tables are read. The first chunk is produced before the
+    response starts, so setup errors still return an error status; a backup
+    interrupted later is truncated and fails verification on restore.
     """
+    logger.info(f"Starting backup for user_id={current_user.id}")
+    chunks = service.stream_backup(
+        password=body.password,
+        user=current_user,
+        request=request,
+    )
     try:
-        logger.info(f"Starting backup for user_id={current_user.id}")
-        backup_data = await service.create_backup(
-            password=body.password,
-            user=current_user,
-            request=request,
-        )
-        logger.info(f"Backup created successfully, size: {len(backup_data)} bytes")
+        first_chunk = await anext(chunks)
     except (ValueError, KeyError, TypeError) as e:
         # Configuration or data format errors
         logger.error(f"Backup failed with ValueError/KeyError/TypeError: {e}", exc_info=True)
@@ -112,13 +151,6 @@ async def create_backup(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid backup configuration",
         )
-    except OSError as e:
-        # File system errors
-        logger.error(f"Backup failed with OSError: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create backup due to storage error",
-        )
     except Exception as e:
         # Generic fallback - don't expose internal details
         logger.error(f"Backup failed with unexpected error: {e}", exc_info=True)
@@ -127,17 +159,26 @@ async def create_backup(
             detail="Failed to create backup",
         )
 
+    async def backup_stream() -> AsyncIterator[bytes]:
+        yield first_chunk
+        size = len(first_chunk)
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                yield chunk
+        except Exception as e:
+            logger.error(f"Backup failed after {size} bytes: {e}", exc_info=True)
+            raise
+        logger.info(f"Backup created successfully, size: {size} bytes")
+
     # Generate filename with timestamp
     timestamp = datetime.now(UTC).strftime("%Y-%m-%d-%H%M%S")
     filename = f"licence-backup-{timestamp}.lcbak"
 
-    return Response(
-        content=backup_data,
+    return StreamingResponse(
+        backup_stream(),
         media_type="application/octet-stream",
-        headers={
-            "Content-Disposition": f'attachment; filename="{filename}"',
-            "Content-Length": str(len(backup_data)),
-        },
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -171,7 +212,8 @@ async def get_backup_info(
             error="Empty file",
         )
 
-    return service.get_backup_info(content)
+    # Hashing a large file would block the event loop
+    return await asyncio.to_thread(service.get_backup_info, content)
 
 
 # Rate limit for setup restore (stricter since no auth)
@@ -213,14 +255,12 @@ async def setup_restore_backup(
     if not file.filename.endswith(".lcbak"):
         raise_bad_request("Invalid file type. Expected .lcbak file")
 
-    # Read file with streaming size check
-    content = await read_upload_with_limit(file, MAX_BACKUP_SIZE)
-
-    if len(content) == 0:
+    if file.size == 0:
         raise_bad_request("Empty file")
 
+    # Restore while the file is read, with streaming size check
     return await service.restore_backup(
-        file_data=content,
+        chunks=iter_upload_with_limit(file, MAX_BACKUP_SIZE),
         password=password,
         user=None,  # No user during setup
         request=request,
@@ -4,14 +4,23 @@ from datetime import date
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
-from licence_api.dependencies import get_export_service
+from licence_api.dependencies import get_export_job_service, get_export_service
+from licence_api.exceptions import ExportJobNotFoundError, ExportJobNotReadyError
 from licence_api.models.domain.admin_user import AdminUser
+from licence_api.models.dto.export_job import ExportJobListResponse, ExportJobResponse
 from licence_api.security.auth import Permissions, require_permission
-from licence_api.security.rate_limit import EXPENSIVE_READ_LIMIT, limiter
+from licence_api.security.rate_limit import (
+    API_DEFAULT_LIMIT,
+    EXPENSIVE_READ_LIMIT,
+    SENSITIVE_OPERATION_LIMIT,
+    limiter,
+)
+from licence_api.services.export_job_service import ExportJobService
 from licence_api.services.export_service import ExportService
+from licence_api.utils.errors import raise_conflict, raise_not_found
 
 router = APIRouter()
 
@@ -27,25 +36,24 @@ async def export_licenses_csv(
         default=None, max_length=100, description="Filter by department"
     ),
     status: str | None = Query(default=None, max_length=50, description="Filter by status"),
-) -> Response:
+) -> StreamingResponse:
     """Export licenses to CSV format.
 
-    Returns a downloadable CSV file with all license data.
+    Returns a downloadable CSV file with all license data, streamed while
+    the licenses are read.
     """
-    csv_content = await export_service.export_licenses_csv(
-        provider_id=provider_id,
-        department=department,
-        status=status,
-    )
-
     filename = ExportService.build_export_filename(
         provider_id=provider_id,
         department=department,
         status=status,
     )
 
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        export_service.export_licenses_csv(
+            provider_id=provider_id,
+            department=department,
+            status=status,
+        ),
         media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
@@ -62,20 +70,18 @@ async def export_costs_csv(
     export_service: Annotated[ExportService, Depends(get_export_service)],
     start_date: date | None = Query(default=None, description="Start date"),
     end_date: date | None = Query(default=None, description="End date"),
-) -> Response:
+) -> StreamingResponse:
     """Export cost data to CSV format.
 
     Returns a downloadable CSV file with cost history.
     """
-    csv_content = await export_service.export_costs_csv(
-        start_date=start_date,
-        end_date=end_date,
-    )
-
     filename = f"costs_{date.today().isoformat()}.csv"
 
-    return Response(
-        content=csv_content,
+    return StreamingResponse(
+        export_service.export_costs_csv(
+            start_date=start_date,
+            end_date=end_date,
+        ),
         media_type="text/csv",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
@@ -97,6 +103,8 @@ async def export_full_report_excel(
     - Summary: Overview statistics
     - Licenses: All license data
     - Costs: Historical cost data
+
+    For large license sets, use POST /full-report/excel/jobs instead.
     """
     excel_content = await export_service.export_full_report_excel()
 
@@ -110,3 +118,73 @@ async def export_full_report_excel(
             "Cache-Control": "no-store",
         },
     )
+
+
+@router.post(
+    "/full-report/excel/jobs",
+    response_model=ExportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@limiter.limit(SENSITIVE_OPERATION_LIMIT)
+async def create_full_report_excel_job(
+    request: Request,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.REPORTS_EXPORT))],
+    service: Annotated[ExportJobService, Depends(get_export_job_service)],
+) -> ExportJobResponse:
+    """Start generating the full Excel report in the background.
+
+    Returns immediately; poll GET /jobs/{job_id} and download the workbook from
+    GET /jobs/{job_id}/download once the job completed.
+    """
+    return await service.create_job(user=current_user, request=request)
+
+
+@router.get("/jobs", response_model=ExportJobListResponse)
+@limiter.limit(API_DEFAULT_LIMIT)
+async def list_export_jobs(
+    request: Request,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.REPORTS_EXPORT))],
+    service: Annotated[ExportJobService, Depends(get_export_job_service)],
+    limit: int = Query(default=20, ge=1, le=100),
+) -> ExportJobListResponse:
+    """List recent export jobs."""
+    return await service.list_jobs(limit=limit)
+
+
+@router.get("/jobs/{job_id}", response_model=ExportJobResponse)
+@limiter.limit(API_DEFAULT_LIMIT)
+async def get_export_job(
+    request: Request,
+    job_id: UUID,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.REPORTS_EXPORT))],
+    service: Annotated[ExportJobService, Depends(get_export_job_service)],
+) -> ExportJobResponse:
+    """Get the state of an export job."""
+    try:
+        return await service.get_job(job_id)
+    except ExportJobNotFoundError:
+        raise_not_found("Export job")
+
+
+@router.get("/jobs/{job_id}/download")
+@limiter.limit(EXPENSIVE_READ_LIMIT)
+async def download_export_job(
+    request: Request,
+    job_id: UUID,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.REPORTS_EXPORT))],
+    service: Annotated[ExportJobService, Depends(get_export_job_service)],
+) -> FileResponse:
+    """Download the workbook of a completed export job."""
+    try:
+        path, filename = await service.get_artifact(job_id)
+    except ExportJobNotFoundError:
+        raise_not_found("Export job")
+    except ExportJobNotReadyError:
+        raise_conflict("Export job has not completed")
+
+    return FileResponse(
+        path=path,
+        filename=filename,
+        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        headers={"Cache-Control": "no-store"},
+    )
@@ -76,6 +76,17 @@ class TestConnectionResponse(BaseModel):
     message: str
 
 
+class ProviderHTTPMetricsResponse(BaseModel):
+    """Provider API request stats of this process, keyed by provider type.
+
+    Each entry has request, error and retry counts, the latency sum and
+    average, a latency histogram (request count per bucket, keyed by the
+    bucket's upper bound in seconds) and counts per response status.
+    """
+
+    providers: dict[str, dict[str, Any]]
+
+
 class SyncResponse(BaseModel):
     """Response from sync operation."""
 
@@ -270,6 +281,19 @@ async def list_providers(
     return ProviderListResponse(items=items, total=len(items))
 
 
+@router.get("/http-metrics", response_model=ProviderHTTPMetricsResponse)
+@limiter.limit(API_DEFAULT_LIMIT)
+async def get_provider_http_metrics(
+    request: Request,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_VIEW))],
+) -> ProviderHTTPMetricsResponse:
+    """Get request counts and latency histograms of the provider APIs.
+
+    Shows which vendor APIs dominate sync time. Requires providers.view permission.
+    """
+    return ProviderHTTPMetricsResponse(providers=ProviderService.get_http_metrics())
+
+
 @router.get("/{provider_id}", response_model=ProviderResponse)
 @limiter.limit(API_DEFAULT_LIMIT)
 async def get_provider(
@@ -525,13 +549,18 @@ async def trigger_sync(
     current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_SYNC))],
     sync_service: Annotated[SyncService, Depends(get_sync_service)],
     provider_id: UUID | None = None,
+    full_resync: bool = False,
 ) -> SyncResponse:
-    """Trigger a sync operation. Requires providers.sync permission."""
+    """Trigger a sync operation. Requires providers.sync permission.
+
+    HRIS providers sync incrementally by default; full_resync fetches all employees.
+    """
     try:
         results = await sync_service.trigger_sync(
             provider_id=provider_id,
             user=current_user,
             request=request,
+            full_resync=full_resync,
         )
         return SyncResponse(success=True, results=results)
     except (ConnectionError, TimeoutError, OSError):
@@ -549,13 +578,18 @@ async def sync_provider(
     provider_id: UUID,
     current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_SYNC))],
     sync_service: Annotated[SyncService, Depends(get_sync_service)],
+    full_resync: bool = False,
 ) -> SyncResponse:
-    """Sync a specific provider. Requires providers.sync permission."""
+    """Sync a specific provider. Requires providers.sync permission.
+
+    HRIS providers sync incrementally by default; full_resync fetches all employees.
+    """
     try:
         results = await sync_service.trigger_provider_sync(
             provider_id=provider_id,
             user=current_user,
             request=request,
+            full_resync=full_resync,
         )
         return SyncResponse(success=True, results=results)
     except ValueError:
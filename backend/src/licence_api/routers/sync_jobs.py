@@ -0,0 +1,118 @@
+"""Sync jobs router for background provider syncs."""
+
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import StreamingResponse
+
+from licence_api.dependencies import get_sync_job_service
+from licence_api.exceptions import SyncJobAlreadyActiveError, SyncJobNotFoundError
+from licence_api.models.domain.admin_user import AdminUser
+from licence_api.models.dto.sync_job import SyncJobCreate, SyncJobListResponse, SyncJobResponse
+from licence_api.security.auth import Permissions, require_permission
+from licence_api.security.rate_limit import (
+    API_DEFAULT_LIMIT,
+    EXPENSIVE_READ_LIMIT,
+    SENSITIVE_OPERATION_LIMIT,
+    limiter,
+)
+from licence_api.services.sync_job_service import SyncJobService
+from licence_api.utils.errors import raise_conflict, raise_not_found
+
+router = APIRouter()
+
+
+@router.post("", response_model=SyncJobResponse, status_code=status.HTTP_202_ACCEPTED)
+@limiter.limit(SENSITIVE_OPERATION_LIMIT)
+async def create_sync_job(
+    request: Request,
+    body: SyncJobCreate,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_SYNC))],
+    service: Annotated[SyncJobService, Depends(get_sync_job_service)],
+) -> SyncJobResponse:
+    """Start a background sync of one or all providers. Requires providers.sync permission.
+
+    Returns immediately; follow the job via GET /{job_id} or GET /{job_id}/events.
+    """
+    try:
+        return await service.create_job(
+            user=current_user,
+            provider_id=body.provider_id,
+            full_resync=body.full_resync,
+            request=request,
+        )
+    except ValueError:
+        raise_not_found("Provider")
+    except SyncJobAlreadyActiveError:
+        raise_conflict("A sync job for these providers is already pending or running")
+
+
+@router.get("", response_model=SyncJobListResponse)
+@limiter.limit(API_DEFAULT_LIMIT)
+async def list_sync_jobs(
+    request: Request,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_SYNC))],
+    service: Annotated[SyncJobService, Depends(get_sync_job_service)],
+    limit: int = Query(default=20, ge=1, le=100),
+) -> SyncJobListResponse:
+    """List recent sync jobs. Requires providers.sync permission."""
+    return await service.list_jobs(limit=limit)
+
+
+@router.get("/{job_id}", response_model=SyncJobResponse)
+@limiter.limit(API_DEFAULT_LIMIT)
+async def get_sync_job(
+    request: Request,
+    job_id: UUID,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_SYNC))],
+    service: Annotated[SyncJobService, Depends(get_sync_job_service)],
+) -> SyncJobResponse:
+    """Get the state and progress of a sync job. Requires providers.sync permission."""
+    try:
+        return await service.get_job(job_id)
+    except SyncJobNotFoundError:
+        raise_not_found("Sync job")
+
+
+@router.get("/{job_id}/events")
+@limiter.limit(EXPENSIVE_READ_LIMIT)
+async def stream_sync_job_events(
+    request: Request,
+    job_id: UUID,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_SYNC))],
+    service: Annotated[SyncJobService, Depends(get_sync_job_service)],
+) -> StreamingResponse:
+    """Stream the progress of a sync job as Server-Sent Events.
+
+    Sends "progress" events while the job runs and a final "done" event.
+    Requires providers.sync permission.
+    """
+    try:
+        await service.get_job(job_id)
+    except SyncJobNotFoundError:
+        raise_not_found("Sync job")
+
+    return StreamingResponse(
+        service.stream_events(job_id, request=request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/{job_id}/cancel", response_model=SyncJobResponse)
+@limiter.limit(SENSITIVE_OPERATION_LIMIT)
+async def cancel_sync_job(
+    request: Request,
+    job_id: UUID,
+    current_user: Annotated[AdminUser, Depends(require_permission(Permissions.PROVIDERS_SYNC))],
+    service: Annotated[SyncJobService, Depends(get_sync_job_service)],
+) -> SyncJobResponse:
+    """Cancel a pending or running sync job. Requires providers.sync permission.
+
+    Providers that already finished keep their synced data.
+    """
+    try:
+        return await service.cancel_job(job_id, user=current_user, request=request)
+    except SyncJobNotFoundError:
+        raise_not_found("Sync job")
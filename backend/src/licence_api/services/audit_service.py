@@ -1,5 +1,6 @@
 """Audit service for centralized audit logging."""
 
+import base64
 import csv
 import io
 import json
@@ -22,6 +23,40 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def encode_audit_cursor(created_at: datetime, log_id: UUID) -> str:
+    """Encode the position of an audit log as an opaque page cursor.
+
+    Args:
+        created_at: Creation time of the last log on a page
+        log_id: ID of the last log on a page
+
+    Returns:
+        URL-safe cursor string
+    """
+    data = json.dumps([created_at.isoformat(), str(log_id)]).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def decode_audit_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a page cursor created by encode_audit_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        Tuple of (created_at, log_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, log_id = json.loads(data)
+        return datetime.fromisoformat(created_at), UUID(log_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
 class AuditAction:
     """Standard audit action types."""
 
@@ -401,6 +436,9 @@ class AuditService:
         self,
         page: int = 1,
         page_size: int = 50,
+        cursor: str | None = None,
+        exact_count: bool = False,
+        ranked: bool = False,
         action: str | None = None,
         resource_type: str | None = None,
         admin_user_id: UUID | None = None,
@@ -412,20 +450,32 @@ class AuditService:
     ) -> AuditLogListResponse:
         """List audit logs with optional filters and email enrichment.
 
+        Follow next_cursor to read further pages; its cost does not grow with
+        the page depth, unlike page numbers. The total is the planner's
+        estimate for large results unless exact_count is set. With ranked, a
+        search is ordered by relevance and read by page number only.
+
         Args:
-            page: Page number (1-based)
+            page: Page number (1-based), ignored when a cursor is given
             page_size: Number of items per page
+            cursor: next_cursor of the previous page
+            exact_count: Whether to count matching logs exactly
+            ranked: Whether to order search results by relevance
             action: Filter by action
             resource_type: Filter by resource type
             admin_user_id: Filter by admin user ID
             date_from: Filter by minimum date
             date_to: Filter by maximum date
-            search: Full-text search string
+            search: Substring search string
             allowed_actions: Whitelist of allowed action values for validation
             allowed_resource_types: Whitelist of allowed resource type values for validation
 
         Returns:
             AuditLogListResponse with items, total, page, page_size, total_pages
+            and next_cursor
+
+        Raises:
+            ValueError: If the cursor is malformed or given for a ranked search
         """
         # Validate filter inputs against whitelists
         if allowed_actions is not None:
@@ -433,18 +483,31 @@ class AuditService:
         if allowed_resource_types is not None:
             resource_type = validate_against_whitelist(resource_type, allowed_resource_types)
 
-        offset = (page - 1) * page_size
-
-        logs, total = await self.audit_repo.get_recent(
-            limit=page_size,
-            offset=offset,
-            action=action,
-            resource_type=resource_type,
-            admin_user_id=admin_user_id,
-            date_from=date_from,
-            date_to=date_to,
-            search=search,
+        filters = {
+            "action": action,
+            "resource_type": resource_type,
+            "admin_user_id": admin_user_id,
+            "date_from": date_from,
+            "date_to": date_to,
+            "search": search,
+        }
+        ranked = ranked and bool(search)
+        if ranked and cursor:
+            raise ValueError("Invalid cursor")
+        before = decode_audit_cursor(cursor) if cursor else None
+        offset = 0 if cursor else (page - 1) * page_size
+
+        # One extra log tells whether there is a next page
+        logs = await self.audit_repo.get_recent(
+            limit=page_size + 1, before=before, offset=offset, ranked=ranked, **filters
         )
+        next_cursor = None
+        if len(logs) > page_size:
+            logs = logs[:page_size]
+            if not ranked:
+                next_cursor = encode_audit_cursor(logs[-1].created_at, logs[-1].id)
+
+        total, total_exact = await self.audit_repo.count_logs(exact=exact_count, **filters)
 
         # Enrich with admin user emails
         user_ids = {log.admin_user_id for log in logs if log.admin_user_id}
@@ -472,9 +535,11 @@ class AuditService:
         return AuditLogListResponse(
             items=items,
             total=total,
+            total_exact=total_exact,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
         )
 
     async def get_audit_log(self, log_id: UUID) -> AuditLogResponse | None:
@@ -542,9 +607,8 @@ class AuditService:
         if allowed_resource_types is not None:
             resource_type = validate_against_whitelist(resource_type, allowed_resource_types)
 
-        logs, total = await self.audit_repo.get_recent(
+        logs = await self.audit_repo.get_recent(
             limit=limit,
-            offset=0,
             action=action,
             resource_type=resource_type,
             admin_user_id=admin_user_id,
@@ -20,24 +20,29 @@ other unsafe deserialization methods. All data is validated against a schema bef
 import. Binary file content is base64-encoded within the JSON structure.
 """
 
+import asyncio
 import base64
 import gzip
 import hashlib
 import json
 import logging
 import os
+import shutil
+import tempfile
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable
 from datetime import UTC, date, datetime
 from decimal import Decimal
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from fastapi import Request
-from sqlalchemy import delete, select
+from fastapi import HTTPException, Request
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from licence_api.config import get_settings
 from licence_api.constants.paths import BACKUPS_DIR, FILES_DIR
 from licence_api.models.dto.backup import (
     BackupConfig,
@@ -52,6 +57,7 @@ from licence_api.models.dto.backup import (
     StoredBackupMetadata,
 )
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 
 if TYPE_CHECKING:
     from licence_api.models.domain.admin_user import AdminUser
@@ -80,18 +86,115 @@ from licence_api.models.orm.settings import SettingsORM
 from licence_api.models.orm.user_notification_preference import UserNotificationPreferenceORM
 from licence_api.models.orm.user_role import UserRoleORM
 from licence_api.security.encryption import get_encryption_service
+from licence_api.utils.backup_stream import (
+    BACKUP_STREAM_HEADER,
+    BackupStreamReader,
+    BackupStreamWriter,
+    derive_backup_key,
+    is_backup_stream,
+    verify_backup_stream_footer,
+)
 
 logger = logging.getLogger(__name__)
 
-# Backup format header
+# Chunked backup format (see utils/backup_stream.py)
+BACKUP_VERSION = "4.0"
+
+# Chunked backup format before the compression codec was recorded
+V3_BACKUP_VERSION = "3.0"
+
+# Legacy single-buffer backup format, still accepted for restore
 BACKUP_HEADER = b"LICENCE_BACKUP_V2"
-BACKUP_VERSION = "2.0"
+LEGACY_BACKUP_VERSION = "2.0"
 
-# Encryption parameters
+# Encryption parameters of the legacy format
 SALT_SIZE = 16
 NONCE_SIZE = 12
 HASH_SIZE = 32  # SHA-256
-PBKDF2_ITERATIONS = 600000
+
+# Rows per query batch when exporting or restoring a table
+BACKUP_BATCH_SIZE = 1000
+
+# Stored backup files are read in pieces of this size
+BACKUP_READ_SIZE = 1024 * 1024
+
+# Tables every backup must contain
+REQUIRED_DATA_KEYS = (
+    "providers",
+    "licenses",
+    "employees",
+    "license_packages",
+    "organization_licenses",
+    "payment_methods",
+    "provider_files",
+    "cost_snapshots",
+    "settings",
+    "notification_rules",
+)
+
+# Exported tables in restore order: (data key, ORM model, metadata count key)
+BACKUP_TABLES: tuple[tuple[str, type, str], ...] = (
+    ("settings", SettingsORM, "settings_count"),
+    ("payment_methods", PaymentMethodORM, "payment_method_count"),
+    ("permissions", PermissionORM, "permission_count"),
+    ("roles", RoleORM, "role_count"),
+    ("admin_users", AdminUserORM, "admin_user_count"),
+    ("refresh_tokens", RefreshTokenORM, "refresh_token_count"),
+    ("employees", EmployeeORM, "employee_count"),
+    ("employee_external_accounts", EmployeeExternalAccountORM, "employee_external_account_count"),
+    ("role_permissions", RolePermissionORM, "role_permission_count"),
+    ("user_roles", UserRoleORM, "user_role_count"),
+    (
+        "user_notification_preferences",
+        UserNotificationPreferenceORM,
+        "user_notification_preference_count",
+    ),
+    ("providers", ProviderORM, "provider_count"),
+    ("notification_rules", NotificationRuleORM, "notification_rule_count"),
+    ("license_packages", LicensePackageORM, "license_package_count"),
+    ("organization_licenses", OrganizationLicenseORM, "organization_license_count"),
+    ("cost_snapshots", CostSnapshotORM, "cost_snapshot_count"),
+    ("licenses", LicenseORM, "license_count"),
+    ("provider_files", ProviderFileORM, "provider_file_count"),
+    ("service_account_patterns", ServiceAccountPatternORM, "service_account_pattern_count"),
+    ("admin_account_patterns", AdminAccountPatternORM, "admin_account_pattern_count"),
+    (
+        "service_account_license_types",
+        ServiceAccountLicenseTypeORM,
+        "service_account_license_type_count",
+    ),
+    ("audit_logs", AuditLogORM, "audit_log_count"),
+)
+
+# Tables an incremental backup writes partially: data key -> watermark column.
+# An incremental backup holds the rows changed since its parent backup and the
+# ids of all rows, so rows deleted since are dropped on restore. All other
+# tables are small and written in full.
+INCREMENTAL_TABLES = {
+    "cost_snapshots": "updated_at",
+    "licenses": "updated_at",
+    "provider_files": "updated_at",
+    "audit_logs": "created_at",
+}
+
+# Incremental tables whose rows are never updated or deleted; no ids are written
+APPEND_ONLY_TABLES = frozenset({"audit_logs"})
+
+# Setting holding the id of the last scheduled backup
+BACKUP_CHAIN_SETTING = "backup_chain"
+
+# Columns of incremental tables cleared when the referenced row is deleted:
+# data key -> [(column, referenced data key)]. Deletes do not touch the
+# watermark column, so restore clears them in rows taken from older backups.
+SET_NULL_REFERENCES = {
+    key: [
+        (fk.parent.name, fk.column.table.name)
+        for fk in model.__table__.foreign_keys
+        if fk.ondelete == "SET NULL"
+    ]
+    for key, model, _ in BACKUP_TABLES
+    if key in INCREMENTAL_TABLES
+}
 
 
 class BackupService:
@@ -133,39 +236,17 @@ class BackupService:
 
     def _derive_key(self, password: str, salt: bytes) -> bytes:
         """Derive encryption key from password using PBKDF2."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=PBKDF2_ITERATIONS,
-        )
-        return kdf.derive(password.encode("utf-8"))
+        return derive_backup_key(password, salt)
 
-    def _encrypt(self, data: bytes, password: str) -> bytes:
-        """Encrypt data with AES-256-GCM using password-derived key.
-
-        Format: header(17B) + content_hash(32B) + salt(16B) + nonce(12B) + ciphertext
-
-        The content_hash is SHA-256 of the uncompressed data, allowing integrity
-        verification without decryption.
-        """
-        # Compress data with gzip
-        compressed = gzip.compress(data, compresslevel=6)
-
-        # Calculate hash of original (uncompressed) data for integrity check
-        content_hash = hashlib.sha256(data).digest()
-
-        salt = os.urandom(SALT_SIZE)
-        nonce = os.urandom(NONCE_SIZE)
-        key = self._derive_key(password, salt)
-
-        aesgcm = AESGCM(key)
-        ciphertext = aesgcm.encrypt(nonce, compressed, None)
-
-        return BACKUP_HEADER + content_hash + salt + nonce + ciphertext
+    def _decrypt_legacy(self, encrypted_data: bytes, password: str) -> dict[str, Any]:
+        """Decrypt and parse a legacy (V2) backup document."""
+        return json.loads(self._decrypt(encrypted_data, password).decode("utf-8"))
 
     def _decrypt(self, encrypted_data: bytes, password: str) -> bytes:
-        """Decrypt backup data.
+        """Decrypt a legacy (V2) backup.
+
+        Format: header(17B) + content_hash(32B) + salt(16B) + nonce(12B) + ciphertext,
+        where the ciphertext is the gzipped JSON document.
 
         Args:
             encrypted_data: Full backup file data
@@ -219,25 +300,36 @@ class BackupService:
     # Export functionality
     # =========================================================================
 
-    async def create_backup(
+    async def stream_backup(
         self,
         password: str,
         user: "AdminUser | None" = None,
         request: Request | None = None,
-    ) -> bytes:
-        """Create an encrypted backup of all system data.
+        since: datetime | None = None,
+        header: dict[str, Any] | None = None,
+    ) -> AsyncIterator[bytes]:
+        """Create an encrypted backup of all system data as a byte stream.
+
+        Each table is read in batches of BACKUP_BATCH_SIZE rows and written as
+        NDJSON records through a BackupStreamWriter, so memory use is bounded
+        by one batch and one chunk regardless of the database size. A stream
+        that is cut short fails authentication on restore.
 
         Args:
             password: Password for encryption
             user: Admin user creating the backup
             request: HTTP request for audit logging
+            since: For an incremental backup, the watermark of its parent
+                backup: of INCREMENTAL_TABLES only rows changed since then are
+                written, plus the ids of all rows
+            header: Additional backup header fields (stored backup id, chain)
 
-        Returns:
+        Yields:
             Encrypted backup file bytes
         """
-        data = await self._collect_data()
-        json_data = json.dumps(data, default=self._json_serializer).encode("utf-8")
-        backup_data = self._encrypt(json_data, password)
+        sections = self._read_tables(since, header or {})
+        async for chunk in self._write_sections(sections, password):
+            yield chunk
 
         # Audit log
         if user and self.audit_service:
@@ -248,9 +340,126 @@ class BackupService:
                 request=request,
                 details={"action": "backup_created", "version": BACKUP_VERSION},
             )
-            await self.session.commit()
+        await self.session.commit()
+
+    async def _read_tables(
+        self, since: datetime | None, header: dict[str, Any]
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Read all tables in the sections format of _read_backup.
+
+        Args:
+            since: Watermark of the parent backup for an incremental backup
+            header: Additional backup header fields
+        """
+        # Read all tables from one snapshot, so references between them match
+        await self.session.commit()
+        await self.session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+        converters = {
+            "admin_users": self._admin_user_to_dict,
+            "user_roles": self._junction_to_dict,
+            "role_permissions": self._junction_to_dict,
+            "providers": self._provider_to_dict,
+            "provider_files": self._provider_file_to_dict,
+            "settings": self._settings_to_dict,
+            "audit_logs": self._audit_log_to_dict,
+        }
+
+        yield "backup", {"version": BACKUP_VERSION, "created_at": datetime.now(UTC), **header}
+        for key, model, _ in BACKUP_TABLES:
+            to_dict = converters.get(key, self._orm_to_dict)
+            query = select(model)
+            incremental = since is not None and key in INCREMENTAL_TABLES
+            if incremental:
+                query = query.where(getattr(model, INCREMENTAL_TABLES[key]) >= since)
+            async for rows in self._stream_rows(query):
+                yield key, [to_dict(row) for row in rows]
+            if incremental and key not in APPEND_ONLY_TABLES:
+                async for ids in self._stream_rows(select(model.id)):
+                    yield "ids", (key, ids)
+
+    async def _stream_rows(self, query: Any) -> AsyncIterator[list]:
+        """Read the results of a query in batches of BACKUP_BATCH_SIZE.
+
+        Relationships are not loaded; the row converters only read columns.
+        """
+        result = await self.session.stream_scalars(
+            query.options(raiseload("*")).execution_options(yield_per=BACKUP_BATCH_SIZE)
+        )
+        async for rows in result.partitions():
+            yield rows
+
+    async def _write_sections(
+        self, sections: AsyncIterator[tuple[str, Any]], password: str
+    ) -> AsyncIterator[bytes]:
+        """Encrypt backup sections into the chunked backup format.
+
+        Every table gets its table record, also when it has no rows.
+
+        Args:
+            sections: ("backup", header), then (table key, rows) batches and
+                ("ids", (table key, ids)) batches in restore order
+            password: Password for encryption
+
+        Yields:
+            Encrypted backup file bytes
+        """
+        settings = get_settings()
+        # Key derivation, serialization, compression and encryption run in a
+        # worker thread, so the event loop stays free
+        writer = await asyncio.to_thread(
+            BackupStreamWriter,
+            password,
+            codec=settings.backup_compression,
+            threads=settings.backup_compression_threads,
+        )
+        yield writer.header()
+
+        _, header = await anext(sections)
+        records: list[Any] = [["backup", header]]
+        chunk = b""
+        metadata = {count_key: 0 for _, _, count_key in BACKUP_TABLES}
+        count_keys = {key: count_key for key, _, count_key in BACKUP_TABLES}
+        tables = iter(BACKUP_TABLES)
+        table: str | None = None
+        async for key, values in sections:
+            if key == "ids":
+                key, ids = values
+                rows = [["ids", key, ids]]
+            else:
+                metadata[count_keys[key]] += len(values)
+                rows = values
+            # Table records of the tables without rows before this one
+            while table != key:
+                table = next(tables)[0]
+                records.append(["table", table])
+            records.extend(rows)
+            chunk += await asyncio.to_thread(self._write_records, writer, records)
+            records = []
+            if chunk:
+                yield chunk
+                chunk = b""
+        records.extend(["table", table] for table, _, _ in tables)
+        records.append(["end", {"metadata": metadata}])
+        chunk += await asyncio.to_thread(self._write_records, writer, records)
+        yield chunk + await asyncio.to_thread(writer.finish)
+
+    def _write_records(self, writer: BackupStreamWriter, records: list[Any]) -> bytes:
+        """Serialize records as NDJSON and add them to a backup stream.
+
+        Returns:
+            Encrypted chunks completed by this write (may be empty)
+        """
+        return writer.write(b"".join(self._ndjson_line(record) for record in records))
+
+    def _ndjson_line(self, record: Any) -> bytes:
+        """Serialize a backup record as one NDJSON line.
 
-        return backup_data
+        Table rows are JSON objects; the backup, table and end markers are
+        JSON arrays of [kind, value].
+        """
+        line = json.dumps(record, default=self._json_serializer, separators=(",", ":"))
+        return line.encode("utf-8") + b"\n"
 
     def _json_serializer(self, obj: Any) -> Any:
         """Custom JSON serializer for special types."""
@@ -271,101 +480,6 @@ class BackupService:
             return None
         raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
 
-    async def _collect_data(self) -> dict[str, Any]:
-        """Collect all exportable data from database."""
-        # Fetch all entities
-        admin_users = await self._fetch_all(AdminUserORM)
-        refresh_tokens = await self._fetch_all(RefreshTokenORM)
-        roles = await self._fetch_all(RoleORM)
-        permissions = await self._fetch_all(PermissionORM)
-        user_roles = await self._fetch_all(UserRoleORM)
-        role_permissions = await self._fetch_all(RolePermissionORM)
-        user_notification_preferences = await self._fetch_all(UserNotificationPreferenceORM)
-        providers = await self._fetch_all(ProviderORM)
-        licenses = await self._fetch_all(LicenseORM)
-        employees = await self._fetch_all(EmployeeORM)
-        employee_external_accounts = await self._fetch_all(EmployeeExternalAccountORM)
-        license_packages = await self._fetch_all(LicensePackageORM)
-        organization_licenses = await self._fetch_all(OrganizationLicenseORM)
-        payment_methods = await self._fetch_all(PaymentMethodORM)
-        provider_files = await self._fetch_all(ProviderFileORM)
-        cost_snapshots = await self._fetch_all(CostSnapshotORM)
-        settings = await self._fetch_all(SettingsORM)
-        notification_rules = await self._fetch_all(NotificationRuleORM)
-        service_account_patterns = await self._fetch_all(ServiceAccountPatternORM)
-        admin_account_patterns = await self._fetch_all(AdminAccountPatternORM)
-        service_account_license_types = await self._fetch_all(ServiceAccountLicenseTypeORM)
-        audit_logs = await self._fetch_all(AuditLogORM)
-
-        # Convert to dicts and collect file data
-        provider_files_data = await self._collect_files(provider_files)
-
-        # Convert admin users but exclude sensitive auth data
-        admin_users_data = [self._admin_user_to_dict(u) for u in admin_users]
-
-        return {
-            "version": BACKUP_VERSION,
-            "created_at": datetime.now(UTC).isoformat(),
-            "metadata": {
-                "admin_user_count": len(admin_users),
-                "refresh_token_count": len(refresh_tokens),
-                "role_count": len(roles),
-                "permission_count": len(permissions),
-                "user_role_count": len(user_roles),
-                "role_permission_count": len(role_permissions),
-                "user_notification_preference_count": len(user_notification_preferences),
-                "provider_count": len(providers),
-                "license_count": len(licenses),
-                "employee_count": len(employees),
-                "employee_external_account_count": len(employee_external_accounts),
-                "license_package_count": len(license_packages),
-                "organization_license_count": len(organization_licenses),
-                "payment_method_count": len(payment_methods),
-                "provider_file_count": len(provider_files),
-                "cost_snapshot_count": len(cost_snapshots),
-                "settings_count": len(settings),
-                "notification_rule_count": len(notification_rules),
-                "service_account_pattern_count": len(service_account_patterns),
-                "admin_account_pattern_count": len(admin_account_patterns),
-                "service_account_license_type_count": len(service_account_license_types),
-                "audit_log_count": len(audit_logs),
-            },
-            "data": {
-                "admin_users": admin_users_data,
-                "refresh_tokens": [self._orm_to_dict(rt) for rt in refresh_tokens],
-                "roles": [self._orm_to_dict(r) for r in roles],
-                "permissions": [self._orm_to_dict(p) for p in permissions],
-                "user_roles": [self._junction_to_dict(ur) for ur in user_roles],
-                "role_permissions": [self._junction_to_dict(rp) for rp in role_permissions],
-                "user_notification_preferences": [
-                    self._orm_to_dict(unp) for unp in user_notification_preferences
-                ],
-                "providers": [self._provider_to_dict(p) for p in providers],
-                "licenses": [self._orm_to_dict(lic) for lic in licenses],
-                "employees": [self._orm_to_dict(e) for e in employees],
-                "employee_external_accounts": [
-                    self._orm_to_dict(eea) for eea in employee_external_accounts
-                ],
-                "license_packages": [self._orm_to_dict(lp) for lp in license_packages],
-                "organization_licenses": [self._orm_to_dict(ol) for ol in organization_licenses],
-                "payment_methods": [self._orm_to_dict(pm) for pm in payment_methods],
-                "provider_files": provider_files_data,
-                "cost_snapshots": [self._orm_to_dict(cs) for cs in cost_snapshots],
-                "settings": [self._settings_to_dict(s) for s in settings],
-                "notification_rules": [self._orm_to_dict(nr) for nr in notification_rules],
-                "service_account_patterns": [
-                    self._orm_to_dict(sap) for sap in service_account_patterns
-                ],
-                "admin_account_patterns": [
-                    self._orm_to_dict(aap) for aap in admin_account_patterns
-                ],
-                "service_account_license_types": [
-                    self._orm_to_dict(salt) for salt in service_account_license_types
-                ],
-                "audit_logs": [self._audit_log_to_dict(al) for al in audit_logs],
-            },
-        }
-
     async def _fetch_all(self, model: type) -> list:
         """Fetch all records of a model.
 
@@ -541,27 +655,23 @@ class BackupService:
             "created_at": audit_log.created_at,
         }
 
-    async def _collect_files(self, provider_files: list[ProviderFileORM]) -> list[dict[str, Any]]:
-        """Collect provider files with their binary content."""
-        files_data = []
-        for pf in provider_files:
-            file_dict = self._orm_to_dict(pf)
+    def _provider_file_to_dict(self, provider_file: ProviderFileORM) -> dict[str, Any]:
+        """Convert provider file ORM to dict, including its base64-encoded content."""
+        file_dict = self._orm_to_dict(provider_file)
 
-            # Read file content and encode as base64
-            file_path = FILES_DIR / str(pf.provider_id) / pf.filename
-            if file_path.exists():
-                try:
-                    file_content = file_path.read_bytes()
-                    file_dict["file_data"] = base64.b64encode(file_content).decode("utf-8")
-                except Exception as e:
-                    logger.warning(f"Failed to read file {file_path}: {e}")
-                    file_dict["file_data"] = None
-            else:
-                logger.warning(f"File not found: {file_path}")
+        file_path = FILES_DIR / str(provider_file.provider_id) / provider_file.filename
+        if file_path.exists():
+            try:
+                file_content = file_path.read_bytes()
+                file_dict["file_data"] = base64.b64encode(file_content).decode("utf-8")
+            except Exception as e:
+                logger.warning(f"Failed to read file {file_path}: {e}")
                 file_dict["file_data"] = None
+        else:
+            logger.warning(f"File not found: {file_path}")
+            file_dict["file_data"] = None
 
-            files_data.append(file_dict)
-        return files_data
+        return file_dict
 
     # =========================================================================
     # Info functionality (without password)
@@ -576,6 +686,21 @@ class BackupService:
         Returns:
             Backup info response with format validation and integrity hash
         """
+        if is_backup_stream(file_data):
+            try:
+                content_hash = verify_backup_stream_footer(file_data)
+            except ValueError as e:
+                return BackupInfoResponse(valid_format=False, error=str(e))
+            return BackupInfoResponse(
+                valid_format=True,
+                version=BACKUP_VERSION
+                if file_data.startswith(BACKUP_STREAM_HEADER)
+                else V3_BACKUP_VERSION,
+                requires_password=True,
+                compressed=True,
+                integrity_hash=content_hash.hex(),
+            )
+
         if not file_data.startswith(BACKUP_HEADER):
             return BackupInfoResponse(
                 valid_format=False,
@@ -596,7 +721,7 @@ class BackupService:
 
         return BackupInfoResponse(
             valid_format=True,
-            version=BACKUP_VERSION,
+            version=LEGACY_BACKUP_VERSION,
             requires_password=True,
             compressed=True,
             integrity_hash=content_hash.hex(),
@@ -608,84 +733,92 @@ class BackupService:
 
     async def restore_backup(
         self,
-        file_data: bytes,
+        chunks: AsyncIterator[bytes],
         password: str,
         user: "AdminUser | None" = None,
         request: Request | None = None,
+        on_progress: Callable[[str, int], Awaitable[None]] | None = None,
     ) -> RestoreResponse:
         """Restore system from encrypted backup.
 
         WARNING: This deletes ALL existing data!
 
+        The backup is decrypted while it is read, and each table section is
+        inserted in batches of BACKUP_BATCH_SIZE rows, in foreign key order and
+        within one transaction. Password and format are checked before any data
+        is deleted; a backup found corrupted or truncated later on rolls the
+        whole restore back. Restored provider files replace the files on disk
+        only once the transaction is committed.
+
         Args:
-            file_data: Encrypted backup file
+            chunks: Encrypted backup file, in pieces
             password: Decryption password
             user: Admin user performing the restore
             request: HTTP request for audit logging
+            on_progress: Optional callback receiving a table name and the number
+                of its rows restored so far, called after every batch
 
         Returns:
             Restore response with import counts and validation results
         """
-        # Decrypt
+        sections = self._read_backup(chunks, password)
         try:
-            json_bytes = self._decrypt(file_data, password)
-            backup_data = json.loads(json_bytes.decode("utf-8"))
+            # Decrypts the first chunk, which verifies the password
+            _, header = await anext(sections)
+        except StopAsyncIteration:
+            return self._restore_failed("Invalid backup format: file too short")
         except ValueError as e:
-            return RestoreResponse(
-                success=False,
-                imported=RestoreImportCounts(),
-                validation=RestoreValidation(
-                    providers_tested=0,
-                    providers_valid=0,
-                    providers_failed=[],
-                ),
-                error=str(e),
-            )
-        except json.JSONDecodeError as e:
-            return RestoreResponse(
-                success=False,
-                imported=RestoreImportCounts(),
-                validation=RestoreValidation(
-                    providers_tested=0,
-                    providers_valid=0,
-                    providers_failed=[],
-                ),
-                error=f"Invalid JSON in backup: {e}",
-            )
+            await sections.aclose()
+            return self._restore_failed(str(e))
 
-        # Validate schema
-        try:
-            self._validate_schema(backup_data)
-        except ValueError as e:
-            return RestoreResponse(
-                success=False,
-                imported=RestoreImportCounts(),
-                validation=RestoreValidation(
-                    providers_tested=0,
-                    providers_valid=0,
-                    providers_failed=[],
-                ),
-                error=str(e),
+        if header.get("parent_id"):
+            await sections.aclose()
+            return self._restore_failed(
+                "Incremental backups can only be restored from the stored backups"
             )
+        return await self._restore_sections(sections, user, request, on_progress)
+
+    async def _restore_sections(
+        self,
+        sections: AsyncGenerator[tuple[str, Any], None],
+        user: "AdminUser | None" = None,
+        request: Request | None = None,
+        on_progress: Callable[[str, int], Awaitable[None]] | None = None,
+    ) -> RestoreResponse:
+        """Replace all data with the table sections of a backup.
+
+        Args:
+            sections: (table key, rows) batches from _read_backup or
+                _read_chain, after the backup header
+            user: Admin user performing the restore
+            request: HTTP request for audit logging
+            on_progress: Optional progress callback (see restore_backup)
 
+        Returns:
+            Restore response with import counts and validation results
+        """
         # Clear existing data and import
+        FILES_DIR.parent.mkdir(parents=True, exist_ok=True)
+        files_dir = Path(tempfile.mkdtemp(prefix=".restore-", dir=FILES_DIR.parent))
         try:
             await self._clear_all_data()
-            counts = await self._import_data(backup_data["data"])
+            counts = await self._import_sections(sections, files_dir, on_progress)
+            await DashboardAggregateService(self.session).rebuild()
             await self.session.commit()
         except Exception as e:
             await self.session.rollback()
+            shutil.rmtree(files_dir, ignore_errors=True)
+            if isinstance(e, HTTPException):
+                # Raised by the upload reader, e.g. when the size limit is exceeded
+                raise
             logger.error(f"Restore failed: {e}")
-            return RestoreResponse(
-                success=False,
-                imported=RestoreImportCounts(),
-                validation=RestoreValidation(
-                    providers_tested=0,
-                    providers_valid=0,
-                    providers_failed=[],
-                ),
-                error=f"Database error during restore: {e}",
-            )
+            if isinstance(e, ValueError):
+                return self._restore_failed(str(e))
+            return self._restore_failed(f"Database error during restore: {e}")
+        finally:
+            await sections.aclose()
+
+        self._replace_provider_files(files_dir)
 
         # Validate provider credentials
         validation = await self._validate_providers()
@@ -712,28 +845,245 @@ class BackupService:
             validation=validation,
         )
 
+    def _restore_failed(self, error: str) -> RestoreResponse:
+        """Build the response of a restore that did not change any data."""
+        return RestoreResponse(
+            success=False,
+            imported=RestoreImportCounts(),
+            validation=RestoreValidation(
+                providers_tested=0,
+                providers_valid=0,
+                providers_failed=[],
+            ),
+            error=error,
+        )
+
+    async def _read_backup(
+        self, chunks: AsyncIterator[bytes], password: str
+    ) -> AsyncGenerator[tuple[str, Any], None]:
+        """Decrypt a backup while it is read.
+
+        Yields ("backup", header) first, then (table key, rows) batches of at
+        most BACKUP_BATCH_SIZE rows in restore order. Incremental backups add
+        ("ids", (table key, ids)) batches after the rows of INCREMENTAL_TABLES.
+        Legacy (V2) backups cannot be decrypted incrementally and are read
+        completely first.
+
+        Args:
+            chunks: Encrypted backup file, in pieces
+            password: Decryption password
+
+        Raises:
+            ValueError: If decryption fails or the content is malformed
+        """
+        head = bytearray()
+        async for chunk in chunks:
+            head += chunk
+            if len(head) >= len(BACKUP_STREAM_HEADER):
+                break
+
+        if not is_backup_stream(bytes(head)):
+            async for chunk in chunks:
+                head += chunk
+            backup_data = await asyncio.to_thread(self._decrypt_legacy, bytes(head), password)
+            self._validate_schema(backup_data)
+            yield "backup", {key: backup_data[key] for key in ("version", "created_at")}
+            for key, _, _ in BACKUP_TABLES:
+                table_rows = backup_data["data"].get(key, [])
+                for start in range(0, len(table_rows), BACKUP_BATCH_SIZE):
+                    yield key, table_rows[start : start + BACKUP_BATCH_SIZE]
+            return
+
+        table_keys = [key for key, _, _ in BACKUP_TABLES]
+        header_read = False
+        table: str | None = None
+        rows: list[dict[str, Any]] = []
+        tables_read: set[str] = set()
+        async for record in self._read_backup_records(bytes(head), chunks, password):
+            if not header_read:
+                if isinstance(record, dict) or record[0] != "backup":
+                    raise ValueError("Invalid backup content: missing backup header")
+                header_read = True
+                yield "backup", record[1]
+            elif isinstance(record, dict):
+                if table is None:
+                    raise ValueError("Invalid backup content: row outside of a table")
+                rows.append(record)
+                if len(rows) == BACKUP_BATCH_SIZE:
+                    yield table, rows
+                    rows = []
+            elif record[0] == "ids":
+                # Ids of all rows of a table in an incremental backup
+                if record[1] != table or table not in INCREMENTAL_TABLES:
+                    raise ValueError("Invalid backup content: unexpected ids")
+                if rows:
+                    yield table, rows
+                    rows = []
+                yield "ids", (table, record[2])
+            elif record[0] == "table":
+                if table is not None and rows:
+                    yield table, rows
+                    rows = []
+                # Tables must follow the restore order for foreign keys to resolve
+                next_keys = table_keys[table_keys.index(table) + 1 :] if table else table_keys
+                if record[1] not in next_keys:
+                    raise ValueError(f"Invalid backup content: unexpected table {record[1]}")
+                table = record[1]
+                tables_read.add(table)
+        if table is not None and rows:
+            yield table, rows
+
+        for key in REQUIRED_DATA_KEYS:
+            if key not in tables_read:
+                raise ValueError(f"Missing data key: {key}")
+
+    async def _read_backup_records(
+        self, head: bytes, chunks: AsyncIterator[bytes], password: str
+    ) -> AsyncIterator[Any]:
+        """Decrypt a chunked backup and yield its NDJSON records.
+
+        Args:
+            head: Bytes already read from the start of the backup
+            chunks: Remaining backup file, in pieces
+            password: Decryption password
+
+        Raises:
+            ValueError: If decryption fails or the stream is incomplete
+        """
+        # Key derivation, decryption, decompression and parsing run in worker
+        # threads, so the event loop stays free
+        reader = BackupStreamReader(password)
+        async for record in self._decode_records(reader, head):
+            yield record
+        async for chunk in chunks:
+            async for record in self._decode_records(reader, chunk):
+                yield record
+        async for record in self._decode_records(reader, None):
+            yield record
+
+    async def _decode_records(
+        self, reader: BackupStreamReader, data: bytes | None
+    ) -> AsyncIterator[Any]:
+        """Add backup bytes to a reader, or end its input if data is None.
+
+        A chunk decompresses to many rows, so its lines are parsed in batches
+        of BACKUP_BATCH_SIZE to bound the memory they take as Python objects.
+
+        Yields:
+            The NDJSON records decoded so far
+        """
+        if data is None:
+            lines = await asyncio.to_thread(reader.close)
+        else:
+            lines = await asyncio.to_thread(reader.feed, data)
+        for start in range(0, len(lines), BACKUP_BATCH_SIZE):
+            batch = lines[start : start + BACKUP_BATCH_SIZE]
+            for record in await asyncio.to_thread(self._parse_records, batch):
+                yield record
+
+    def _parse_records(self, lines: list[bytes]) -> list[Any]:
+        """Parse NDJSON lines."""
+        return [json.loads(line) for line in lines]
+
+    async def _read_chain(
+        self, paths: list[Path], password: str
+    ) -> AsyncGenerator[tuple[str, Any], None]:
+        """Decrypt a chain of stored backups as the sections of one full backup.
+
+        All backups of the chain are read side by side, one table at a time.
+        Tables outside INCREMENTAL_TABLES come from the newest backup. Rows of
+        INCREMENTAL_TABLES come from the newest backup containing them, if the
+        newest backup still lists their id; references to rows deleted since
+        the backup they come from are cleared, as the database did.
+
+        Args:
+            paths: Backup files of the chain, newest first, ending with its full backup
+            password: Decryption password
+
+        Yields:
+            Sections in the format of _read_backup, without ids
+
+        Raises:
+            ValueError: If decryption fails, the content is malformed or the
+                backups do not form a chain
+        """
+        readers = [self._read_backup(self._read_file_chunks(path), password) for path in paths]
+        try:
+            headers = []
+            for reader in readers:
+                first = await anext(reader, None)
+                if first is None:
+                    raise ValueError("Invalid backup format: file too short")
+                headers.append(first[1])
+            parents = [header.get("backup_id") for header in headers[1:]] + [None]
+            for header, parent_id in zip(headers, parents, strict=True):
+                if header.get("parent_id") != parent_id:
+                    raise ValueError("Invalid backup chain: backups do not belong together")
+            yield "backup", {key: value for key, value in headers[0].items() if key != "parent_id"}
+
+            pending = [await anext(reader, None) for reader in readers]
+
+            async def take(index: int, key: str) -> AsyncIterator[tuple[str, Any]]:
+                """Yield the sections of one table from one backup of the chain."""
+                while (current := pending[index]) is not None:
+                    section, values = current
+                    if (values[0] if section == "ids" else section) != key:
+                        return
+                    yield section, values
+                    pending[index] = await anext(readers[index], None)
+
+            restored_ids: dict[str, set[str]] = {
+                referenced: set()
+                for references in SET_NULL_REFERENCES.values()
+                for _, referenced in references
+            }
+            for key, _, _ in BACKUP_TABLES:
+                if key not in INCREMENTAL_TABLES:
+                    async for _, rows in take(0, key):
+                        if key in restored_ids:
+                            restored_ids[key].update(row["id"] for row in rows)
+                        yield key, rows
+                    for index in range(1, len(readers)):
+                        async for _ in take(index, key):
+                            pass
+                    continue
+
+                # Ids of the newest backup, read before any older rows
+                live: set[str] | None = None if key in APPEND_ONLY_TABLES else set()
+                seen: set[str] = set()
+                for index in range(len(readers)):
+                    async for section, values in take(index, key):
+                        if section == "ids":
+                            if index == 0 and live is not None:
+                                live.update(values[1])
+                            continue
+                        rows = values
+                        if index > 0:
+                            rows = [
+                                row
+                                for row in rows
+                                if row["id"] not in seen and (live is None or row["id"] in live)
+                            ]
+                            for row in rows:
+                                for column, referenced in SET_NULL_REFERENCES[key]:
+                                    if row.get(column) not in restored_ids[referenced]:
+                                        row[column] = None
+                        if index < len(readers) - 1:
+                            seen.update(row["id"] for row in rows)
+                        if rows:
+                            yield key, rows
+        finally:
+            for reader in readers:
+                await reader.aclose()
+
     def _validate_schema(self, data: dict[str, Any]) -> None:
-        """Validate backup data schema."""
+        """Validate the schema of a legacy backup document."""
         required_keys = ["version", "created_at", "data"]
         for key in required_keys:
             if key not in data:
                 raise ValueError(f"Missing required key: {key}")
 
-        # Required data keys for V1 backups
-        required_data_keys_v1 = [
-            "providers",
-            "licenses",
-            "employees",
-            "license_packages",
-            "organization_licenses",
-            "payment_methods",
-            "provider_files",
-            "cost_snapshots",
-            "settings",
-            "notification_rules",
-        ]
-
-        for key in required_data_keys_v1:
+        for key in REQUIRED_DATA_KEYS:
             if key not in data["data"]:
                 raise ValueError(f"Missing data key: {key}")
 
@@ -799,504 +1149,484 @@ class BackupService:
         # 13. Audit logs (immutable but included for full restore)
         await self.session.execute(delete(AuditLogORM))
 
-        # Delete all provider files from disk
+        await self.session.flush()
+
+    def _replace_provider_files(self, files_dir: Path) -> None:
+        """Replace the provider files on disk with the files of a committed restore.
+
+        Args:
+            files_dir: Directory the restored provider files were written to
+        """
         if FILES_DIR.exists():
-            for provider_dir in FILES_DIR.iterdir():
-                if provider_dir.is_dir():
-                    for file in provider_dir.iterdir():
-                        file.unlink()
-                    provider_dir.rmdir()
+            shutil.rmtree(FILES_DIR)
+        files_dir.replace(FILES_DIR)
 
-        await self.session.flush()
+    async def _import_sections(
+        self,
+        sections: AsyncIterator[tuple[str, Any]],
+        files_dir: Path,
+        on_progress: Callable[[str, int], Awaitable[None]] | None = None,
+    ) -> RestoreImportCounts:
+        """Insert the table batches of a backup with bulk INSERT statements.
+
+        Batches arrive in restore order (parents first). Employees are inserted
+        without their manager first, and linked once all employees exist.
 
-    async def _import_data(self, data: dict[str, Any]) -> RestoreImportCounts:
-        """Import data in correct order (respecting foreign keys)."""
+        Args:
+            sections: (table key, rows) batches from _read_backup
+            files_dir: Directory to write restored provider files to
+            on_progress: Optional callback receiving a table name and the number
+                of its rows restored so far
+
+        Returns:
+            Number of restored rows per table
+        """
         counts = RestoreImportCounts()
+        models = {key: model for key, model, _ in BACKUP_TABLES}
+        row_values = {
+            "settings": self._settings_values,
+            "payment_methods": self._payment_method_values,
+            "permissions": self._permission_values,
+            "roles": self._role_values,
+            "admin_users": self._admin_user_values,
+            "refresh_tokens": self._refresh_token_values,
+            "employees": self._employee_values,
+            "employee_external_accounts": self._employee_external_account_values,
+            "role_permissions": self._role_permission_values,
+            "user_roles": self._user_role_values,
+            "user_notification_preferences": self._user_notification_preference_values,
+            "providers": self._provider_values,
+            "notification_rules": self._notification_rule_values,
+            "license_packages": self._license_package_values,
+            "organization_licenses": self._organization_license_values,
+            "cost_snapshots": self._cost_snapshot_values,
+            "licenses": self._license_values,
+            "provider_files": lambda pf: self._provider_file_values(pf, files_dir),
+            "service_account_patterns": self._account_pattern_values,
+            "admin_account_patterns": self._account_pattern_values,
+            "service_account_license_types": self._service_account_license_type_values,
+            "audit_logs": self._audit_log_values,
+        }
+        managers: list[dict[str, UUID]] = []
+        table: str | None = None
+
+        async for key, rows in sections:
+            if key != table:
+                await self._finish_table(table, counts, managers)
+                table = key
+
+            values = [row_values[key](row) for row in rows]
+            await self.session.execute(insert(models[key]), values)
+            if key == "employees":
+                managers.extend(
+                    {"id": value["id"], "manager_id": self._parse_uuid(row["manager_id"])}
+                    for row, value in zip(rows, values, strict=True)
+                    if row.get("manager_id")
+                )
 
-        # Import in dependency order (parents first)
+            setattr(counts, key, getattr(counts, key) + len(values))
+            if on_progress:
+                await on_progress(key, getattr(counts, key))
 
-        # 1. Settings (no dependencies)
-        for s in data["settings"]:
-            value = s["value"]
+        await self._finish_table(table, counts, managers)
+        return counts
 
-            # Handle SMTP config: re-encrypt password if it was decrypted for backup
-            if s["key"] == "smtp_config" and value and value.get("password_decrypted"):
-                decrypted_password = value["password_decrypted"]
-                # Re-encrypt with current encryption key
-                encrypted_bytes = self.encryption.encrypt_string(decrypted_password)
-                value = dict(value)
-                value["password_encrypted"] = encrypted_bytes.hex()
-                del value["password_decrypted"]
+    async def _finish_table(
+        self,
+        table: str | None,
+        counts: RestoreImportCounts,
+        managers: list[dict[str, UUID]],
+    ) -> None:
+        """Complete the restore of a table once all its batches are inserted."""
+        if table is None:
+            return
+        if table == "employees" and managers:
+            # Bulk UPDATE by primary key, once every manager row exists
+            await self.session.execute(update(EmployeeORM), managers)
+            managers.clear()
+        logger.info(f"Restored {getattr(counts, table)} rows into {table}")
+
+    def _settings_values(self, s: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up setting."""
+        value = s["value"]
+
+        # Handle SMTP config: re-encrypt password if it was decrypted for backup
+        if s["key"] == "smtp_config" and value and value.get("password_decrypted"):
+            decrypted_password = value["password_decrypted"]
+            # Re-encrypt with current encryption key
+            encrypted_bytes = self.encryption.encrypt_string(decrypted_password)
+            value = dict(value)
+            value["password_encrypted"] = encrypted_bytes.hex()
+            del value["password_decrypted"]
+
+        return {"key": s["key"], "value": value}
+
+    def _payment_method_values(self, pm: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up payment method."""
+        return {
+            "id": self._parse_uuid(pm["id"]),
+            "name": pm["name"],
+            "type": pm["type"],
+            "details": pm.get("details", {}),
+            "is_default": pm.get("is_default", False),
+            "notes": pm.get("notes"),
+            "created_at": self._parse_datetime(pm.get("created_at")),
+            "updated_at": self._parse_datetime(pm.get("updated_at")),
+        }
 
-            settings_orm = SettingsORM(
-                key=s["key"],
-                value=value,
-            )
-            self.session.add(settings_orm)
-            counts.settings += 1
-
-        # 2. Payment methods (no dependencies)
-        for pm in data["payment_methods"]:
-            pm_orm = PaymentMethodORM(
-                id=UUID(pm["id"]) if isinstance(pm["id"], str) else pm["id"],
-                name=pm["name"],
-                type=pm["type"],
-                details=pm.get("details", {}),
-                is_default=pm.get("is_default", False),
-                notes=pm.get("notes"),
-                created_at=self._parse_datetime(pm.get("created_at")),
-                updated_at=self._parse_datetime(pm.get("updated_at")),
-            )
-            self.session.add(pm_orm)
-            counts.payment_methods += 1
-
-        # 3. Permissions (no dependencies)
-        for p in data.get("permissions", []):
-            perm_orm = PermissionORM(
-                id=UUID(p["id"]) if isinstance(p["id"], str) else p["id"],
-                code=p["code"],
-                name=p["name"],
-                description=p.get("description"),
-                category=p["category"],
-                created_at=self._parse_datetime(p.get("created_at")),
-                updated_at=self._parse_datetime(p.get("updated_at")),
-            )
-            self.session.add(perm_orm)
-            counts.permissions += 1
-
-        # 4. Roles (no dependencies)
-        for r in data.get("roles", []):
-            role_orm = RoleORM(
-                id=UUID(r["id"]) if isinstance(r["id"], str) else r["id"],
-                code=r["code"],
-                name=r["name"],
-                description=r.get("description"),
-                is_system=r.get("is_system", False),
-                priority=r.get("priority", 0),
-                created_at=self._parse_datetime(r.get("created_at")),
-                updated_at=self._parse_datetime(r.get("updated_at")),
-            )
-            self.session.add(role_orm)
-            counts.roles += 1
-
-        # 5. Admin users (no dependencies) - Google OAuth only
-        for u in data.get("admin_users", []):
-            user_orm = AdminUserORM(
-                id=UUID(u["id"]) if isinstance(u["id"], str) else u["id"],
-                email=u["email"],
-                name=u.get("name"),
-                picture_url=u.get("picture_url"),
-                auth_provider=u.get("auth_provider", "google"),
-                google_id=u.get("google_id"),
-                is_active=u.get("is_active", True),
-                last_login_at=self._parse_datetime(u.get("last_login_at")),
-                language=u.get("language", "en"),
-                date_format=u.get("date_format", "DD.MM.YYYY"),
-                number_format=u.get("number_format", "de-DE"),
-                currency=u.get("currency", "EUR"),
-                created_at=self._parse_datetime(u.get("created_at")),
-                updated_at=self._parse_datetime(u.get("updated_at")),
-            )
-            self.session.add(user_orm)
-            counts.admin_users += 1
-
-        # 5b. Refresh tokens (depends on admin_users)
-        for rt in data.get("refresh_tokens", []):
-            rt_orm = RefreshTokenORM(
-                id=UUID(rt["id"]) if isinstance(rt["id"], str) else rt["id"],
-                user_id=UUID(rt["user_id"]) if isinstance(rt["user_id"], str) else rt["user_id"],
-                token_hash=rt["token_hash"],
-                expires_at=self._parse_datetime(rt["expires_at"]),
-                created_at=self._parse_datetime(rt.get("created_at")),
-                revoked_at=self._parse_datetime(rt.get("revoked_at")),
-                user_agent=rt.get("user_agent"),
-                ip_address=rt.get("ip_address"),
-            )
-            self.session.add(rt_orm)
-            counts.refresh_tokens += 1
-
-        # 6. Employees (self-referential FK: manager_id -> employees.id)
-        # Insert in two passes to handle manager_id references
-        # Pass 1: Insert all employees WITHOUT manager_id
-        employee_manager_map: dict[UUID, UUID] = {}  # employee_id -> manager_id
-        for e in data["employees"]:
-            emp_id = UUID(e["id"]) if isinstance(e["id"], str) else e["id"]
-            # Store manager_id for second pass
-            if e.get("manager_id"):
-                manager_id = (
-                    UUID(e["manager_id"]) if isinstance(e["manager_id"], str) else e["manager_id"]
-                )
-                employee_manager_map[emp_id] = manager_id
-
-            emp_orm = EmployeeORM(
-                id=emp_id,
-                hibob_id=e["hibob_id"],
-                email=e["email"],
-                full_name=e["full_name"],
-                department=e.get("department"),
-                status=e["status"],
-                source=e.get("source", "hibob"),
-                start_date=self._parse_date(e.get("start_date")),
-                termination_date=self._parse_date(e.get("termination_date")),
-                avatar_url=e.get("avatar_url"),
-                manager_email=e.get("manager_email"),
-                manager_id=None,  # Set to None initially, will update in pass 2
-                synced_at=self._parse_datetime(e["synced_at"]),
-                created_at=self._parse_datetime(e.get("created_at")),
-                updated_at=self._parse_datetime(e.get("updated_at")),
-            )
-            self.session.add(emp_orm)
-            counts.employees += 1
+    def _permission_values(self, p: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up permission."""
+        return {
+            "id": self._parse_uuid(p["id"]),
+            "code": p["code"],
+            "name": p["name"],
+            "description": p.get("description"),
+            "category": p["category"],
+            "created_at": self._parse_datetime(p.get("created_at")),
+            "updated_at": self._parse_datetime(p.get("updated_at")),
+        }
 
-        await self.session.flush()
+    def _role_values(self, r: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up role."""
+        return {
+            "id": self._parse_uuid(r["id"]),
+            "code": r["code"],
+            "name": r["name"],
+            "description": r.get("description"),
+            "is_system": r.get("is_system", False),
+            "priority": r.get("priority", 0),
+            "created_at": self._parse_datetime(r.get("created_at")),
+            "updated_at": self._parse_datetime(r.get("updated_at")),
+        }
 
-        # Pass 2: Update employees with their manager_id references
-        if employee_manager_map:
-            from sqlalchemy import update
+    def _admin_user_values(self, u: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up admin user (Google OAuth only)."""
+        return {
+            "id": self._parse_uuid(u["id"]),
+            "email": u["email"],
+            "name": u.get("name"),
+            "picture_url": u.get("picture_url"),
+            "auth_provider": u.get("auth_provider", "google"),
+            "google_id": u.get("google_id"),
+            "is_active": u.get("is_active", True),
+            "last_login_at": self._parse_datetime(u.get("last_login_at")),
+            "language": u.get("language", "en"),
+            "date_format": u.get("date_format", "DD.MM.YYYY"),
+            "number_format": u.get("number_format", "de-DE"),
+            "currency": u.get("currency", "EUR"),
+            "created_at": self._parse_datetime(u.get("created_at")),
+            "updated_at": self._parse_datetime(u.get("updated_at")),
+        }
 
-            for emp_id, manager_id in employee_manager_map.items():
-                await self.session.execute(
-                    update(EmployeeORM)
-                    .where(EmployeeORM.id == emp_id)
-                    .values(manager_id=manager_id)
-                )
-            await self.session.flush()
-
-        # 6b. Employee external accounts (depends on employees)
-        for eea in data.get("employee_external_accounts", []):
-            eea_orm = EmployeeExternalAccountORM(
-                id=UUID(eea["id"]) if isinstance(eea["id"], str) else eea["id"],
-                employee_id=UUID(eea["employee_id"])
-                if isinstance(eea["employee_id"], str)
-                else eea["employee_id"],
-                provider_type=eea["provider_type"],
-                external_username=eea["external_username"],
-                external_user_id=eea.get("external_user_id"),
-                display_name=eea.get("display_name"),
-                linked_at=self._parse_datetime(eea["linked_at"]),
-                linked_by_id=UUID(eea["linked_by_id"]) if eea.get("linked_by_id") else None,
-                created_at=self._parse_datetime(eea.get("created_at")),
-                updated_at=self._parse_datetime(eea.get("updated_at")),
-            )
-            self.session.add(eea_orm)
-            counts.employee_external_accounts += 1
+    def _refresh_token_values(self, rt: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up refresh token."""
+        return {
+            "id": self._parse_uuid(rt["id"]),
+            "user_id": self._parse_uuid(rt["user_id"]),
+            "token_hash": rt["token_hash"],
+            "expires_at": self._parse_datetime(rt["expires_at"]),
+            "created_at": self._parse_datetime(rt.get("created_at")),
+            "revoked_at": self._parse_datetime(rt.get("revoked_at")),
+            "user_agent": rt.get("user_agent"),
+            "ip_address": rt.get("ip_address"),
+        }
 
-        await self.session.flush()
+    def _employee_values(self, e: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up employee.
 
-        # 7. Role permissions (depends on roles and permissions)
-        for rp in data.get("role_permissions", []):
-            rp_orm = RolePermissionORM(
-                role_id=UUID(rp["role_id"]) if isinstance(rp["role_id"], str) else rp["role_id"],
-                permission_id=UUID(rp["permission_id"])
-                if isinstance(rp["permission_id"], str)
-                else rp["permission_id"],
-                created_at=self._parse_datetime(rp.get("created_at")),
-            )
-            self.session.add(rp_orm)
-            counts.role_permissions += 1
-
-        # 8. User roles (depends on admin_users and roles)
-        for ur in data.get("user_roles", []):
-            ur_orm = UserRoleORM(
-                user_id=UUID(ur["user_id"]) if isinstance(ur["user_id"], str) else ur["user_id"],
-                role_id=UUID(ur["role_id"]) if isinstance(ur["role_id"], str) else ur["role_id"],
-                assigned_at=self._parse_datetime(ur.get("assigned_at")),
-                assigned_by=UUID(ur["assigned_by"]) if ur.get("assigned_by") else None,
-            )
-            self.session.add(ur_orm)
-            counts.user_roles += 1
-
-        # 9. User notification preferences (depends on admin_users)
-        for unp in data.get("user_notification_preferences", []):
-            unp_orm = UserNotificationPreferenceORM(
-                id=UUID(unp["id"]) if isinstance(unp["id"], str) else unp["id"],
-                user_id=UUID(unp["user_id"]) if isinstance(unp["user_id"], str) else unp["user_id"],
-                event_type=unp["event_type"],
-                enabled=unp.get("enabled", True),
-                slack_dm=unp.get("slack_dm", False),
-                slack_channel=unp.get("slack_channel"),
-                created_at=self._parse_datetime(unp.get("created_at")),
-                updated_at=self._parse_datetime(unp.get("updated_at")),
-            )
-            self.session.add(unp_orm)
-            counts.user_notification_preferences += 1
-
-        # 10. Providers (depends on payment_methods)
-        for p in data["providers"]:
-            # Handle credentials: new format (plaintext dict) or old format (encrypted bytes)
-            if p.get("credentials") is not None:
-                # New format: plaintext credentials, encrypt with current key
-                credentials_encrypted = self.encryption.encrypt(p["credentials"])
-            elif p.get("credentials_encrypted"):
-                # Old format: already encrypted (backward compatibility)
-                credentials = p["credentials_encrypted"]
-                if isinstance(credentials, str):
-                    credentials_encrypted = base64.b64decode(credentials)
-                else:
-                    credentials_encrypted = credentials
+        manager_id references another employee and is set after all employees
+        are inserted (see _finish_table).
+        """
+        return {
+            "id": self._parse_uuid(e["id"]),
+            "hibob_id": e["hibob_id"],
+            "email": e["email"],
+            "full_name": e["full_name"],
+            "department": e.get("department"),
+            "status": e["status"],
+            "source": e.get("source", "hibob"),
+            "start_date": self._parse_date(e.get("start_date")),
+            "termination_date": self._parse_date(e.get("termination_date")),
+            "avatar_url": e.get("avatar_url"),
+            "manager_email": e.get("manager_email"),
+            "manager_id": None,
+            "synced_at": self._parse_datetime(e["synced_at"]),
+            "created_at": self._parse_datetime(e.get("created_at")),
+            "updated_at": self._parse_datetime(e.get("updated_at")),
+        }
+
+    def _employee_external_account_values(self, eea: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up employee external account."""
+        return {
+            "id": self._parse_uuid(eea["id"]),
+            "employee_id": self._parse_uuid(eea["employee_id"]),
+            "provider_type": eea["provider_type"],
+            "external_username": eea["external_username"],
+            "external_user_id": eea.get("external_user_id"),
+            "display_name": eea.get("display_name"),
+            "linked_at": self._parse_datetime(eea["linked_at"]),
+            "linked_by_id": self._parse_uuid(eea.get("linked_by_id")),
+            "created_at": self._parse_datetime(eea.get("created_at")),
+            "updated_at": self._parse_datetime(eea.get("updated_at")),
+        }
+
+    def _role_permission_values(self, rp: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up role permission."""
+        return {
+            "role_id": self._parse_uuid(rp["role_id"]),
+            "permission_id": self._parse_uuid(rp["permission_id"]),
+            "created_at": self._parse_datetime(rp.get("created_at")),
+        }
+
+    def _user_role_values(self, ur: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up user role."""
+        return {
+            "user_id": self._parse_uuid(ur["user_id"]),
+            "role_id": self._parse_uuid(ur["role_id"]),
+            "assigned_at": self._parse_datetime(ur.get("assigned_at")),
+            "assigned_by": self._parse_uuid(ur.get("assigned_by")),
+        }
+
+    def _user_notification_preference_values(self, unp: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up user notification preference."""
+        return {
+            "id": self._parse_uuid(unp["id"]),
+            "user_id": self._parse_uuid(unp["user_id"]),
+            "event_type": unp["event_type"],
+            "enabled": unp.get("enabled", True),
+            "slack_dm": unp.get("slack_dm", False),
+            "slack_channel": unp.get("slack_channel"),
+            "created_at": self._parse_datetime(unp.get("created_at")),
+            "updated_at": self._parse_datetime(unp.get("updated_at")),
+        }
+
+    def _provider_values(self, p: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up provider, encrypting its credentials."""
+        # Handle credentials: new format (plaintext dict) or old format (encrypted bytes)
+        if p.get("credentials") is not None:
+            # New format: plaintext credentials, encrypt with current key
+            credentials_encrypted = self.encryption.encrypt(p["credentials"])
+        elif p.get("credentials_encrypted"):
+            # Old format: already encrypted (backward compatibility)
+            credentials = p["credentials_encrypted"]
+            if isinstance(credentials, str):
+                credentials_encrypted = base64.b64decode(credentials)
             else:
-                # No credentials - encrypt empty dict
-                credentials_encrypted = self.encryption.encrypt({})
-
-            provider_orm = ProviderORM(
-                id=UUID(p["id"]) if isinstance(p["id"], str) else p["id"],
-                name=p["name"],
-                display_name=p["display_name"],
-                logo_url=p.get("logo_url"),
-                enabled=p.get("enabled", True),
-                credentials_encrypted=credentials_encrypted,
-                config=p.get("config"),
-                last_sync_at=self._parse_datetime(p.get("last_sync_at")),
-                last_sync_status=p.get("last_sync_status"),
-                payment_method_id=UUID(p["payment_method_id"])
-                if p.get("payment_method_id")
-                else None,
-                created_at=self._parse_datetime(p.get("created_at")),
-                updated_at=self._parse_datetime(p.get("updated_at")),
-            )
-            self.session.add(provider_orm)
-            counts.providers += 1
-
-        # 11. Notification rules (no dependencies)
-        for nr in data["notification_rules"]:
-            nr_orm = NotificationRuleORM(
-                id=UUID(nr["id"]) if isinstance(nr["id"], str) else nr["id"],
-                event_type=nr["event_type"],
-                slack_channel=nr["slack_channel"],
-                enabled=nr.get("enabled", True),
-                template=nr.get("template"),
-                created_at=self._parse_datetime(nr.get("created_at")),
-                updated_at=self._parse_datetime(nr.get("updated_at")),
-            )
-            self.session.add(nr_orm)
-            counts.notification_rules += 1
+                credentials_encrypted = credentials
+        else:
+            # No credentials - encrypt empty dict
+            credentials_encrypted = self.encryption.encrypt({})
 
-        await self.session.flush()
+        return {
+            "id": self._parse_uuid(p["id"]),
+            "name": p["name"],
+            "display_name": p["display_name"],
+            "logo_url": p.get("logo_url"),
+            "enabled": p.get("enabled", True),
+            "credentials_encrypted": credentials_encrypted,
+            "config": p.get("config"),
+            "last_sync_at": self._parse_datetime(p.get("last_sync_at")),
+            "last_sync_status": p.get("last_sync_status"),
+            "payment_method_id": self._parse_uuid(p.get("payment_method_id")),
+            "created_at": self._parse_datetime(p.get("created_at")),
+            "updated_at": self._parse_datetime(p.get("updated_at")),
+        }
 
-        # 12. License packages (depends on providers)
-        for lp in data["license_packages"]:
-            lp_orm = LicensePackageORM(
-                id=UUID(lp["id"]) if isinstance(lp["id"], str) else lp["id"],
-                provider_id=UUID(lp["provider_id"])
-                if isinstance(lp["provider_id"], str)
-                else lp["provider_id"],
-                license_type=lp["license_type"],
-                display_name=lp.get("display_name"),
-                total_seats=lp["total_seats"],
-                cost_per_seat=Decimal(lp["cost_per_seat"]) if lp.get("cost_per_seat") else None,
-                billing_cycle=lp.get("billing_cycle"),
-                payment_frequency=lp.get("payment_frequency"),
-                currency=lp.get("currency", "EUR"),
-                contract_start=self._parse_date(lp.get("contract_start")),
-                contract_end=self._parse_date(lp.get("contract_end")),
-                auto_renew=lp.get("auto_renew", True),
-                notes=lp.get("notes"),
-                cancelled_at=self._parse_datetime(lp.get("cancelled_at")),
-                cancellation_effective_date=self._parse_date(lp.get("cancellation_effective_date")),
-                cancellation_reason=lp.get("cancellation_reason"),
-                cancelled_by=UUID(lp["cancelled_by"]) if lp.get("cancelled_by") else None,
-                needs_reorder=lp.get("needs_reorder", False),
-                status=lp.get("status", "active"),
-                created_at=self._parse_datetime(lp.get("created_at")),
-                updated_at=self._parse_datetime(lp.get("updated_at")),
-            )
-            self.session.add(lp_orm)
-            counts.license_packages += 1
-
-        # 13. Organization licenses (depends on providers)
-        for ol in data["organization_licenses"]:
-            ol_orm = OrganizationLicenseORM(
-                id=UUID(ol["id"]) if isinstance(ol["id"], str) else ol["id"],
-                provider_id=UUID(ol["provider_id"])
-                if isinstance(ol["provider_id"], str)
-                else ol["provider_id"],
-                name=ol["name"],
-                license_type=ol.get("license_type"),
-                quantity=ol.get("quantity"),
-                unit=ol.get("unit"),
-                monthly_cost=Decimal(ol["monthly_cost"]) if ol.get("monthly_cost") else None,
-                currency=ol.get("currency", "EUR"),
-                billing_cycle=ol.get("billing_cycle"),
-                renewal_date=self._parse_date(ol.get("renewal_date")),
-                notes=ol.get("notes"),
-                expires_at=self._parse_date(ol.get("expires_at")),
-                cancelled_at=self._parse_datetime(ol.get("cancelled_at")),
-                cancellation_effective_date=self._parse_date(ol.get("cancellation_effective_date")),
-                cancellation_reason=ol.get("cancellation_reason"),
-                cancelled_by=UUID(ol["cancelled_by"]) if ol.get("cancelled_by") else None,
-                needs_reorder=ol.get("needs_reorder", False),
-                status=ol.get("status", "active"),
-                created_at=self._parse_datetime(ol.get("created_at")),
-                updated_at=self._parse_datetime(ol.get("updated_at")),
-            )
-            self.session.add(ol_orm)
-            counts.organization_licenses += 1
-
-        # 14. Cost snapshots (depends on providers)
-        for cs in data["cost_snapshots"]:
-            cs_orm = CostSnapshotORM(
-                id=UUID(cs["id"]) if isinstance(cs["id"], str) else cs["id"],
-                snapshot_date=self._parse_date(cs["snapshot_date"]),
-                provider_id=UUID(cs["provider_id"]) if cs.get("provider_id") else None,
-                total_cost=Decimal(cs["total_cost"]),
-                license_count=cs["license_count"],
-                active_count=cs.get("active_count", 0),
-                unassigned_count=cs.get("unassigned_count", 0),
-                currency=cs.get("currency", "EUR"),
-                breakdown=cs.get("breakdown"),
-                created_at=self._parse_datetime(cs.get("created_at")),
-                updated_at=self._parse_datetime(cs.get("updated_at")),
-            )
-            self.session.add(cs_orm)
-            counts.cost_snapshots += 1
-
-        # 15. Licenses (depends on providers and employees)
-        for lic in data["licenses"]:
-            lic_orm = LicenseORM(
-                id=UUID(lic["id"]) if isinstance(lic["id"], str) else lic["id"],
-                provider_id=UUID(lic["provider_id"])
-                if isinstance(lic["provider_id"], str)
-                else lic["provider_id"],
-                employee_id=UUID(lic["employee_id"]) if lic.get("employee_id") else None,
-                external_user_id=lic["external_user_id"],
-                license_type=lic.get("license_type"),
-                status=lic["status"],
-                assigned_at=self._parse_datetime(lic.get("assigned_at")),
-                last_activity_at=self._parse_datetime(lic.get("last_activity_at")),
-                monthly_cost=Decimal(lic["monthly_cost"]) if lic.get("monthly_cost") else None,
-                currency=lic.get("currency", "EUR"),
-                extra_data=lic.get("metadata") or lic.get("extra_data"),
-                synced_at=self._parse_datetime(lic["synced_at"]),
-                is_service_account=lic.get("is_service_account", False),
-                service_account_name=lic.get("service_account_name"),
-                service_account_owner_id=UUID(lic["service_account_owner_id"])
-                if lic.get("service_account_owner_id")
-                else None,
-                is_admin_account=lic.get("is_admin_account", False),
-                admin_account_name=lic.get("admin_account_name"),
-                admin_account_owner_id=UUID(lic["admin_account_owner_id"])
-                if lic.get("admin_account_owner_id")
-                else None,
-                suggested_employee_id=UUID(lic["suggested_employee_id"])
-                if lic.get("suggested_employee_id")
-                else None,
-                match_confidence=lic.get("match_confidence"),
-                match_status=lic.get("match_status"),
-                match_method=lic.get("match_method"),
-                match_reviewed_at=self._parse_datetime(lic.get("match_reviewed_at")),
-                match_reviewed_by=UUID(lic["match_reviewed_by"])
-                if lic.get("match_reviewed_by")
-                else None,
-                expires_at=self._parse_date(lic.get("expires_at")),
-                needs_reorder=lic.get("needs_reorder", False),
-                cancelled_at=self._parse_datetime(lic.get("cancelled_at")),
-                cancellation_effective_date=self._parse_date(
-                    lic.get("cancellation_effective_date")
-                ),
-                cancellation_reason=lic.get("cancellation_reason"),
-                cancelled_by=UUID(lic["cancelled_by"]) if lic.get("cancelled_by") else None,
-                created_at=self._parse_datetime(lic.get("created_at")),
-                updated_at=self._parse_datetime(lic.get("updated_at")),
-            )
-            self.session.add(lic_orm)
-            counts.licenses += 1
-
-        # 16. Provider files (depends on providers) - also restore files to disk
-        for pf in data["provider_files"]:
-            pf_orm = ProviderFileORM(
-                id=UUID(pf["id"]) if isinstance(pf["id"], str) else pf["id"],
-                provider_id=UUID(pf["provider_id"])
-                if isinstance(pf["provider_id"], str)
-                else pf["provider_id"],
-                filename=pf["filename"],
-                original_name=pf["original_name"],
-                file_type=pf["file_type"],
-                file_size=pf["file_size"],
-                description=pf.get("description"),
-                category=pf.get("category"),
-                created_at=self._parse_datetime(pf.get("created_at")),
-                updated_at=self._parse_datetime(pf.get("updated_at")),
-            )
-            self.session.add(pf_orm)
-            counts.provider_files += 1
+    def _notification_rule_values(self, nr: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up notification rule."""
+        return {
+            "id": self._parse_uuid(nr["id"]),
+            "event_type": nr["event_type"],
+            "slack_channel": nr["slack_channel"],
+            "enabled": nr.get("enabled", True),
+            "template": nr.get("template"),
+            "created_at": self._parse_datetime(nr.get("created_at")),
+            "updated_at": self._parse_datetime(nr.get("updated_at")),
+        }
 
-            # Restore file to disk if data is present
-            if pf.get("file_data"):
-                try:
-                    provider_id = pf["provider_id"]
-                    if isinstance(provider_id, str):
-                        provider_id = UUID(provider_id)
-                    provider_dir = FILES_DIR / str(provider_id)
-                    provider_dir.mkdir(parents=True, exist_ok=True)
-                    file_path = provider_dir / pf["filename"]
-                    file_content = base64.b64decode(pf["file_data"])
-                    file_path.write_bytes(file_content)
-                except Exception as e:
-                    logger.warning(f"Failed to restore file {pf['filename']}: {e}")
-
-        # 17. Service account patterns (depends on employees for owner_id)
-        for sap in data.get("service_account_patterns", []):
-            sap_orm = ServiceAccountPatternORM(
-                id=UUID(sap["id"]) if isinstance(sap["id"], str) else sap["id"],
-                email_pattern=sap["email_pattern"],
-                name=sap.get("name"),
-                owner_id=UUID(sap["owner_id"]) if sap.get("owner_id") else None,
-                notes=sap.get("notes"),
-                created_by=UUID(sap["created_by"]) if sap.get("created_by") else None,
-                created_at=self._parse_datetime(sap.get("created_at")),
-                updated_at=self._parse_datetime(sap.get("updated_at")),
-            )
-            self.session.add(sap_orm)
-            counts.service_account_patterns += 1
-
-        # 18. Admin account patterns (depends on employees for owner_id)
-        for aap in data.get("admin_account_patterns", []):
-            aap_orm = AdminAccountPatternORM(
-                id=UUID(aap["id"]) if isinstance(aap["id"], str) else aap["id"],
-                email_pattern=aap["email_pattern"],
-                name=aap.get("name"),
-                owner_id=UUID(aap["owner_id"]) if aap.get("owner_id") else None,
-                notes=aap.get("notes"),
-                created_by=UUID(aap["created_by"]) if aap.get("created_by") else None,
-                created_at=self._parse_datetime(aap.get("created_at")),
-                updated_at=self._parse_datetime(aap.get("updated_at")),
-            )
-            self.session.add(aap_orm)
-            counts.admin_account_patterns += 1
-
-        # 19. Service account license types (depends on employees and admin_users)
-        for salt in data.get("service_account_license_types", []):
-            salt_orm = ServiceAccountLicenseTypeORM(
-                id=UUID(salt["id"]) if isinstance(salt["id"], str) else salt["id"],
-                license_type=salt["license_type"],
-                name=salt.get("name"),
-                owner_id=UUID(salt["owner_id"]) if salt.get("owner_id") else None,
-                notes=salt.get("notes"),
-                created_by=UUID(salt["created_by"]) if salt.get("created_by") else None,
-                created_at=self._parse_datetime(salt.get("created_at")),
-                updated_at=self._parse_datetime(salt.get("updated_at")),
-            )
-            self.session.add(salt_orm)
-            counts.service_account_license_types += 1
-
-        # 20. Audit logs (depends on admin_users)
-        for al in data.get("audit_logs", []):
-            al_orm = AuditLogORM(
-                id=UUID(al["id"]) if isinstance(al["id"], str) else al["id"],
-                admin_user_id=UUID(al["admin_user_id"]) if al.get("admin_user_id") else None,
-                action=al["action"],
-                resource_type=al["resource_type"],
-                resource_id=UUID(al["resource_id"]) if al.get("resource_id") else None,
-                changes=al.get("changes"),
-                ip_address=al.get("ip_address"),
-                user_agent=al.get("user_agent"),
-                created_at=self._parse_datetime(al.get("created_at")),
-            )
-            self.session.add(al_orm)
-            counts.audit_logs += 1
+    def _license_package_values(self, lp: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up license package."""
+        return {
+            "id": self._parse_uuid(lp["id"]),
+            "provider_id": self._parse_uuid(lp["provider_id"]),
+            "license_type": lp["license_type"],
+            "display_name": lp.get("display_name"),
+            "total_seats": lp["total_seats"],
+            "cost_per_seat": Decimal(lp["cost_per_seat"]) if lp.get("cost_per_seat") else None,
+            "billing_cycle": lp.get("billing_cycle"),
+            "payment_frequency": lp.get("payment_frequency"),
+            "currency": lp.get("currency", "EUR"),
+            "contract_start": self._parse_date(lp.get("contract_start")),
+            "contract_end": self._parse_date(lp.get("contract_end")),
+            "auto_renew": lp.get("auto_renew", True),
+            "notes": lp.get("notes"),
+            "cancelled_at": self._parse_datetime(lp.get("cancelled_at")),
+            "cancellation_effective_date": self._parse_date(lp.get("cancellation_effective_date")),
+            "cancellation_reason": lp.get("cancellation_reason"),
+            "cancelled_by": self._parse_uuid(lp.get("cancelled_by")),
+            "needs_reorder": lp.get("needs_reorder", False),
+            "status": lp.get("status", "active"),
+            "created_at": self._parse_datetime(lp.get("created_at")),
+            "updated_at": self._parse_datetime(lp.get("updated_at")),
+        }
 
-        await self.session.flush()
-        return counts
+    def _organization_license_values(self, ol: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up organization license."""
+        return {
+            "id": self._parse_uuid(ol["id"]),
+            "provider_id": self._parse_uuid(ol["provider_id"]),
+            "name": ol["name"],
+            "license_type": ol.get("license_type"),
+            "quantity": ol.get("quantity"),
+            "unit": ol.get("unit"),
+            "monthly_cost": Decimal(ol["monthly_cost"]) if ol.get("monthly_cost") else None,
+            "currency": ol.get("currency", "EUR"),
+            "billing_cycle": ol.get("billing_cycle"),
+            "renewal_date": self._parse_date(ol.get("renewal_date")),
+            "notes": ol.get("notes"),
+            "expires_at": self._parse_date(ol.get("expires_at")),
+            "cancelled_at": self._parse_datetime(ol.get("cancelled_at")),
+            "cancellation_effective_date": self._parse_date(ol.get("cancellation_effective_date")),
+            "cancellation_reason": ol.get("cancellation_reason"),
+            "cancelled_by": self._parse_uuid(ol.get("cancelled_by")),
+            "needs_reorder": ol.get("needs_reorder", False),
+            "status": ol.get("status", "active"),
+            "created_at": self._parse_datetime(ol.get("created_at")),
+            "updated_at": self._parse_datetime(ol.get("updated_at")),
+        }
+
+    def _cost_snapshot_values(self, cs: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up cost snapshot."""
+        return {
+            "id": self._parse_uuid(cs["id"]),
+            "snapshot_date": self._parse_date(cs["snapshot_date"]),
+            "provider_id": self._parse_uuid(cs.get("provider_id")),
+            "total_cost": Decimal(cs["total_cost"]),
+            "license_count": cs["license_count"],
+            "active_count": cs.get("active_count", 0),
+            "unassigned_count": cs.get("unassigned_count", 0),
+            "currency": cs.get("currency", "EUR"),
+            "breakdown": cs.get("breakdown"),
+            "created_at": self._parse_datetime(cs.get("created_at")),
+            "updated_at": self._parse_datetime(cs.get("updated_at")),
+        }
+
+    def _license_values(self, lic: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up license."""
+        return {
+            "id": self._parse_uuid(lic["id"]),
+            "provider_id": self._parse_uuid(lic["provider_id"]),
+            "employee_id": self._parse_uuid(lic.get("employee_id")),
+            "external_user_id": lic["external_user_id"],
+            "license_type": lic.get("license_type"),
+            "status": lic["status"],
+            "assigned_at": self._parse_datetime(lic.get("assigned_at")),
+            "last_activity_at": self._parse_datetime(lic.get("last_activity_at")),
+            "monthly_cost": Decimal(lic["monthly_cost"]) if lic.get("monthly_cost") else None,
+            "currency": lic.get("currency", "EUR"),
+            "extra_data": lic.get("metadata") or lic.get("extra_data"),
+            "synced_at": self._parse_datetime(lic["synced_at"]),
+            "is_service_account": lic.get("is_service_account", False),
+            "service_account_name": lic.get("service_account_name"),
+            "service_account_owner_id": self._parse_uuid(lic.get("service_account_owner_id")),
+            "is_admin_account": lic.get("is_admin_account", False),
+            "admin_account_name": lic.get("admin_account_name"),
+            "admin_account_owner_id": self._parse_uuid(lic.get("admin_account_owner_id")),
+            "suggested_employee_id": self._parse_uuid(lic.get("suggested_employee_id")),
+            "match_confidence": lic.get("match_confidence"),
+            "match_status": lic.get("match_status"),
+            "match_method": lic.get("match_method"),
+            "match_reviewed_at": self._parse_datetime(lic.get("match_reviewed_at")),
+            "match_reviewed_by": self._parse_uuid(lic.get("match_reviewed_by")),
+            "expires_at": self._parse_date(lic.get("expires_at")),
+            "needs_reorder": lic.get("needs_reorder", False),
+            "cancelled_at": self._parse_datetime(lic.get("cancelled_at")),
+            "cancellation_effective_date": self._parse_date(lic.get("cancellation_effective_date")),
+            "cancellation_reason": lic.get("cancellation_reason"),
+            "cancelled_by": self._parse_uuid(lic.get("cancelled_by")),
+            "created_at": self._parse_datetime(lic.get("created_at")),
+            "updated_at": self._parse_datetime(lic.get("updated_at")),
+        }
+
+    def _provider_file_values(self, pf: dict[str, Any], files_dir: Path) -> dict[str, Any]:
+        """Get the insert values of a backed up provider file and write its content.
+
+        Args:
+            pf: Backed up provider file
+            files_dir: Directory to write the file content to
+        """
+        provider_id = self._parse_uuid(pf["provider_id"])
+
+        # Restore file to disk if data is present
+        if pf.get("file_data"):
+            try:
+                provider_dir = files_dir / str(provider_id)
+                provider_dir.mkdir(parents=True, exist_ok=True)
+                file_path = provider_dir / pf["filename"]
+                file_path.write_bytes(base64.b64decode(pf["file_data"]))
+            except Exception as e:
+                logger.warning(f"Failed to restore file {pf['filename']}: {e}")
+
+        return {
+            "id": self._parse_uuid(pf["id"]),
+            "provider_id": provider_id,
+            "filename": pf["filename"],
+            "original_name": pf["original_name"],
+            "file_type": pf["file_type"],
+            "file_size": pf["file_size"],
+            "description": pf.get("description"),
+            "category": pf.get("category"),
+            "created_at": self._parse_datetime(pf.get("created_at")),
+            "updated_at": self._parse_datetime(pf.get("updated_at")),
+        }
+
+    def _account_pattern_values(self, ap: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up service or admin account pattern."""
+        return {
+            "id": self._parse_uuid(ap["id"]),
+            "email_pattern": ap["email_pattern"],
+            "name": ap.get("name"),
+            "owner_id": self._parse_uuid(ap.get("owner_id")),
+            "notes": ap.get("notes"),
+            "created_by": self._parse_uuid(ap.get("created_by")),
+            "created_at": self._parse_datetime(ap.get("created_at")),
+            "updated_at": self._parse_datetime(ap.get("updated_at")),
+        }
+
+    def _service_account_license_type_values(self, salt: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up service account license type."""
+        return {
+            "id": self._parse_uuid(salt["id"]),
+            "license_type": salt["license_type"],
+            "name": salt.get("name"),
+            "owner_id": self._parse_uuid(salt.get("owner_id")),
+            "notes": salt.get("notes"),
+            "created_by": self._parse_uuid(salt.get("created_by")),
+            "created_at": self._parse_datetime(salt.get("created_at")),
+            "updated_at": self._parse_datetime(salt.get("updated_at")),
+        }
+
+    def _audit_log_values(self, al: dict[str, Any]) -> dict[str, Any]:
+        """Get the insert values of a backed up audit log entry."""
+        return {
+            "id": self._parse_uuid(al["id"]),
+            "admin_user_id": self._parse_uuid(al.get("admin_user_id")),
+            "action": al["action"],
+            "resource_type": al["resource_type"],
+            "resource_id": self._parse_uuid(al.get("resource_id")),
+            "changes": al.get("changes"),
+            "ip_address": al.get("ip_address"),
+            "user_agent": al.get("user_agent"),
+            "created_at": self._parse_datetime(al.get("created_at")),
+        }
+
+    def _parse_uuid(self, value: str | UUID | None) -> UUID | None:
+        """Parse UUID from string or return as-is."""
+        if not value:
+            return None
+        if isinstance(value, UUID):
+            return value
+        return UUID(value)
 
     def _parse_datetime(self, value: str | datetime | None) -> datetime | None:
         """Parse datetime from string or return as-is."""
@@ -1420,6 +1750,8 @@ class BackupService:
             schedule=config_data.get("schedule", "0 2 * * *"),
             retention_count=config_data.get("retention_count", 7),
             password_configured=bool(config_data.get("password_encrypted")),
+            incremental=config_data.get("incremental", False),
+            full_backup_interval=config_data.get("full_backup_interval", 7),
         )
 
     async def update_config(
@@ -1452,6 +1784,10 @@ class BackupService:
             config_data["schedule"] = request.schedule
         if request.retention_count is not None:
             config_data["retention_count"] = request.retention_count
+        if request.incremental is not None:
+            config_data["incremental"] = request.incremental
+        if request.full_backup_interval is not None:
+            config_data["full_backup_interval"] = request.full_backup_interval
         if request.password is not None:
             # Encrypt the password
             encrypted = self.encryption.encrypt_string(request.password)
@@ -1478,6 +1814,8 @@ class BackupService:
                     "enabled": config_data.get("enabled"),
                     "schedule": config_data.get("schedule"),
                     "retention_count": config_data.get("retention_count"),
+                    "incremental": config_data.get("incremental", False),
+                    "full_backup_interval": config_data.get("full_backup_interval", 7),
                 },
             )
 
@@ -1488,6 +1826,8 @@ class BackupService:
             schedule=config_data.get("schedule", "0 2 * * *"),
             retention_count=config_data.get("retention_count", 7),
             password_configured=bool(config_data.get("password_encrypted")),
+            incremental=config_data.get("incremental", False),
+            full_backup_interval=config_data.get("full_backup_interval", 7),
         )
 
     def _validate_cron(self, expression: str) -> None:
@@ -1546,9 +1886,6 @@ class BackupService:
             logger.error(f"Failed to decrypt backup password: {e}")
             return None
 
-        # Create the backup
-        backup_data = await self.create_backup(password=password)
-
         # Generate backup ID and filename
         backup_id = self._generate_backup_id()
         timestamp = datetime.now(UTC).strftime("%Y-%m-%d-%H%M%S")
@@ -1557,43 +1894,134 @@ class BackupService:
         # Ensure backups directory exists
         BACKUPS_DIR.mkdir(parents=True, exist_ok=True)
 
-        # Write backup file
+        # Incremental backups continue the chain of the last backup
+        parent = await self._get_incremental_parent(config_data)
+        watermark = await self._get_backup_watermark()
+        header: dict[str, Any] = {"backup_id": backup_id, "watermark": watermark}
+        since = None
+        if parent:
+            header["parent_id"] = parent["id"]
+            since = self._parse_datetime(parent["watermark"])
+
         backup_path = BACKUPS_DIR / filename
-        backup_path.write_bytes(backup_data)
-        # Set restrictive permissions (owner read/write only)
-        os.chmod(backup_path, 0o600)
+        await self._write_backup_file(
+            backup_path, self.stream_backup(password=password, since=since, header=header)
+        )
+        size_bytes = backup_path.stat().st_size
 
         # Create metadata
         metadata = await self._get_backup_metadata()
 
         # Write metadata file
-        metadata_path = BACKUPS_DIR / f"{filename[:-6]}.json"
+        metadata_path = backup_path.with_suffix(".json")
         metadata_dict = {
             "id": backup_id,
             "filename": filename,
             "created_at": datetime.now(UTC).isoformat(),
-            "size_bytes": len(backup_data),
+            "size_bytes": size_bytes,
             "is_encrypted": True,
             "metadata": metadata.model_dump(),
+            "kind": "incremental" if parent else "full",
+            "parent_id": parent["id"] if parent else None,
+            "watermark": watermark.isoformat(),
         }
         metadata_path.write_text(json.dumps(metadata_dict, indent=2))
 
+        # Remember the backup the next incremental backup is based on. Restores
+        # bring back the value of the restored backup, so after a restore the
+        # next backup continues from a backup matching the restored data.
+        await settings_repo.set(BACKUP_CHAIN_SETTING, {"last_backup_id": backup_id})
+        await self.session.commit()
+
         # Cleanup old backups
         retention = config_data.get("retention_count", 7)
-        await self.cleanup_old_backups(retention)
+        await self.cleanup_old_backups(retention, password=password)
 
-        logger.info(f"Scheduled backup created: {filename} ({len(backup_data)} bytes)")
+        kind = "incremental" if parent else "full"
+        logger.info(f"Scheduled {kind} backup created: {filename} ({size_bytes} bytes)")
 
         return StoredBackup(
             id=backup_id,
             filename=filename,
-            size_bytes=len(backup_data),
+            size_bytes=size_bytes,
             created_at=datetime.now(UTC),
             is_encrypted=True,
             age_description=self._calculate_age_description(datetime.now(UTC)),
             is_overdue=False,
             metadata=metadata,
+            kind=kind,
+            parent_id=metadata_dict["parent_id"],
+            chain_length=len(self._get_chain(backup_id)),
+        )
+
+    async def _get_incremental_parent(self, config_data: dict[str, Any]) -> dict[str, Any] | None:
+        """Get the stored backup the next scheduled backup is based on.
+
+        Args:
+            config_data: Backup configuration setting
+
+        Returns:
+            Metadata of the last backup, or None if the next backup is a full
+            backup: incremental backups are disabled, the last backup is gone,
+            or its chain has reached full_backup_interval backups
+        """
+        from licence_api.repositories.settings_repository import SettingsRepository
+
+        if not config_data.get("incremental"):
+            return None
+
+        chain_setting = await SettingsRepository(self.session).get(BACKUP_CHAIN_SETTING)
+        if not chain_setting:
+            return None
+        try:
+            chain = self._get_chain(chain_setting["last_backup_id"])
+        except (ValueError, KeyError):
+            return None
+
+        if len(chain) >= config_data.get("full_backup_interval", 7):
+            return None
+        if not chain[0].get("watermark"):
+            return None
+        return chain[0]
+
+    async def _get_backup_watermark(self) -> datetime:
+        """Get the watermark of a backup that is about to start.
+
+        Rows are stamped with the start time of the transaction writing them,
+        which can commit after the backup snapshot was taken. The watermark is
+        therefore the start of the oldest open transaction, so the next
+        incremental backup includes every row the snapshot may have missed.
+        """
+        from sqlalchemy import column, func, table
+
+        activity = table("pg_stat_activity", column("xact_start"), column("datname"))
+        oldest_transaction = (
+            select(func.min(activity.c.xact_start))
+            .where(activity.c.datname == func.current_database())
+            .scalar_subquery()
         )
+        return await self.session.scalar(select(func.least(func.now(), oldest_transaction)))
+
+    async def _write_backup_file(self, path: Path, chunks: AsyncIterator[bytes]) -> None:
+        """Write a backup file with restrictive permissions (owner read/write only).
+
+        The chunks go to a partial file that is renamed once complete, so
+        a stored backup is never incomplete.
+
+        Args:
+            path: Backup file path
+            chunks: Backup file content, in pieces
+        """
+        partial_path = path.with_suffix(".partial")
+        try:
+            fd = os.open(partial_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as backup_file:
+                async for chunk in chunks:
+                    await asyncio.to_thread(backup_file.write, chunk)
+            partial_path.replace(path)
+        except BaseException:
+            partial_path.unlink(missing_ok=True)
+            raise
 
     def _generate_backup_id(self) -> str:
         """Generate a unique backup ID."""
@@ -1656,6 +2084,8 @@ class BackupService:
                             metadata=StoredBackupMetadata(**metadata_dict.get("metadata", {}))
                             if metadata_dict.get("metadata")
                             else None,
+                            kind=metadata_dict.get("kind", "full"),
+                            parent_id=metadata_dict.get("parent_id"),
                         )
                     )
                 except (json.JSONDecodeError, KeyError) as e:
@@ -1692,6 +2122,14 @@ class BackupService:
                     )
                 )
 
+        # Count the backups each restore reads, up to the full backup
+        parents = {backup.id: backup.parent_id for backup in backups}
+        for backup in backups:
+            parent_id = backup.parent_id
+            while parent_id in parents and backup.chain_length <= len(parents):
+                backup.chain_length += 1
+                parent_id = parents[parent_id]
+
         config = await self.get_config()
 
         # Calculate next scheduled and last backup times
@@ -1724,21 +2162,105 @@ class BackupService:
         Raises:
             ValueError: If backup not found
         """
+        backup_file = self._find_stored_backup(backup_id)
+        return await asyncio.to_thread(backup_file.read_bytes), backup_file.name
+
+    def _find_stored_backup(self, backup_id: str) -> Path:
+        """Find the file of a stored backup by ID.
+
+        Args:
+            backup_id: Backup ID
+
+        Returns:
+            Path of the backup file
+
+        Raises:
+            ValueError: If backup not found
+        """
+        metadata_dict = self._load_stored_backups().get(backup_id)
+        if metadata_dict:
+            backup_file = BACKUPS_DIR / metadata_dict["filename"]
+            if backup_file.exists():
+                return backup_file
+
+        raise ValueError("Backup not found")
+
+    def _load_stored_backups(self) -> dict[str, dict[str, Any]]:
+        """Read the metadata files of all stored backups.
+
+        Returns:
+            Backup metadata by backup ID
+        """
+        backups: dict[str, dict[str, Any]] = {}
         if not BACKUPS_DIR.exists():
-            raise ValueError("Backup not found")
+            return backups
 
-        # Find the backup file
         for metadata_file in BACKUPS_DIR.glob("*.json"):
             try:
                 metadata_dict = json.loads(metadata_file.read_text())
-                if metadata_dict.get("id") == backup_id:
-                    backup_file = BACKUPS_DIR / metadata_dict["filename"]
-                    if backup_file.exists():
-                        return backup_file.read_bytes(), metadata_dict["filename"]
+                backups[metadata_dict["id"]] = metadata_dict
             except (json.JSONDecodeError, KeyError):
                 continue
+        return backups
 
-        raise ValueError("Backup not found")
+    def _get_chain(
+        self, backup_id: str, backups: dict[str, dict[str, Any]] | None = None
+    ) -> list[dict[str, Any]]:
+        """Get a stored backup and the backups it is based on.
+
+        Args:
+            backup_id: Backup ID
+            backups: Metadata of the stored backups, if already loaded
+
+        Returns:
+            Metadata of the backups a restore reads, newest first, ending with
+            a full backup
+
+        Raises:
+            ValueError: If the backup or one it is based on is not found
+        """
+        if backups is None:
+            backups = self._load_stored_backups()
+        if backup_id not in backups:
+            raise ValueError("Backup not found")
+
+        chain = [backups[backup_id]]
+        while parent_id := chain[-1].get("parent_id"):
+            if parent_id not in backups or len(chain) > len(backups):
+                raise ValueError("Backup chain is incomplete")
+            chain.append(backups[parent_id])
+
+        for metadata_dict in chain:
+            if not (BACKUPS_DIR / metadata_dict["filename"]).exists():
+                raise ValueError("Backup chain is incomplete")
+        return chain
+
+    def _get_dependents(self, backup_id: str, backups: dict[str, dict[str, Any]]) -> list[str]:
+        """Get the IDs of the incremental backups based on a stored backup."""
+        dependents: list[str] = []
+        pending = [backup_id]
+        while pending:
+            parent_id = pending.pop()
+            children = [
+                child_id
+                for child_id, metadata_dict in backups.items()
+                if metadata_dict.get("parent_id") == parent_id
+            ]
+            dependents.extend(children)
+            pending.extend(children)
+        return dependents
+
+    def _delete_backup_files(self, metadata_dict: dict[str, Any]) -> None:
+        """Delete a stored backup file and its metadata file."""
+        backup_file = BACKUPS_DIR / metadata_dict["filename"]
+        backup_file.unlink(missing_ok=True)
+        backup_file.with_suffix(".json").unlink(missing_ok=True)
+
+    async def _read_file_chunks(self, path: Path) -> AsyncIterator[bytes]:
+        """Read a stored backup file in pieces of BACKUP_READ_SIZE bytes."""
+        with path.open("rb") as backup_file:
+            while chunk := await asyncio.to_thread(backup_file.read, BACKUP_READ_SIZE):
+                yield chunk
 
     async def delete_stored_backup(
         self,
@@ -1756,26 +2278,14 @@ class BackupService:
         Raises:
             ValueError: If backup not found
         """
-        if not BACKUPS_DIR.exists():
+        backups = self._load_stored_backups()
+        if backup_id not in backups:
             raise ValueError("Backup not found")
 
-        # Find and delete the backup file
-        deleted = False
-        for metadata_file in BACKUPS_DIR.glob("*.json"):
-            try:
-                metadata_dict = json.loads(metadata_file.read_text())
-                if metadata_dict.get("id") == backup_id:
-                    backup_file = BACKUPS_DIR / metadata_dict["filename"]
-                    if backup_file.exists():
-                        backup_file.unlink()
-                    metadata_file.unlink()
-                    deleted = True
-                    break
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-        if not deleted:
-            raise ValueError("Backup not found")
+        # Incremental backups based on this backup cannot be restored without it
+        dependents = self._get_dependents(backup_id, backups)
+        for deleted_id in [backup_id, *dependents]:
+            self._delete_backup_files(backups[deleted_id])
 
         # Audit log
         if user and self.audit_service:
@@ -1784,7 +2294,11 @@ class BackupService:
                 resource_type=ResourceType.SYSTEM,
                 user=user,
                 request=http_request,
-                details={"action": "backup_deleted", "backup_id": backup_id},
+                details={
+                    "action": "backup_deleted",
+                    "backup_id": backup_id,
+                    "dependent_backups_deleted": dependents,
+                },
             )
             await self.session.commit()
 
@@ -1805,22 +2319,45 @@ class BackupService:
             user: Admin user performing the restore
             http_request: HTTP request for audit logging
 
+        An incremental backup is restored together with the backups it is
+        based on (see _read_chain).
+
         Returns:
             Restore response
+
+        Raises:
+            ValueError: If the backup or one it is based on is not found
         """
-        file_data, filename = await self.get_stored_backup(backup_id)
-        return await self.restore_backup(
-            file_data=file_data,
-            password=password,
-            user=user,
-            request=http_request,
-        )
+        paths = [
+            BACKUPS_DIR / metadata_dict["filename"] for metadata_dict in self._get_chain(backup_id)
+        ]
+        if len(paths) == 1:
+            return await self.restore_backup(
+                chunks=self._read_file_chunks(paths[0]),
+                password=password,
+                user=user,
+                request=http_request,
+            )
 
-    async def cleanup_old_backups(self, retention_count: int) -> int:
+        sections = self._read_chain(paths, password)
+        try:
+            # Decrypts the first chunk of every backup, which verifies the password
+            await anext(sections)
+        except ValueError as e:
+            await sections.aclose()
+            return self._restore_failed(str(e))
+        return await self._restore_sections(sections, user, http_request)
+
+    async def cleanup_old_backups(self, retention_count: int, password: str | None = None) -> int:
         """Remove old backups beyond retention count.
 
+        An incremental backup that is kept while the backup it is based on is
+        removed is first compacted into a full backup. Without the password,
+        the backups it is based on are kept instead.
+
         Args:
             retention_count: Number of backups to keep
+            password: Backup password, to compact incremental backups
 
         Returns:
             Number of backups deleted
@@ -1829,16 +2366,43 @@ class BackupService:
             return 0
 
         # Get all backups sorted by creation time (newest first)
-        backups = []
+        backups = self._load_stored_backups()
+        by_filename = {
+            metadata_dict["filename"]: metadata_dict for metadata_dict in backups.values()
+        }
+        entries = []
         for backup_file in BACKUPS_DIR.glob("*.lcbak"):
-            stat = backup_file.stat()
-            backups.append((backup_file, stat.st_mtime))
+            metadata_dict = by_filename.get(backup_file.name)
+            if metadata_dict:
+                created_at = self._parse_datetime(metadata_dict["created_at"])
+            else:
+                created_at = datetime.fromtimestamp(backup_file.stat().st_mtime, tz=UTC)
+            entries.append((created_at, backup_file, metadata_dict))
 
-        backups.sort(key=lambda x: x[1], reverse=True)
+        entries.sort(key=lambda x: x[0], reverse=True)
+        expired = entries[retention_count:]
+        expired_ids = {metadata_dict["id"] for _, _, metadata_dict in expired if metadata_dict}
+
+        # Compact the chains of kept incremental backups based on expired backups
+        for _, _, metadata_dict in entries[:retention_count]:
+            if not metadata_dict or metadata_dict.get("parent_id") not in expired_ids:
+                continue
+            if password:
+                try:
+                    await self._compact_backup(metadata_dict, password, backups)
+                    continue
+                except Exception as e:
+                    logger.warning(f"Failed to compact backup {metadata_dict['filename']}: {e}")
+            parent_id = metadata_dict.get("parent_id")
+            while parent_id in backups:
+                expired_ids.discard(parent_id)
+                parent_id = backups[parent_id].get("parent_id")
 
         # Delete backups beyond retention
         deleted = 0
-        for backup_file, _ in backups[retention_count:]:
+        for _, backup_file, metadata_dict in expired:
+            if metadata_dict and metadata_dict["id"] not in expired_ids:
+                continue
             try:
                 backup_file.unlink()
                 # Also delete metadata file
@@ -1855,6 +2419,34 @@ class BackupService:
 
         return deleted
 
+    async def _compact_backup(
+        self,
+        metadata_dict: dict[str, Any],
+        password: str,
+        backups: dict[str, dict[str, Any]],
+    ) -> None:
+        """Rewrite an incremental backup as a full backup of the same data.
+
+        Args:
+            metadata_dict: Metadata of the incremental backup, updated in place
+            password: Backup password
+            backups: Metadata of all stored backups
+        """
+        chain = self._get_chain(metadata_dict["id"], backups)
+        backup_path = BACKUPS_DIR / metadata_dict["filename"]
+        sections = self._read_chain(
+            [BACKUPS_DIR / backup["filename"] for backup in chain], password
+        )
+        await self._write_backup_file(backup_path, self._write_sections(sections, password))
+
+        metadata_dict.update(
+            kind="full",
+            parent_id=None,
+            size_bytes=backup_path.stat().st_size,
+        )
+        backup_path.with_suffix(".json").write_text(json.dumps(metadata_dict, indent=2))
+        logger.info(f"Compacted {len(chain)} backups into {metadata_dict['filename']}")
+
     def _calculate_age_description(self, created_at: datetime) -> str:
         """Calculate a human-readable age description.
 
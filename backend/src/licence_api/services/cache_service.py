@@ -2,7 +2,7 @@
 
 import json
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import date, datetime
 from decimal import Decimal
 from functools import wraps
@@ -13,6 +13,7 @@ import redis.asyncio as redis
 from pydantic import BaseModel
 
 from licence_api.config import get_settings
+from licence_api.models.domain.sync import SyncChangeSet
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +32,7 @@ class CacheJSONEncoder(json.JSONEncoder):
             return str(obj)
         return super().default(obj)
 
+
 T = TypeVar("T")
 
 
@@ -39,6 +41,7 @@ class CacheConfig:
 
     # Cache key prefixes (constant - not configurable)
     PREFIX_DASHBOARD = "dashboard"
+    PREFIX_DASHBOARD_PROVIDERS = "dashboard_providers"
     PREFIX_DEPARTMENTS = "departments"
     PREFIX_PROVIDERS = "providers"
     PREFIX_PROVIDER_STATS = "provider_stats"
@@ -46,6 +49,46 @@ class CacheConfig:
     PREFIX_PAYMENT_METHODS = "payment_methods"
     PREFIX_SETTINGS = "settings"
     PREFIX_REPORTS = "reports"
+    PREFIX_TAGS = "tags"
+
+
+class CacheTag:
+    """Dependency tags for cache entries.
+
+    Entries are registered under the tags of the data they are computed from,
+    so that a change only invalidates the entries depending on it.
+    """
+
+    # Any license data
+    LICENSES = "licenses"
+    # Any employee data
+    EMPLOYEES = "employees"
+    # Provider list, sync status and per-provider license counts
+    PROVIDER_STATUS = "provider_status"
+
+    @staticmethod
+    def department(name: str) -> str:
+        """Tag for data scoped to one department's employees and their licenses."""
+        return f"department:{name}"
+
+
+def tags_for_changes(changes: SyncChangeSet) -> set[str]:
+    """Get the tags invalidated by a sync change set.
+
+    Args:
+        changes: Data changed by a sync
+
+    Returns:
+        Set of cache tags
+    """
+    tags = {CacheTag.department(department) for department in changes.departments}
+    if changes.provider_ids:
+        tags.add(CacheTag.PROVIDER_STATUS)
+    if changes.licenses_changed:
+        tags.add(CacheTag.LICENSES)
+    if changes.employees_changed:
+        tags.add(CacheTag.EMPLOYEES)
+    return tags
 
 
 # Default TTL for reports (5 minutes - they can be expensive)
@@ -153,6 +196,10 @@ class CacheService:
         key_parts = [prefix] + [str(p) for p in parts if p]
         return ":".join(key_parts)
 
+    def _tag_key(self, tag: str) -> str:
+        """Get the key of the set holding the cache keys registered under a tag."""
+        return self._make_key(CacheConfig.PREFIX_TAGS, tag)
+
     async def get(self, key: str) -> str | None:
         """Get value from cache.
 
@@ -176,6 +223,7 @@ class CacheService:
         key: str,
         value: str,
         ttl: int | None = None,
+        tags: Iterable[str] = (),
     ) -> bool:
         """Set value in cache.
 
@@ -183,6 +231,7 @@ class CacheService:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds
+            tags: Dependency tags to register the key under (see invalidate_tags)
 
         Returns:
             True if successful
@@ -191,10 +240,21 @@ class CacheService:
             return False
 
         try:
-            if ttl:
-                await self._client.setex(key, ttl, value)
-            else:
-                await self._client.set(key, value)
+            # The value and its tag registrations are written atomically, so an
+            # invalidation can never miss a value that is already visible
+            async with self._client.pipeline(transaction=True) as pipe:
+                if ttl:
+                    pipe.setex(key, ttl, value)
+                else:
+                    pipe.set(key, value)
+                for tag in tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    if ttl:
+                        # Keep the tag set as long as its longest-lived entry
+                        pipe.expire(tag_key, ttl, nx=True)
+                        pipe.expire(tag_key, ttl, gt=True)
+                await pipe.execute()
             return True
         except redis.RedisError as e:
             logger.error("Cache set error: %s", e)
@@ -264,6 +324,7 @@ class CacheService:
         key: str,
         value: dict | list | BaseModel,
         ttl: int | None = None,
+        tags: Iterable[str] = (),
     ) -> bool:
         """Set JSON value in cache.
 
@@ -271,6 +332,7 @@ class CacheService:
             key: Cache key
             value: Value to cache (dict, list, or Pydantic model)
             ttl: Time-to-live in seconds
+            tags: Dependency tags to register the key under
 
         Returns:
             True if successful
@@ -280,11 +342,55 @@ class CacheService:
                 json_str = value.model_dump_json()
             else:
                 json_str = json.dumps(value, cls=CacheJSONEncoder)
-            return await self.set(key, json_str, ttl)
+            return await self.set(key, json_str, ttl, tags)
         except (redis.RedisError, TypeError, ValueError) as e:
             logger.error("Cache set_json error: %s", e)
             return False
 
+    async def invalidate_tags(self, *tags: str) -> int:
+        """Invalidate all cache entries registered under any of the tags.
+
+        Args:
+            *tags: Dependency tags
+
+        Returns:
+            Number of keys deleted
+        """
+        if not self.is_connected or not tags:
+            return 0
+
+        try:
+            # Read and drop each tag set atomically so that entries registered
+            # concurrently end up in a fresh tag set instead of being lost
+            async with self._client.pipeline(transaction=True) as pipe:
+                for tag in tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.smembers(tag_key)
+                    pipe.delete(tag_key)
+                results = await pipe.execute()
+
+            keys = set().union(*results[::2])
+            if keys:
+                return await self._client.delete(*keys)
+            return 0
+        except redis.RedisError as e:
+            logger.error("Cache invalidate tags error: %s", e)
+            return 0
+
+    async def invalidate_changes(self, changes: SyncChangeSet) -> int:
+        """Invalidate the cache entries that depend on data changed by a sync.
+
+        Args:
+            changes: Data changed by the sync
+
+        Returns:
+            Number of keys deleted
+        """
+        tags = tags_for_changes(changes)
+        count = await self.invalidate_tags(*sorted(tags))
+        logger.info("Invalidated %d cache entries for tags %s", count, sorted(tags))
+        return count
+
     # Domain-specific cache methods
 
     async def get_dashboard(self, department: str | None = None) -> dict | None:
@@ -306,6 +412,10 @@ class CacheService:
     ) -> bool:
         """Cache dashboard data.
 
+        A department dashboard only depends on that department's employees
+        and their licenses; provider summaries are cached separately (see
+        set_dashboard_providers).
+
         Args:
             data: Dashboard data
             department: Optional department filter
@@ -314,7 +424,39 @@ class CacheService:
             True if successful
         """
         key = self._make_key(CacheConfig.PREFIX_DASHBOARD, department or "all")
-        return await self.set_json(key, data, get_cache_ttl(CacheConfig.PREFIX_DASHBOARD))
+        if department:
+            tags = [CacheTag.department(department)]
+        else:
+            tags = [CacheTag.LICENSES, CacheTag.EMPLOYEES]
+        return await self.set_json(
+            key, data, get_cache_ttl(CacheConfig.PREFIX_DASHBOARD), tags=tags
+        )
+
+    async def get_dashboard_providers(self) -> list | None:
+        """Get cached dashboard provider summaries.
+
+        Returns:
+            Cached provider summaries or None
+        """
+        key = self._make_key(CacheConfig.PREFIX_DASHBOARD_PROVIDERS)
+        return await self.get_json(key)
+
+    async def set_dashboard_providers(self, data: list) -> bool:
+        """Cache dashboard provider summaries, shared by all dashboards.
+
+        Args:
+            data: Provider summaries
+
+        Returns:
+            True if successful
+        """
+        key = self._make_key(CacheConfig.PREFIX_DASHBOARD_PROVIDERS)
+        return await self.set_json(
+            key,
+            data,
+            get_cache_ttl(CacheConfig.PREFIX_DASHBOARD),
+            tags=[CacheTag.PROVIDER_STATUS],
+        )
 
     async def invalidate_dashboard(self) -> int:
         """Invalidate all dashboard cache entries.
@@ -322,7 +464,9 @@ class CacheService:
         Returns:
             Number of keys deleted
         """
-        return await self.delete_pattern(f"{CacheConfig.PREFIX_DASHBOARD}:*")
+        count = await self.delete_pattern(f"{CacheConfig.PREFIX_DASHBOARD}:*")
+        count += await self.delete(self._make_key(CacheConfig.PREFIX_DASHBOARD_PROVIDERS))
+        return count
 
     async def get_departments(self) -> list | None:
         """Get cached departments list.
@@ -343,7 +487,9 @@ class CacheService:
             True if successful
         """
         key = self._make_key(CacheConfig.PREFIX_DEPARTMENTS)
-        return await self.set_json(key, data, get_cache_ttl(CacheConfig.PREFIX_DEPARTMENTS))
+        return await self.set_json(
+            key, data, get_cache_ttl(CacheConfig.PREFIX_DEPARTMENTS), tags=[CacheTag.EMPLOYEES]
+        )
 
     async def invalidate_departments(self) -> int:
         """Invalidate departments cache.
@@ -373,7 +519,9 @@ class CacheService:
             True if successful
         """
         key = self._make_key(CacheConfig.PREFIX_PROVIDERS)
-        return await self.set_json(key, data, get_cache_ttl(CacheConfig.PREFIX_PROVIDERS))
+        return await self.set_json(
+            key, data, get_cache_ttl(CacheConfig.PREFIX_PROVIDERS), tags=[CacheTag.PROVIDER_STATUS]
+        )
 
     async def invalidate_providers(self) -> int:
         """Invalidate providers cache.
@@ -452,7 +600,9 @@ class CacheService:
         param_parts = [f"{k}={v}" for k, v in sorted(params.items()) if v is not None]
         param_str = "_".join(param_parts) if param_parts else "default"
         key = self._make_key(CacheConfig.PREFIX_REPORTS, report_name, param_str)
-        return await self.set_json(key, data, ttl or REPORT_CACHE_TTL)
+        return await self.set_json(
+            key, data, ttl or REPORT_CACHE_TTL, tags=[CacheTag.LICENSES, CacheTag.EMPLOYEES]
+        )
 
     async def invalidate_reports(self) -> int:
         """Invalidate all report caches.
@@ -33,6 +33,7 @@ from licence_api.repositories.organization_license_repository import Organizatio
 from licence_api.repositories.settings_repository import SettingsRepository
 from licence_api.repositories.user_repository import UserRepository
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 from licence_api.services.notification_service import NotificationService
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,7 @@ class CancellationService:
         self.package_repo = LicensePackageRepository(session)
         self.org_license_repo = OrganizationLicenseRepository(session)
         self.audit_service = AuditService(session)
+        self.dashboard_aggregates = DashboardAggregateService(session)
 
     async def _get_slack_token(self) -> str | None:
         """Get Slack bot token from settings."""
@@ -100,6 +102,8 @@ class CancellationService:
         # If effective date is today or in the past, mark as cancelled
         if effective_date <= date.today():
             license_orm.status = LicenseStatus.CANCELLED
+            await self.session.flush()
+            await self.dashboard_aggregates.refresh_licenses(provider_ids={license_orm.provider_id})
 
         # Store notification data before commit to avoid extra SELECT after expire
         provider_name = license_orm.provider.display_name if license_orm.provider else "Unknown"
@@ -354,6 +358,10 @@ class CancellationService:
             # Reset status if it was cancelled or expired
             if license_orm.status in (LicenseStatus.CANCELLED, LicenseStatus.EXPIRED):
                 license_orm.status = LicenseStatus.ACTIVE
+                await self.session.flush()
+                await self.dashboard_aggregates.refresh_licenses(
+                    provider_ids={license_orm.provider_id}
+                )
 
         # Store notification data before commit to avoid extra SELECT after expire
         provider_name = license_orm.provider.display_name if license_orm.provider else "Unknown"
@@ -0,0 +1,84 @@
+"""Dashboard aggregate service for maintaining precomputed dashboard metrics."""
+
+from collections.abc import Collection
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from licence_api.config import get_settings
+from licence_api.repositories.dashboard_aggregate_repository import (
+    DashboardAggregateRepository,
+)
+from licence_api.repositories.settings_repository import SettingsRepository
+
+
+class DashboardAggregateService:
+    """Service for the precomputed dashboard aggregates.
+
+    Counts and costs are kept per (department, provider) in the
+    dashboard_aggregates table. Syncs and license mutations refresh the rows
+    they affect in their own transaction; a scheduled rebuild recomputes all
+    rows. Callers commit.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service with database session."""
+        self.session = session
+        self.aggregate_repo = DashboardAggregateRepository(session)
+        self.settings_repo = SettingsRepository(session)
+
+    async def _get_company_domains(self) -> list[str]:
+        """Get the configured company email domains."""
+        setting = await self.settings_repo.get("company_domains")
+        return setting.get("domains", []) if setting else []
+
+    async def refresh_licenses(
+        self,
+        provider_ids: Collection[UUID] | None = None,
+        departments: Collection[str | None] | None = None,
+    ) -> None:
+        """Recompute the license aggregates of providers and departments.
+
+        Args:
+            provider_ids: Providers whose licenses changed
+            departments: Departments whose employees' licenses changed
+                (with neither given, all license aggregates are recomputed)
+        """
+        await self.aggregate_repo.refresh_licenses(
+            await self._get_company_domains(),
+            datetime.now(UTC),
+            provider_ids=provider_ids,
+            departments=departments,
+        )
+
+    async def refresh_employees(self) -> None:
+        """Recompute the employee counts of all departments."""
+        await self.aggregate_repo.refresh_employees(datetime.now(UTC))
+
+    async def rebuild(self) -> None:
+        """Recompute all aggregates."""
+        refreshed_at = datetime.now(UTC)
+        await self.aggregate_repo.refresh_licenses(await self._get_company_domains(), refreshed_at)
+        await self.aggregate_repo.refresh_employees(refreshed_at)
+
+    async def get_totals(self, department: str | None = None) -> dict[str, Any]:
+        """Get the dashboard totals, building the aggregates on first use.
+
+        Args:
+            department: Optional department filter
+
+        Returns:
+            Dict with the summed metrics (see DashboardAggregateRepository.get_totals),
+            plus "stale" if the oldest row is older than the rebuild interval
+        """
+        if not await self.aggregate_repo.has_rows():
+            await self.rebuild()
+            await self.session.commit()
+
+        totals = await self.aggregate_repo.get_totals(department)
+        max_age = timedelta(hours=get_settings().dashboard_aggregate_rebuild_hours)
+        oldest = totals["oldest_refreshed_at"]
+        totals["stale"] = oldest is not None and datetime.now(UTC) - oldest > max_age
+        return totals
@@ -9,6 +9,7 @@ Architecture Note (MVC-07):
 """
 
 from datetime import date
+from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -21,6 +22,7 @@ from licence_api.models.orm.provider import ProviderORM
 from licence_api.repositories.license_package_repository import LicensePackageRepository
 from licence_api.repositories.license_repository import LicenseRepository
 from licence_api.repositories.organization_license_repository import OrganizationLicenseRepository
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 
 
 class ExpirationService:
@@ -32,6 +34,7 @@ class ExpirationService:
         self.license_repo = LicenseRepository(session)
         self.package_repo = LicensePackageRepository(session)
         self.org_license_repo = OrganizationLicenseRepository(session)
+        self.dashboard_aggregates = DashboardAggregateService(session)
 
     async def check_and_update_expired_licenses(self) -> dict:
         """Check for expired licenses and update their status.
@@ -61,8 +64,10 @@ class ExpirationService:
             today=today,
             excluded_statuses=[LicenseStatus.EXPIRED, LicenseStatus.CANCELLED],
         )
+        changed_provider_ids: set[UUID] = set()
         for license_orm in expired_licenses:
             license_orm.status = LicenseStatus.EXPIRED
+            changed_provider_ids.add(license_orm.provider_id)
             counts["licenses_expired"] += 1
 
         # Update cancelled licenses using repository
@@ -72,6 +77,7 @@ class ExpirationService:
         )
         for license_orm in cancelled_licenses:
             license_orm.status = LicenseStatus.CANCELLED
+            changed_provider_ids.add(license_orm.provider_id)
             counts["licenses_cancelled"] += 1
 
         # Update expired packages using repository
@@ -111,6 +117,8 @@ class ExpirationService:
             counts["org_licenses_cancelled"] += 1
 
         await self.session.flush()
+        if changed_provider_ids:
+            await self.dashboard_aggregates.refresh_licenses(provider_ids=changed_provider_ids)
         return counts
 
     async def get_expiring_licenses(
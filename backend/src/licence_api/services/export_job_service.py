@@ -0,0 +1,228 @@
+"""Export job service for generating large report exports as background jobs.
+
+An export job is created by the API, queued on the APScheduler instance in
+tasks/scheduler.py and run there by execute_export_job, which writes the
+artifact to EXPORTS_DIR. Clients poll the job and download the artifact once
+it completed. Finished jobs and their artifacts are purged after
+export_job_retention_hours.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from uuid import UUID
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from licence_api.config import get_settings
+from licence_api.constants.paths import EXPORTS_DIR
+from licence_api.exceptions import ExportJobNotFoundError, ExportJobNotReadyError
+from licence_api.models.domain.admin_user import AdminUser
+from licence_api.models.dto.export_job import ExportJobListResponse, ExportJobResponse
+from licence_api.repositories.export_job_repository import ExportJobRepository
+from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.export_service import ExportService
+from licence_api.utils.secure_logging import log_error
+
+logger = logging.getLogger(__name__)
+
+# Export types that can run as jobs
+FULL_REPORT_EXCEL = "full_report_excel"
+
+# Minimum seconds between progress writes of a running job
+EXPORT_PROGRESS_INTERVAL_SECONDS = 1.0
+
+
+def export_artifact_path(job_id: UUID) -> Path:
+    """Get the artifact file of an export job.
+
+    Args:
+        job_id: Export job UUID
+
+    Returns:
+        Path of the artifact in EXPORTS_DIR
+    """
+    return EXPORTS_DIR / f"{job_id}.xlsx"
+
+
+async def execute_export_job(job_id: UUID) -> None:
+    """Run a pending export job to completion.
+
+    The workbook is written to a temporary file that is renamed to the
+    artifact path once complete, so a download never sees a partial file.
+
+    Args:
+        job_id: Export job UUID
+    """
+    from licence_api.database import async_session_maker
+
+    async with async_session_maker() as session:
+        job_repo = ExportJobRepository(session)
+        job = await job_repo.get_by_id(job_id)
+        if job is None or job.status != "pending":
+            return
+
+        await job_repo.update(job_id, status="running", started_at=datetime.now(UTC))
+        await session.commit()
+
+        flushed_at = time.monotonic()
+
+        async def save_progress(rows_written: int) -> None:
+            nonlocal flushed_at
+            if time.monotonic() - flushed_at < EXPORT_PROGRESS_INTERVAL_SECONDS:
+                return
+            # Separate session: the export session holds an open cursor
+            async with async_session_maker() as progress_session:
+                await ExportJobRepository(progress_session).update(
+                    job_id, rows_written=rows_written
+                )
+                await progress_session.commit()
+            flushed_at = time.monotonic()
+
+        path = export_artifact_path(job_id)
+        partial_path = path.with_suffix(".partial")
+        try:
+            await asyncio.to_thread(EXPORTS_DIR.mkdir, parents=True, exist_ok=True)
+            rows_written = await ExportService(session).write_full_report_excel(
+                partial_path, on_progress=save_progress
+            )
+            await asyncio.to_thread(partial_path.replace, path)
+            values = {
+                "status": "completed",
+                "rows_written": rows_written,
+                "filename": f"license_report_{date.today().isoformat()}.xlsx",
+                "file_size": path.stat().st_size,
+            }
+        except Exception as e:
+            log_error(logger, f"Export job {job_id} failed", e)
+            partial_path.unlink(missing_ok=True)
+            await session.rollback()
+            values = {"status": "failed", "error_message": "Export failed"}
+
+        await job_repo.update(job_id, completed_at=datetime.now(UTC), **values)
+        await session.commit()
+        logger.info(f"Export job {job_id} {values['status']}")
+
+
+class ExportJobService:
+    """Service for creating, observing and downloading export jobs."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service with database session."""
+        self.session = session
+        self.job_repo = ExportJobRepository(session)
+        self.audit_service = AuditService(session)
+
+    async def create_job(
+        self,
+        user: AdminUser,
+        request: Request | None = None,
+    ) -> ExportJobResponse:
+        """Create a full report Excel export job and queue it for execution.
+
+        The job is committed before it is queued, so the runner can load it.
+
+        Args:
+            user: AdminUser starting the export
+            request: HTTP request for audit logging
+
+        Returns:
+            Created export job
+        """
+        from licence_api.tasks.scheduler import enqueue_export_job
+
+        job = await self.job_repo.create(
+            kind=FULL_REPORT_EXCEL,
+            status="pending",
+            created_by=user.id,
+        )
+
+        await self.audit_service.log(
+            action=AuditAction.EXPORT,
+            resource_type=ResourceType.LICENSE,
+            user=user,
+            request=request,
+            details={"job_id": str(job.id), "kind": FULL_REPORT_EXCEL},
+        )
+        await self.session.commit()
+
+        if not enqueue_export_job(job.id):
+            job = await self.job_repo.update(
+                job.id,
+                status="failed",
+                error_message="Background scheduler is not running",
+                completed_at=datetime.now(UTC),
+            )
+            await self.session.commit()
+
+        return ExportJobResponse.model_validate(job)
+
+    async def get_job(self, job_id: UUID) -> ExportJobResponse:
+        """Get an export job.
+
+        Args:
+            job_id: Export job UUID
+
+        Returns:
+            Export job
+
+        Raises:
+            ExportJobNotFoundError: If the job does not exist
+        """
+        job = await self.job_repo.get_by_id(job_id)
+        if job is None:
+            raise ExportJobNotFoundError(str(job_id))
+        return ExportJobResponse.model_validate(job)
+
+    async def list_jobs(self, limit: int = 20) -> ExportJobListResponse:
+        """List the most recent export jobs.
+
+        Args:
+            limit: Maximum number of jobs
+
+        Returns:
+            Export jobs, newest first
+        """
+        jobs = await self.job_repo.get_recent(limit)
+        return ExportJobListResponse(items=[ExportJobResponse.model_validate(job) for job in jobs])
+
+    async def get_artifact(self, job_id: UUID) -> tuple[Path, str]:
+        """Get the artifact of a completed export job.
+
+        Args:
+            job_id: Export job UUID
+
+        Returns:
+            Tuple of (artifact path, download filename)
+
+        Raises:
+            ExportJobNotFoundError: If the job or its artifact does not exist
+            ExportJobNotReadyError: If the job has not completed
+        """
+        job = await self.job_repo.get_by_id(job_id)
+        if job is None:
+            raise ExportJobNotFoundError(str(job_id))
+        if job.status != "completed":
+            raise ExportJobNotReadyError(str(job_id))
+
+        path = export_artifact_path(job_id)
+        if not path.is_file():
+            raise ExportJobNotFoundError(str(job_id))
+        return path, job.filename or path.name
+
+    async def purge_expired(self) -> int:
+        """Delete finished jobs and their artifacts after the retention period.
+
+        Returns:
+            Number of deleted jobs
+        """
+        retention = timedelta(hours=get_settings().export_job_retention_hours)
+        jobs = await self.job_repo.get_finished_before(datetime.now(UTC) - retention)
+        for job in jobs:
+            await asyncio.to_thread(export_artifact_path(job.id).unlink, missing_ok=True)
+            await self.job_repo.delete(job.id)
+        await self.session.commit()
+        return len(jobs)
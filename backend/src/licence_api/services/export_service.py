@@ -1,10 +1,14 @@
 """Export service for CSV and Excel generation."""
 
+import asyncio
 import csv
 import io
 import re
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from datetime import date, datetime
 from decimal import Decimal
+from pathlib import Path
 from typing import Any
 from uuid import UUID
 
@@ -16,6 +20,11 @@ from licence_api.repositories.license_repository import LicenseRepository
 # Pattern for safe filename characters (alphanumeric, underscore, hyphen)
 _SAFE_FILENAME_PATTERN = re.compile(r"[^a-zA-Z0-9_-]")
 
+# Licenses read from the database cursor and written per CSV chunk
+EXPORT_BATCH_SIZE = 1000
+# Leading license rows measured for the Excel column widths
+EXCEL_WIDTH_SAMPLE_ROWS = 200
+
 
 def _sanitize_filename_part(value: str, max_length: int = 30) -> str:
     """Sanitize a string for safe use in filenames.
@@ -51,6 +60,59 @@ def _escape_csv_formula(value: str) -> str:
     return value
 
 
+def _csv_chunk(rows: Iterable[Iterable[Any]]) -> str:
+    """Render rows as CSV text.
+
+    Args:
+        rows: Rows of cell values
+
+    Returns:
+        CSV text of the rows
+    """
+    output = io.StringIO()
+    csv.writer(output).writerows(rows)
+    return output.getvalue()
+
+
+def _sample_column_widths(
+    headers: list[str],
+    rows: list[list[Any]],
+    min_width: float = 10,
+    max_width: float = 60,
+) -> list[float]:
+    """Estimate column widths from the header and the first rows.
+
+    Args:
+        headers: Column headers
+        rows: Data rows; only the first EXCEL_WIDTH_SAMPLE_ROWS are measured
+        min_width: Narrowest column width
+        max_width: Widest column width
+
+    Returns:
+        Width per column, in characters
+    """
+    widths = [len(header) for header in headers]
+    for row in rows[:EXCEL_WIDTH_SAMPLE_ROWS]:
+        for index, value in enumerate(row):
+            if value is not None:
+                widths[index] = max(widths[index], len(str(value)))
+    return [min(max(width + 2, min_width), max_width) for width in widths]
+
+
+def _set_column_widths(ws: Any, widths: list[float]) -> None:
+    """Set the column widths of a worksheet, starting at column A."""
+    from openpyxl.utils import get_column_letter
+
+    for index, width in enumerate(widths, 1):
+        ws.column_dimensions[get_column_letter(index)].width = width
+
+
+def _append_rows(ws: Any, rows: list[list[Any]]) -> None:
+    """Append rows to a worksheet."""
+    for row in rows:
+        ws.append(row)
+
+
 class ExportService:
     """Service for exporting data to CSV and Excel formats."""
 
@@ -94,49 +156,49 @@ class ExportService:
         provider_id: UUID | None = None,
         department: str | None = None,
         status: str | None = None,
-    ) -> str:
+    ) -> AsyncIterator[str]:
         """Export licenses to CSV format.
 
+        The CSV is generated while the licenses are read from a server-side
+        cursor, one batch at a time, so memory use does not grow with the
+        number of licenses and the header is sent right away.
+
         Args:
             provider_id: Filter by provider
             department: Filter by department
             status: Filter by status
 
-        Returns:
-            CSV string
+        Yields:
+            CSV text chunks, starting with the header row
         """
-        results, _ = await self.license_repo.get_all_with_details(
-            provider_id=provider_id,
-            department=department,
-            status=status,
-            limit=50000,
-        )
-
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header row
-        writer.writerow(
+        yield _csv_chunk(
             [
-                "License ID",
-                "Provider",
-                "External User ID",
-                "License Type",
-                "Status",
-                "Employee Name",
-                "Employee Email",
-                "Employee Department",
-                "Monthly Cost",
-                "Currency",
-                "Last Activity",
-                "Assigned At",
-                "Synced At",
+                [
+                    "License ID",
+                    "Provider",
+                    "External User ID",
+                    "License Type",
+                    "Status",
+                    "Employee Name",
+                    "Employee Email",
+                    "Employee Department",
+                    "Monthly Cost",
+                    "Currency",
+                    "Last Activity",
+                    "Assigned At",
+                    "Synced At",
+                ]
             ]
         )
 
         # Data rows (escape string fields to prevent CSV formula injection)
-        for lic, provider, employee in results:
-            writer.writerow(
+        async for batch in self.license_repo.stream_with_details(
+            provider_id=provider_id,
+            department=department,
+            status=status,
+            batch_size=EXPORT_BATCH_SIZE,
+        ):
+            yield _csv_chunk(
                 [
                     str(lic.id),
                     _escape_csv_formula(provider.display_name),
@@ -152,53 +214,50 @@ class ExportService:
                     lic.assigned_at.isoformat() if lic.assigned_at else "",
                     lic.synced_at.isoformat() if lic.synced_at else "",
                 ]
+                for lic, provider, employee in batch
             )
 
-        return output.getvalue()
-
     async def export_costs_csv(
         self,
         start_date: date | None = None,
         end_date: date | None = None,
-    ) -> str:
+    ) -> AsyncIterator[str]:
         """Export cost data to CSV format.
 
         Args:
             start_date: Start date for the export
             end_date: End date for the export
 
-        Returns:
-            CSV string
+        Yields:
+            CSV text chunks, starting with the header row
         """
         if start_date is None:
             start_date = date.today().replace(day=1, month=1)
         if end_date is None:
             end_date = date.today()
 
+        yield _csv_chunk(
+            [
+                [
+                    "Date",
+                    "Total Cost",
+                    "License Count",
+                    "Active Count",
+                    "Unassigned Count",
+                    "Currency",
+                ]
+            ]
+        )
+
         snapshots = await self.snapshot_repo.get_range(
             start_date=start_date,
             end_date=end_date,
             provider_id=None,
         )
 
-        output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Header row
-        writer.writerow(
-            [
-                "Date",
-                "Total Cost",
-                "License Count",
-                "Active Count",
-                "Unassigned Count",
-                "Currency",
-            ]
-        )
-
         # Data rows
-        for snapshot in snapshots:
-            writer.writerow(
+        if snapshots:
+            yield _csv_chunk(
                 [
                     snapshot.snapshot_date.isoformat(),
                     str(snapshot.total_cost),
@@ -207,138 +266,117 @@ class ExportService:
                     snapshot.unassigned_count,
                     snapshot.currency,
                 ]
+                for snapshot in snapshots
             )
+            return
 
         # If no snapshots, add current data
-        if not snapshots:
-            results, _ = await self.license_repo.get_all_with_details(limit=50000)
-
-            total_cost = Decimal("0")
-            total_count = 0
-            active_count = 0
-            unassigned_count = 0
-
-            for lic, provider, employee in results:
-                if provider.name == "hibob":
-                    continue
-                total_count += 1
-                if lic.monthly_cost:
-                    total_cost += lic.monthly_cost
-                if lic.status == "active":
-                    active_count += 1
-                if employee is None:
-                    unassigned_count += 1
-
-            writer.writerow(
+        totals = await self.license_repo.get_totals_excluding_provider("hibob")
+        yield _csv_chunk(
+            [
                 [
                     date.today().isoformat(),
-                    str(total_cost),
-                    total_count,
-                    active_count,
-                    unassigned_count,
+                    str(totals["total_monthly_cost"]),
+                    totals["total"],
+                    totals["active"],
+                    totals["unassigned"],
                     "EUR",
                 ]
-            )
-
-        return output.getvalue()
+            ]
+        )
 
     async def export_full_report_excel(self) -> bytes:
         """Export full report to Excel format with multiple sheets.
 
+        Large reports should be generated as an export job instead (see
+        export_job_service), which writes the same workbook to a file.
+
         Returns:
             Excel file bytes
         """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "report.xlsx"
+            await self.write_full_report_excel(path)
+            return await asyncio.to_thread(path.read_bytes)
+
+    async def write_full_report_excel(
+        self,
+        path: Path,
+        on_progress: Callable[[int], Awaitable[None]] | None = None,
+    ) -> int:
+        """Write the full report workbook with Summary, Licenses and Costs sheets.
+
+        The workbook is created in write-only mode: rows are streamed to the
+        file as they are appended instead of being kept as cell objects.
+        Summary figures come from aggregate queries, licenses are read in
+        batches, and column widths are computed from the first rows. Appending
+        rows and saving run in a worker thread, so the event loop stays free.
+
+        Args:
+            path: File to write the workbook to
+            on_progress: Called with the number of license rows written so far
+
+        Returns:
+            Number of license rows written
+        """
         try:
             from openpyxl import Workbook
+            from openpyxl.cell import WriteOnlyCell
             from openpyxl.styles import Font, PatternFill
         except ImportError:
             raise ImportError(
                 "openpyxl is required for Excel export. Install it with: pip install openpyxl"
             )
 
-        wb = Workbook()
-
-        # Summary Sheet
-        ws_summary = wb.active
-        ws_summary.title = "Summary"
-
-        # Get license statistics
-        results, total = await self.license_repo.get_all_with_details(limit=50000)
-
-        total_cost = Decimal("0")
-        active_count = 0
-        unassigned_count = 0
-        provider_stats: dict[str, dict[str, Any]] = {}
-
-        for lic, provider, employee in results:
-            if provider.name == "hibob":
-                continue
-
-            if lic.monthly_cost:
-                total_cost += lic.monthly_cost
-            if lic.status == "active":
-                active_count += 1
-            if employee is None:
-                unassigned_count += 1
-
-            # Aggregate by provider
-            pname = provider.display_name
-            if pname not in provider_stats:
-                provider_stats[pname] = {"count": 0, "cost": Decimal("0")}
-            provider_stats[pname]["count"] += 1
-            if lic.monthly_cost:
-                provider_stats[pname]["cost"] += lic.monthly_cost
+        wb = Workbook(write_only=True)
 
         # Style definitions
         header_font = Font(bold=True)
         header_fill = PatternFill(start_color="E0E0E0", end_color="E0E0E0", fill_type="solid")
 
-        # Summary content
-        ws_summary["A1"] = "License Report Summary"
-        ws_summary["A1"].font = Font(bold=True, size=14)
-
-        ws_summary["A3"] = "Generated"
-        ws_summary["B3"] = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-        ws_summary["A5"] = "Total Licenses"
-        ws_summary["B5"] = total
-
-        ws_summary["A6"] = "Active Licenses"
-        ws_summary["B6"] = active_count
-
-        ws_summary["A7"] = "Unassigned Licenses"
-        ws_summary["B7"] = unassigned_count
-
-        ws_summary["A8"] = "Total Monthly Cost"
-        ws_summary["B8"] = f"EUR {total_cost:,.2f}"
-
-        # Provider breakdown
-        ws_summary["A10"] = "Provider"
-        ws_summary["B10"] = "Licenses"
-        ws_summary["C10"] = "Monthly Cost"
-        ws_summary["A10"].font = header_font
-        ws_summary["B10"].font = header_font
-        ws_summary["C10"].font = header_font
-        ws_summary["A10"].fill = header_fill
-        ws_summary["B10"].fill = header_fill
-        ws_summary["C10"].fill = header_fill
-
-        row = 11
-        for pname, stats in sorted(provider_stats.items()):
-            ws_summary[f"A{row}"] = pname
-            ws_summary[f"B{row}"] = stats["count"]
-            ws_summary[f"C{row}"] = f"EUR {stats['cost']:,.2f}"
-            row += 1
+        def header_row(ws: Any, headers: list[str]) -> list[Any]:
+            cells = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = header_font
+                cell.fill = header_fill
+                cells.append(cell)
+            return cells
+
+        # License statistics (HRIS licenses are not part of the report)
+        totals = await self.license_repo.get_totals_excluding_provider("hibob")
+        provider_stats: dict[str, dict[str, Any]] = {}
+        for pname, _, cost, count, _ in await self.license_repo.get_cost_totals_by_provider():
+            stats = provider_stats.setdefault(pname, {"count": 0, "cost": Decimal("0")})
+            stats["count"] += count
+            stats["cost"] += cost
 
-        # Adjust column widths
-        ws_summary.column_dimensions["A"].width = 25
-        ws_summary.column_dimensions["B"].width = 15
-        ws_summary.column_dimensions["C"].width = 18
+        # Summary Sheet
+        ws_summary = wb.create_sheet("Summary")
+        _set_column_widths(ws_summary, [25, 15, 18])
+
+        title = WriteOnlyCell(ws_summary, value="License Report Summary")
+        title.font = Font(bold=True, size=14)
+        summary_rows: list[list[Any]] = [
+            [title],
+            [],
+            ["Generated", datetime.now().strftime("%Y-%m-%d %H:%M")],
+            [],
+            ["Total Licenses", totals["total"]],
+            ["Active Licenses", totals["active"]],
+            ["Unassigned Licenses", totals["unassigned"]],
+            ["Total Monthly Cost", f"EUR {totals['total_monthly_cost']:,.2f}"],
+            [],
+            header_row(ws_summary, ["Provider", "Licenses", "Monthly Cost"]),
+        ]
+        summary_rows.extend(
+            [pname, stats["count"], f"EUR {stats['cost']:,.2f}"]
+            for pname, stats in sorted(provider_stats.items())
+        )
+        await asyncio.to_thread(_append_rows, ws_summary, summary_rows)
 
         # Licenses Sheet
         ws_licenses = wb.create_sheet("Licenses")
-
-        # Headers
         license_headers = [
             "License ID",
             "Provider",
@@ -354,82 +392,78 @@ class ExportService:
             "Assigned At",
         ]
 
-        for col, header in enumerate(license_headers, 1):
-            cell = ws_licenses.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-
-        # Data
-        row = 2
-        for lic, provider, employee in results:
-            if provider.name == "hibob":
+        rows_written = 0
+        async for batch in self.license_repo.stream_with_details(batch_size=EXPORT_BATCH_SIZE):
+            rows = [
+                [
+                    str(lic.id),
+                    provider.display_name,
+                    lic.external_user_id,
+                    lic.license_type or "",
+                    lic.status,
+                    employee.full_name if employee else "",
+                    employee.email if employee else "",
+                    employee.department if employee else "",
+                    float(lic.monthly_cost) if lic.monthly_cost else None,
+                    lic.currency or "EUR",
+                    lic.last_activity_at.strftime("%Y-%m-%d") if lic.last_activity_at else "",
+                    lic.assigned_at.strftime("%Y-%m-%d") if lic.assigned_at else "",
+                ]
+                for lic, provider, employee in batch
+                if provider.name != "hibob"
+            ]
+            if not rows:
                 continue
-
-            ws_licenses.cell(row=row, column=1, value=str(lic.id))
-            ws_licenses.cell(row=row, column=2, value=provider.display_name)
-            ws_licenses.cell(row=row, column=3, value=lic.external_user_id)
-            ws_licenses.cell(row=row, column=4, value=lic.license_type or "")
-            ws_licenses.cell(row=row, column=5, value=lic.status)
-            ws_licenses.cell(row=row, column=6, value=employee.full_name if employee else "")
-            ws_licenses.cell(row=row, column=7, value=employee.email if employee else "")
-            ws_licenses.cell(row=row, column=8, value=employee.department if employee else "")
-            ws_licenses.cell(
-                row=row, column=9, value=float(lic.monthly_cost) if lic.monthly_cost else None
-            )
-            ws_licenses.cell(row=row, column=10, value=lic.currency or "EUR")
-            ws_licenses.cell(
-                row=row,
-                column=11,
-                value=lic.last_activity_at.strftime("%Y-%m-%d") if lic.last_activity_at else "",
-            )
-            ws_licenses.cell(
-                row=row,
-                column=12,
-                value=lic.assigned_at.strftime("%Y-%m-%d") if lic.assigned_at else "",
-            )
-            row += 1
-
-        # Adjust column widths
-        for col in range(1, len(license_headers) + 1):
-            ws_licenses.column_dimensions[chr(64 + col)].width = 18
+            if not rows_written:
+                # Widths must be set before the first row is written
+                _set_column_widths(ws_licenses, _sample_column_widths(license_headers, rows))
+                ws_licenses.append(header_row(ws_licenses, license_headers))
+            await asyncio.to_thread(_append_rows, ws_licenses, rows)
+            rows_written += len(rows)
+            if on_progress is not None:
+                await on_progress(rows_written)
+        if not rows_written:
+            _set_column_widths(ws_licenses, _sample_column_widths(license_headers, []))
+            ws_licenses.append(header_row(ws_licenses, license_headers))
 
         # Costs Sheet
         ws_costs = wb.create_sheet("Costs")
+        _set_column_widths(ws_costs, [18] * 5)
 
         # Get cost snapshots
         today = date.today()
         start = today.replace(day=1, month=1)
         snapshots = await self.snapshot_repo.get_range(start_date=start, end_date=today)
 
-        cost_headers = ["Date", "Total Cost", "License Count", "Active Count", "Unassigned Count"]
-
-        for col, header in enumerate(cost_headers, 1):
-            cell = ws_costs.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-
+        cost_rows: list[list[Any]] = [
+            header_row(
+                ws_costs,
+                ["Date", "Total Cost", "License Count", "Active Count", "Unassigned Count"],
+            )
+        ]
         if snapshots:
-            row = 2
-            for snapshot in snapshots:
-                ws_costs.cell(row=row, column=1, value=snapshot.snapshot_date.strftime("%Y-%m-%d"))
-                ws_costs.cell(row=row, column=2, value=float(snapshot.total_cost))
-                ws_costs.cell(row=row, column=3, value=snapshot.license_count)
-                ws_costs.cell(row=row, column=4, value=snapshot.active_count)
-                ws_costs.cell(row=row, column=5, value=snapshot.unassigned_count)
-                row += 1
+            cost_rows.extend(
+                [
+                    snapshot.snapshot_date.strftime("%Y-%m-%d"),
+                    float(snapshot.total_cost),
+                    snapshot.license_count,
+                    snapshot.active_count,
+                    snapshot.unassigned_count,
+                ]
+                for snapshot in snapshots
+            )
         else:
             # Current data if no snapshots
-            ws_costs.cell(row=2, column=1, value=today.strftime("%Y-%m-%d"))
-            ws_costs.cell(row=2, column=2, value=float(total_cost))
-            ws_costs.cell(row=2, column=3, value=total)
-            ws_costs.cell(row=2, column=4, value=active_count)
-            ws_costs.cell(row=2, column=5, value=unassigned_count)
-
-        # Adjust column widths
-        for col in range(1, len(cost_headers) + 1):
-            ws_costs.column_dimensions[chr(64 + col)].width = 18
-
-        # Save to bytes
-        output = io.BytesIO()
-        wb.save(output)
-        return output.getvalue()
+            cost_rows.append(
+                [
+                    today.strftime("%Y-%m-%d"),
+                    float(totals["total_monthly_cost"]),
+                    totals["total"],
+                    totals["active"],
+                    totals["unassigned"],
+                ]
+            )
+        await asyncio.to_thread(_append_rows, ws_costs, cost_rows)
+
+        await asyncio.to_thread(wb.save, path)
+        return rows_written
@@ -35,6 +35,7 @@ from licence_api.repositories.import_job_repository import ImportJobRepository
 from licence_api.repositories.license_repository import LicenseRepository
 from licence_api.repositories.provider_repository import ProviderRepository
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 from licence_api.utils.file_parser import (
     parse_boolean,
     parse_csv_file,
@@ -84,6 +85,7 @@ class ImportService:
         self.provider_repo = ProviderRepository(session)
         self.import_job_repo = ImportJobRepository(session)
         self.audit_service = AuditService(session)
+        self.dashboard_aggregates = DashboardAggregateService(session)
 
     async def upload_file(
         self,
@@ -555,6 +557,7 @@ class ImportService:
                 if request.options.error_handling == "strict":
                     job.status = "failed"
                     job.error_details = {"errors": error_details}
+                    await self.dashboard_aggregates.refresh_licenses(provider_ids={provider_id})
                     await self.session.commit()
                     raise ValueError(f"Import failed at row {row_num}: {str(e)}")
 
@@ -582,6 +585,7 @@ class ImportService:
             },
         )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={provider_id})
         await self.session.commit()
 
         # Clean up temp file
@@ -27,6 +27,7 @@ from licence_api.repositories.settings_repository import SettingsRepository
 from licence_api.security.encryption import get_encryption_service
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
 from licence_api.services.cache_service import get_cache_service
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 from licence_api.utils.domain_check import is_company_email
 
 
@@ -47,6 +48,7 @@ class LicenseService:
         self.employee_repo = EmployeeRepository(session)
         self.settings_repo = SettingsRepository(session)
         self.audit_service = AuditService(session)
+        self.dashboard_aggregates = DashboardAggregateService(session)
         # Request-scoped cache for company domains
         self._company_domains_cache: list[str] | None = None
 
@@ -336,6 +338,7 @@ class LicenseService:
         # Invalidate dashboard cache
         cache = await get_cache_service()
         await cache.invalidate_dashboard()
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={license_orm.provider_id})
 
         await self.session.commit()
 
@@ -386,6 +389,7 @@ class LicenseService:
         # Invalidate dashboard cache
         cache = await get_cache_service()
         await cache.invalidate_dashboard()
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={license_orm.provider_id})
 
         await self.session.commit()
 
@@ -938,6 +942,7 @@ class LicenseService:
         # Invalidate dashboard cache
         cache = await get_cache_service()
         await cache.invalidate_dashboard()
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={license_orm.provider_id})
 
         await self.session.commit()
 
@@ -961,10 +966,12 @@ class LicenseService:
         """
         # Check which IDs exist before deleting so we can report accurately
         existing_ids: set[UUID] = set()
+        provider_ids: set[UUID] = set()
         for lid in license_ids:
             license_orm = await self.license_repo.get_by_id(lid)
             if license_orm is not None:
                 existing_ids.add(lid)
+                provider_ids.add(license_orm.provider_id)
 
         deleted_count = await self.license_repo.delete_by_ids(license_ids)
 
@@ -1005,6 +1012,7 @@ class LicenseService:
             request=request,
         )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids=provider_ids)
         await self.session.commit()
         return BulkActionResponse(
             total=len(license_ids),
@@ -1031,10 +1039,12 @@ class LicenseService:
         """
         # Check which IDs exist before unassigning so we can report accurately
         existing_ids: set[UUID] = set()
+        provider_ids: set[UUID] = set()
         for lid in license_ids:
             license_orm = await self.license_repo.get_by_id(lid)
             if license_orm is not None:
                 existing_ids.add(lid)
+                provider_ids.add(license_orm.provider_id)
 
         unassigned_count = await self.license_repo.unassign_by_ids(license_ids)
 
@@ -1075,6 +1085,7 @@ class LicenseService:
             request=request,
         )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids=provider_ids)
         await self.session.commit()
         return BulkActionResponse(
             total=len(license_ids),
@@ -1149,6 +1160,9 @@ class LicenseService:
                     },
                     request=request,
                 )
+                await self.dashboard_aggregates.refresh_licenses(
+                    provider_ids={license_orm.provider_id}
+                )
                 await self.session.commit()
 
             return {
@@ -1194,6 +1208,7 @@ class LicenseService:
         successful = 0
         failed = 0
         deleted_license_ids: list[UUID] = []
+        deleted_provider_ids: set[UUID] = set()
 
         for license_orm, provider in licenses_with_providers:
             # Check if provider supports remote removal
@@ -1224,6 +1239,7 @@ class LicenseService:
                 if result["success"]:
                     await self.license_repo.delete(license_orm.id)
                     deleted_license_ids.append(license_orm.id)
+                    deleted_provider_ids.add(provider.id)
                     successful += 1
                     results.append(
                         BulkActionResult(
@@ -1265,6 +1281,7 @@ class LicenseService:
                 },
                 request=request,
             )
+            await self.dashboard_aggregates.refresh_licenses(provider_ids=deleted_provider_ids)
 
         await self.session.commit()
 
@@ -18,6 +18,7 @@ from licence_api.models.dto.employee import (
 )
 from licence_api.repositories.employee_repository import EmployeeRepository
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 
 
 class ManualEmployeeService:
@@ -28,6 +29,7 @@ class ManualEmployeeService:
         self.session = session
         self.employee_repo = EmployeeRepository(session)
         self.audit_service = AuditService(session)
+        self.dashboard_aggregates = DashboardAggregateService(session)
 
     async def _build_employee_response(
         self,
@@ -102,6 +104,9 @@ class ManualEmployeeService:
             await self.employee_repo.resolve_manager_ids()
             employee_orm = await self.employee_repo.refresh(employee_orm)
 
+        # A new employee has no licenses yet
+        await self.dashboard_aggregates.refresh_employees()
+
         # Audit log
         await self.audit_service.log(
             action=AuditAction.EMPLOYEE_CREATE,
@@ -197,9 +202,18 @@ class ManualEmployeeService:
                 changes["manager_email"] = {"old": employee_orm.manager_email, "new": manager_email}
 
         if update_data:
+            old_department = employee_orm.department
             update_data["synced_at"] = datetime.now(UTC)
             employee_orm = await self.employee_repo.update(employee_id, **update_data)
 
+            if "department" in update_data or "status" in update_data:
+                await self.dashboard_aggregates.refresh_employees()
+            if "department" in update_data:
+                # The employee's licenses move to the new department
+                await self.dashboard_aggregates.refresh_licenses(
+                    departments={old_department, employee_orm.department}
+                )
+
             # Resolve manager if changed
             if "manager_email" in update_data:
                 await self.employee_repo.resolve_manager_ids()
@@ -244,9 +258,14 @@ class ManualEmployeeService:
         # Store info for audit log before deletion
         employee_email = employee_orm.email
         employee_name = employee_orm.full_name
+        employee_department = employee_orm.department
 
         await self.employee_repo.delete(employee_id)
 
+        await self.dashboard_aggregates.refresh_employees()
+        # Its licenses become unassigned (department None)
+        await self.dashboard_aggregates.refresh_licenses(departments={employee_department, None})
+
         # Audit log
         await self.audit_service.log(
             action=AuditAction.EMPLOYEE_DELETE,
@@ -286,6 +305,8 @@ class ManualEmployeeService:
         updated = 0
         skipped = 0
         errors: list[str] = []
+        # Departments whose employees' licenses moved
+        moved_departments: set[str | None] = set()
         now = datetime.now(UTC)
 
         for item in employees:
@@ -300,6 +321,9 @@ class ManualEmployeeService:
                         errors.append(f"Skipped {email_lower}: employee is synced from HRIS")
                         continue
 
+                    if existing.department != item.department:
+                        moved_departments |= {existing.department, item.department}
+
                     # Update existing manual employee
                     await self.employee_repo.update(
                         existing.id,
@@ -335,6 +359,11 @@ class ManualEmployeeService:
         # Resolve manager IDs for all newly created/updated employees
         await self.employee_repo.resolve_manager_ids()
 
+        if created or updated:
+            await self.dashboard_aggregates.refresh_employees()
+        if moved_departments:
+            await self.dashboard_aggregates.refresh_licenses(departments=moved_departments)
+
         # Audit log
         await self.audit_service.log(
             action=AuditAction.EMPLOYEE_BULK_IMPORT,
@@ -13,6 +13,7 @@ from licence_api.repositories.employee_repository import EmployeeRepository
 from licence_api.repositories.license_repository import LicenseRepository
 from licence_api.repositories.provider_repository import ProviderRepository
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 
 
 class ManualLicenseService:
@@ -25,6 +26,7 @@ class ManualLicenseService:
         self.provider_repo = ProviderRepository(session)
         self.employee_repo = EmployeeRepository(session)
         self.audit_service = AuditService(session)
+        self.dashboard_aggregates = DashboardAggregateService(session)
 
     async def _build_license_response(self, license_orm, provider=None) -> LicenseResponse:
         """Build a LicenseResponse from ORM object."""
@@ -149,6 +151,7 @@ class ManualLicenseService:
                     },
                 )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={provider_id})
         await self.session.commit()
         return created_licenses
 
@@ -241,6 +244,7 @@ class ManualLicenseService:
                 },
             )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={provider_id})
         await self.session.commit()
         return created_licenses
 
@@ -330,6 +334,7 @@ class ManualLicenseService:
                 details={"changes": list(update_data.keys()), "manual_entry": True},
             )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={license_orm.provider_id})
         await self.session.commit()
         return await self._build_license_response(license_orm)
 
@@ -376,6 +381,7 @@ class ManualLicenseService:
                 details={"previous_employee_id": str(old_employee_id) if old_employee_id else None},
             )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={license_orm.provider_id})
         await self.session.commit()
         return await self._build_license_response(license_orm)
 
@@ -418,4 +424,5 @@ class ManualLicenseService:
                 details={"provider_id": str(provider_id), "manual_entry": True},
             )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={provider_id})
         await self.session.commit()
@@ -0,0 +1,324 @@
+"""Fuzzy name scoring engine for license-to-employee matching.
+
+Fuzzy matching is pure-Python CPU work (difflib.SequenceMatcher). Running it on
+the event loop during a large sync stalls every request served by the worker,
+so FuzzyMatchEngine can score batches of queries in a process pool instead.
+
+This module deliberately has no database or settings dependencies so that it
+is cheap to import in worker processes. The employee snapshot is shipped to
+each worker once, through the pool initializer, and indexed there.
+"""
+
+import asyncio
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Any, Literal, NamedTuple, Protocol
+from uuid import UUID
+
+from licence_api.utils.name_index import NameIndex
+
+# Queries per task submitted to the process pool
+BATCH_SIZE = 250
+
+
+class NamedEmployee(Protocol):
+    """Anything with an id and a full name (EmployeeORM or EmployeeName)."""
+
+    @property
+    def id(self) -> Any:
+        """Employee ID."""
+        ...
+
+    @property
+    def full_name(self) -> str:
+        """Employee full name."""
+        ...
+
+
+@dataclass(frozen=True, slots=True)
+class EmployeeName:
+    """Picklable employee snapshot shipped to worker processes."""
+
+    id: UUID
+    full_name: str
+
+
+class FuzzyQuery(NamedTuple):
+    """A fuzzy name lookup deferred for batch scoring.
+
+    kind is "email" for external email addresses (name taken from the local
+    part) and "display_name" for provider display names.
+    """
+
+    kind: Literal["email", "display_name"]
+    text: str
+
+
+def extract_name_from_email(email: str) -> str | None:
+    """Extract a potential name from an email local part.
+
+    Handles formats like:
+    - john.doe@domain.com -> "john doe"
+    - john_doe@domain.com -> "john doe"
+    - johndoe@domain.com -> "johndoe"
+    """
+    if "@" not in email:
+        return None
+
+    local = email.split("@")[0].lower()
+    # Replace common separators with space
+    name = re.sub(r"[._\-]", " ", local)
+    # Remove numbers
+    name = re.sub(r"\d+", "", name)
+    return name.strip() if name.strip() else None
+
+
+def fuzzy_email_match[E: NamedEmployee](
+    license_email: str,
+    employees: list[E],
+) -> tuple[E | None, float]:
+    """Find best fuzzy name match from email to employee names.
+
+    Args:
+        license_email: License email address
+        employees: List of employees to match against
+
+    Returns:
+        Tuple of (best_match_employee, confidence)
+    """
+    email_name = extract_name_from_email(license_email)
+    if not email_name:
+        return None, 0.0
+
+    best_match: E | None = None
+    best_score = 0.0
+
+    for emp in employees:
+        emp_name = emp.full_name.lower()
+
+        # Direct name comparison
+        score = SequenceMatcher(None, email_name, emp_name).ratio()
+
+        # Also try reversed name parts (for "doe john" vs "john doe")
+        email_parts = email_name.split()
+        if len(email_parts) == 2:
+            reversed_email = f"{email_parts[1]} {email_parts[0]}"
+            reversed_score = SequenceMatcher(None, reversed_email, emp_name).ratio()
+            score = max(score, reversed_score)
+
+        # Check if first.last or last.first pattern matches
+        name_parts = emp_name.split()
+        if len(name_parts) >= 2:
+            first_last = f"{name_parts[0]} {name_parts[-1]}"
+            last_first = f"{name_parts[-1]} {name_parts[0]}"
+            score = max(
+                score,
+                SequenceMatcher(None, email_name, first_last).ratio(),
+                SequenceMatcher(None, email_name, last_first).ratio(),
+            )
+
+        if score > best_score:
+            best_score = score
+            best_match = emp
+
+    # Apply confidence adjustment for fuzzy matching
+    # Fuzzy matches are inherently less reliable
+    confidence = best_score * 0.85  # Max 85% confidence for fuzzy
+
+    return best_match, confidence
+
+
+def fuzzy_display_name_match[E: NamedEmployee](
+    display_name: str,
+    employees: list[E],
+) -> tuple[E | None, float]:
+    """Find best fuzzy name match from display name to employee names.
+
+    Used when providers return display names (e.g., HuggingFace fullName)
+    but not email addresses.
+
+    Args:
+        display_name: Display name from provider metadata
+        employees: List of employees to match against
+
+    Returns:
+        Tuple of (best_match_employee, confidence)
+    """
+    if not display_name or not display_name.strip():
+        return None, 0.0
+
+    name = display_name.lower().strip()
+    best_match: E | None = None
+    best_score = 0.0
+
+    for emp in employees:
+        emp_name = emp.full_name.lower()
+
+        # Direct name comparison
+        score = SequenceMatcher(None, name, emp_name).ratio()
+
+        # Also try reversed name parts (for "doe john" vs "john doe")
+        name_parts = name.split()
+        if len(name_parts) >= 2:
+            reversed_name = f"{name_parts[-1]} {' '.join(name_parts[:-1])}"
+            reversed_score = SequenceMatcher(None, reversed_name, emp_name).ratio()
+            score = max(score, reversed_score)
+
+        # Check first.last and last.first patterns
+        emp_parts = emp_name.split()
+        if len(emp_parts) >= 2:
+            first_last = f"{emp_parts[0]} {emp_parts[-1]}"
+            last_first = f"{emp_parts[-1]} {emp_parts[0]}"
+            score = max(
+                score,
+                SequenceMatcher(None, name, first_last).ratio(),
+                SequenceMatcher(None, name, last_first).ratio(),
+            )
+
+        if score > best_score:
+            best_score = score
+            best_match = emp
+
+    # Apply confidence adjustment - metadata names can be more reliable
+    # than email-derived names, so use 0.90 multiplier
+    confidence = best_score * 0.90  # Max 90% confidence for metadata name
+
+    return best_match, confidence
+
+
+def build_name_index[E: NamedEmployee](employees: list[E]) -> NameIndex[E]:
+    """Build the trigram name index over employees.
+
+    Args:
+        employees: Employees to index
+
+    Returns:
+        NameIndex keyed by lowercase full name
+    """
+    index: NameIndex[E] = NameIndex()
+    for emp in employees:
+        index.add(emp, emp.full_name.lower())
+    return index
+
+
+def name_candidates[E: NamedEmployee](index: NameIndex[E], name: str | None) -> list[E]:
+    """Get a shortlist of employees whose names resemble a name.
+
+    Fuzzy matching against every employee is O(N) SequenceMatcher calls per
+    license; the trigram index narrows this to the few employees that can
+    plausibly reach the suggestion threshold.
+
+    Args:
+        index: Employee name index
+        name: Lowercase name (from an email local part or display name)
+
+    Returns:
+        Candidate employees in the same order as the full employee list
+    """
+    if not name or not name.strip():
+        return []
+    return index.search(name.strip())
+
+
+def score_queries(
+    index: NameIndex[Any],
+    queries: list[FuzzyQuery],
+) -> list[tuple[UUID | None, float]]:
+    """Score fuzzy queries against the indexed employees.
+
+    Args:
+        index: Employee name index
+        queries: Queries to score
+
+    Returns:
+        (employee_id, confidence) per query, employee_id None if nothing scored
+    """
+    scores: list[tuple[UUID | None, float]] = []
+    for query in queries:
+        if query.kind == "email":
+            candidates = name_candidates(index, extract_name_from_email(query.text))
+            emp, confidence = fuzzy_email_match(query.text, candidates)
+        else:
+            candidates = name_candidates(index, query.text.lower())
+            emp, confidence = fuzzy_display_name_match(query.text, candidates)
+        scores.append((emp.id if emp else None, confidence))
+    return scores
+
+
+# Per-process index, built once by the pool initializer
+_worker_index: NameIndex[EmployeeName] | None = None
+
+
+def _init_worker(employees: list[EmployeeName]) -> None:
+    """Build the employee name index in a worker process."""
+    global _worker_index
+    _worker_index = build_name_index(employees)
+
+
+def _score_in_worker(queries: list[FuzzyQuery]) -> list[tuple[UUID | None, float]]:
+    """Score a batch of queries with the worker's index."""
+    if _worker_index is None:
+        raise RuntimeError("Matching worker was not initialized")
+    return score_queries(_worker_index, queries)
+
+
+class FuzzyMatchEngine:
+    """Scores fuzzy queries in a process pool, keeping the event loop free.
+
+    Use as an async context manager; the pool is started on entry with the
+    employee snapshot and shut down on exit.
+    """
+
+    def __init__(self, employees: list[EmployeeName], max_workers: int) -> None:
+        """Initialize engine.
+
+        Args:
+            employees: Employee snapshot to ship to the workers
+            max_workers: Number of worker processes
+        """
+        self._employees = employees
+        self._max_workers = max_workers
+        self._pool: ProcessPoolExecutor | None = None
+
+    async def __aenter__(self) -> "FuzzyMatchEngine":
+        """Start the worker pool."""
+        # Fork would copy the event loop, open sockets and the DB pool of the API
+        # process into the workers; forkserver forks them from a clean process that
+        # has imported this module once (importing the services package is slow)
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload([__name__])
+        self._pool = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._employees,),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Shut down the worker pool without blocking the event loop."""
+        if self._pool is not None:
+            pool, self._pool = self._pool, None
+            await asyncio.to_thread(pool.shutdown, wait=True, cancel_futures=True)
+
+    async def score(self, queries: list[FuzzyQuery]) -> list[tuple[UUID | None, float]]:
+        """Score queries in batches across the worker pool.
+
+        Args:
+            queries: Queries to score
+
+        Returns:
+            (employee_id, confidence) per query, in query order
+        """
+        if self._pool is None:
+            raise RuntimeError("FuzzyMatchEngine must be used as an async context manager")
+
+        loop = asyncio.get_running_loop()
+        batches = [queries[i : i + BATCH_SIZE] for i in range(0, len(queries), BATCH_SIZE)]
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._pool, _score_in_worker, batch) for batch in batches)
+        )
+        return [score for batch_scores in results for score in batch_scores]
@@ -19,11 +19,9 @@ It only creates temporary suggestions for manual review.
 Admins decide what to do with each suggestion.
 """
 
-import re
 from dataclasses import dataclass
 from datetime import UTC, datetime
-from difflib import SequenceMatcher
-from typing import Literal
+from typing import Literal, NamedTuple
 from uuid import UUID
 
 from fastapi import Request
@@ -39,6 +37,19 @@ from licence_api.repositories.employee_repository import EmployeeRepository
 from licence_api.repositories.license_repository import LicenseRepository
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
 from licence_api.services.cache_service import get_cache_service
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
+from licence_api.services.matching_engine import (
+    EmployeeName,
+    FuzzyMatchEngine,
+    FuzzyQuery,
+    build_name_index,
+    extract_name_from_email,
+    fuzzy_display_name_match,
+    fuzzy_email_match,
+    name_candidates,
+    score_queries,
+)
+from licence_api.utils.name_index import NameIndex
 
 # Match status constants
 MATCH_STATUS_AUTO_MATCHED = "auto_matched"  # High confidence, auto-assigned
@@ -59,6 +70,9 @@ MATCH_METHOD_METADATA_NAME = "metadata_name"
 CONFIDENCE_AUTO_ASSIGN = 0.95  # Auto-assign if confidence >= this
 CONFIDENCE_SUGGEST = 0.5  # Suggest if confidence >= this
 
+# Minimum number of fuzzy lookups before starting a process pool is worth it
+PROCESS_POOL_MIN_QUERIES = 200
+
 MatchStatus = Literal[
     "auto_matched", "suggested", "confirmed", "rejected", "external_guest", "external_review"
 ]
@@ -91,6 +105,15 @@ class MatchResult:
         )
 
 
+class MatchRequest(NamedTuple):
+    """License identifiers used for matching."""
+
+    external_user_id: str
+    provider_type: str | None = None
+    username: str | None = None
+    display_name: str | None = None
+
+
 class MatchingService:
     """Service for matching licenses to employees.
 
@@ -109,6 +132,7 @@ class MatchingService:
         self._email_to_employee: dict[str, EmployeeORM] = {}
         self._local_to_employees: dict[str, list[EmployeeORM]] = {}
         self._employees_by_id: dict[UUID, EmployeeORM] = {}
+        self._name_index: NameIndex[EmployeeORM] = NameIndex()
         self._external_accounts: dict[
             str, dict[str, UUID]
         ] = {}  # provider -> username -> employee_id
@@ -118,6 +142,9 @@ class MatchingService:
         # Get all employees
         employees = await self.employee_repo.get_all()
 
+        # Trigram index for fuzzy name candidate retrieval
+        self._name_index = build_name_index(employees)
+
         for emp in employees:
             # Store by ID
             self._employees_by_id[emp.id] = emp
@@ -164,22 +191,19 @@ class MatchingService:
         return True
 
     def _extract_name_from_email(self, email: str) -> str | None:
-        """Extract a potential name from an email local part.
+        """Extract a potential name from an email local part."""
+        return extract_name_from_email(email)
 
-        Handles formats like:
-        - john.doe@domain.com -> "john doe"
-        - john_doe@domain.com -> "john doe"
-        - johndoe@domain.com -> "johndoe"
-        """
-        if "@" not in email:
-            return None
+    def _name_candidates(self, name: str | None) -> list[EmployeeORM]:
+        """Get a shortlist of employees whose names resemble a name.
 
-        local = email.split("@")[0].lower()
-        # Replace common separators with space
-        name = re.sub(r"[._\-]", " ", local)
-        # Remove numbers
-        name = re.sub(r"\d+", "", name)
-        return name.strip() if name.strip() else None
+        Args:
+            name: Lowercase name (from an email local part or display name)
+
+        Returns:
+            Candidate employees in the same order as the full employee list
+        """
+        return name_candidates(self._name_index, name)
 
     def _fuzzy_name_match(
         self,
@@ -195,46 +219,7 @@ class MatchingService:
         Returns:
             Tuple of (best_match_employee, confidence)
         """
-        email_name = self._extract_name_from_email(license_email)
-        if not email_name:
-            return None, 0.0
-
-        best_match: EmployeeORM | None = None
-        best_score = 0.0
-
-        for emp in employees:
-            emp_name = emp.full_name.lower()
-
-            # Direct name comparison
-            score = SequenceMatcher(None, email_name, emp_name).ratio()
-
-            # Also try reversed name parts (for "doe john" vs "john doe")
-            email_parts = email_name.split()
-            if len(email_parts) == 2:
-                reversed_email = f"{email_parts[1]} {email_parts[0]}"
-                reversed_score = SequenceMatcher(None, reversed_email, emp_name).ratio()
-                score = max(score, reversed_score)
-
-            # Check if first.last or last.first pattern matches
-            name_parts = emp_name.split()
-            if len(name_parts) >= 2:
-                first_last = f"{name_parts[0]} {name_parts[-1]}"
-                last_first = f"{name_parts[-1]} {name_parts[0]}"
-                score = max(
-                    score,
-                    SequenceMatcher(None, email_name, first_last).ratio(),
-                    SequenceMatcher(None, email_name, last_first).ratio(),
-                )
-
-            if score > best_score:
-                best_score = score
-                best_match = emp
-
-        # Apply confidence adjustment for fuzzy matching
-        # Fuzzy matches are inherently less reliable
-        confidence = best_score * 0.85  # Max 85% confidence for fuzzy
-
-        return best_match, confidence
+        return fuzzy_email_match(license_email, employees)
 
     def _fuzzy_name_match_by_display_name(
         self,
@@ -243,9 +228,6 @@ class MatchingService:
     ) -> tuple[EmployeeORM | None, float]:
         """Find best fuzzy name match from display name to employee names.
 
-        Used when providers return display names (e.g., HuggingFace fullName)
-        but not email addresses.
-
         Args:
             display_name: Display name from provider metadata
             employees: List of employees to match against
@@ -253,46 +235,7 @@ class MatchingService:
         Returns:
             Tuple of (best_match_employee, confidence)
         """
-        if not display_name or not display_name.strip():
-            return None, 0.0
-
-        name = display_name.lower().strip()
-        best_match: EmployeeORM | None = None
-        best_score = 0.0
-
-        for emp in employees:
-            emp_name = emp.full_name.lower()
-
-            # Direct name comparison
-            score = SequenceMatcher(None, name, emp_name).ratio()
-
-            # Also try reversed name parts (for "doe john" vs "john doe")
-            name_parts = name.split()
-            if len(name_parts) >= 2:
-                reversed_name = f"{name_parts[-1]} {' '.join(name_parts[:-1])}"
-                reversed_score = SequenceMatcher(None, reversed_name, emp_name).ratio()
-                score = max(score, reversed_score)
-
-            # Check first.last and last.first patterns
-            emp_parts = emp_name.split()
-            if len(emp_parts) >= 2:
-                first_last = f"{emp_parts[0]} {emp_parts[-1]}"
-                last_first = f"{emp_parts[-1]} {emp_parts[0]}"
-                score = max(
-                    score,
-                    SequenceMatcher(None, name, first_last).ratio(),
-                    SequenceMatcher(None, name, last_first).ratio(),
-                )
-
-            if score > best_score:
-                best_score = score
-                best_match = emp
-
-        # Apply confidence adjustment - metadata names can be more reliable
-        # than email-derived names, so use 0.90 multiplier
-        confidence = best_score * 0.90  # Max 90% confidence for metadata name
-
-        return best_match, confidence
+        return fuzzy_display_name_match(display_name, employees)
 
     async def _build_external_accounts_cache(self, provider_type: str) -> None:
         """Build cache of external account mappings for a provider.
@@ -333,13 +276,92 @@ class MatchingService:
         Returns:
             MatchResult with match details
         """
-        email = external_user_id.lower().strip()
-        is_external = self._is_external_email(email, company_domains)
+        request = MatchRequest(external_user_id, provider_type, username, display_name)
+        results = await self.match_licenses([request], company_domains)
+        return results[0]
 
+    async def create_fuzzy_engine(self, max_workers: int) -> FuzzyMatchEngine:
+        """Create a process pool engine over the cached employees.
+
+        The engine is not started; use it as an async context manager around
+        all match_licenses calls that should share its worker pool.
+
+        Args:
+            max_workers: Number of worker processes
+
+        Returns:
+            FuzzyMatchEngine with a snapshot of the employee names
+        """
         # Build caches if not done
         if not self._email_to_employee:
             await self._build_caches()
 
+        snapshot = [EmployeeName(emp.id, emp.full_name) for emp in self._employees_by_id.values()]
+        return FuzzyMatchEngine(snapshot, max_workers)
+
+    async def match_licenses(
+        self,
+        requests: list[MatchRequest],
+        company_domains: list[str],
+        engine: FuzzyMatchEngine | None = None,
+    ) -> list[MatchResult]:
+        """Match a batch of licenses to employees.
+
+        Applies the same levels as match_license. The cheap levels run inline;
+        fuzzy name lookups against all employees are collected and scored in one
+        batch. With a started engine and at least PROCESS_POOL_MIN_QUERIES
+        lookups, the batch is scored in the engine's process pool so the event
+        loop stays responsive during large syncs.
+
+        Args:
+            requests: Licenses to match
+            company_domains: List of company email domains
+            engine: Started engine from create_fuzzy_engine (None = score inline)
+
+        Returns:
+            MatchResult per request, in request order
+        """
+        # Build caches if not done
+        if not self._email_to_employee:
+            await self._build_caches()
+
+        results: list[MatchResult | FuzzyQuery] = []
+        for request in requests:
+            results.append(await self._match_without_full_scan(request, company_domains))
+
+        pending = [(i, r) for i, r in enumerate(results) if isinstance(r, FuzzyQuery)]
+        if pending:
+            queries = [query for _, query in pending]
+            if engine is not None and len(queries) >= PROCESS_POOL_MIN_QUERIES:
+                scores = await engine.score(queries)
+            else:
+                scores = score_queries(self._name_index, queries)
+
+            for (i, query), (employee_id, confidence) in zip(pending, scores, strict=True):
+                results[i] = self._fuzzy_result(query, employee_id, confidence)
+
+        return [r for r in results if isinstance(r, MatchResult)]
+
+    async def _match_without_full_scan(
+        self,
+        request: MatchRequest,
+        company_domains: list[str],
+    ) -> MatchResult | FuzzyQuery:
+        """Run all matching levels that do not scan every employee.
+
+        Args:
+            request: License to match
+            company_domains: List of company email domains
+
+        Returns:
+            MatchResult, or a FuzzyQuery if only a fuzzy match against all
+            employees can still produce a result (see _fuzzy_result)
+        """
+        email = request.external_user_id.lower().strip()
+        is_external = self._is_external_email(email, company_domains)
+        provider_type = request.provider_type
+        username = request.username
+
         # Level 0: External account match (if provider and username provided)
         if provider_type and username:
             await self._build_external_accounts_cache(provider_type)
@@ -370,19 +392,8 @@ class MatchingService:
         if "@" not in email:
             # Non-email identifiers (license keys, user IDs, etc.)
             # Try metadata name matching if display_name is provided
-            if display_name:
-                all_employees = list(self._employees_by_id.values())
-                best_emp, confidence = self._fuzzy_name_match_by_display_name(
-                    display_name, all_employees
-                )
-                if best_emp and confidence >= CONFIDENCE_SUGGEST:
-                    return MatchResult(
-                        employee_id=best_emp.id,
-                        confidence=confidence,
-                        method=MATCH_METHOD_METADATA_NAME,
-                        status=MATCH_STATUS_SUGGESTED,
-                        is_external=False,
-                    )
+            if request.display_name:
+                return FuzzyQuery("display_name", request.display_name)
 
             # No match possible without email or display name
             return MatchResult(
@@ -420,30 +431,56 @@ class MatchingService:
 
         # Level 3: Fuzzy name match against all employees (only for external)
         if is_external:
-            all_employees = list(self._employees_by_id.values())
-            best_emp, confidence = self._fuzzy_name_match(email, all_employees)
+            return FuzzyQuery("email", email)
+
+        # Internal email but no match - "unknown internal"
+        return MatchResult(
+            is_external=False,
+            status=None,  # Will be handled as "not_in_hris"
+        )
+
+    def _fuzzy_result(
+        self,
+        query: FuzzyQuery,
+        employee_id: UUID | None,
+        confidence: float,
+    ) -> MatchResult:
+        """Turn a scored fuzzy query into a MatchResult.
+
+        Display name queries only come from non-email identifiers and email
+        queries only from external emails, which determines the fallback.
+
+        Args:
+            query: The fuzzy query
+            employee_id: Best scoring employee, if any
+            confidence: Confidence of the best score
 
-            if best_emp and confidence >= CONFIDENCE_SUGGEST:
+        Returns:
+            MatchResult for the license
+        """
+        if query.kind == "display_name":
+            if employee_id and confidence >= CONFIDENCE_SUGGEST:
                 return MatchResult(
-                    employee_id=best_emp.id,
+                    employee_id=employee_id,
                     confidence=confidence,
-                    method=MATCH_METHOD_FUZZY_NAME,
+                    method=MATCH_METHOD_METADATA_NAME,
                     status=MATCH_STATUS_SUGGESTED,
-                    is_external=is_external,
+                    is_external=False,
                 )
+            return MatchResult(is_external=False, status=None)
 
-        # No match found
-        if is_external:
+        if employee_id and confidence >= CONFIDENCE_SUGGEST:
             return MatchResult(
+                employee_id=employee_id,
+                confidence=confidence,
+                method=MATCH_METHOD_FUZZY_NAME,
+                status=MATCH_STATUS_SUGGESTED,
                 is_external=True,
-                status=MATCH_STATUS_EXTERNAL_REVIEW,
-            )
-        else:
-            # Internal email but no match - "unknown internal"
-            return MatchResult(
-                is_external=False,
-                status=None,  # Will be handled as "not_in_hris"
             )
+        return MatchResult(
+            is_external=True,
+            status=MATCH_STATUS_EXTERNAL_REVIEW,
+        )
 
     async def process_license_matches(
         self,
@@ -694,6 +731,9 @@ class MatchingService:
         # Invalidate dashboard cache
         cache = await get_cache_service()
         await cache.invalidate_dashboard()
+        await DashboardAggregateService(self.session).refresh_licenses(
+            provider_ids={license.provider_id}
+        )
 
         await self.session.commit()
         return license
@@ -764,6 +804,9 @@ class MatchingService:
         # Invalidate dashboard cache
         cache = await get_cache_service()
         await cache.invalidate_dashboard()
+        await DashboardAggregateService(self.session).refresh_licenses(
+            provider_ids={license.provider_id}
+        )
 
         await self.session.commit()
         return license
@@ -806,6 +849,9 @@ class MatchingService:
         # Invalidate dashboard cache
         cache = await get_cache_service()
         await cache.invalidate_dashboard()
+        await DashboardAggregateService(self.session).refresh_licenses(
+            provider_ids={license.provider_id}
+        )
 
         await self.session.commit()
         return license
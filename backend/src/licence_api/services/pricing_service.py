@@ -17,6 +17,7 @@ from licence_api.models.dto.provider import (
 from licence_api.repositories.license_repository import LicenseRepository
 from licence_api.repositories.provider_repository import ProviderRepository
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 
 if TYPE_CHECKING:
     from licence_api.models.domain.admin_user import AdminUser
@@ -41,6 +42,7 @@ class PricingService:
         self.provider_repo = ProviderRepository(session)
         self.license_repo = LicenseRepository(session)
         self.audit_service = AuditService(session)
+        self.dashboard_aggregates = DashboardAggregateService(session)
 
     async def update_license_pricing(
         self,
@@ -145,6 +147,7 @@ class PricingService:
                 },
             )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={provider_id})
         await self.session.commit()
 
     async def update_individual_license_pricing(
@@ -229,6 +232,7 @@ class PricingService:
                 },
             )
 
+        await self.dashboard_aggregates.refresh_licenses(provider_ids={provider_id})
         await self.session.commit()
 
         # Return updated overview
@@ -830,6 +830,20 @@ class ProviderService:
 
         return True
 
+    @staticmethod
+    def get_http_metrics() -> dict[str, dict[str, Any]]:
+        """Get request counts and latency histograms of the provider APIs.
+
+        Covers all requests sent by this process since startup, keyed by
+        provider type.
+
+        Returns:
+            Dict of per-provider request stats
+        """
+        from licence_api.providers.http import provider_http_metrics
+
+        return provider_http_metrics.snapshot()
+
     @staticmethod
     async def test_connection(name: str, credentials: dict[str, Any]) -> tuple[bool, str]:
         """Test provider connection with given credentials.
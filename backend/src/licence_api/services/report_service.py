@@ -57,6 +57,7 @@ from licence_api.repositories.license_repository import LicenseRepository
 from licence_api.repositories.provider_repository import ProviderRepository
 from licence_api.repositories.settings_repository import SettingsRepository
 from licence_api.repositories.user_repository import UserRepository
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 from licence_api.services.expiration_service import ExpirationService
 from licence_api.utils.domain_check import is_company_email
 
@@ -80,6 +81,9 @@ class ReportService:
         """Get dashboard data with cache layer.
 
         Checks cache first, falls back to database and caches the result.
+        Provider summaries are cached separately from the department-scoped
+        metrics, so a provider sync only invalidates the dashboards of the
+        departments it touched.
 
         Args:
             department: Optional department filter
@@ -92,11 +96,18 @@ class ReportService:
         cache = await get_cache_service()
         cached = await cache.get_dashboard(department=department)
         if cached:
-            return DashboardResponse(**cached)
+            providers = await cache.get_dashboard_providers()
+            if providers is None:
+                providers = [
+                    summary.model_dump() for summary in await self._get_provider_summaries()
+                ]
+                await cache.set_dashboard_providers(providers)
+            return DashboardResponse(**{**cached, "providers": providers})
 
         result = await self.get_dashboard(department=department)
 
-        await cache.set_dashboard(result, department=department)
+        await cache.set_dashboard(result.model_dump(exclude={"providers"}), department=department)
+        await cache.set_dashboard_providers([summary.model_dump() for summary in result.providers])
         return result
 
     async def get_utilization_report_cached(self) -> "UtilizationReport":
@@ -159,30 +170,11 @@ class ReportService:
         Returns:
             DashboardResponse with all dashboard metrics
         """
-        # Employee stats
-        employee_stats = await self.employee_repo.count_by_status(department=department)
-        total_employees = sum(employee_stats.values())
-        active_employees = employee_stats.get("active", 0)
-        offboarded_employees = employee_stats.get("offboarded", 0)
-
-        # License stats
-        license_stats = await self.license_repo.get_statistics(department=department)
+        # Employee and license counts and costs, precomputed per department and provider
+        totals = await DashboardAggregateService(self.session).get_totals(department)
 
         # Provider summaries
-        providers_with_counts = await self.provider_repo.get_all_with_license_counts()
-        provider_summaries = []
-        for provider, count in providers_with_counts:
-            provider_summaries.append(
-                ProviderSummary(
-                    id=str(provider.id),
-                    name=provider.name,
-                    display_name=provider.display_name,
-                    total_licenses=count,
-                    active_licenses=count,  # Simplified
-                    inactive_licenses=0,
-                    last_sync_at=provider.last_sync_at,
-                )
-            )
+        provider_summaries = await self._get_provider_summaries()
 
         # Recent offboardings - using batch query to avoid N+1
         recent_offboarded = await self.employee_repo.get_recently_offboarded(
@@ -238,32 +230,44 @@ class ReportService:
                 for lic, provider, _ in unassigned_results
             ]
 
-        # Count external licenses using optimized SQL query
-        external_count = 0
-        setting = await self.settings_repo.get("company_domains")
-        company_domains = setting.get("domains", []) if setting else []
-        if company_domains:
-            external_count = await self.license_repo.count_external_licenses(
-                company_domains=company_domains,
-                department=department,
-                exclude_provider_name="hibob",
-            )
-
         return DashboardResponse(
-            total_employees=total_employees,
-            active_employees=active_employees,
-            offboarded_employees=offboarded_employees,
-            total_licenses=license_stats["total"],
-            active_licenses=license_stats["by_status"].get("active", 0),
-            unassigned_licenses=license_stats["unassigned"],
-            external_licenses=external_count,
-            total_monthly_cost=license_stats["total_monthly_cost"],
-            potential_savings=license_stats["potential_savings"],
+            total_employees=totals["employees_total"],
+            active_employees=totals["employees_active"],
+            offboarded_employees=totals["employees_offboarded"],
+            total_licenses=totals["licenses_total"],
+            active_licenses=totals["licenses_active"],
+            # Unassigned licenses have no department, so these are 0 for a department
+            unassigned_licenses=totals["licenses_unassigned"],
+            external_licenses=totals["licenses_external"],
+            total_monthly_cost=totals["monthly_cost"],
+            potential_savings=totals["unassigned_monthly_cost"],
             providers=provider_summaries,
             recent_offboardings=recent_offboardings,
             unassigned_license_samples=unassigned_samples,
+            aggregates_refreshed_at=totals["oldest_refreshed_at"],
+            aggregates_stale=totals["stale"],
         )
 
+    async def _get_provider_summaries(self) -> list[ProviderSummary]:
+        """Get license counts and sync status of all providers for the dashboard.
+
+        Returns:
+            List of ProviderSummary
+        """
+        providers_with_counts = await self.provider_repo.get_all_with_license_counts()
+        return [
+            ProviderSummary(
+                id=str(provider.id),
+                name=provider.name,
+                display_name=provider.display_name,
+                total_licenses=count,
+                active_licenses=count,  # Simplified
+                inactive_licenses=0,
+                last_sync_at=provider.last_sync_at,
+            )
+            for provider, count in providers_with_counts
+        ]
+
     async def get_cost_report(
         self,
         start_date: date | None = None,
@@ -286,28 +290,20 @@ class ReportService:
             end_date = date.today()
         if start_date is None:
             start_date = end_date - timedelta(days=90)
-        # Get all licenses with costs (exclude HRIS providers like hibob)
+        # Sum costs per provider in the database (HRIS providers like hibob excluded).
         # Don't filter by status - unassigned licenses still cost money
-        results, _ = await self.license_repo.get_all_with_details(
-            department=department,
-            limit=10000,
-        )
+        totals = await self.license_repo.get_cost_totals_by_provider(department=department)
 
-        # Group by provider and calculate costs
+        # Merge the per-currency totals of each provider
         provider_costs: dict[str, Decimal] = {}
         provider_counts: dict[str, int] = {}
         currencies_found: set[str] = set()
 
-        for lic, provider, _ in results:
-            # Skip HRIS providers (they don't have licenses)
-            if provider.name == "hibob":
-                continue
-            name = provider.display_name
-            cost = lic.monthly_cost or Decimal("0")
+        for name, currency, cost, count, has_cost in totals:
             provider_costs[name] = provider_costs.get(name, Decimal("0")) + cost
-            provider_counts[name] = provider_counts.get(name, 0) + 1
-            if cost > 0:
-                currencies_found.add(lic.currency)
+            provider_counts[name] = provider_counts.get(name, 0) + count
+            if has_cost:
+                currencies_found.add(currency)
 
         # Create cost summary per provider (no month duplication)
         monthly_costs = []
@@ -607,15 +603,10 @@ class ReportService:
         # Get detailed license stats per provider via repository
         provider_stats = await self.license_repo.get_utilization_stats()
 
-        # Count external licenses and their costs per provider
-        external_by_provider: dict[str, dict] = {}
-        if company_domains:
-            for provider_id in all_providers.keys():
-                ext_data = await self.license_repo.count_external_by_provider(
-                    provider_id=provider_id,
-                    company_domains=company_domains,
-                )
-                external_by_provider[str(provider_id)] = ext_data
+        # Count external licenses and their costs for all providers in one query
+        external_by_provider = await self.license_repo.get_external_stats_by_provider(
+            company_domains
+        )
 
         # Build report
         providers_list = []
@@ -1015,80 +1006,47 @@ class ReportService:
         """
         import statistics
 
-        # Get all licenses with employee info
-        results, _ = await self.license_repo.get_all_with_details(
+        # Active license costs summed per employee in the database (highest first)
+        totals = await self.license_repo.get_active_cost_totals_by_employee(
             department=department,
-            limit=10000,
+            min_cost=Decimal(str(min_cost)) if min_cost is not None else None,
         )
 
-        # Group by employee
-        emp_data: dict[str, dict] = {}
+        # Statistics cover all matching employees; license details only the returned ones
+        costs_list = [float(cost) for _, _, cost in totals]
+        shown_licenses = await self.license_repo.get_active_license_costs_for_employees(
+            [emp.id for emp, _, _ in totals[:limit]]
+        )
 
-        for lic, provider, employee in results:
-            if provider.name == "hibob":
-                continue
-            if lic.status != "active":
-                continue
-            if not employee:
-                continue  # Skip unassigned licenses
-
-            emp_id = str(employee.id)
-            if emp_id not in emp_data:
-                emp_data[emp_id] = {
-                    "employee": employee,
-                    "licenses": [],
-                    "cost": Decimal("0"),
-                }
-
-            cost = lic.monthly_cost or Decimal("0")
-            emp_data[emp_id]["licenses"].append(
+        employees = []
+        for emp, license_count, cost in totals[:limit]:
+            licenses = [
                 EmployeeLicense(
-                    provider_name=provider.display_name,
-                    license_type=lic.license_type,
-                    monthly_cost=cost if cost > 0 else None,
+                    provider_name=provider_name,
+                    license_type=license_type,
+                    monthly_cost=monthly_cost if monthly_cost and monthly_cost > 0 else None,
                 )
-            )
-            emp_data[emp_id]["cost"] += cost
-
-        # Build response
-        employees = []
-        costs_list = []
-
-        for emp_id, data in emp_data.items():
-            emp = data["employee"]
-            cost = data["cost"]
-
-            # Apply min_cost filter
-            if min_cost is not None and float(cost) < min_cost:
-                continue
-
-            costs_list.append(float(cost))
-
+                for provider_name, license_type, monthly_cost in shown_licenses.get(emp.id, [])
+            ]
             employees.append(
                 EmployeeCost(
-                    employee_id=emp_id,
+                    employee_id=str(emp.id),
                     employee_name=emp.full_name,
                     employee_email=emp.email,
                     department=emp.department,
                     status=emp.status,
-                    license_count=len(data["licenses"]),
+                    license_count=license_count,
                     total_monthly_cost=round(cost, 2),
-                    licenses=data["licenses"],
+                    licenses=licenses,
                 )
             )
 
-        # Sort by cost descending
-        employees.sort(key=lambda x: x.total_monthly_cost, reverse=True)
-
         # Calculate statistics (based on filtered results)
-        total_cost = sum(e.total_monthly_cost for e in employees)
-        avg_cost = total_cost / len(employees) if employees else Decimal("0")
+        total_cost = sum((round(cost, 2) for _, _, cost in totals), Decimal("0"))
+        avg_cost = total_cost / len(totals) if totals else Decimal("0")
         median_cost = Decimal(str(statistics.median(costs_list))) if costs_list else Decimal("0")
         max_employee = employees[0].employee_name if employees else None
 
-        # Limit results
-        employees = employees[:limit]
-
         return CostsByEmployeeReport(
             total_employees=len(employees),
             total_monthly_cost=round(total_cost, 2),
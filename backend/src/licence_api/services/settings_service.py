@@ -12,6 +12,7 @@ from licence_api.repositories.provider_repository import ProviderRepository
 from licence_api.repositories.settings_repository import SettingsRepository
 from licence_api.repositories.user_repository import UserRepository
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
 from licence_api.services.notification_service import NotificationService
 
 
@@ -220,6 +221,8 @@ class SettingsService:
                 details={"old_domains": old_domains, "new_domains": normalized_domains},
             )
 
+        # External license counts of all providers depend on the domains
+        await DashboardAggregateService(self.session).refresh_licenses()
         await self.session.commit()
         return normalized_domains
 
@@ -0,0 +1,391 @@
+"""Sync job service for running provider syncs as background jobs.
+
+A sync job is created by the API, queued on the APScheduler instance in
+tasks/scheduler.py and run there by execute_sync_job. Progress is collected by
+SyncJobProgress and written to the job row in batches; clients poll the job or
+follow it as a Server-Sent Events stream. Cancellation is requested on the row
+and picked up by the runner at its next progress write.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from licence_api.config import get_settings
+from licence_api.exceptions import SyncJobAlreadyActiveError, SyncJobNotFoundError
+from licence_api.models.domain.admin_user import AdminUser
+from licence_api.models.dto.sync_job import SyncJobListResponse, SyncJobResponse
+from licence_api.repositories.provider_repository import ProviderRepository
+from licence_api.repositories.sync_job_repository import SyncJobRepository
+from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
+from licence_api.services.cache_service import get_cache_service
+from licence_api.services.sync_service import SyncCancelledError, SyncService
+from licence_api.utils.secure_logging import log_error
+
+logger = logging.getLogger(__name__)
+
+# Statuses of jobs that will not change anymore
+TERMINAL_SYNC_JOB_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Seconds between job reads of an event stream
+EVENT_POLL_INTERVAL_SECONDS = 1.0
+# Seconds without events after which a stream sends a keep-alive comment
+EVENT_KEEPALIVE_SECONDS = 15.0
+
+
+class SyncJobProgress:
+    """Progress receiver for a running sync job.
+
+    Counters reported by the sync are kept in memory and written to the job
+    row at most once per flush interval, so that checkpoints are cheap. Each
+    write also reads the job's cancellation flag; once it is set, the next
+    checkpoint raises SyncCancelledError.
+    """
+
+    def __init__(self, job_id: UUID, flush_interval: float) -> None:
+        """Initialize progress for a job.
+
+        Args:
+            job_id: Sync job UUID
+            flush_interval: Minimum seconds between progress writes
+        """
+        self.job_id = job_id
+        self.flush_interval = flush_interval
+        self.providers: dict[str, dict[str, Any]] = {}
+        self.completed = 0
+        self.failed = 0
+        self.cancel_requested = False
+        self._flushed_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def provider_started(self, provider_name: str) -> None:
+        """Record that a provider sync started."""
+        self.providers[provider_name] = {"status": "running"}
+        await self._flush_due()
+
+    async def checkpoint(self, provider_name: str, **counters: Any) -> None:
+        """Record progress counters of a running provider sync."""
+        self.providers.setdefault(provider_name, {"status": "running"}).update(counters)
+        await self._flush_due()
+
+    async def provider_finished(
+        self, provider_name: str, result: dict[str, Any], failed: bool = False
+    ) -> None:
+        """Record the result of a finished provider sync."""
+        self.providers[provider_name] = {
+            "status": "failed" if failed else "completed",
+            "result": result,
+        }
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+        await self.flush()
+
+    async def _flush_due(self) -> None:
+        """Write progress if the flush interval has passed.
+
+        Raises:
+            SyncCancelledError: If cancellation of the job was requested
+        """
+        if time.monotonic() - self._flushed_at >= self.flush_interval:
+            await self.flush(only_if_due=True)
+        if self.cancel_requested:
+            raise SyncCancelledError(f"Sync job {self.job_id} cancelled")
+
+    async def flush(self, only_if_due: bool = False) -> None:
+        """Write the current progress to the job row.
+
+        Args:
+            only_if_due: Skip the write if another task wrote within the interval
+        """
+        from licence_api.database import async_session_maker
+
+        async with self._lock:
+            if only_if_due and time.monotonic() - self._flushed_at < self.flush_interval:
+                return
+            async with async_session_maker() as session:
+                cancel_requested = await SyncJobRepository(session).save_progress(
+                    self.job_id,
+                    progress=json.loads(json.dumps(self.providers, default=str)),
+                    completed_providers=self.completed,
+                    failed_providers=self.failed,
+                )
+                await session.commit()
+            self._flushed_at = time.monotonic()
+            self.cancel_requested = self.cancel_requested or cancel_requested
+
+
+async def execute_sync_job(job_id: UUID) -> None:
+    """Run a pending sync job to completion.
+
+    Called by the scheduler once a job slot is free. Each provider is synced
+    in its own transaction (see SyncService.sync_provider_isolated); a
+    cancelled job rolls back the providers still running and skips the rest.
+
+    Args:
+        job_id: Sync job UUID
+    """
+    from licence_api.database import async_session_maker
+
+    settings = get_settings()
+
+    async with async_session_maker() as session:
+        job_repo = SyncJobRepository(session)
+        job = await job_repo.get_by_id(job_id)
+        if job is None or job.status != "pending":
+            return
+        if job.cancel_requested:
+            await job_repo.update(job_id, status="cancelled", completed_at=datetime.now(UTC))
+            await session.commit()
+            return
+
+        provider_repo = ProviderRepository(session)
+        if job.provider_id is not None:
+            provider = await provider_repo.get_by_id(job.provider_id)
+            providers = [provider] if provider is not None else []
+        else:
+            providers = await provider_repo.get_enabled()
+
+        await job_repo.update(
+            job_id,
+            status="running",
+            started_at=datetime.now(UTC),
+            total_providers=len(providers),
+        )
+        await session.commit()
+
+        progress = SyncJobProgress(job_id, settings.sync_job_progress_interval_seconds)
+        service = SyncService(session)
+        service.progress = progress
+        status = "completed"
+        error_message = None
+        try:
+            if job.provider_id is not None:
+                if not providers:
+                    raise ValueError(f"Provider not found: {job.provider_id}")
+                await service.sync_provider_isolated(
+                    providers[0].id, providers[0].name, full_resync=job.full_resync
+                )
+            else:
+                await service.sync_all_providers(
+                    max_concurrency=settings.sync_max_concurrency,
+                    full_resync=job.full_resync,
+                )
+            await progress.flush()
+            if progress.cancel_requested:
+                status = "cancelled"
+        except Exception as e:
+            log_error(logger, f"Sync job {job_id} failed", e)
+            status = "failed"
+            error_message = "Sync operation failed"
+
+        await job_repo.update(
+            job_id,
+            status=status,
+            error_message=error_message,
+            completed_at=datetime.now(UTC),
+        )
+        await session.commit()
+        logger.info(f"Sync job {job_id} {status}")
+
+    # Invalidate the caches depending on data changed by the committed providers
+    cache = await get_cache_service()
+    await cache.invalidate_changes(service.change_set)
+
+
+class SyncJobService:
+    """Service for creating, observing and cancelling sync jobs."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        """Initialize service with database session."""
+        self.session = session
+        self.job_repo = SyncJobRepository(session)
+        self.provider_repo = ProviderRepository(session)
+        self.audit_service = AuditService(session)
+
+    async def create_job(
+        self,
+        user: AdminUser,
+        provider_id: UUID | None = None,
+        full_resync: bool = False,
+        request: Request | None = None,
+    ) -> SyncJobResponse:
+        """Create a sync job and queue it for execution.
+
+        The job is committed before it is queued, so the runner can load it.
+
+        Args:
+            user: AdminUser starting the job
+            provider_id: Provider to sync, or None for all enabled providers
+            full_resync: Force a full resync of HRIS providers
+            request: HTTP request for audit logging
+
+        Returns:
+            Created sync job
+
+        Raises:
+            ValueError: If the provider does not exist
+            SyncJobAlreadyActiveError: If a job for the same providers is active
+        """
+        from licence_api.tasks.scheduler import enqueue_sync_job
+
+        if provider_id is not None and await self.provider_repo.get_by_id(provider_id) is None:
+            raise ValueError(f"Provider not found: {provider_id}")
+
+        active = await self.job_repo.get_active(provider_id)
+        if active is not None:
+            raise SyncJobAlreadyActiveError(str(active.id))
+
+        job = await self.job_repo.create(
+            provider_id=provider_id,
+            full_resync=full_resync,
+            status="pending",
+            progress={},
+            created_by=user.id,
+        )
+
+        await self.audit_service.log(
+            action=AuditAction.PROVIDER_SYNC,
+            resource_type=ResourceType.PROVIDER,
+            resource_id=provider_id,
+            user=user,
+            request=request,
+            details={
+                "job_id": str(job.id),
+                "scope": "single" if provider_id else "all",
+                "full_resync": full_resync,
+            },
+        )
+        await self.session.commit()
+
+        if not enqueue_sync_job(job.id):
+            job = await self.job_repo.update(
+                job.id,
+                status="failed",
+                error_message="Background scheduler is not running",
+                completed_at=datetime.now(UTC),
+            )
+            await self.session.commit()
+
+        return SyncJobResponse.model_validate(job)
+
+    async def get_job(self, job_id: UUID) -> SyncJobResponse:
+        """Get a sync job.
+
+        Args:
+            job_id: Sync job UUID
+
+        Returns:
+            Sync job
+
+        Raises:
+            SyncJobNotFoundError: If the job does not exist
+        """
+        job = await self.job_repo.get_by_id(job_id)
+        if job is None:
+            raise SyncJobNotFoundError(str(job_id))
+        return SyncJobResponse.model_validate(job)
+
+    async def list_jobs(self, limit: int = 20) -> SyncJobListResponse:
+        """List the most recent sync jobs.
+
+        Args:
+            limit: Maximum number of jobs
+
+        Returns:
+            Sync jobs, newest first
+        """
+        jobs = await self.job_repo.get_recent(limit)
+        return SyncJobListResponse(items=[SyncJobResponse.model_validate(job) for job in jobs])
+
+    async def cancel_job(
+        self,
+        job_id: UUID,
+        user: AdminUser,
+        request: Request | None = None,
+    ) -> SyncJobResponse:
+        """Request cancellation of a sync job.
+
+        Running providers are rolled back at their next progress checkpoint;
+        cancelling a finished job has no effect.
+
+        Args:
+            job_id: Sync job UUID
+            user: AdminUser cancelling the job
+            request: HTTP request for audit logging
+
+        Returns:
+            Sync job
+
+        Raises:
+            SyncJobNotFoundError: If the job does not exist
+        """
+        job = await self.job_repo.get_by_id(job_id)
+        if job is None:
+            raise SyncJobNotFoundError(str(job_id))
+
+        if await self.job_repo.request_cancel(job_id):
+            await self.audit_service.log(
+                action=AuditAction.PROVIDER_SYNC,
+                resource_type=ResourceType.PROVIDER,
+                resource_id=job.provider_id,
+                user=user,
+                request=request,
+                details={"job_id": str(job_id), "cancel_requested": True},
+            )
+            await self.session.commit()
+            await self.session.refresh(job)
+
+        return SyncJobResponse.model_validate(job)
+
+    async def stream_events(
+        self,
+        job_id: UUID,
+        request: Request | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream the progress of a sync job as Server-Sent Events.
+
+        Sends a "progress" event whenever the job changed and a final "done"
+        event once it finished. The job is read in a short-lived session per
+        poll, so an open stream does not hold a database connection.
+
+        Args:
+            job_id: Sync job UUID
+            request: HTTP request, to stop when the client disconnects
+
+        Yields:
+            Server-Sent Events messages
+        """
+        from licence_api.database import async_session_maker
+
+        last_payload = None
+        last_sent = time.monotonic()
+        while True:
+            async with async_session_maker() as session:
+                job = await SyncJobRepository(session).get_by_id(job_id)
+            if job is None:
+                return
+
+            payload = SyncJobResponse.model_validate(job).model_dump_json()
+            finished = job.status in TERMINAL_SYNC_JOB_STATUSES
+            if payload != last_payload:
+                event = "done" if finished else "progress"
+                yield f"event: {event}\ndata: {payload}\n\n"
+                last_payload = payload
+                last_sent = time.monotonic()
+            elif time.monotonic() - last_sent >= EVENT_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                last_sent = time.monotonic()
+
+            if finished or (request is not None and await request.is_disconnected()):
+                return
+            await asyncio.sleep(EVENT_POLL_INTERVAL_SECONDS)
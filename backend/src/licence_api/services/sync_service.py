@@ -6,22 +6,36 @@ Architecture Note (MVC-06):
 """
 
 import asyncio
+import contextlib
+import hashlib
+import json
 import logging
-from datetime import UTC, datetime
-from decimal import Decimal
-from typing import Any
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from decimal import ROUND_HALF_UP, Decimal
+from pathlib import Path
+from typing import Any, Protocol
 from uuid import UUID
 
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from licence_api.constants.paths import AVATAR_DIR
+from licence_api.config import get_settings
+from licence_api.constants.paths import AVATAR_DIR, AVATAR_MANIFEST_PATH
 from licence_api.middleware.error_handler import sanitize_error_for_audit
 from licence_api.models.domain.admin_user import AdminUser
 from licence_api.models.domain.provider import ProviderName, SyncStatus
+from licence_api.models.domain.sync import SyncChangeSet
+from licence_api.providers.base import ProviderRateLimitError
 from licence_api.repositories.admin_account_pattern_repository import AdminAccountPatternRepository
 from licence_api.repositories.employee_repository import EmployeeRepository
-from licence_api.repositories.license_repository import LicenseRepository
+from licence_api.repositories.license_repository import (
+    SYNC_COLUMNS,
+    SYNC_CONTENT_COLUMNS,
+    LicenseRepository,
+)
 from licence_api.repositories.provider_repository import ProviderRepository
 from licence_api.repositories.service_account_license_type_repository import (
     ServiceAccountLicenseTypeRepository,
@@ -33,12 +47,165 @@ from licence_api.repositories.settings_repository import SettingsRepository
 from licence_api.security.encryption import get_encryption_service
 from licence_api.services.audit_service import AuditAction, AuditService, ResourceType
 from licence_api.services.cache_service import get_cache_service
-from licence_api.services.matching_service import MatchingService
+from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
+from licence_api.services.matching_engine import FuzzyMatchEngine
+from licence_api.services.matching_service import MatchingService, MatchRequest
 from licence_api.utils.pattern_matcher import PatternMatcher
+from licence_api.utils.rate_limiter import AdaptiveTokenBucket
 from licence_api.utils.secure_logging import log_error, log_warning
 
 logger = logging.getLogger(__name__)
 
+# Employees processed between two progress checkpoints of an HRIS sync
+HRIS_PROGRESS_BATCH_SIZE = 500
+
+# Account flag columns that a sync only ever sets, never clears
+_ACCOUNT_FLAG_DEFAULTS: dict[str, Any] = {
+    "is_service_account": False,
+    "service_account_name": None,
+    "service_account_owner_id": None,
+    "is_admin_account": False,
+    "admin_account_name": None,
+    "admin_account_owner_id": None,
+}
+_ACCOUNT_FLAG_COLUMNS = tuple(_ACCOUNT_FLAG_DEFAULTS)
+
+# Columns compared to decide whether a synced license changed. Provider content is
+# compared through sync_fingerprint; synced_at always differs.
+_COMPARED_COLUMNS = tuple(
+    column
+    for column in SYNC_COLUMNS
+    if column not in SYNC_CONTENT_COLUMNS and column != "synced_at"
+)
+
+
+# Provider config key holding the HRIS incremental sync state
+HRIS_SYNC_STATE_KEY = "hris_sync_state"
+
+# Incremental HRIS syncs re-request this much before the high-water mark to
+# tolerate clock skew between us and the HRIS
+HRIS_WATERMARK_OVERLAP = timedelta(minutes=5)
+
+# Employee fields written by HRIS syncs, compared to skip unchanged employees
+_HRIS_EMPLOYEE_FIELDS = (
+    "email",
+    "full_name",
+    "department",
+    "status",
+    "start_date",
+    "termination_date",
+    "manager_email",
+)
+
+
+def _load_avatar_manifest() -> dict[str, dict[str, Any]]:
+    """Load the avatar manifest, or an empty one if missing or unreadable."""
+    try:
+        return json.loads(AVATAR_MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_avatar_manifest(manifest: dict[str, dict[str, Any]]) -> None:
+    """Write the avatar manifest."""
+    _write_file_atomic(AVATAR_MANIFEST_PATH, json.dumps(manifest).encode())
+
+
+def _write_file_atomic(path: Path, data: bytes) -> None:
+    """Write a file via a temporary file so readers never see partial content."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def _content_fingerprint(row: dict[str, Any]) -> str:
+    """Compute a stable SHA-256 fingerprint of a license's provider content."""
+    content = {column: row[column] for column in SYNC_CONTENT_COLUMNS}
+    canonical = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _round_cost(monthly_cost: Any) -> Decimal | None:
+    """Round a monthly cost to the precision stored in licenses.monthly_cost."""
+    if monthly_cost is None:
+        return None
+    return Decimal(str(monthly_cost)).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+
+
+async def _prefetch_pages(
+    pages: AsyncIterator[list[dict[str, Any]]],
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Iterate over pages while the next page is already being fetched.
+
+    Args:
+        pages: Provider page iterator (see BaseProvider.iter_licenses)
+
+    Yields:
+        The pages of the iterator, in order
+    """
+    next_page = asyncio.ensure_future(anext(pages, None))
+    try:
+        while (page := await next_page) is not None:
+            next_page = asyncio.ensure_future(anext(pages, None))
+            yield page
+    finally:
+        if not next_page.done():
+            next_page.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await next_page
+
+
+@dataclass(slots=True)
+class _LicenseSyncState:
+    """Per-provider inputs and running totals of a paged license sync."""
+
+    provider_id: UUID
+    provider_type: str | None
+    synced_at: datetime
+    # Stored sync state of the provider's licenses, keyed by external_user_id
+    existing_rows: dict[str, dict[str, Any]]
+    matching_service: MatchingService
+    company_domains: list[str]
+    pattern_matcher: PatternMatcher
+    pricing_config: dict[str, Any]
+    package_monthly_cost: Decimal | None
+    package_currency: str
+    # Started fuzzy scoring pool shared by all pages (None = score inline)
+    fuzzy_engine: FuzzyMatchEngine | None = None
+    seen_external_ids: set[str] = field(default_factory=set)
+    # Previous and new assignees of written rows
+    assignee_ids: set[UUID | None] = field(default_factory=set)
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    processed: int = 0
+    written: int = 0
+
+
+class SyncCancelledError(Exception):
+    """Raised at a progress checkpoint when the sync job was cancelled."""
+
+
+class SyncProgress(Protocol):
+    """Receives the progress of a sync run (implemented by SyncJobProgress).
+
+    Each method may raise SyncCancelledError to stop the sync at that point.
+    """
+
+    async def provider_started(self, provider_name: str) -> None:
+        """Record that a provider sync started."""
+        ...
+
+    async def checkpoint(self, provider_name: str, **counters: Any) -> None:
+        """Record progress counters of a running provider sync."""
+        ...
+
+    async def provider_finished(
+        self, provider_name: str, result: dict[str, Any], failed: bool = False
+    ) -> None:
+        """Record the result of a finished provider sync."""
+        ...
+
 
 class SyncService:
     """Service for synchronizing data from providers."""
@@ -54,16 +221,29 @@ class SyncService:
         self.admin_account_pattern_repo = AdminAccountPatternRepository(session)
         self.encryption = get_encryption_service()
         self.audit_service = AuditService(session)
+        # Data changed by syncs run through this service, for cache invalidation
+        self.change_set = SyncChangeSet()
+        # Progress receiver of a sync job, if the sync runs as one
+        self.progress: SyncProgress | None = None
+
+    async def _checkpoint(self, provider_name: str, **counters: Any) -> None:
+        """Report progress of the running provider sync, if a receiver is set.
 
-    def _update_match_fields_if_better(
+        Raises:
+            SyncCancelledError: If the sync job was cancelled
+        """
+        if self.progress is not None:
+            await self.progress.checkpoint(provider_name, **counters)
+
+    def _merge_match_fields(
         self,
-        license_orm: Any,
+        existing: dict[str, Any] | None,
         suggested_employee_id: UUID | None,
         match_confidence: float | None,
         match_method: str | None,
         match_status: str | None,
-    ) -> None:
-        """Update match fields only if the new match is better than existing.
+    ) -> dict[str, Any]:
+        """Merge new match fields with the stored ones, keeping the better match.
 
         Preserves existing suggestions if:
         - The user has manually reviewed the match (match_reviewed_at is set)
@@ -71,51 +251,81 @@ class SyncService:
         - There's an existing suggestion but no new one
 
         Args:
-            license_orm: The license ORM object to update
+            existing: Stored license row (column mapping) or None for new licenses
             suggested_employee_id: New suggested employee ID
             match_confidence: New match confidence
             match_method: New match method
             match_status: New match status
+
+        Returns:
+            Dict with the match columns to store
         """
+        new_fields = {
+            "suggested_employee_id": suggested_employee_id,
+            "match_confidence": match_confidence,
+            "match_method": match_method,
+            "match_status": match_status,
+        }
+        if existing is None:
+            return new_fields
+
+        existing_fields = {column: existing[column] for column in new_fields}
+
         # If user has manually reviewed this match, don't overwrite
-        if license_orm.match_reviewed_at is not None:
-            return
+        if existing["match_reviewed_at"] is not None:
+            return existing_fields
 
         # If there's no new suggestion
         if suggested_employee_id is None:
             # Keep existing suggestion if present, but update confidence/status
             # to reflect that we tried to match again
-            if license_orm.suggested_employee_id is None:
+            if existing["suggested_employee_id"] is None:
                 # No existing suggestion either, update all fields
-                license_orm.match_confidence = match_confidence
-                license_orm.match_method = match_method
-                license_orm.match_status = match_status
+                return new_fields
             # else: keep existing suggestion unchanged
-            return
+            return existing_fields
 
         # There's a new suggestion - check if it's better than existing
-        existing_confidence = license_orm.match_confidence or 0.0
+        existing_confidence = existing["match_confidence"] or 0.0
         new_confidence = match_confidence or 0.0
 
         # Update if: no existing suggestion, or new confidence is higher
-        if license_orm.suggested_employee_id is None or new_confidence > existing_confidence:
-            license_orm.suggested_employee_id = suggested_employee_id
-            license_orm.match_confidence = match_confidence
-            license_orm.match_method = match_method
-            license_orm.match_status = match_status
+        if existing["suggested_employee_id"] is None or new_confidence > existing_confidence:
+            return new_fields
+        return existing_fields
 
-    async def sync_all_providers(self) -> dict[str, Any]:
+    async def sync_all_providers(
+        self,
+        max_concurrency: int = 1,
+        full_resync: bool = False,
+    ) -> dict[str, Any]:
         """Sync all enabled providers.
 
+        With max_concurrency > 1, providers are synced in parallel, each in its own
+        database session (see _sync_providers_concurrently). Otherwise providers
+        are synced one after another in this service's session. Syncs reporting
+        to a progress receiver always use isolated sessions, so that a cancelled
+        provider sync can be rolled back on its own.
+
+        Args:
+            max_concurrency: Maximum number of providers synced at the same time
+            full_resync: Force a full resync of HRIS providers
+
         Returns:
-            Dict with sync results
+            Dict with sync results keyed by provider name, each including
+            the sync duration in seconds
         """
         providers = await self.provider_repo.get_enabled()
+
+        if max_concurrency > 1 or self.progress is not None:
+            return await self._sync_providers_concurrently(providers, max_concurrency, full_resync)
+
         results = {}
 
         for provider in providers:
+            started = time.perf_counter()
             try:
-                result = await self.sync_provider(provider.id)
+                result = await self.sync_provider(provider.id, full_resync=full_resync)
                 results[provider.name] = result
             except Exception as e:
                 log_error(logger, f"Error syncing provider {provider.name}", e)
@@ -124,14 +334,116 @@ class SyncService:
                     provider.id,
                     SyncStatus.FAILED,
                 )
+            results[provider.name]["duration_seconds"] = round(time.perf_counter() - started, 3)
 
         return results
 
-    async def sync_provider(self, provider_id: UUID) -> dict[str, Any]:
+    async def _sync_providers_concurrently(
+        self,
+        providers: list[Any],
+        max_concurrency: int,
+        full_resync: bool = False,
+    ) -> dict[str, Any]:
+        """Sync providers in parallel with isolated sessions.
+
+        Each provider runs in its own AsyncSession and transaction, so a failing
+        provider is rolled back without affecting the others. HRIS providers are
+        synced first and sequentially because they write the shared employee
+        table that license matching reads; license providers only write their
+        own rows and run in parallel, bounded by max_concurrency.
+
+        Args:
+            providers: Enabled provider ORM objects
+            max_concurrency: Maximum number of providers synced at the same time
+            full_resync: Force a full resync of HRIS providers
+
+        Returns:
+            Dict with sync results keyed by provider name
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def sync_isolated(provider_id: UUID, provider_name: str) -> dict[str, Any]:
+            async with semaphore:
+                return await self.sync_provider_isolated(provider_id, provider_name, full_resync)
+
+        hris_names = {ProviderName.HIBOB, ProviderName.PERSONIO}
+        hris_providers = [(p.id, p.name) for p in providers if p.name in hris_names]
+        license_providers = [(p.id, p.name) for p in providers if p.name not in hris_names]
+
+        results: dict[str, Any] = {}
+        for provider_id, provider_name in hris_providers:
+            results[provider_name] = await sync_isolated(provider_id, provider_name)
+
+        license_results = await asyncio.gather(
+            *(sync_isolated(provider_id, name) for provider_id, name in license_providers)
+        )
+        for (_, provider_name), result in zip(license_providers, license_results, strict=True):
+            results[provider_name] = result
+
+        return results
+
+    async def sync_provider_isolated(
+        self,
+        provider_id: UUID,
+        provider_name: str,
+        full_resync: bool = False,
+    ) -> dict[str, Any]:
+        """Sync a single provider in its own session and transaction.
+
+        Failures are rolled back and recorded as a failed sync instead of being
+        raised. A cancelled sync is rolled back entirely, leaving the provider's
+        data and sync status as they were. Changes are merged into this
+        service's change set, and progress is reported to its receiver.
+
+        Args:
+            provider_id: Provider UUID
+            provider_name: Provider name, for logging and progress
+            full_resync: Force a full resync of HRIS providers
+
+        Returns:
+            Dict with sync results, including the sync duration in seconds
+        """
+        from licence_api.database import async_session_maker
+
+        started = time.perf_counter()
+        failed = False
+        async with async_session_maker() as session:
+            service = SyncService(session)
+            service.progress = self.progress
+            try:
+                if self.progress is not None:
+                    await self.progress.provider_started(provider_name)
+                result = await service.sync_provider(provider_id, full_resync=full_resync)
+                await session.commit()
+                self.change_set.merge(service.change_set)
+            except SyncCancelledError:
+                logger.info(f"Sync of provider {provider_name} cancelled")
+                await session.rollback()
+                result = {"cancelled": True}
+            except Exception as e:
+                log_error(logger, f"Error syncing provider {provider_name}", e)
+                await session.rollback()
+                result = {"error": "Sync operation failed"}
+                failed = True
+                await service.provider_repo.update_sync_status(
+                    provider_id,
+                    SyncStatus.FAILED,
+                )
+                await session.commit()
+                self.change_set.provider_ids.add(provider_id)
+        result["duration_seconds"] = round(time.perf_counter() - started, 3)
+
+        if self.progress is not None and not result.get("cancelled"):
+            await self.progress.provider_finished(provider_name, result, failed=failed)
+        return result
+
+    async def sync_provider(self, provider_id: UUID, full_resync: bool = False) -> dict[str, Any]:
         """Sync a single provider.
 
         Args:
             provider_id: Provider UUID
+            full_resync: For HRIS providers, fetch all employees instead of
+                only those changed since the last sync
 
         Returns:
             Dict with sync results
@@ -140,6 +452,8 @@ class SyncService:
         if provider is None:
             raise ValueError(f"Provider not found: {provider_id}")
 
+        self.change_set.provider_ids.add(provider_id)
+
         # Update status to in progress
         await self.provider_repo.update_sync_status(
             provider_id,
@@ -187,9 +501,9 @@ class SyncService:
 
             # Sync based on provider type
             if provider.name == ProviderName.HIBOB:
-                result = await self._sync_hibob(provider_impl)
+                result = await self._sync_hibob(provider_impl, provider_id, full_resync)
             elif provider.name == ProviderName.PERSONIO:
-                result = await self._sync_personio(provider_impl)
+                result = await self._sync_personio(provider_impl, provider_id, full_resync)
             else:
                 result = await self._sync_license_provider(provider_impl, provider_id)
 
@@ -202,6 +516,9 @@ class SyncService:
 
             return result
 
+        except SyncCancelledError:
+            # The caller rolls back, which also reverts the in-progress status
+            raise
         except Exception as e:
             log_error(logger, f"Error syncing provider {provider.name}", e)
             await self.provider_repo.update_sync_status(
@@ -278,91 +595,214 @@ class SyncService:
 
         return provider_class(credentials)
 
+    def _incremental_since(
+        self,
+        state: dict[str, Any],
+        now: datetime,
+        full_resync: bool,
+    ) -> datetime | None:
+        """Get the change time to sync HRIS employees from.
+
+        Args:
+            state: Stored HRIS sync state of the provider
+            now: Start time of this sync
+            full_resync: Whether a full resync was requested
+
+        Returns:
+            Time to request changes since, or None for a full resync
+        """
+        if full_resync or not state.get("high_water_mark") or not state.get("last_full_sync_at"):
+            return None
+
+        last_full_sync_at = datetime.fromisoformat(state["last_full_sync_at"])
+        full_resync_interval = timedelta(hours=get_settings().hris_full_resync_interval_hours)
+        if now - last_full_sync_at >= full_resync_interval:
+            return None
+
+        return datetime.fromisoformat(state["high_water_mark"]) - HRIS_WATERMARK_OVERLAP
+
     async def _sync_hris_employees(
         self,
         provider,
         provider_name: str,
+        provider_id: UUID,
         sync_avatars: bool = False,
+        full_resync: bool = False,
     ) -> dict[str, Any]:
         """Sync employees from HRIS provider (HiBob or Personio).
 
-        Uses batch loading to avoid N+1 queries when checking for existing employees.
+        Syncs are incremental where the HRIS supports it: only employees
+        changed since the provider's stored high-water mark are requested.
+        A full resync runs on the first sync, when requested, and after
+        hris_full_resync_interval_hours, and also whenever the HRIS has no
+        change feed.
+
+        In both modes, employees whose HRIS data did not change are not
+        rewritten. Incremental syncs resolve managers only for affected
+        employees; full resyncs resolve all manager relationships.
 
         Args:
             provider: HRIS provider instance
             provider_name: Name for result dict (e.g., "hibob", "personio")
+            provider_id: Provider UUID (holds the sync state in its config)
             sync_avatars: Whether to sync avatars after employee data
+            full_resync: Force a full resync
 
         Returns:
             Dict with sync results
         """
-        employees = await provider.fetch_employees()
+        provider_orm = await self.provider_repo.get_by_id(provider_id)
+        state = (provider_orm.config or {}).get(HRIS_SYNC_STATE_KEY, {}) if provider_orm else {}
+
+        started_at = datetime.now(UTC)
+        since = self._incremental_since(state, started_at, full_resync)
+        employees = None
+        if since is not None:
+            employees = await provider.fetch_employees_changed_since(since)
+        incremental = employees is not None
+        if employees is None:
+            employees = await provider.fetch_employees()
+        await self._checkpoint(provider_name, phase="employees", processed=0, total=len(employees))
+
         synced_at = datetime.now(UTC)
         created = 0
         updated = 0
+        unchanged_ids: list[UUID] = []
+        # Employees whose own manager must be resolved
+        affected_ids: list[UUID] = []
+        # Emails whose direct reports must be resolved
+        affected_manager_emails: set[str] = set()
+        # Departments that existing employees left or joined; their licenses'
+        # dashboard aggregates move with them
+        moved_departments: set[str | None] = set()
 
         # Batch load all existing employees by hibob_id to avoid N+1 queries
         hibob_ids = [emp_data["hibob_id"] for emp_data in employees]
         existing_employees = await self.employee_repo.get_by_hibob_ids(hibob_ids)
 
-        for emp_data in employees:
+        for index, emp_data in enumerate(employees):
+            if index and index % HRIS_PROGRESS_BATCH_SIZE == 0:
+                await self._checkpoint(
+                    provider_name, phase="employees", processed=index, total=len(employees)
+                )
             existing = existing_employees.get(emp_data["hibob_id"])
-            await self.employee_repo.upsert(
+            fields = {field: emp_data.get(field) for field in _HRIS_EMPLOYEE_FIELDS}
+            if existing and all(getattr(existing, f) == v for f, v in fields.items()):
+                unchanged_ids.append(existing.id)
+                continue
+
+            # Compared before the upsert, which updates existing in place
+            manager_changed = existing is None or existing.manager_email != fields["manager_email"]
+            email_changed = existing is None or existing.email != fields["email"]
+            if existing and existing.department != fields["department"]:
+                moved_departments.update((existing.department, fields["department"]))
+            employee = await self.employee_repo.upsert(
                 hibob_id=emp_data["hibob_id"],
-                email=emp_data["email"],
-                full_name=emp_data["full_name"],
-                department=emp_data.get("department"),
-                status=emp_data["status"],
-                start_date=emp_data.get("start_date"),
-                termination_date=emp_data.get("termination_date"),
                 synced_at=synced_at,
-                manager_email=emp_data.get("manager_email"),
+                existing=existing,
+                **fields,
             )
+            self.change_set.employee_ids.add(employee.id)
+            self.change_set.departments.update(
+                department
+                for department in (existing.department if existing else None, employee.department)
+                if department
+            )
+            if manager_changed:
+                affected_ids.append(employee.id)
+            if email_changed:
+                affected_manager_emails.add(fields["email"])
             if existing:
                 updated += 1
             else:
                 created += 1
 
-        # Resolve manager relationships after all employees are synced
-        managers_resolved = await self.employee_repo.resolve_manager_ids()
+        await self.employee_repo.touch_synced_at(unchanged_ids, synced_at)
+
+        offboarded: dict[UUID, str | None] = {}
+        if incremental:
+            # Terminations that took effect without a change in the HRIS
+            offboarded = await self.employee_repo.offboard_terminated(synced_at.date())
+            self.change_set.employee_ids.update(offboarded)
+            self.change_set.departments.update(d for d in offboarded.values() if d)
+            managers_resolved = await self.employee_repo.resolve_manager_ids(
+                employee_ids=affected_ids,
+                manager_emails=list(affected_manager_emails),
+            )
+        else:
+            # Resolve manager relationships after all employees are synced
+            managers_resolved = await self.employee_repo.resolve_manager_ids()
         logger.info(f"Resolved {managers_resolved} manager relationships")
 
+        if created or updated or offboarded:
+            aggregates = DashboardAggregateService(self.session)
+            await aggregates.refresh_employees()
+            if moved_departments:
+                await aggregates.refresh_licenses(departments=moved_departments)
+
+        # The next incremental sync requests changes since this sync started
+        new_state = {
+            "high_water_mark": started_at.isoformat(),
+            "last_full_sync_at": (
+                state.get("last_full_sync_at") if incremental else started_at.isoformat()
+            ),
+        }
+        if provider_orm:
+            config = {**(provider_orm.config or {}), HRIS_SYNC_STATE_KEY: new_state}
+            await self.provider_repo.update(provider_id, config=config)
+
         result: dict[str, Any] = {
             "provider": provider_name,
+            "mode": "incremental" if incremental else "full",
             "employees_created": created,
             "employees_updated": updated,
+            "employees_unchanged": len(unchanged_ids),
+            "employees_offboarded": len(offboarded),
             "total": len(employees),
             "managers_resolved": managers_resolved,
         }
 
         # Sync avatars after employee data (HiBob only)
         if sync_avatars:
+            await self._checkpoint(
+                provider_name, phase="avatars", processed=len(employees), total=len(employees)
+            )
             avatar_result = await self._sync_avatars(provider, employees)
             result["avatars"] = avatar_result
 
         return result
 
-    async def _sync_hibob(self, provider) -> dict[str, Any]:
+    async def _sync_hibob(self, provider, provider_id: UUID, full_resync: bool) -> dict[str, Any]:
         """Sync employees from HiBob.
 
         Args:
             provider: HiBob provider instance
+            provider_id: Provider UUID
+            full_resync: Force a full resync
 
         Returns:
             Dict with sync results
         """
-        return await self._sync_hris_employees(provider, "hibob", sync_avatars=True)
+        return await self._sync_hris_employees(
+            provider, "hibob", provider_id, sync_avatars=True, full_resync=full_resync
+        )
 
-    async def _sync_personio(self, provider) -> dict[str, Any]:
+    async def _sync_personio(
+        self, provider, provider_id: UUID, full_resync: bool
+    ) -> dict[str, Any]:
         """Sync employees from Personio.
 
         Args:
             provider: Personio provider instance
+            provider_id: Provider UUID
+            full_resync: Force a full resync
 
         Returns:
             Dict with sync results
         """
-        return await self._sync_hris_employees(provider, "personio", sync_avatars=False)
+        return await self._sync_hris_employees(
+            provider, "personio", provider_id, sync_avatars=False, full_resync=full_resync
+        )
 
     async def _sync_avatars(
         self,
@@ -371,10 +811,15 @@ class SyncService:
     ) -> dict[str, Any]:
         """Sync employee avatars from HiBob.
 
-        Downloads avatars with intelligent rate limiting:
-        - Base delay between requests
-        - Exponential backoff on 429 errors
-        - Batch pauses every N requests
+        Downloads avatars concurrently (avatar_sync_concurrency) through an
+        adaptive token bucket that starts at avatar_sync_rate_per_second,
+        halves its rate on 429 responses and waits for Retry-After.
+
+        A manifest records the content hash, source URL and ETag of every
+        stored avatar. Avatars checked within avatar_refresh_interval_hours
+        are skipped without a request; older ones are re-requested
+        conditionally, and files are only rewritten when their content hash
+        changed. File I/O runs in worker threads, off the event loop.
 
         Args:
             provider: HiBob provider instance
@@ -383,85 +828,100 @@ class SyncService:
         Returns:
             Dict with avatar sync results
         """
-        # Ensure avatar directory exists
-        AVATAR_DIR.mkdir(parents=True, exist_ok=True)
-
-        downloaded = 0
-        skipped = 0
-        failed = 0
-        rate_limited = 0
-
-        # Rate limiting configuration
-        base_delay = 1.0  # 1 second between requests
-        batch_size = 50  # Pause after every N requests
-        batch_pause = 30.0  # 30 second pause between batches
+        settings = get_settings()
         max_retries = 3
 
-        requests_in_batch = 0
-
-        for emp_data in employees:
-            hibob_id = emp_data["hibob_id"]
-            avatar_path = AVATAR_DIR / f"{hibob_id}.jpg"
+        # Ensure avatar directory exists
+        await asyncio.to_thread(AVATAR_DIR.mkdir, parents=True, exist_ok=True)
+        manifest = await asyncio.to_thread(_load_avatar_manifest)
 
-            # Skip if avatar already exists
-            if avatar_path.exists():
-                skipped += 1
-                continue
+        limiter = AdaptiveTokenBucket(
+            rate=settings.avatar_sync_rate_per_second,
+            capacity=settings.avatar_sync_concurrency,
+        )
+        semaphore = asyncio.Semaphore(settings.avatar_sync_concurrency)
+        refresh_before = datetime.now(UTC) - timedelta(hours=settings.avatar_refresh_interval_hours)
+        counts = {"downloaded": 0, "unchanged": 0, "skipped": 0, "failed": 0, "rate_limited": 0}
 
-            # Batch pause to avoid rate limiting
-            if requests_in_batch >= batch_size:
-                logger.info(f"Batch pause: waiting {batch_pause}s after {batch_size} requests")
-                await asyncio.sleep(batch_pause)
-                requests_in_batch = 0
-
-            # Retry loop with exponential backoff
-            for attempt in range(max_retries):
-                try:
-                    # Base delay between requests
-                    await asyncio.sleep(base_delay)
-
-                    avatar_bytes = await provider.fetch_avatar(hibob_id)
-                    requests_in_batch += 1
-
-                    if avatar_bytes:
-                        avatar_path.write_bytes(avatar_bytes)
-                        downloaded += 1
-                        if downloaded % 10 == 0:
-                            logger.info(
-                                f"Avatar progress: {downloaded} downloaded, {skipped} skipped"
-                            )
-                    else:
-                        # Could be 429 or no avatar - check if we should retry
-                        failed += 1
-                    break  # Success or definite failure, exit retry loop
-
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "429" in error_msg or "too many" in error_msg:
-                        rate_limited += 1
-                        backoff = base_delay * (2**attempt) * 10  # Exponential backoff
+        async def sync_one(hibob_id: str) -> None:
+            avatar_path = AVATAR_DIR / f"{hibob_id}.jpg"
+            entry = manifest.get(hibob_id)
+            stored = entry is not None and await asyncio.to_thread(avatar_path.exists)
+
+            # Skip avatars checked recently
+            if stored and datetime.fromisoformat(entry["checked_at"]) > refresh_before:
+                counts["skipped"] += 1
+                return
+
+            async with semaphore:
+                for attempt in range(max_retries):
+                    await limiter.acquire()
+                    try:
+                        result = await provider.fetch_avatar_conditional(
+                            hibob_id,
+                            source_url=entry.get("source_url") if stored else None,
+                            etag=entry.get("etag") if stored else None,
+                        )
+                    except ProviderRateLimitError as e:
+                        counts["rate_limited"] += 1
+                        limiter.on_rate_limited(e.retry_after)
                         logger.warning(
-                            f"Rate limited for {hibob_id}, waiting {backoff}s "
-                            f"(attempt {attempt + 1}/{max_retries})"
+                            f"Rate limited for {hibob_id} "
+                            f"(attempt {attempt + 1}/{max_retries}), "
+                            f"rate now {limiter.rate:.2f}/s"
                         )
-                        await asyncio.sleep(backoff)
-                        if attempt == max_retries - 1:
-                            failed += 1
-                    else:
-                        log_warning(logger, f"Failed to fetch avatar for {hibob_id}", e)
-                        failed += 1
-                        break
+                        continue
+                    limiter.on_success()
+                    break
+                else:
+                    counts["failed"] += 1
+                    return
+
+            if result is None:
+                counts["failed"] += 1
+                return
+
+            checked_at = datetime.now(UTC).isoformat()
+            if result.content is None:
+                # 304 Not Modified
+                manifest[hibob_id] = {**entry, "checked_at": checked_at}
+                counts["unchanged"] += 1
+                return
+
+            content_hash = hashlib.sha256(result.content).hexdigest()
+            if stored and entry.get("sha256") == content_hash:
+                counts["unchanged"] += 1
+            else:
+                await asyncio.to_thread(_write_file_atomic, avatar_path, result.content)
+                counts["downloaded"] += 1
+                if counts["downloaded"] % 50 == 0:
+                    logger.info(f"Avatar progress: {counts['downloaded']} downloaded")
+            manifest[hibob_id] = {
+                "sha256": content_hash,
+                "source_url": result.source_url,
+                "etag": result.etag,
+                "checked_at": checked_at,
+            }
+
+        async def sync_one_safely(hibob_id: str) -> None:
+            try:
+                await sync_one(hibob_id)
+            except Exception as e:
+                log_warning(logger, f"Failed to sync avatar for {hibob_id}", e)
+                counts["failed"] += 1
+
+        hibob_ids = list(dict.fromkeys(emp_data["hibob_id"] for emp_data in employees))
+        # Requests go through the provider's shared client and connection pool
+        await asyncio.gather(*(sync_one_safely(hibob_id) for hibob_id in hibob_ids))
+
+        await asyncio.to_thread(_save_avatar_manifest, manifest)
 
         logger.info(
-            f"Avatar sync complete: {downloaded} downloaded, {skipped} skipped, "
-            f"{failed} failed, {rate_limited} rate limited"
+            f"Avatar sync complete: {counts['downloaded']} downloaded, "
+            f"{counts['unchanged']} unchanged, {counts['skipped']} skipped, "
+            f"{counts['failed']} failed, {counts['rate_limited']} rate limited"
         )
-        return {
-            "downloaded": downloaded,
-            "skipped": skipped,
-            "failed": failed,
-            "rate_limited": rate_limited,
-        }
+        return counts
 
     async def _sync_license_provider(
         self,
@@ -477,6 +937,16 @@ class SyncService:
 
         GDPR: No private emails are stored. External matches are only suggested.
 
+        Change detection: each license gets a fingerprint of its provider content.
+        Rows whose fingerprint and derived fields (assignment, match, account flags)
+        are unchanged are not written at all, so a license's synced_at and
+        updated_at record when the sync last changed it. When licenses were last
+        seen is the provider's last_sync_at, set once per sync.
+
+        Licenses are consumed page by page from provider.iter_licenses: each
+        page is matched and written while the provider fetches the next one,
+        so the sync does not wait for (or hold) the complete license list.
+
         Args:
             provider: Provider instance
             provider_id: Provider UUID
@@ -484,13 +954,11 @@ class SyncService:
         Returns:
             Dict with sync results
         """
-        licenses = await provider.fetch_licenses()
         synced_at = datetime.now(UTC)
-        created = 0
-        updated = 0
 
         # Get provider config for pricing
         provider_orm = await self.provider_repo.get_by_id(provider_id)
+        progress_name = provider_orm.name if provider_orm else str(provider_id)
         provider_config = provider_orm.config or {} if provider_orm else {}
         pricing_config = provider_config.get("license_pricing", {})
         package_pricing = provider_config.get("package_pricing")
@@ -548,23 +1016,124 @@ class SyncService:
         svc_license_types = await self.svc_account_license_type_repo.get_all()
         pattern_matcher = PatternMatcher(svc_patterns, admin_patterns, svc_license_types)
 
+        # Preload all existing rows for this provider in one query (avoids 2+ round-trips
+        # per license); changes are then written with batched INSERT ... ON CONFLICT
+        state = _LicenseSyncState(
+            provider_id=provider_id,
+            provider_type=provider_orm.name if provider_orm else None,
+            synced_at=synced_at,
+            existing_rows=await self.license_repo.get_sync_state_by_provider(provider_id),
+            matching_service=matching_service,
+            company_domains=company_domains,
+            pattern_matcher=pattern_matcher,
+            pricing_config=pricing_config,
+            package_monthly_cost=package_monthly_cost,
+            package_currency=package_currency,
+        )
+
+        await self._checkpoint(progress_name, phase="matching", processed=0)
+        async with contextlib.AsyncExitStack() as stack:
+            # One worker pool for all pages; workers start on the first scored batch
+            max_workers = get_settings().matching_max_workers
+            if max_workers > 0:
+                state.fuzzy_engine = await stack.enter_async_context(
+                    await matching_service.create_fuzzy_engine(max_workers)
+                )
+            async for licenses in _prefetch_pages(provider.iter_licenses()):
+                await self._sync_license_page(state, licenses)
+                await self._checkpoint(progress_name, phase="matching", processed=state.processed)
+
+        # Vanished rows are left as they are
+        vanished = len(state.existing_rows.keys() - state.seen_external_ids)
+        await self.session.flush()
+
+        if state.written:
+            # Departments of both the previous and the new assignee are affected
+            state.assignee_ids.discard(None)
+            self.change_set.license_provider_ids.add(provider_id)
+            self.change_set.departments |= await self.employee_repo.get_departments_by_ids(
+                list(state.assignee_ids)
+            )
+            await DashboardAggregateService(self.session).refresh_licenses(
+                provider_ids={provider_id}
+            )
+
+        # Store provider metadata (e.g., license info) if available
+        if hasattr(provider, "get_provider_metadata"):
+            metadata = provider.get_provider_metadata()
+            if metadata:
+                provider_orm = await self.provider_repo.get_by_id(provider_id)
+                if provider_orm:
+                    config = provider_orm.config or {}
+                    config["provider_license_info"] = metadata
+                    await self.provider_repo.update(provider_id, config=config)
+
+        return {
+            "provider": provider.__class__.__name__,
+            "licenses_created": state.created,
+            "licenses_updated": state.updated,
+            "licenses_unchanged": state.unchanged,
+            "licenses_vanished": vanished,
+            "total": state.processed,
+        }
+
+    async def _sync_license_page(
+        self,
+        state: _LicenseSyncState,
+        licenses: list[dict[str, Any]],
+    ) -> None:
+        """Match and write one page of provider licenses.
+
+        Args:
+            state: Provider inputs and running totals, updated in place
+            licenses: License data dicts of the page
+        """
+        rows_by_external_id: dict[str, dict[str, Any]] = {}
+
+        # Match the page in one batch so fuzzy name scoring can run off the event loop
+        match_requests = []
         for lic_data in licenses:
-            existing = await self.license_repo.get_by_provider_and_external_id(
-                provider_id,
-                lic_data["external_user_id"],
+            # Use email field if available (JetBrains provides email separately from license ID)
+            # Fall back to external_user_id (typically an email for most providers)
+            match_identifier = lic_data.get("email") or lic_data["external_user_id"]
+
+            # Get username and display name from metadata for matching
+            # This enables matching by linked external accounts (e.g., HuggingFace username)
+            # and fuzzy name matching by display name (e.g., HuggingFace fullName)
+            metadata = lic_data.get("metadata", {})
+            match_requests.append(
+                MatchRequest(
+                    match_identifier,
+                    provider_type=state.provider_type,
+                    username=metadata.get("username") or metadata.get("hf_username"),
+                    display_name=(
+                        metadata.get("fullName")
+                        or metadata.get("fullname")
+                        or metadata.get("display_name")
+                        or metadata.get("displayName")
+                    ),
+                )
             )
+        match_results = await state.matching_service.match_licenses(
+            match_requests,
+            state.company_domains,
+            engine=state.fuzzy_engine,
+        )
+
+        for lic_data, match_result in zip(licenses, match_results, strict=True):
+            existing = state.existing_rows.get(lic_data["external_user_id"])
 
             # Apply pricing: package pricing takes precedence, then per-type pricing
             monthly_cost = lic_data.get("monthly_cost")
             currency = lic_data.get("currency", "EUR")
             license_type = lic_data.get("license_type")
 
-            if package_monthly_cost is not None:
+            if state.package_monthly_cost is not None:
                 # Package pricing: same cost for all licenses
-                monthly_cost = package_monthly_cost
-                currency = package_currency
-            elif license_type and license_type in pricing_config:
-                price_info = pricing_config[license_type]
+                monthly_cost = state.package_monthly_cost
+                currency = state.package_currency
+            elif license_type and license_type in state.pricing_config:
+                price_info = state.pricing_config[license_type]
                 cost = Decimal(price_info.get("cost", "0"))
                 billing_cycle = price_info.get("billing_cycle", "yearly")
                 currency = price_info.get("currency", "EUR")
@@ -580,31 +1149,6 @@ class SyncService:
                     # perpetual/one_time - no recurring monthly cost
                     monthly_cost = Decimal("0")
 
-            # Use matching service for employee assignment
-            # Use email field if available (JetBrains provides email separately from license ID)
-            # Fall back to external_user_id (typically an email for most providers)
-            match_identifier = lic_data.get("email") or lic_data["external_user_id"]
-
-            # Get username and display name from metadata for matching
-            # This enables matching by linked external accounts (e.g., HuggingFace username)
-            # and fuzzy name matching by display name (e.g., HuggingFace fullName)
-            metadata = lic_data.get("metadata", {})
-            username_for_matching = metadata.get("username") or metadata.get("hf_username")
-            display_name_for_matching = (
-                metadata.get("fullName")
-                or metadata.get("fullname")
-                or metadata.get("display_name")
-                or metadata.get("displayName")
-            )
-
-            match_result = await matching_service.match_license(
-                match_identifier,
-                company_domains,
-                provider_type=provider_orm.name if provider_orm else None,
-                username=username_for_matching,
-                display_name=display_name_for_matching,
-            )
-
             # Determine employee_id and match fields
             employee_id = None
             suggested_employee_id = None
@@ -618,14 +1162,18 @@ class SyncService:
                 suggested_employee_id = match_result.employee_id
 
             # Check for global service account patterns (email-based) using preloaded patterns
-            svc_match = pattern_matcher.match_service_account_email(lic_data["external_user_id"])
+            svc_match = state.pattern_matcher.match_service_account_email(
+                lic_data["external_user_id"]
+            )
             is_service_account = svc_match.matched
             service_account_name = svc_match.name
             service_account_owner_id = svc_match.owner_id
 
             # Check for license type-based service account rules if not already matched
             if not is_service_account and license_type:
-                svc_type_match = pattern_matcher.match_service_account_license_type(license_type)
+                svc_type_match = state.pattern_matcher.match_service_account_license_type(
+                    license_type
+                )
                 if svc_type_match.matched:
                     is_service_account = True
                     service_account_name = svc_type_match.name
@@ -636,81 +1184,94 @@ class SyncService:
             admin_account_name = None
             admin_account_owner_id = None
             if not is_service_account:
-                admin_match = pattern_matcher.match_admin_account_email(
+                admin_match = state.pattern_matcher.match_admin_account_email(
                     lic_data["external_user_id"]
                 )
                 is_admin_account = admin_match.matched
                 admin_account_name = admin_match.name
                 admin_account_owner_id = admin_match.owner_id
 
-            license_orm = await self.license_repo.upsert(
-                provider_id=provider_id,
-                external_user_id=lic_data["external_user_id"],
-                employee_id=employee_id if not is_service_account else None,
-                license_type=license_type,
-                status=lic_data.get("status", "active"),
-                assigned_at=lic_data.get("assigned_at"),
-                last_activity_at=lic_data.get("last_activity_at"),
-                monthly_cost=monthly_cost,
-                currency=currency,
-                metadata=lic_data.get("metadata"),
-                synced_at=synced_at,
-            )
+            row: dict[str, Any] = {
+                "provider_id": state.provider_id,
+                "external_user_id": lic_data["external_user_id"],
+                "employee_id": employee_id if not is_service_account else None,
+                "license_type": license_type,
+                "status": lic_data.get("status", "active"),
+                "assigned_at": lic_data.get("assigned_at"),
+                "last_activity_at": lic_data.get("last_activity_at"),
+                "monthly_cost": _round_cost(monthly_cost),
+                "currency": currency,
+                "metadata": lic_data.get("metadata"),
+                "synced_at": state.synced_at,
+            }
+            row["sync_fingerprint"] = _content_fingerprint(row)
+            # Flags not set by this sync keep their stored values
+            for column in _ACCOUNT_FLAG_COLUMNS:
+                row[column] = existing[column] if existing else _ACCOUNT_FLAG_DEFAULTS[column]
 
             # Update service account fields if pattern matched
             if is_service_account:
-                license_orm.is_service_account = True
-                license_orm.service_account_name = service_account_name
-                license_orm.service_account_owner_id = service_account_owner_id
+                row["is_service_account"] = True
+                row["service_account_name"] = service_account_name
+                row["service_account_owner_id"] = service_account_owner_id
                 # Clear match fields for service accounts
-                license_orm.suggested_employee_id = None
-                license_orm.match_confidence = None
-                license_orm.match_method = None
-                license_orm.match_status = None
-            elif is_admin_account:
-                # Admin accounts are personal, so they keep the employee link if matched
-                license_orm.is_admin_account = True
-                license_orm.admin_account_name = admin_account_name
-                license_orm.admin_account_owner_id = admin_account_owner_id
-                # Update match fields, preserving existing suggestions
-                self._update_match_fields_if_better(
-                    license_orm, suggested_employee_id, match_confidence, match_method, match_status
-                )
+                row["suggested_employee_id"] = None
+                row["match_confidence"] = None
+                row["match_method"] = None
+                row["match_status"] = None
             else:
+                if is_admin_account:
+                    # Admin accounts are personal, so they keep the employee link if matched
+                    row["is_admin_account"] = True
+                    row["admin_account_name"] = admin_account_name
+                    row["admin_account_owner_id"] = admin_account_owner_id
                 # Update match fields, preserving existing suggestions
-                self._update_match_fields_if_better(
-                    license_orm, suggested_employee_id, match_confidence, match_method, match_status
+                row.update(
+                    self._merge_match_fields(
+                        existing,
+                        suggested_employee_id,
+                        match_confidence,
+                        match_method,
+                        match_status,
+                    )
                 )
 
-            if existing:
-                updated += 1
+            # Providers occasionally report the same user twice; the last entry wins
+            rows_by_external_id[row["external_user_id"]] = row
+
+        rows_to_write: list[dict[str, Any]] = []
+        for external_user_id, row in rows_by_external_id.items():
+            existing = state.existing_rows.get(external_user_id)
+            if external_user_id in state.seen_external_ids:
+                # Reported again on a later page: the last entry wins, counted once
+                rows_to_write.append(row)
+            elif existing is None:
+                state.created += 1
+                rows_to_write.append(row)
+            elif any(existing[column] != row[column] for column in _COMPARED_COLUMNS):
+                state.updated += 1
+                rows_to_write.append(row)
             else:
-                created += 1
-
-        await self.session.flush()
+                state.unchanged += 1
+        state.seen_external_ids.update(rows_by_external_id)
+        state.processed += len(licenses)
+        state.written += len(rows_to_write)
 
-        # Store provider metadata (e.g., license info) if available
-        if hasattr(provider, "get_provider_metadata"):
-            metadata = provider.get_provider_metadata()
-            if metadata:
-                provider_orm = await self.provider_repo.get_by_id(provider_id)
-                if provider_orm:
-                    config = provider_orm.config or {}
-                    config["provider_license_info"] = metadata
-                    await self.provider_repo.update(provider_id, config=config)
+        # Only new and changed rows are written
+        await self.license_repo.bulk_upsert(rows_to_write)
 
-        return {
-            "provider": provider.__class__.__name__,
-            "licenses_created": created,
-            "licenses_updated": updated,
-            "total": len(licenses),
-        }
+        for row in rows_to_write:
+            state.assignee_ids.add(row["employee_id"])
+            existing = state.existing_rows.get(row["external_user_id"])
+            if existing:
+                state.assignee_ids.add(existing["employee_id"])
 
     async def trigger_sync(
         self,
         provider_id: UUID | None = None,
         user: AdminUser | None = None,
         request: Request | None = None,
+        full_resync: bool = False,
     ) -> dict[str, Any]:
         """Trigger a sync operation with audit logging and cache invalidation.
 
@@ -718,6 +1279,7 @@ class SyncService:
             provider_id: Specific provider to sync, or None for all
             user: AdminUser for audit logging
             request: HTTP request for audit logging
+            full_resync: Force a full resync of HRIS providers
 
         Returns:
             Dict with sync results
@@ -730,9 +1292,12 @@ class SyncService:
         """
         try:
             if provider_id:
-                results = await self.sync_provider(provider_id)
+                results = await self.sync_provider(provider_id, full_resync=full_resync)
             else:
-                results = await self.sync_all_providers()
+                results = await self.sync_all_providers(
+                    max_concurrency=get_settings().sync_max_concurrency,
+                    full_resync=full_resync,
+                )
 
             # Audit log success
             if user:
@@ -745,12 +1310,13 @@ class SyncService:
                     details={
                         "results": results,
                         "scope": "single" if provider_id else "all",
+                        "full_resync": full_resync,
                     },
                 )
 
-            # Invalidate caches after sync (data has changed)
+            # Invalidate the caches depending on data changed by the sync
             cache = await get_cache_service()
-            await cache.invalidate_all()
+            await cache.invalidate_changes(self.change_set)
 
             return results
 
@@ -791,6 +1357,7 @@ class SyncService:
         provider_id: UUID,
         user: AdminUser | None = None,
         request: Request | None = None,
+        full_resync: bool = False,
     ) -> dict[str, Any]:
         """Sync a specific provider with audit logging and cache invalidation.
 
@@ -798,6 +1365,7 @@ class SyncService:
             provider_id: Provider UUID to sync
             user: AdminUser for audit logging
             request: HTTP request for audit logging
+            full_resync: Force a full resync of HRIS providers
 
         Returns:
             Dict with sync results
@@ -809,7 +1377,7 @@ class SyncService:
             OSError: On OS-level errors
         """
         try:
-            results = await self.sync_provider(provider_id)
+            results = await self.sync_provider(provider_id, full_resync=full_resync)
 
             # Audit log success
             if user:
@@ -819,12 +1387,12 @@ class SyncService:
                     resource_id=provider_id,
                     user=user,
                     request=request,
-                    details={"results": results},
+                    details={"results": results, "full_resync": full_resync},
                 )
 
-            # Invalidate caches after sync (data has changed)
+            # Invalidate the caches depending on data changed by the sync
             cache = await get_cache_service()
-            await cache.invalidate_all()
+            await cache.invalidate_changes(self.change_set)
 
             return results
 
@@ -1,7 +1,9 @@
 """Background task scheduler using APScheduler."""
 
+import asyncio
 import logging
-from datetime import datetime
+from datetime import UTC, datetime
+from uuid import UUID
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
@@ -14,25 +16,153 @@ logger = logging.getLogger(__name__)
 # Global scheduler instance
 _scheduler: AsyncIOScheduler | None = None
 
+# Limits how many sync jobs run at once; queued jobs wait for a free slot
+_sync_job_slots: asyncio.Semaphore | None = None
+
 
 async def sync_all_providers_job() -> None:
     """Background job to sync all providers."""
     from licence_api.database import async_session_maker
+    from licence_api.services.cache_service import get_cache_service
     from licence_api.services.sync_service import SyncService
 
     logger.info("Starting scheduled sync of all providers")
 
+    settings = get_settings()
     async with async_session_maker() as session:
         try:
             service = SyncService(session)
-            results = await service.sync_all_providers()
+            results = await service.sync_all_providers(
+                max_concurrency=settings.sync_max_concurrency
+            )
             await session.commit()
             logger.info(f"Scheduled sync completed: {results}")
+
+            cache = await get_cache_service()
+            await cache.invalidate_changes(service.change_set)
         except Exception as e:
             logger.error(f"Scheduled sync failed: {e}")
             await session.rollback()
 
 
+async def run_sync_job(job_id: UUID) -> None:
+    """Background job to run a queued sync job once a job slot is free.
+
+    Args:
+        job_id: Sync job UUID
+    """
+    from licence_api.services.sync_job_service import execute_sync_job
+
+    global _sync_job_slots
+
+    if _sync_job_slots is None:
+        _sync_job_slots = asyncio.Semaphore(get_settings().sync_job_max_concurrent)
+
+    async with _sync_job_slots:
+        logger.info(f"Starting sync job {job_id}")
+        try:
+            await execute_sync_job(job_id)
+        except Exception as e:
+            logger.error(f"Sync job {job_id} failed: {e}")
+
+
+def enqueue_sync_job(job_id: UUID) -> bool:
+    """Queue a sync job for immediate execution.
+
+    Args:
+        job_id: Sync job UUID
+
+    Returns:
+        True if the job was queued, False if the scheduler is not running
+    """
+    if not _scheduler:
+        logger.warning("Cannot queue sync job: scheduler not running")
+        return False
+
+    _scheduler.add_job(
+        run_sync_job,
+        args=[job_id],
+        id=f"sync_job_{job_id}",
+        name="Sync job",
+        # Run however late the event loop picks it up
+        misfire_grace_time=None,
+    )
+    return True
+
+
+def enqueue_export_job(job_id: UUID) -> bool:
+    """Queue an export job for immediate execution.
+
+    Args:
+        job_id: Export job UUID
+
+    Returns:
+        True if the job was queued, False if the scheduler is not running
+    """
+    from licence_api.services.export_job_service import execute_export_job
+
+    if not _scheduler:
+        logger.warning("Cannot queue export job: scheduler not running")
+        return False
+
+    _scheduler.add_job(
+        execute_export_job,
+        args=[job_id],
+        id=f"export_job_{job_id}",
+        name="Export job",
+        # Run however late the event loop picks it up
+        misfire_grace_time=None,
+    )
+    return True
+
+
+async def fail_interrupted_sync_jobs() -> None:
+    """Mark sync jobs left pending or running by a previous process as failed."""
+    from licence_api.database import async_session_maker
+    from licence_api.repositories.sync_job_repository import SyncJobRepository
+
+    async with async_session_maker() as session:
+        try:
+            count = await SyncJobRepository(session).fail_interrupted(datetime.now(UTC))
+            await session.commit()
+            if count:
+                logger.info(f"Marked {count} interrupted sync job(s) as failed")
+        except Exception as e:
+            logger.warning(f"Failed to clean up interrupted sync jobs: {e}")
+            await session.rollback()
+
+
+async def fail_interrupted_export_jobs() -> None:
+    """Mark export jobs left pending or running by a previous process as failed."""
+    from licence_api.database import async_session_maker
+    from licence_api.repositories.export_job_repository import ExportJobRepository
+
+    async with async_session_maker() as session:
+        try:
+            count = await ExportJobRepository(session).fail_interrupted(datetime.now(UTC))
+            await session.commit()
+            if count:
+                logger.info(f"Marked {count} interrupted export job(s) as failed")
+        except Exception as e:
+            logger.warning(f"Failed to clean up interrupted export jobs: {e}")
+            await session.rollback()
+
+
+async def purge_export_jobs_job() -> None:
+    """Background job to delete expired export jobs and their artifacts."""
+    from licence_api.database import async_session_maker
+    from licence_api.services.export_job_service import ExportJobService
+
+    async with async_session_maker() as session:
+        try:
+            count = await ExportJobService(session).purge_expired()
+            if count:
+                logger.info(f"Purged {count} expired export job(s)")
+        except Exception as e:
+            logger.error(f"Export job purge failed: {e}")
+            await session.rollback()
+
+
 async def check_inactive_licenses_job() -> None:
     """Background job to check for inactive licenses and send notifications."""
     from licence_api.database import async_session_maker
@@ -271,6 +401,26 @@ async def create_cost_snapshots_job() -> None:
             await session.rollback()
 
 
+async def rebuild_dashboard_aggregates_job() -> None:
+    """Background job to recompute all dashboard aggregates."""
+    from licence_api.database import async_session_maker
+    from licence_api.services.cache_service import get_cache_service
+    from licence_api.services.dashboard_aggregate_service import DashboardAggregateService
+
+    logger.info("Rebuilding dashboard aggregates")
+
+    async with async_session_maker() as session:
+        try:
+            await DashboardAggregateService(session).rebuild()
+            await session.commit()
+
+            cache = await get_cache_service()
+            await cache.invalidate_dashboard()
+        except Exception as e:
+            logger.error(f"Dashboard aggregate rebuild failed: {e}")
+            await session.rollback()
+
+
 async def start_scheduler() -> None:
     """Start the background task scheduler."""
     global _scheduler
@@ -324,6 +474,28 @@ async def start_scheduler() -> None:
         replace_existing=True,
     )
 
+    # Rebuild dashboard aggregates, catching changes outside syncs and mutations
+    _scheduler.add_job(
+        rebuild_dashboard_aggregates_job,
+        trigger=IntervalTrigger(hours=settings.dashboard_aggregate_rebuild_hours),
+        id="rebuild_dashboard_aggregates",
+        name="Rebuild dashboard aggregates",
+        replace_existing=True,
+    )
+
+    # Delete export artifacts after their retention period
+    _scheduler.add_job(
+        purge_export_jobs_job,
+        trigger=IntervalTrigger(hours=1),
+        id="purge_export_jobs",
+        name="Purge expired export jobs",
+        replace_existing=True,
+    )
+
+    # Jobs queued before a restart are lost with the in-memory job store
+    await fail_interrupted_sync_jobs()
+    await fail_interrupted_export_jobs()
+
     _scheduler.start()
     logger.info("Background scheduler started")
 
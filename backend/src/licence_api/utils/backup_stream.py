@@ -0,0 +1,338 @@
+"""Chunked, encrypted backup stream format.
+
+A backup is a stream of newline-delimited JSON records, compressed with gzip
+or zstd and split into chunks that are each encrypted with AES-256-GCM. Both
+directions work incrementally, so neither creating nor reading a backup holds
+more than one chunk in memory.
+
+File layout:
+    header   magic (17B) + codec (1B) + salt (16B)
+    chunks   length (4B, big-endian, high bit set on the final chunk) + ciphertext
+    footer   SHA-256 of all preceding bytes (32B)
+
+Version 3 files have no codec byte and are always gzip-compressed; they are
+still read. zstd needs the optional zstandard package, which also compresses
+with worker threads.
+
+Key derivation, compression and encryption are CPU-bound and block the
+calling thread; async callers run the writer and reader methods in a worker
+thread (cryptography, zlib and zstandard release the GIL while working).
+
+Every chunk is encrypted with a key derived from the password and the salt,
+a nonce holding the chunk counter, and the header and length field as
+associated data. Reordered, truncated or extended streams therefore fail
+authentication. The footer allows an integrity check without the password.
+"""
+
+import hashlib
+import os
+import zlib
+from typing import Any
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+BACKUP_STREAM_HEADER = b"LICENCE_BACKUP_V4"
+
+# Version 3 header: no codec byte, always gzip
+BACKUP_STREAM_HEADER_V3 = b"LICENCE_BACKUP_V3"
+
+# Compression codecs and their header byte
+CODECS = {"gzip": 1, "zstd": 2}
+
+# Encryption parameters
+SALT_SIZE = 16
+NONCE_SIZE = 12
+TAG_SIZE = 16
+HASH_SIZE = 32  # SHA-256
+PBKDF2_ITERATIONS = 600000
+
+# Compressed bytes per encrypted chunk
+CHUNK_SIZE = 1024 * 1024
+
+# Chunks larger than this are rejected when reading
+MAX_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Compressed bytes decompressed at a time when reading, so the decompressed
+# data of a chunk is split into lines piece by piece
+DECOMPRESS_SIZE = 64 * 1024
+
+LENGTH_SIZE = 4
+FINAL_CHUNK_FLAG = 0x80000000
+
+
+def is_backup_stream(data: bytes) -> bool:
+    """Check whether data starts with the header of a chunked backup (V3 or V4)."""
+    return data.startswith((BACKUP_STREAM_HEADER, BACKUP_STREAM_HEADER_V3))
+
+
+def _import_zstd() -> Any:
+    """Import the optional zstandard package."""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstandard is required for zstd-compressed backups. "
+            "Install it with: pip install zstandard"
+        )
+    return zstandard
+
+
+def derive_backup_key(password: str, salt: bytes) -> bytes:
+    """Derive a backup encryption key from a password using PBKDF2.
+
+    Args:
+        password: Backup password
+        salt: Random salt stored with the backup
+
+    Returns:
+        32-byte AES key
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=PBKDF2_ITERATIONS,
+    )
+    return kdf.derive(password.encode("utf-8"))
+
+
+class BackupStreamWriter:
+    """Compress and encrypt backup records into authenticated chunks.
+
+    Usage: emit header(), then the bytes returned by each write() call, then
+    the bytes returned by finish().
+    """
+
+    def __init__(
+        self,
+        password: str,
+        chunk_size: int = CHUNK_SIZE,
+        codec: str = "gzip",
+        threads: int = 0,
+    ) -> None:
+        """Initialize the writer with a fresh salt and derived key.
+
+        Args:
+            password: Backup password
+            chunk_size: Compressed bytes per chunk
+            codec: Compression codec, "gzip" or "zstd"
+            threads: zstd worker threads (0 compresses on the calling thread)
+
+        Raises:
+            ImportError: If zstd is requested but zstandard is not installed
+        """
+        if codec == "zstd":
+            zstd = _import_zstd()
+            self._compressor = zstd.ZstdCompressor(level=3, threads=threads).compressobj()
+        else:
+            self._compressor = zlib.compressobj(6, wbits=31)
+        salt = os.urandom(SALT_SIZE)
+        self._header = BACKUP_STREAM_HEADER + bytes([CODECS[codec]]) + salt
+        self._aesgcm = AESGCM(derive_backup_key(password, salt))
+        self._buffer = bytearray()
+        self._chunk_size = chunk_size
+        self._counter = 0
+        self._digest = hashlib.sha256(self._header)
+
+    def header(self) -> bytes:
+        """Get the stream header."""
+        return self._header
+
+    def write(self, data: bytes) -> bytes:
+        """Add plaintext to the stream.
+
+        Args:
+            data: NDJSON record bytes
+
+        Returns:
+            Encrypted chunks completed by this write (may be empty)
+        """
+        self._buffer += self._compressor.compress(data)
+        chunks = []
+        while len(self._buffer) >= self._chunk_size:
+            chunks.append(self._seal(bytes(self._buffer[: self._chunk_size]), final=False))
+            del self._buffer[: self._chunk_size]
+        return b"".join(chunks)
+
+    def finish(self) -> bytes:
+        """End the stream.
+
+        Returns:
+            The final encrypted chunk followed by the footer
+        """
+        self._buffer += self._compressor.flush()
+        chunk = self._seal(bytes(self._buffer), final=True)
+        self._buffer.clear()
+        return chunk + self._digest.digest()
+
+    def _seal(self, plaintext: bytes, final: bool) -> bytes:
+        """Encrypt one chunk and prefix it with its length field."""
+        length = len(plaintext) + TAG_SIZE
+        if final:
+            length |= FINAL_CHUNK_FLAG
+        length_field = length.to_bytes(LENGTH_SIZE, "big")
+        nonce = self._counter.to_bytes(NONCE_SIZE, "big")
+        self._counter += 1
+        chunk = length_field + self._aesgcm.encrypt(nonce, plaintext, self._header + length_field)
+        self._digest.update(chunk)
+        return chunk
+
+
+class BackupStreamReader:
+    """Verify, decrypt and decompress a chunked backup stream incrementally.
+
+    Feed the stream in pieces of any size with feed(), which returns the
+    complete NDJSON lines decoded so far, and call close() at the end of
+    input to verify the stream was complete.
+    """
+
+    def __init__(self, password: str) -> None:
+        """Initialize the reader.
+
+        Args:
+            password: Backup password
+        """
+        self._password = password
+        self._aesgcm: AESGCM | None = None
+        self._header = b""
+        self._buffer = bytearray()
+        self._decompressor: Any = None
+        self._pending = b""
+        self._counter = 0
+        self._finished = False
+        self._digest = hashlib.sha256()
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Add stream bytes.
+
+        Args:
+            data: Next bytes of the backup file
+
+        Returns:
+            Complete NDJSON lines decoded from the stream so far
+
+        Raises:
+            ValueError: If the stream is malformed, was encrypted with a
+                different password or was modified
+        """
+        self._buffer += data
+        if self._aesgcm is None and not self._read_header():
+            return []
+
+        lines: list[bytes] = []
+        while not self._finished and len(self._buffer) >= LENGTH_SIZE:
+            length_field = bytes(self._buffer[:LENGTH_SIZE])
+            length = int.from_bytes(length_field, "big")
+            final = bool(length & FINAL_CHUNK_FLAG)
+            length &= ~FINAL_CHUNK_FLAG
+            if length < TAG_SIZE or length > MAX_CHUNK_SIZE:
+                raise ValueError("Invalid backup format: corrupted chunk")
+            if len(self._buffer) < LENGTH_SIZE + length:
+                break
+            ciphertext = bytes(self._buffer[LENGTH_SIZE : LENGTH_SIZE + length])
+            del self._buffer[: LENGTH_SIZE + length]
+            self._digest.update(length_field + ciphertext)
+
+            nonce = self._counter.to_bytes(NONCE_SIZE, "big")
+            self._counter += 1
+            try:
+                compressed = self._aesgcm.decrypt(nonce, ciphertext, self._header + length_field)
+            except InvalidTag as e:
+                raise ValueError("Decryption failed: wrong password or corrupted data") from e
+            view = memoryview(compressed)
+            for start in range(0, len(view), DECOMPRESS_SIZE):
+                try:
+                    data = self._decompressor.decompress(view[start : start + DECOMPRESS_SIZE])
+                except Exception as e:
+                    # zlib.error or zstandard.ZstdError
+                    raise ValueError("Decompression failed: corrupted data") from e
+                lines.extend(self._split_lines(data))
+            self._finished = final
+
+        if self._finished and len(self._buffer) > HASH_SIZE:
+            raise ValueError("Invalid backup format: data after final chunk")
+        return lines
+
+    def _read_header(self) -> bool:
+        """Parse the header once buffered and derive the key.
+
+        Returns:
+            False if the header is not complete yet
+        """
+        magic_size = len(BACKUP_STREAM_HEADER)
+        if len(self._buffer) < magic_size + 1:
+            return False
+        if self._buffer.startswith(BACKUP_STREAM_HEADER):
+            codecs = {value: name for name, value in CODECS.items()}
+            codec = codecs.get(self._buffer[magic_size])
+            if codec is None:
+                raise ValueError("Invalid backup format: unknown compression")
+            header_size = magic_size + 1 + SALT_SIZE
+        elif self._buffer.startswith(BACKUP_STREAM_HEADER_V3):
+            codec = "gzip"
+            header_size = magic_size + SALT_SIZE
+        else:
+            raise ValueError("Invalid backup format: missing or wrong header")
+        if len(self._buffer) < header_size:
+            return False
+
+        if codec == "zstd":
+            self._decompressor = _import_zstd().ZstdDecompressor().decompressobj()
+        else:
+            self._decompressor = zlib.decompressobj(wbits=31)
+        self._header = bytes(self._buffer[:header_size])
+        del self._buffer[:header_size]
+        self._digest.update(self._header)
+        salt = self._header[-SALT_SIZE:]
+        self._aesgcm = AESGCM(derive_backup_key(self._password, salt))
+        return True
+
+    def close(self) -> list[bytes]:
+        """End the input and verify the stream was complete.
+
+        Returns:
+            The last NDJSON line, if not newline-terminated
+
+        Raises:
+            ValueError: If the stream was truncated or its footer does not match
+        """
+        # Older zstandard releases do not report the end of the frame
+        if not self._finished or not getattr(self._decompressor, "eof", True):
+            raise ValueError("Invalid backup format: file is truncated")
+        if bytes(self._buffer) != self._digest.digest():
+            raise ValueError("Integrity check failed: data may be corrupted")
+        lines = [self._pending] if self._pending else []
+        self._pending = b""
+        return lines
+
+    def _split_lines(self, data: bytes) -> list[bytes]:
+        """Split decompressed data into complete lines, keeping the remainder."""
+        if not data:
+            return []
+        lines = (self._pending + data).split(b"\n")
+        self._pending = lines.pop()
+        return [line for line in lines if line]
+
+
+def verify_backup_stream_footer(file_data: bytes) -> bytes:
+    """Check a chunked backup file against its footer without decrypting it.
+
+    Args:
+        file_data: Complete backup file
+
+    Returns:
+        The SHA-256 digest stored in the footer
+
+    Raises:
+        ValueError: If the file is too short or does not match its footer
+    """
+    min_size = len(BACKUP_STREAM_HEADER_V3) + SALT_SIZE + LENGTH_SIZE + TAG_SIZE + HASH_SIZE
+    if len(file_data) < min_size:
+        raise ValueError("Invalid backup format: file too short")
+    stored = file_data[-HASH_SIZE:]
+    if hashlib.sha256(file_data[:-HASH_SIZE]).digest() != stored:
+        raise ValueError("Integrity check failed: data may be corrupted")
+    return stored
@@ -0,0 +1,104 @@
+"""Trigram name index for fuzzy name matching.
+
+Scoring a name against every employee with SequenceMatcher is O(N) per lookup.
+This index narrows the search to a small shortlist of employees whose names
+share the most character trigrams with the query, so exact scoring only runs
+on a handful of plausible candidates.
+"""
+
+import heapq
+from collections import Counter, defaultdict
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+# Default number of candidates returned by NameIndex.search
+DEFAULT_SHORTLIST_SIZE = 200
+
+
+def name_trigrams(name: str) -> set[str]:
+    """Get the padded character trigrams of a name.
+
+    Each name is padded with two leading spaces and one trailing space so that
+    short names and word starts still produce trigrams.
+
+    Args:
+        name: Lowercase name
+
+    Returns:
+        Set of trigrams
+    """
+    padded = f"  {name} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class NameIndex(Generic[T]):
+    """Inverted trigram index over names.
+
+    Items keep their insertion order, and search results are returned in that
+    order so callers that pick the first best-scoring item behave exactly as
+    when iterating over the full list.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._items: list[T] = []
+        self._gram_counts: list[int] = []
+        self._postings: dict[str, list[int]] = defaultdict(list)
+
+    def __len__(self) -> int:
+        """Get the number of indexed items."""
+        return len(self._items)
+
+    def add(self, item: T, name: str) -> None:
+        """Index an item by name.
+
+        Besides the full name, "first last" and "last first" variants are
+        indexed so that middle names and reversed name orders are found.
+
+        Args:
+            item: Item to return from searches
+            name: Lowercase name of the item
+        """
+        position = len(self._items)
+        self._items.append(item)
+
+        grams = name_trigrams(name)
+        parts = name.split()
+        if len(parts) >= 2:
+            grams |= name_trigrams(f"{parts[0]} {parts[-1]}")
+            grams |= name_trigrams(f"{parts[-1]} {parts[0]}")
+
+        for gram in grams:
+            self._postings[gram].append(position)
+        self._gram_counts.append(len(grams))
+
+    def search(self, name: str, limit: int = DEFAULT_SHORTLIST_SIZE) -> list[T]:
+        """Get the items whose names are most similar to a name.
+
+        Candidates are ranked by the Dice coefficient of their trigram sets.
+
+        Args:
+            name: Lowercase name to search for
+            limit: Maximum number of candidates
+
+        Returns:
+            Up to `limit` items sharing at least one trigram, in insertion order
+        """
+        query = name_trigrams(name)
+        shared: Counter[int] = Counter()
+        for gram in query:
+            for position in self._postings.get(gram, ()):
+                shared[position] += 1
+
+        if len(shared) > limit:
+            query_size = len(query)
+            positions = heapq.nlargest(
+                limit,
+                shared,
+                key=lambda p: shared[p] / (query_size + self._gram_counts[p]),
+            )
+        else:
+            positions = list(shared)
+
+        return [self._items[position] for position in sorted(positions)]
@@ -2,11 +2,18 @@
 
 This module provides in-memory pattern matching to avoid N+1 queries during sync.
 Patterns are loaded once and matched against all licenses in memory.
+
+Email patterns are compiled at construction: exact patterns go into a dict,
+the common "*@domain" and "prefix*" shapes into suffix/prefix dicts, and all
+other wildcard patterns into one combined regex, so matching an email does not
+walk the pattern list.
 """
 
 import fnmatch
+import re
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -24,6 +31,108 @@ class PatternMatch:
     owner_id: UUID | None = None
 
 
+class EmailPattern(Protocol):
+    """Service or admin account email pattern."""
+
+    email_pattern: str
+    name: str | None
+    owner_id: UUID | None
+
+
+class CompiledEmailPatterns:
+    """Email patterns compiled for fast lookup.
+
+    Semantics match checking each pattern in list order: an exact
+    (case-insensitive) match on any pattern wins first, then the first pattern
+    containing "*" or "?" that matches with fnmatch.
+    """
+
+    def __init__(self, patterns: Sequence[EmailPattern]) -> None:
+        """Compile patterns.
+
+        Args:
+            patterns: Email patterns in priority order
+        """
+        self._patterns = patterns
+        self._exact: dict[str, int] = {}
+        self._suffixes: dict[str, int] = {}
+        self._prefixes: dict[str, int] = {}
+        self._regex_positions: list[int] = []
+        self._regexes: list[re.Pattern[str]] = []
+
+        for position, pattern in enumerate(patterns):
+            pattern_lower = pattern.email_pattern.lower()
+            self._exact.setdefault(pattern_lower, position)
+
+            if "*" not in pattern_lower and "?" not in pattern_lower:
+                continue
+
+            body = pattern_lower.strip("*")
+            is_simple = "*" not in body and "?" not in body and "[" not in body
+            if is_simple and pattern_lower == f"*{body}":
+                self._suffixes.setdefault(body, position)
+            elif is_simple and pattern_lower == f"{body}*":
+                self._prefixes.setdefault(body, position)
+            else:
+                self._regex_positions.append(position)
+                self._regexes.append(re.compile(fnmatch.translate(pattern_lower)))
+
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffixes})
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+        # One combined regex rejects non-matching emails in a single call
+        self._combined = (
+            re.compile("|".join(f"(?:{regex.pattern})" for regex in self._regexes))
+            if self._regexes
+            else None
+        )
+
+    def match(self, email: str) -> PatternMatch:
+        """Match an email against the compiled patterns.
+
+        Args:
+            email: Email address to match
+
+        Returns:
+            PatternMatch with result
+        """
+        email_lower = email.lower()
+
+        position = self._exact.get(email_lower)
+        if position is None:
+            position = self._match_wildcard(email_lower)
+        if position is None:
+            return PatternMatch(matched=False)
+
+        pattern = self._patterns[position]
+        return PatternMatch(matched=True, name=pattern.name, owner_id=pattern.owner_id)
+
+    def _match_wildcard(self, email_lower: str) -> int | None:
+        """Get the position of the first wildcard pattern matching an email."""
+        hits: list[int] = []
+
+        for length in self._suffix_lengths:
+            if length > len(email_lower):
+                break
+            position = self._suffixes.get(email_lower[len(email_lower) - length :])
+            if position is not None:
+                hits.append(position)
+
+        for length in self._prefix_lengths:
+            if length > len(email_lower):
+                break
+            position = self._prefixes.get(email_lower[:length])
+            if position is not None:
+                hits.append(position)
+
+        if self._combined is not None and self._combined.match(email_lower):
+            for position, regex in zip(self._regex_positions, self._regexes, strict=True):
+                if regex.match(email_lower):
+                    hits.append(position)
+                    break
+
+        return min(hits) if hits else None
+
+
 class PatternMatcher:
     """In-memory pattern matcher for bulk license processing.
 
@@ -44,8 +153,8 @@ class PatternMatcher:
             admin_account_patterns: List of admin account email patterns
             service_account_license_types: List of service account license type rules
         """
-        self._svc_patterns = service_account_patterns
-        self._admin_patterns = admin_account_patterns
+        self._svc_patterns = CompiledEmailPatterns(service_account_patterns)
+        self._admin_patterns = CompiledEmailPatterns(admin_account_patterns)
         self._svc_license_types = service_account_license_types
 
         # Build lookup dict for exact license type matches (case-insensitive)
@@ -62,29 +171,7 @@ class PatternMatcher:
         Returns:
             PatternMatch with result
         """
-        email_lower = email.lower()
-
-        # First try exact match
-        for pattern in self._svc_patterns:
-            if pattern.email_pattern.lower() == email_lower:
-                return PatternMatch(
-                    matched=True,
-                    name=pattern.name,
-                    owner_id=pattern.owner_id,
-                )
-
-        # Then try wildcard patterns
-        for pattern in self._svc_patterns:
-            pattern_lower = pattern.email_pattern.lower()
-            if "*" in pattern_lower or "?" in pattern_lower:
-                if fnmatch.fnmatch(email_lower, pattern_lower):
-                    return PatternMatch(
-                        matched=True,
-                        name=pattern.name,
-                        owner_id=pattern.owner_id,
-                    )
-
-        return PatternMatch(matched=False)
+        return self._svc_patterns.match(email)
 
     def match_admin_account_email(self, email: str) -> PatternMatch:
         """Match email against admin account patterns.
@@ -95,29 +182,7 @@ class PatternMatcher:
         Returns:
             PatternMatch with result
         """
-        email_lower = email.lower()
-
-        # First try exact match
-        for pattern in self._admin_patterns:
-            if pattern.email_pattern.lower() == email_lower:
-                return PatternMatch(
-                    matched=True,
-                    name=pattern.name,
-                    owner_id=pattern.owner_id,
-                )
-
-        # Then try wildcard patterns
-        for pattern in self._admin_patterns:
-            pattern_lower = pattern.email_pattern.lower()
-            if "*" in pattern_lower or "?" in pattern_lower:
-                if fnmatch.fnmatch(email_lower, pattern_lower):
-                    return PatternMatch(
-                        matched=True,
-                        name=pattern.name,
-                        owner_id=pattern.owner_id,
-                    )
-
-        return PatternMatch(matched=False)
+        return self._admin_patterns.match(email)
 
     def match_service_account_license_type(self, license_type: str | None) -> PatternMatch:
         """Match license type against service account license type rules.
@@ -0,0 +1,81 @@
+"""Adaptive token bucket rate limiter for outbound provider requests."""
+
+import asyncio
+import time
+
+
+class AdaptiveTokenBucket:
+    """Token bucket whose rate adapts to provider rate limiting.
+
+    Requests acquire one token each. Tokens refill at the current rate up to
+    `capacity`, which bounds bursts. When the provider answers 429, the rate
+    is halved and all requests pause until Retry-After has passed; each
+    successful request then raises the rate again by a small step, up to the
+    configured maximum (additive increase, multiplicative decrease).
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        min_rate: float = 0.1,
+        increase_step: float | None = None,
+    ) -> None:
+        """Initialize limiter.
+
+        Args:
+            rate: Maximum (and initial) requests per second
+            capacity: Maximum number of tokens, i.e. burst size
+            min_rate: Lower bound for the rate after repeated 429s
+            increase_step: Requests per second added after each success
+                (default: 5% of rate, so a halved rate recovers in ~10 requests)
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.min_rate = min(min_rate, rate)
+        self.increase_step = increase_step if increase_step is not None else rate / 20
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent.
+
+        Waiters are served in arrival order.
+        """
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Record a request that was not rate limited."""
+        self.rate = min(self.max_rate, self.rate + self.increase_step)
+
+    def on_rate_limited(self, retry_after: float | None = None) -> None:
+        """Record a 429 response.
+
+        Args:
+            retry_after: Seconds from the Retry-After header, if any
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.min_rate, self.rate / 2)
+        self._tokens = 0.0
+        pause = retry_after if retry_after is not None else 1 / self.rate
+        self._paused_until = max(self._paused_until, now + pause)